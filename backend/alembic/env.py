@@ -15,10 +15,12 @@ from app.models.user import User
 from app.models.universe import Universe
 from app.models.universe_snapshot import UniverseSnapshot  # Sprint 2.5: Temporal universe system
 from app.models.asset import Asset, UniverseAsset  # Phase 2: Asset models
+from app.models.market_data import PriceBar, CorporateAction, EconomicSeries, EconomicObservation, FundamentalsSnapshot
 from app.models.strategy import Strategy
 from app.models.portfolio import Portfolio, PortfolioAllocation
 from app.models.execution import Order, Execution
 from app.models.chat import Conversation, ChatMessage
+from app.models.cache_outbox import CacheOutboxEvent
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,24 @@
+"""add next_attempt_at to cache outbox events for retry backoff
+
+Revision ID: a6f2d9c4e170
+Revises: b3d8e1f4a692
+Create Date: 2026-10-19 14:02:51.318462
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6f2d9c4e170'
+down_revision = 'b3d8e1f4a692'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('cache_outbox_events', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('cache_outbox_events', 'next_attempt_at')
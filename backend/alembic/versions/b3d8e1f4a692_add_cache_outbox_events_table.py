@@ -0,0 +1,42 @@
+"""add cache outbox events table for event-driven cache invalidation
+
+Revision ID: b3d8e1f4a692
+Revises: f19c3d5e7a28
+Create Date: 2026-10-19 09:14:27.551203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d8e1f4a692'
+down_revision = 'f19c3d5e7a28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('cache_outbox_events',
+    sa.Column('entity_type', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.String(length=36), nullable=False),
+    sa.Column('universe_id', sa.String(length=36), nullable=True),
+    sa.Column('operation', sa.String(length=20), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cache_outbox_events_universe_id'), 'cache_outbox_events', ['universe_id'], unique=False)
+    op.create_index('idx_cache_outbox_events_pending', 'cache_outbox_events', ['processed_at', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_cache_outbox_events_pending', table_name='cache_outbox_events')
+    op.drop_index(op.f('ix_cache_outbox_events_universe_id'), table_name='cache_outbox_events')
+    op.drop_table('cache_outbox_events')
@@ -0,0 +1,66 @@
+"""add price bars and corporate actions tables for local price store
+
+Revision ID: d41b7e9c2a53
+Revises: c8c7722f1c31
+Create Date: 2026-10-18 09:12:41.318205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41b7e9c2a53'
+down_revision = 'c8c7722f1c31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Unadjusted OHLCV history - adjustments are applied at read time
+    op.create_table('price_bars',
+    sa.Column('symbol', sa.String(length=50), nullable=False),
+    sa.Column('interval', sa.String(length=10), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('open', sa.Float(), nullable=False),
+    sa.Column('high', sa.Float(), nullable=False),
+    sa.Column('low', sa.Float(), nullable=False),
+    sa.Column('close', sa.Float(), nullable=False),
+    sa.Column('volume', sa.BIGINT(), nullable=False),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('symbol', 'interval', 'timestamp', name='uq_price_bar_symbol_interval_timestamp')
+    )
+    op.create_index('idx_price_bars_symbol_interval_timestamp', 'price_bars', ['symbol', 'interval', 'timestamp'])
+
+    # Splits and dividends driving the read-time adjustment factors
+    op.create_table('corporate_actions',
+    sa.Column('symbol', sa.String(length=50), nullable=False),
+    sa.Column('ex_date', sa.Date(), nullable=False),
+    sa.Column('action_type', sa.String(length=20), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('price_factor', sa.Float(), nullable=True),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('action_metadata', sa.JSON(), nullable=True),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('symbol', 'ex_date', 'action_type', name='uq_corporate_action_symbol_date_type')
+    )
+    op.create_index(op.f('ix_corporate_actions_symbol'), 'corporate_actions', ['symbol'], unique=False)
+    op.create_index('idx_corporate_actions_symbol_ex_date', 'corporate_actions', ['symbol', 'ex_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_corporate_actions_symbol_ex_date', table_name='corporate_actions')
+    op.drop_index(op.f('ix_corporate_actions_symbol'), table_name='corporate_actions')
+    op.drop_table('corporate_actions')
+
+    op.drop_index('idx_price_bars_symbol_interval_timestamp', table_name='price_bars')
+    op.drop_table('price_bars')
@@ -0,0 +1,54 @@
+"""add economic series cache tables for incremental indicator refresh
+
+Revision ID: e7a2c4f81b96
+Revises: d41b7e9c2a53
+Create Date: 2026-10-18 10:04:12.870551
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c4f81b96'
+down_revision = 'd41b7e9c2a53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-series refresh state (last stored observation, last upstream check)
+    op.create_table('economic_series',
+    sa.Column('series_id', sa.String(length=50), nullable=False),
+    sa.Column('provider', sa.String(length=50), nullable=True),
+    sa.Column('last_observation_date', sa.Date(), nullable=True),
+    sa.Column('last_checked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('observation_count', sa.BIGINT(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_economic_series_series_id'), 'economic_series', ['series_id'], unique=True)
+
+    op.create_table('economic_observations',
+    sa.Column('series_id', sa.String(length=50), nullable=False),
+    sa.Column('observation_date', sa.Date(), nullable=False),
+    sa.Column('values', sa.JSON(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('series_id', 'observation_date', name='uq_economic_observation_series_date')
+    )
+    op.create_index('idx_economic_observations_series_date', 'economic_observations', ['series_id', 'observation_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_economic_observations_series_date', table_name='economic_observations')
+    op.drop_table('economic_observations')
+
+    op.drop_index(op.f('ix_economic_series_series_id'), table_name='economic_series')
+    op.drop_table('economic_series')
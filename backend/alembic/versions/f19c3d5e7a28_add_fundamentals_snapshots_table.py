@@ -0,0 +1,43 @@
+"""add fundamentals snapshots table for bulk fundamentals refresh
+
+Revision ID: f19c3d5e7a28
+Revises: e7a2c4f81b96
+Create Date: 2026-10-18 11:26:53.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f19c3d5e7a28'
+down_revision = 'e7a2c4f81b96'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('fundamentals_snapshots',
+    sa.Column('symbol', sa.String(length=50), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('market_cap', sa.BIGINT(), nullable=True),
+    sa.Column('pe_ratio', sa.Float(), nullable=True),
+    sa.Column('dividend_yield', sa.Float(), nullable=True),
+    sa.Column('roic', sa.Float(), nullable=True),
+    sa.Column('sector', sa.String(length=100), nullable=True),
+    sa.Column('industry', sa.String(length=100), nullable=True),
+    sa.Column('provider', sa.String(length=50), nullable=True),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('symbol', 'snapshot_date', name='uq_fundamentals_snapshot_symbol_date')
+    )
+    op.create_index('idx_fundamentals_snapshots_symbol_date', 'fundamentals_snapshots', ['symbol', 'snapshot_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_fundamentals_snapshots_symbol_date', table_name='fundamentals_snapshots')
+    op.drop_table('fundamentals_snapshots')
@@ -97,7 +97,7 @@ class AISectorsResponse(BaseModel):
 
 # Service dependency
 def get_asset_validation_service() -> AssetValidationService:
-    """Create AssetValidationService with default providers and Redis client"""
+    """Create AssetValidationService with default providers (Redis client taken from the shared pool per call)"""
     try:
         print("🔧 DEBUG: Creating AssetValidationService instance...")
         service = AssetValidationService()
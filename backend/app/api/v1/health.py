@@ -1,10 +1,11 @@
 from fastapi import APIRouter, status, HTTPException
 from datetime import datetime, timezone
 import psutil
-import redis
 import anthropic
 from ...core.config import settings
 from ...core.database import SessionLocal
+from ...core.http_pool import get_http_pool
+from ...core.redis_pool import get_redis_pool
 from ...core.celery_app import get_worker_status
 from ...workers.asset_validation_worker import get_task_progress
 from sqlalchemy import text
@@ -28,8 +29,7 @@ async def check_database_connection() -> bool:
 async def check_redis_connection() -> bool:
     """Check Redis connectivity"""
     try:
-        r = redis.from_url(settings.redis_url)
-        r.ping()
+        get_redis_pool().get_sync_client().ping()
         return True
     except Exception as e:
         print(f"Redis connection failed: {e}")
@@ -126,6 +126,8 @@ async def metrics_endpoint():
         "http_requests_total": request_counter,
         "http_errors_total": error_counter,
         "database_connections_active": active_connections,
+        "http_pools": get_http_pool().get_metrics(),
+        "redis_pools": get_redis_pool().get_metrics(),
         
         # System metrics
         "memory_usage_bytes": memory.used,
@@ -11,32 +11,41 @@ Features:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from typing import List, Dict, Any, Optional
 from datetime import date, datetime
 from pydantic import BaseModel, Field
+import json
 
 from ...core.dependencies import get_current_user
 from ...models.user import User
 from ...services.market_data_service import MarketDataService
 from ...core.config import settings
+from ...core.redis_pool import get_redis_pool
 
 router = APIRouter(prefix="/api/v1/market-data", tags=["Market Data"])
 
-# Initialize market data service
+# Initialize market data service (background services started by the application lifespan)
 market_data_service = MarketDataService(
     openbb_api_key=getattr(settings, 'openbb_api_key', None),
     alpha_vantage_api_key=getattr(settings, 'alpha_vantage_api_key', None),
     enable_monitoring=True,
     enable_caching=True,
     cache_ttl_seconds=300,
-    max_workers=10
+    max_workers=10,
+    redis_pool=get_redis_pool() if settings.provider_cache_redis_enabled else None
 )
 
 # Pydantic models for request/response
 
 class RealTimeRequest(BaseModel):
     symbols: List[str] = Field(..., description="List of asset symbols", example=["AAPL", "GOOGL", "MSFT"])
+    max_age_seconds: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Oldest snapshot quote to accept (default: service setting; 0 forces a provider fetch)"
+    )
 
 class HistoricalDataRequest(BaseModel):
     symbols: List[str] = Field(..., description="List of asset symbols")
@@ -69,6 +78,10 @@ class BulkDataRequest(BaseModel):
         example=["historical_data", "asset_info", "fundamental_data"]
     )
     parallel_requests: int = Field(default=5, description="Number of parallel requests")
+    stream_progress: bool = Field(
+        default=False,
+        description="Stream newline-delimited JSON progress events per provider batch"
+    )
 
 class NewsAnalysisRequest(BaseModel):
     symbols: Optional[List[str]] = Field(default=None, description="Symbols for news analysis")
@@ -83,16 +96,6 @@ class InsiderTradingRequest(BaseModel):
 
 # API Endpoints
 
-@router.on_event("startup")
-async def startup_market_data_service():
-    """Initialize market data service on startup"""
-    await market_data_service.initialize()
-
-@router.on_event("shutdown")
-async def shutdown_market_data_service():
-    """Shutdown market data service"""
-    await market_data_service.shutdown()
-
 @router.post("/real-time")
 async def fetch_real_time_data(
     request: RealTimeRequest,
@@ -105,9 +108,15 @@ async def fetch_real_time_data(
     - Primary: OpenBB Terminal (professional-grade data)
     - Secondary: Yahoo Finance (high reliability)
     - Tertiary: Alpha Vantage (comprehensive coverage)
+    
+    Quotes for symbols in active universes are served from a background-refreshed
+    snapshot; metadata.quote_age_seconds reports each quote's age.
     """
     try:
-        result = await market_data_service.fetch_real_time_data_with_fallback(request.symbols)
+        result = await market_data_service.fetch_real_time_data_with_fallback(
+            request.symbols,
+            max_age_seconds=request.max_age_seconds
+        )
         
         if not result.success:
             raise HTTPException(status_code=400, detail={
@@ -374,8 +383,23 @@ async def bulk_data_fetch(
     - Provider load balancing
     - Cache-first strategy
     - Automatic retry and fallback
+    
+    With stream_progress=true the response is application/x-ndjson: one
+    "progress" event per completed batch (with that batch's results), then
+    a final "complete" event with the summary metadata.
     """
     try:
+        if request.stream_progress:
+            async def _progress_stream():
+                async for event in market_data_service.stream_bulk_data_fetch(
+                    symbols=request.symbols,
+                    operations=request.operations,
+                    parallel_requests=request.parallel_requests
+                ):
+                    yield json.dumps(jsonable_encoder(event)) + "\n"
+            
+            return StreamingResponse(_progress_stream(), media_type="application/x-ndjson")
+        
         result = await market_data_service.bulk_data_fetch(
             symbols=request.symbols,
             operations=request.operations,
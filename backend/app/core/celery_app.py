@@ -9,6 +9,7 @@ Following Phase 2 Step 5 requirements:
 """
 
 from celery import Celery
+from celery.schedules import crontab
 from celery.signals import setup_logging
 from .config import settings
 import logging
@@ -18,7 +19,8 @@ celery_app = Celery(
     "bubble-platform",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=['app.workers.asset_validation_worker']
+    include=['app.workers.asset_validation_worker', 'app.workers.market_data_worker',
+             'app.workers.temporal_cache_worker', 'app.workers.cache_outbox_worker']
 )
 
 # Celery configuration
@@ -28,6 +30,12 @@ celery_app.conf.update(
         'app.workers.asset_validation_worker.validate_asset_background': {'queue': 'validation'},
         'app.workers.asset_validation_worker.refresh_stale_validations': {'queue': 'maintenance'},
         'app.workers.asset_validation_worker.bulk_validate_assets': {'queue': 'bulk_validation'},
+        'app.workers.market_data_worker.refresh_fundamentals_snapshot': {'queue': 'maintenance'},
+        'app.workers.market_data_worker.premarket_warmup': {'queue': 'maintenance'},
+        'app.workers.temporal_cache_worker.warm_temporal_cache': {'queue': 'maintenance'},
+        'app.workers.temporal_cache_worker.decay_temporal_cache_access': {'queue': 'maintenance'},
+        'app.workers.cache_outbox_worker.dispatch_cache_outbox': {'queue': 'maintenance'},
+        'app.workers.cache_outbox_worker.purge_cache_outbox': {'queue': 'maintenance'},
     },
     
     # Worker configuration
@@ -69,6 +77,36 @@ celery_app.conf.update(
             'schedule': 21600.0,  # Every 6 hours
             'options': {'queue': 'maintenance'}
         },
+        'refresh-fundamentals-snapshot': {
+            'task': 'app.workers.market_data_worker.refresh_fundamentals_snapshot',
+            'schedule': crontab(hour=22, minute=30, day_of_week='mon-fri'),  # Daily after the US close
+            'options': {'queue': 'maintenance'}
+        },
+        'premarket-warmup': {
+            'task': 'app.workers.market_data_worker.premarket_warmup',
+            'schedule': crontab(hour='13,14', minute=5, day_of_week='mon-fri'),  # Task runs whichever is pre-open
+            'options': {'queue': 'maintenance'}
+        },
+        'warm-temporal-cache': {
+            'task': 'app.workers.temporal_cache_worker.warm_temporal_cache',
+            'schedule': 300.0,  # Every 5 minutes
+            'options': {'queue': 'maintenance'}
+        },
+        'decay-temporal-cache-access': {
+            'task': 'app.workers.temporal_cache_worker.decay_temporal_cache_access',
+            'schedule': crontab(hour=4, minute=0),  # Daily, halves read counts
+            'options': {'queue': 'maintenance'}
+        },
+        'dispatch-cache-outbox': {
+            'task': 'app.workers.cache_outbox_worker.dispatch_cache_outbox',
+            'schedule': 15.0,  # Every 15 seconds
+            'options': {'queue': 'maintenance'}
+        },
+        'purge-cache-outbox': {
+            'task': 'app.workers.cache_outbox_worker.purge_cache_outbox',
+            'schedule': crontab(hour=4, minute=30),  # Daily
+            'options': {'queue': 'maintenance'}
+        },
     },
     beat_schedule_filename='/tmp/celerybeat-schedule',
 )
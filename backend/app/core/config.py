@@ -16,6 +16,9 @@ class Settings(BaseSettings):
     
     # Redis
     redis_url: str = "redis://localhost:6379"
+    redis_max_connections: int = 50  # Per async pool (one per event loop)
+    redis_worker_max_connections: int = 10  # Per sync pool in each worker process
+    redis_pool_timeout: float = 5.0  # Seconds to wait for a free pooled connection
     
     # External APIs
     claude_api_key: str
@@ -50,6 +53,8 @@ class Settings(BaseSettings):
     enable_provider_failover: bool = True
     provider_failover_chain: str = "openbb,yahoo,alpha_vantage"  # Comma-separated priority order
     data_cache_ttl_seconds: int = 300
+    provider_cache_redis_enabled: bool = True  # Share provider cache across API workers and Celery jobs
+    market_data_background_enabled: bool = True  # Provider health monitor and quote snapshot poller in the API process
     enable_data_quality_monitoring: bool = True
     
     @field_validator('database_url')
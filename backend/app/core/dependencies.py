@@ -18,6 +18,19 @@ from .security import auth_service
 security = HTTPBearer(auto_error=False)
 
 
+_redis_rate_limiter = None
+
+
+def _get_redis_rate_limiter():
+    """Redis rate limiter reused across requests (on the shared Redis pool)"""
+    global _redis_rate_limiter
+    from ..services.implementations.redis_rate_limiter import RedisRateLimiter
+
+    if _redis_rate_limiter is None:
+        _redis_rate_limiter = RedisRateLimiter()
+    return _redis_rate_limiter
+
+
 async def check_rate_limit(request: Request) -> None:
     """
     Rate limiting dependency that runs before authentication.
@@ -42,7 +55,6 @@ async def check_rate_limit(request: Request) -> None:
     import os
     from ..core.config import settings
     from ..services.implementations.memory_rate_limiter import MemoryRateLimiter
-    from ..services.implementations.redis_rate_limiter import RedisRateLimiter
     
     environment = os.environ.get("ENVIRONMENT", settings.environment)
     
@@ -59,7 +71,7 @@ async def check_rate_limit(request: Request) -> None:
     if environment == "testing_with_rate_limits":
         rate_limiter = MemoryRateLimiter()
     else:
-        rate_limiter = RedisRateLimiter()
+        rate_limiter = _get_redis_rate_limiter()
     
     path = request.url.path
     method = request.method
@@ -0,0 +1,222 @@
+"""
+Central HTTP connection-pool registry
+
+Hands out one pooled aiohttp session per upstream host and event loop so
+every provider reuses warm keep-alive connections (and cached DNS lookups)
+instead of paying connection setup per request. The registry is owned by the
+application lifespan, which closes all sessions on shutdown.
+
+Code running its own event loop (Celery tasks) must call
+``close_loop_sessions()`` before closing the loop; once a loop is closed its
+sessions can no longer be closed and are only dropped.
+
+Providers must not close sessions obtained from the registry.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostPoolConfig:
+    """Connection limits and timeouts for one upstream host"""
+    limit_per_host: int = 10
+    keepalive_timeout: float = 60.0
+    ttl_dns_cache: int = 300
+    total_timeout: float = 30.0
+    connect_timeout: float = 10.0
+    sock_read_timeout: float = 20.0
+
+
+class HttpPoolRegistry:
+    """Per-host aiohttp session registry with utilization metrics"""
+
+    def __init__(
+        self,
+        default_config: Optional[HostPoolConfig] = None,
+        user_agent: str = "BubblePlatform/1.0"
+    ):
+        """
+        Initialize pool registry
+
+        Args:
+            default_config: Pool settings for hosts without a registered config
+            user_agent: User-Agent header sent on every pooled session
+        """
+        self.default_config = default_config or HostPoolConfig()
+        self.user_agent = user_agent
+
+        self._host_configs: Dict[str, HostPoolConfig] = {}
+        self._sessions: Dict[Tuple[str, asyncio.AbstractEventLoop], aiohttp.ClientSession] = {}
+        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def configure_host(self, host: str, config: HostPoolConfig):
+        """Register pool settings for a host (applies to sessions created afterwards)"""
+        self._host_configs[host] = config
+
+    def _get_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _release_sockets(session: aiohttp.ClientSession):
+        """
+        Close the sockets of a session whose event loop is already closed
+
+        session.close() and transport.abort() both need the loop, so the raw
+        sockets behind the connector's pooled and acquired connections are
+        closed directly (connector internals, as in get_metrics).
+        """
+        connector = session.connector
+        if connector is None:
+            return
+        protocols = [proto for conns in getattr(connector, "_conns", {}).values() for proto, _ in conns]
+        protocols.extend(getattr(connector, "_acquired", ()))
+        for proto in protocols:
+            sock = getattr(getattr(proto, "transport", None), "_sock", None)
+            if sock is not None:
+                sock.close()
+
+    def _prune_closed_loops(self):
+        """Drop sessions of loops closed without close_loop_sessions, releasing their sockets"""
+        for key in [key for key in self._sessions if key[1].is_closed()]:
+            session = self._sessions.pop(key)
+            if not session.closed:
+                self._stats[key[0]]["sessions_abandoned"] += 1
+                logger.warning(f"HTTP pool for {key[0]} dropped with its closed event loop")
+                try:
+                    self._release_sockets(session)
+                except Exception as e:
+                    logger.error(f"Error releasing HTTP pool sockets for {key[0]}: {e}")
+        for loop in [loop for loop in self._locks if loop.is_closed()]:
+            del self._locks[loop]
+
+    def _create_session(self, host: str) -> aiohttp.ClientSession:
+        config = self._host_configs.get(host, self.default_config)
+
+        connector = aiohttp.TCPConnector(
+            limit=config.limit_per_host,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=config.ttl_dns_cache,
+            enable_cleanup_closed=True
+        )
+
+        timeout = aiohttp.ClientTimeout(
+            total=config.total_timeout,
+            connect=config.connect_timeout,
+            sock_read=config.sock_read_timeout
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept-Encoding": "gzip, deflate"
+            }
+        )
+
+    async def get_session(self, host: str) -> aiohttp.ClientSession:
+        """
+        Get the shared session for an upstream host, creating it on first use
+
+        Sessions are bound to the event loop they were created on, so each
+        loop (e.g. a Celery task's own loop) gets its own session per host.
+        """
+        loop = asyncio.get_running_loop()
+        stats = self._stats[host]
+
+        async with self._get_lock(loop):
+            session = self._sessions.get((host, loop))
+            if session is not None and not session.closed:
+                stats["session_reuses"] += 1
+                return session
+
+            self._prune_closed_loops()
+            session = self._sessions[(host, loop)] = self._create_session(host)
+            stats["sessions_created"] += 1
+            logger.info(f"HTTP connection pool created for {host}")
+            return session
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool utilization per host, summed over the event loops holding a session"""
+        hosts = {}
+        for (host, _), session in self._sessions.items():
+            connector = session.connector
+            limit = connector.limit_per_host if connector is not None else 0
+            # aiohttp keeps no public counters; in_use/idle read connector internals
+            in_use = len(getattr(connector, "_acquired", ())) if connector is not None else 0
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values()) if connector is not None else 0
+
+            metrics = hosts.setdefault(host, {
+                "closed": True,
+                "loops": 0,
+                "limit_per_host": limit,
+                "in_use": 0,
+                "idle": 0,
+                "sessions_created": self._stats[host]["sessions_created"],
+                "session_reuses": self._stats[host]["session_reuses"],
+                "sessions_abandoned": self._stats[host]["sessions_abandoned"]
+            })
+            metrics["closed"] = metrics["closed"] and session.closed
+            metrics["loops"] += 1
+            metrics["in_use"] += in_use
+            metrics["idle"] += idle
+
+        for metrics in hosts.values():
+            capacity = metrics["limit_per_host"] * metrics["loops"]
+            metrics["utilization"] = metrics["in_use"] / capacity if capacity else 0.0
+
+        return {
+            "hosts": hosts,
+            "total_hosts": len(hosts),
+            "total_in_use": sum(h["in_use"] for h in hosts.values()),
+            "total_idle": sum(h["idle"] for h in hosts.values())
+        }
+
+    async def close_loop_sessions(self):
+        """Close the sessions bound to the running event loop (call before closing the loop)"""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in self._sessions if key[1] is loop]:
+            session = self._sessions.pop(key)
+            try:
+                if not session.closed:
+                    await session.close()
+                    logger.debug(f"HTTP connection pool closed for {key[0]}")
+            except Exception as e:
+                logger.error(f"Error closing HTTP pool for {key[0]}: {e}")
+        self._locks.pop(loop, None)
+
+    async def close_all(self):
+        """Close every pooled session (application shutdown)"""
+        await self.close_loop_sessions()
+        # Sessions of other loops can only be closed on their own loop
+        self._prune_closed_loops()
+        for host, _ in self._sessions:
+            logger.warning(f"HTTP pool for {host} still open on another event loop at shutdown")
+        self._sessions.clear()
+        logger.info("All HTTP connection pools closed")
+
+
+# Application-wide registry, closed by the FastAPI lifespan
+http_pool = HttpPoolRegistry()
+
+# Alpha Vantage allows only a handful of requests per minute - keep its pool small
+http_pool.configure_host("www.alphavantage.co", HostPoolConfig(limit_per_host=5))
+
+
+def get_http_pool() -> HttpPoolRegistry:
+    """Get the application-wide HTTP pool registry"""
+    return http_pool
@@ -0,0 +1,255 @@
+"""
+Central Redis connection-pool registry
+
+Hands out Redis clients backed by shared, bounded connection pools so
+services reuse connections instead of each building a client (and pool) of
+their own:
+- async pools, one per Redis URL, decode mode and event loop
+- sync pools, one per Redis URL and decode mode, for Celery workers and
+  helper threads (redis-py resets them in forked worker processes)
+
+Pools are bounded: sync pools block for up to ``pool_timeout`` seconds when
+all connections are in use, async pools fail fast with ``ConnectionError``
+(redis-py's async blocking pool deadlocks when a connect attempt fails, as
+its error path re-acquires the lock it already holds). Saturation shows up in
+``get_metrics``. The
+registry is owned by the application lifespan, which disconnects all pools
+on shutdown. Code running its own event loop (Celery tasks) calls
+``close_loop_clients()`` before closing the loop; pools of a loop closed
+without it have their sockets released when the registry next prunes.
+
+Services must not close or disconnect pools obtained from the registry.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+import redis.asyncio as async_redis
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_usage(pool) -> Tuple[int, int]:
+    """(in use, idle) connections of a redis-py pool"""
+    if hasattr(pool, "_in_use_connections"):
+        return len(pool._in_use_connections), len(pool._available_connections)
+    # Sync BlockingConnectionPool keeps a queue of idle connections (None = free slot)
+    created = len(getattr(pool, "_connections", ()))
+    queue = getattr(getattr(pool, "pool", None), "queue", ())
+    idle = sum(1 for connection in list(queue) if connection is not None)
+    return created - idle, idle
+
+
+class RedisPoolRegistry:
+    """Shared async and sync Redis connection pools with saturation metrics"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_connections: int = 50,
+        sync_max_connections: int = 10,
+        pool_timeout: float = 5.0,
+        socket_connect_timeout: float = 5.0,
+        socket_timeout: float = 5.0,
+        health_check_interval: int = 30,
+        saturation_threshold: float = 0.8
+    ):
+        """
+        Initialize pool registry
+
+        Args:
+            redis_url: Default Redis URL (defaults to settings.redis_url)
+            max_connections: Connections per async pool
+            sync_max_connections: Connections per sync pool
+            pool_timeout: Seconds a sync client waits for a free connection before failing
+            socket_connect_timeout: Connect timeout in seconds
+            socket_timeout: Command timeout in seconds
+            health_check_interval: Idle seconds after which a connection is pinged before reuse
+            saturation_threshold: Utilization from which a pool is reported saturated
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.max_connections = max_connections
+        self.sync_max_connections = sync_max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.socket_timeout = socket_timeout
+        self.health_check_interval = health_check_interval
+        self.saturation_threshold = saturation_threshold
+
+        self._async_clients: Dict[Tuple[str, bool, asyncio.AbstractEventLoop], async_redis.Redis] = {}
+        self._sync_clients: Dict[Tuple[str, bool], redis.Redis] = {}
+        self._lock = threading.Lock()
+        self._stats = {"pools_created": 0, "client_reuses": 0, "unpooled_clients": 0, "pools_abandoned": 0}
+
+    def _pool_kwargs(self, decode_responses: bool) -> Dict[str, Any]:
+        return {
+            "decode_responses": decode_responses,
+            "socket_connect_timeout": self.socket_connect_timeout,
+            "socket_timeout": self.socket_timeout,
+            "health_check_interval": self.health_check_interval
+        }
+
+    @staticmethod
+    def _release_connections(client: async_redis.Redis):
+        """
+        Close the sockets of an async pool whose event loop is already closed
+
+        disconnect() needs the loop, so the raw sockets behind the pool's idle
+        and checked-out connections are closed directly (pool internals, as in
+        _pool_usage).
+        """
+        pool = client.connection_pool
+        for connection in list(pool._available_connections) + list(pool._in_use_connections):
+            transport = getattr(getattr(connection, "_writer", None), "transport", None)
+            sock = getattr(transport, "_sock", None)
+            if sock is not None:
+                sock.close()
+
+    def _prune_closed_loops(self):
+        """Drop async pools of loops closed without close_loop_clients, releasing their sockets (lock held)"""
+        for key in [key for key in self._async_clients if key[2].is_closed()]:
+            client = self._async_clients.pop(key)
+            self._stats["pools_abandoned"] += 1
+            logger.warning("Redis connection pool dropped with its closed event loop")
+            try:
+                self._release_connections(client)
+            except Exception as e:
+                logger.error(f"Error releasing Redis connection pool sockets: {e}")
+
+    def get_client(self, decode_responses: bool = True, redis_url: Optional[str] = None) -> async_redis.Redis:
+        """
+        Get an async client on the shared pool for the running event loop
+
+        Async connections are bound to the loop they were opened on, so each
+        loop (e.g. a Celery task's own loop) gets its own pool. Called outside
+        a running loop, a client with a private pool is returned instead.
+        """
+        redis_url = redis_url or self.redis_url
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            with self._lock:
+                self._stats["unpooled_clients"] += 1
+            return async_redis.from_url(redis_url, decode_responses=decode_responses)
+
+        key = (redis_url, decode_responses, loop)
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is not None:
+                self._stats["client_reuses"] += 1
+                return client
+
+            self._prune_closed_loops()
+
+            pool = async_redis.ConnectionPool.from_url(
+                redis_url, max_connections=self.max_connections, **self._pool_kwargs(decode_responses)
+            )
+            client = async_redis.Redis(connection_pool=pool)
+            self._async_clients[key] = client
+            self._stats["pools_created"] += 1
+        logger.info(f"Redis connection pool created (async, decode_responses={decode_responses})")
+        return client
+
+    def get_sync_client(self, decode_responses: bool = False, redis_url: Optional[str] = None) -> redis.Redis:
+        """Get a sync client on the per-process shared pool (workers, helper threads)"""
+        redis_url = redis_url or self.redis_url
+        key = (redis_url, decode_responses)
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is not None:
+                self._stats["client_reuses"] += 1
+                return client
+
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url, max_connections=self.sync_max_connections, timeout=self.pool_timeout,
+                **self._pool_kwargs(decode_responses)
+            )
+            client = redis.Redis(connection_pool=pool)
+            self._sync_clients[key] = client
+            self._stats["pools_created"] += 1
+        logger.info(f"Redis connection pool created (sync, decode_responses={decode_responses})")
+        return client
+
+    def _pool_metrics(self, client) -> Dict[str, Any]:
+        pool = client.connection_pool
+        in_use, idle = _pool_usage(pool)
+        utilization = in_use / pool.max_connections if pool.max_connections else 0.0
+        return {
+            "max_connections": pool.max_connections,
+            "in_use": in_use,
+            "idle": idle,
+            "utilization": utilization,
+            "saturated": utilization >= self.saturation_threshold
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Connection usage and saturation per pool"""
+        with self._lock:
+            async_clients = [(key, client) for key, client in self._async_clients.items() if not key[2].is_closed()]
+            sync_clients = list(self._sync_clients.items())
+            stats = dict(self._stats)
+
+        pools = [
+            {"mode": "async", "decode_responses": decode, **self._pool_metrics(client)}
+            for (_, decode, _), client in async_clients
+        ] + [
+            {"mode": "sync", "decode_responses": decode, **self._pool_metrics(client)}
+            for (_, decode), client in sync_clients
+        ]
+        return {
+            "pools": pools,
+            "total_pools": len(pools),
+            "total_in_use": sum(pool["in_use"] for pool in pools),
+            "total_idle": sum(pool["idle"] for pool in pools),
+            "saturated_pools": sum(pool["saturated"] for pool in pools),
+            **stats
+        }
+
+    async def close_loop_clients(self):
+        """Disconnect the async pools bound to the running event loop (call before closing the loop)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = [self._async_clients.pop(key) for key in [key for key in self._async_clients if key[2] is loop]]
+
+        for client in clients:
+            try:
+                await client.connection_pool.disconnect()
+            except Exception as e:
+                logger.error(f"Error closing Redis connection pool: {e}")
+
+    async def close_all(self):
+        """Disconnect every pool (application shutdown)"""
+        await self.close_loop_clients()
+        with self._lock:
+            # Async pools of other loops can only be disconnected on their own loop
+            self._prune_closed_loops()
+            for _ in self._async_clients:
+                logger.warning("Redis connection pool still open on another event loop at shutdown")
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+
+        for client in sync_clients:
+            try:
+                client.connection_pool.disconnect()
+            except Exception as e:
+                logger.error(f"Error closing Redis connection pool: {e}")
+        logger.info("All Redis connection pools closed")
+
+
+# Application-wide registry, closed by the FastAPI lifespan
+redis_pool = RedisPoolRegistry(
+    max_connections=settings.redis_max_connections,
+    sync_max_connections=settings.redis_worker_max_connections,
+    pool_timeout=settings.redis_pool_timeout
+)
+
+
+def get_redis_pool() -> RedisPoolRegistry:
+    """Get the application-wide Redis pool registry"""
+    return redis_pool
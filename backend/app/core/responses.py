@@ -0,0 +1,20 @@
+"""
+API response classes
+
+``FastJSONResponse`` renders through the shared serializer (orjson when
+installed). It is the default response class of the v1 routers; endpoints
+returning large timelines or bulk results benefit most.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from ..utils.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with the shared serializer"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
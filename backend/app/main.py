@@ -7,6 +7,9 @@ import os
 from .core.config import settings
 from .models.base import Base
 from .core.database import engine
+from .core.http_pool import http_pool
+from .core.redis_pool import redis_pool
+from .core.responses import FastJSONResponse
 # Enterprise middleware imports (conditionally enabled)
 from .core.middleware.rate_limiting import RateLimitMiddleware, TESTING_CONFIG
 from .core.middleware.input_validation import InputValidationMiddleware, TESTING_CONFIG as INPUT_TESTING_CONFIG
@@ -42,10 +45,29 @@ async def lifespan(app: FastAPI):
     else:
         print("INFO: SQLite database - RLS policies not applicable")
     
+    # Provider health monitoring and the real-time quote snapshot poller
+    # (not under test clients, which must not poll live providers)
+    environment = os.environ.get("ENVIRONMENT", settings.environment)
+    market_data_background = settings.market_data_background_enabled and not environment.startswith("testing")
+    if market_data_background:
+        result = await market_data.market_data_service.initialize()
+        if not result.success:
+            print(f"WARNING: Market data background services failed to start: {result.error}")
+    
     yield
     
     # Shutdown
     print(f"Shutting down {settings.app_name}")
+    
+    # Stop the poller and health monitor before closing the pools they use
+    if market_data_background:
+        await market_data.market_data_service.shutdown()
+    
+    # Close pooled upstream HTTP connections shared by the data providers
+    await http_pool.close_all()
+    
+    # Disconnect the shared Redis connection pools
+    await redis_pool.close_all()
 
 # Enhanced FastAPI app with comprehensive configuration
 app = FastAPI(
@@ -117,14 +139,14 @@ app.add_middleware(
 
 # Include routers
 app.include_router(health.router, prefix="/health", tags=["Health Checks"])
-app.include_router(features.router, prefix="/api/v1/features", tags=["Feature Flags"])
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(rls_admin.router, prefix="/api/v1/admin/rls", tags=["RLS Administration"])
-app.include_router(universes.router, prefix="/api/v1/universes", tags=["Universe Management"])
-app.include_router(assets.router, prefix="/api/v1/assets", tags=["Asset Management"])
-app.include_router(market_data.router, tags=["Market Data - Triple Provider"])
-app.include_router(indicators.router, prefix="/api/v1/indicators", tags=["Technical Indicators"])
-app.include_router(signals.router, prefix="/api/v1/signals", tags=["Signal Generation"])
+app.include_router(features.router, prefix="/api/v1/features", tags=["Feature Flags"], default_response_class=FastJSONResponse)
+app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"], default_response_class=FastJSONResponse)
+app.include_router(rls_admin.router, prefix="/api/v1/admin/rls", tags=["RLS Administration"], default_response_class=FastJSONResponse)
+app.include_router(universes.router, prefix="/api/v1/universes", tags=["Universe Management"], default_response_class=FastJSONResponse)
+app.include_router(assets.router, prefix="/api/v1/assets", tags=["Asset Management"], default_response_class=FastJSONResponse)
+app.include_router(market_data.router, tags=["Market Data - Triple Provider"], default_response_class=FastJSONResponse)
+app.include_router(indicators.router, prefix="/api/v1/indicators", tags=["Technical Indicators"], default_response_class=FastJSONResponse)
+app.include_router(signals.router, prefix="/api/v1/signals", tags=["Signal Generation"], default_response_class=FastJSONResponse)
 
 @app.get("/", tags=["Root"])
 async def root():
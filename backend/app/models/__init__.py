@@ -4,20 +4,25 @@ from .user import User, UserRole, SubscriptionTier
 from .universe import Universe
 from .universe_snapshot import UniverseSnapshot  # Sprint 2.5: Temporal universe system
 from .asset import Asset, UniverseAsset  # Phase 2: New Asset models
+from .market_data import PriceBar, CorporateAction, EconomicSeries, EconomicObservation, FundamentalsSnapshot
 from .strategy import Strategy, StrategyStatus
 from .portfolio import Portfolio, PortfolioAllocation
 from .execution import Order, Execution, OrderStatus, OrderType
 from .chat import Conversation, ChatMessage
 from .security_audit import SecurityAuditLog, SecurityAlertModel  # Sprint 2.5 Part D: Security audit system
+from .cache_outbox import CacheOutboxEvent
 
 __all__ = [
     "BaseModel",
     "User", "UserRole", "SubscriptionTier",
     "Universe", "UniverseSnapshot",  # Sprint 2.5: Temporal universe system
     "Asset", "UniverseAsset",  # Phase 2: New Asset models
+    "PriceBar", "CorporateAction", "EconomicSeries", "EconomicObservation",
+    "FundamentalsSnapshot",
     "Strategy", "StrategyStatus",
     "Portfolio", "PortfolioAllocation",
     "Order", "Execution", "OrderStatus", "OrderType",
     "Conversation", "ChatMessage",
-    "SecurityAuditLog", "SecurityAlertModel"  # Sprint 2.5 Part D: Security audit system
+    "SecurityAuditLog", "SecurityAlertModel",  # Sprint 2.5 Part D: Security audit system
+    "CacheOutboxEvent"
 ]
\ No newline at end of file
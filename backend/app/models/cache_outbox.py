@@ -0,0 +1,130 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, JSON, Index, event, inspect
+from sqlalchemy.orm import Session
+from typing import Dict, Any, List, Optional
+from .base import BaseModel
+from .universe import Universe
+from .universe_snapshot import UniverseSnapshot
+from .asset import Asset
+
+
+class CacheOutboxEvent(BaseModel):
+    """
+    Cache invalidation event written in the same transaction as the change
+
+    Rows are recorded by a flush listener for every change that makes cached
+    data stale, so no write path can forget to invalidate. The
+    CacheOutboxDispatcher turns pending rows into targeted cache updates and
+    marks them processed; a failed dispatch leaves the row pending for retry
+    after next_attempt_at.
+    """
+    __tablename__ = "cache_outbox_events"
+
+    UNIVERSE = "universe"
+    UNIVERSE_SNAPSHOT = "universe_snapshot"
+    ASSET = "asset"
+
+    entity_type = Column(String(50), nullable=False)  # 'universe', 'universe_snapshot' or 'asset'
+    entity_id = Column(String(36), nullable=False)
+    universe_id = Column(String(36), index=True)  # Set for universe and snapshot events
+    operation = Column(String(20), nullable=False)  # 'insert', 'update' or 'delete'
+    payload = Column(JSON, default=dict)  # Cache keys affected: snapshot_dates, symbols
+
+    processed_at = Column(DateTime(timezone=True))
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True))  # Retry backoff after a failed dispatch
+    last_error = Column(Text)
+
+    __table_args__ = (
+        Index('idx_cache_outbox_events_pending', 'processed_at', 'created_at'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<CacheOutboxEvent(entity_type='{self.entity_type}', entity_id='{self.entity_id}', operation='{self.operation}')>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        base_dict = super().to_dict()
+        base_dict.update({
+            'payload': self.payload or {},
+            'processed_at': self.processed_at.isoformat() if self.processed_at else None,
+            'next_attempt_at': self.next_attempt_at.isoformat() if self.next_attempt_at else None
+        })
+        return base_dict
+
+
+def _changed_values(instance: Any, column: str) -> List[Any]:
+    """Current and, when it changed in this flush, previous value of a column"""
+    history = inspect(instance).attrs[column].history
+    values = list(history.added or [getattr(instance, column)]) + list(history.deleted or [])
+    return [value for value in dict.fromkeys(values) if value is not None]
+
+
+def _has_changes(instance: Any, columns: Optional[List[str]] = None) -> bool:
+    state = inspect(instance)
+    names = columns or [attr.key for attr in state.mapper.column_attrs if attr.key != "updated_at"]
+    return any(state.attrs[name].history.has_changes() for name in names)
+
+
+def _outbox_row(instance: Any, operation: str) -> Optional[Dict[str, Any]]:
+    """Outbox row for a flushed change, None if no cached data depends on it"""
+    if isinstance(instance, Universe):
+        # Cached universe data is all derived from its snapshots; only removal affects it
+        if operation != "delete":
+            return None
+        return {"entity_type": CacheOutboxEvent.UNIVERSE, "universe_id": instance.id, "payload": {}}
+
+    if isinstance(instance, UniverseSnapshot):
+        if operation == "update" and not _has_changes(instance):
+            return None
+        snapshot_dates = [value.isoformat() for value in _changed_values(instance, "snapshot_date")]
+        return {
+            "entity_type": CacheOutboxEvent.UNIVERSE_SNAPSHOT,
+            "universe_id": instance.universe_id,
+            "payload": {"snapshot_dates": snapshot_dates}
+        }
+
+    if isinstance(instance, Asset):
+        # Validation results are cached per symbol; a new or re-validated asset
+        # does not contradict them, a removed, renamed or revoked one does
+        if operation == "insert":
+            return None
+        if operation == "update":
+            revoked = instance.is_validated is False and _has_changes(instance, ["is_validated"])
+            if not revoked and not _has_changes(instance, ["symbol"]):
+                return None
+        return {
+            "entity_type": CacheOutboxEvent.ASSET,
+            "universe_id": None,
+            "payload": {"symbols": _changed_values(instance, "symbol")}
+        }
+
+    return None
+
+
+def _load_replaced_value(target, value, oldvalue, initiator):
+    """No-op; registered with active_history so the replaced value is in the history"""
+
+
+# Cache keys embed these columns: a change must invalidate the old key too,
+# even when the old value was expired by a commit before being replaced
+for _attribute in (UniverseSnapshot.snapshot_date, Asset.symbol):
+    event.listen(_attribute, "set", _load_replaced_value, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def record_cache_outbox_events(session: Session, flush_context) -> None:
+    """
+    Write outbox rows for the flushed changes on the flush's own connection
+
+    Runs after the flush so generated ids are known; the rows commit or roll
+    back together with the changes they describe.
+    """
+    rows = []
+    for operation, instances in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for instance in instances:
+            row = _outbox_row(instance, operation)
+            if row is not None:
+                rows.append({**row, "entity_id": instance.id, "operation": operation})
+
+    if rows:
+        session.connection().execute(CacheOutboxEvent.__table__.insert(), rows)
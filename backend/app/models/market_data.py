@@ -0,0 +1,146 @@
+from sqlalchemy import Column, String, Date, DateTime, Float, BIGINT, JSON, Index, UniqueConstraint
+from typing import Dict, Any
+from .base import BaseModel
+
+
+class PriceBar(BaseModel):
+    """
+    Locally stored OHLCV bar, as delivered by the provider (unadjusted)
+
+    Corporate-action adjustments are applied at read time from the
+    corporate_actions table, so a new split or dividend never requires
+    rewriting or re-downloading stored history.
+    """
+    __tablename__ = "price_bars"
+
+    symbol = Column(String(50), nullable=False)
+    interval = Column(String(10), nullable=False, default="1d")
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    volume = Column(BIGINT, nullable=False, default=0)
+
+    source = Column(String(50))  # Provider that delivered the bar
+
+    __table_args__ = (
+        UniqueConstraint('symbol', 'interval', 'timestamp', name='uq_price_bar_symbol_interval_timestamp'),
+        Index('idx_price_bars_symbol_interval_timestamp', 'symbol', 'interval', 'timestamp'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<PriceBar(symbol='{self.symbol}', interval='{self.interval}', timestamp='{self.timestamp}', close={self.close})>"
+
+
+class CorporateAction(BaseModel):
+    """
+    Split or cash dividend affecting the price history of a symbol
+
+    price_factor is the multiplier applied to prices of bars strictly before
+    ex_date (1 / ratio for splits, 1 - amount / previous close for dividends).
+    It is left empty when the previous close is not yet stored and resolved at
+    read time.
+    """
+    __tablename__ = "corporate_actions"
+
+    SPLIT = "split"
+    DIVIDEND = "dividend"
+
+    symbol = Column(String(50), nullable=False, index=True)
+    ex_date = Column(Date, nullable=False)
+    action_type = Column(String(20), nullable=False)  # 'split' or 'dividend'
+    value = Column(Float, nullable=False)  # Split ratio (new shares per old share) or cash amount per share
+    price_factor = Column(Float)
+
+    source = Column(String(50))
+    action_metadata = Column(JSON, default=dict)
+
+    __table_args__ = (
+        UniqueConstraint('symbol', 'ex_date', 'action_type', name='uq_corporate_action_symbol_date_type'),
+        Index('idx_corporate_actions_symbol_ex_date', 'symbol', 'ex_date'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<CorporateAction(symbol='{self.symbol}', ex_date='{self.ex_date}', type='{self.action_type}', value={self.value})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        base_dict = super().to_dict()
+        base_dict.update({
+            'ex_date': self.ex_date.isoformat() if self.ex_date else None,
+            'action_metadata': self.action_metadata or {}
+        })
+        return base_dict
+
+
+class EconomicSeries(BaseModel):
+    """
+    Locally cached economic indicator series
+
+    Tracks the last stored observation so refreshes only request newer
+    observations upstream, and when upstream was last checked so series that
+    change at most daily are not re-requested on every call.
+    """
+    __tablename__ = "economic_series"
+
+    series_id = Column(String(50), unique=True, nullable=False, index=True)  # Indicator name, e.g. 'gdp'
+    provider = Column(String(50))
+    last_observation_date = Column(Date)
+    last_checked_at = Column(DateTime(timezone=True))
+    observation_count = Column(BIGINT, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<EconomicSeries(series_id='{self.series_id}', last_observation='{self.last_observation_date}')>"
+
+
+class EconomicObservation(BaseModel):
+    """Single dated observation of an economic series (all columns the provider returned)"""
+    __tablename__ = "economic_observations"
+
+    series_id = Column(String(50), nullable=False)
+    observation_date = Column(Date, nullable=False)
+    values = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('series_id', 'observation_date', name='uq_economic_observation_series_date'),
+        Index('idx_economic_observations_series_date', 'series_id', 'observation_date'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<EconomicObservation(series_id='{self.series_id}', date='{self.observation_date}')>"
+
+
+class FundamentalsSnapshot(BaseModel):
+    """
+    Dated fundamentals per symbol, written by the bulk fundamentals refresh
+
+    The latest snapshot is copied onto Asset (market_cap, pe_ratio,
+    dividend_yield) so screening reads local data only.
+    """
+    __tablename__ = "fundamentals_snapshots"
+
+    symbol = Column(String(50), nullable=False)
+    snapshot_date = Column(Date, nullable=False)
+
+    market_cap = Column(BIGINT)
+    pe_ratio = Column(Float)
+    dividend_yield = Column(Float)  # Decimal (0.0350 = 3.5%)
+    roic = Column(Float)
+    sector = Column(String(100))
+    industry = Column(String(100))
+
+    provider = Column(String(50))
+    data = Column(JSON)  # Full provider payload
+
+    __table_args__ = (
+        UniqueConstraint('symbol', 'snapshot_date', name='uq_fundamentals_snapshot_symbol_date'),
+        Index('idx_fundamentals_snapshots_symbol_date', 'symbol', 'snapshot_date'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<FundamentalsSnapshot(symbol='{self.symbol}', date='{self.snapshot_date}', market_cap={self.market_cap})>"
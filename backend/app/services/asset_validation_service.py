@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
 import redis.asyncio as redis
 from sqlalchemy.orm import Session
@@ -15,11 +15,14 @@ from .interfaces.asset_validation import (
     BulkValidationResult,
     ServiceResult
 )
-from .interfaces.data_provider import ValidationResult
+from .interfaces.data_provider import ValidationResult, SYMBOL_NOT_FOUND
 from .implementations.yahoo_data_provider import YahooDataProvider
 from .implementations.alpha_vantage_provider import AlphaVantageProvider
+from .implementations.invalid_symbol_filter import InvalidSymbolFilter, get_invalid_symbol_filter
 from ..models.asset import Asset
 from ..core.database import get_db
+from ..core.redis_pool import get_redis_pool
+from ..utils.serialization import dumps_str, loads
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ class AssetValidationService(IAssetValidationService):
     3. Alpha Vantage as fallback provider
     4. Background validation queue for edge cases
     5. Graceful degradation on failures
+    6. Negative cache of symbols both providers reported as not found
     """
     
     def __init__(
@@ -39,23 +43,35 @@ class AssetValidationService(IAssetValidationService):
         yahoo_provider: Optional[YahooDataProvider] = None,
         alpha_vantage_provider: Optional[AlphaVantageProvider] = None,
         cache_ttl: int = 3600,  # 1 hour default TTL
-        max_concurrent_validations: int = 10
+        max_concurrent_validations: int = 10,
+        invalid_symbol_filter: Optional[InvalidSymbolFilter] = None,
+        negative_cache_ttl: int = 6 * 3600,
+        provider_batch_size: int = 25
     ):
         """
         Initialize Asset Validation Service
         
         Args:
-            redis_client: Redis client for caching
+            redis_client: Redis client for caching (defaults to the application-wide pool)
             yahoo_provider: Yahoo Finance data provider
             alpha_vantage_provider: Alpha Vantage fallback provider
             cache_ttl: Default cache TTL in seconds
             max_concurrent_validations: Max concurrent validation requests
+            invalid_symbol_filter: In-process filter of known-invalid symbols (shared by default)
+            negative_cache_ttl: TTL in seconds for known-invalid symbols
+            provider_batch_size: Symbols per provider call in bulk validation
         """
-        self.redis_client = redis_client or self._create_redis_client()
+        # Without an injected client the shared pool's client for the running
+        # event loop is looked up per call (services are created in sync
+        # dependencies and before a Celery task's loop exists)
+        self._redis_client = redis_client
         self.yahoo_provider = yahoo_provider or YahooDataProvider()
         self.alpha_vantage_provider = alpha_vantage_provider or AlphaVantageProvider()
         self.cache_ttl = cache_ttl
         self.max_concurrent_validations = max_concurrent_validations
+        self.invalid_symbol_filter = invalid_symbol_filter or get_invalid_symbol_filter()
+        self.negative_cache_ttl = negative_cache_ttl
+        self.provider_batch_size = provider_batch_size
         
         # Performance tracking
         self._validation_stats = {
@@ -66,23 +82,26 @@ class AssetValidationService(IAssetValidationService):
             "yahoo_failures": 0,
             "alpha_vantage_success": 0,
             "alpha_vantage_failures": 0,
+            "negative_cache_hits": 0,
+            "upstream_calls_saved": 0,
             "average_response_time": 0.0
         }
     
-    def _create_redis_client(self) -> redis.Redis:
-        """Create Redis client with default configuration"""
-        try:
-            import os
-            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-            return redis.from_url(redis_url, decode_responses=True)
-        except Exception as e:
-            logger.error(f"Failed to create Redis client: {e}")
-            raise
+    @property
+    def redis_client(self) -> redis.Redis:
+        """Injected Redis client, or the application-wide pool's client"""
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_redis_pool().get_client(decode_responses=True)
     
     def _get_cache_key(self, symbol: str) -> str:
         """Generate cache key for symbol validation"""
         return f"asset_validation:{symbol.upper()}"
     
+    def _get_negative_cache_key(self, symbol: str) -> str:
+        """Generate cache key for a known-invalid symbol"""
+        return f"asset_validation:invalid:{symbol.upper()}"
+    
     def _get_stats_key(self) -> str:
         """Get cache key for validation statistics"""
         return "asset_validation:stats"
@@ -94,7 +113,7 @@ class AssetValidationService(IAssetValidationService):
     ) -> ServiceResult[ValidationResult]:
         """
         Validate a single symbol using mixed strategy:
-        1. Check Redis cache (if not force_refresh)
+        1. Check negative cache and Redis cache (if not force_refresh)
         2. Real-time validation for common symbols  
         3. Background validation for edge cases
         4. Graceful degradation on failures
@@ -105,8 +124,13 @@ class AssetValidationService(IAssetValidationService):
         try:
             self._validation_stats["total_requests"] += 1
             
-            # Step 1: Check Redis cache (unless force refresh)
+            # Step 1: Check caches (unless force refresh)
             if not force_refresh:
+                # Known-invalid symbols: in-process filter first, shared Redis
+                # entry only after a positive cache miss
+                if self.invalid_symbol_filter.is_known_invalid(symbol):
+                    return self._negative_cache_result(symbol, time.time() - start_time)
+                
                 cached_result = await self.get_cached_validation(symbol)
                 if cached_result.success and cached_result.data:
                     self._validation_stats["cache_hits"] += 1
@@ -126,6 +150,9 @@ class AssetValidationService(IAssetValidationService):
                         },
                         next_actions=["use_validated_symbol", "add_to_universe"]
                     )
+                
+                if await self._is_known_invalid_shared(symbol):
+                    return self._negative_cache_result(symbol, time.time() - start_time)
             
             self._validation_stats["cache_misses"] += 1
             
@@ -135,6 +162,9 @@ class AssetValidationService(IAssetValidationService):
             if validation_result.success and validation_result.data:
                 # Cache the successful result
                 await self.cache_validation_result(symbol, validation_result.data, self.cache_ttl)
+                self.invalid_symbol_filter.clear(symbol)
+                if force_refresh:
+                    await self._clear_negative_cache(symbol)
                 
                 processing_time = time.time() - start_time
                 self._update_average_response_time(processing_time)
@@ -153,8 +183,14 @@ class AssetValidationService(IAssetValidationService):
                 )
             
             # Step 3: Background validation (for edge cases)
-            # For now, we'll queue it but still return the failed result
-            await self.queue_background_validation([symbol], "system")
+            # Symbols every provider reported as not found go to the negative
+            # cache instead; re-validating them in the background would only
+            # repeat the same upstream calls
+            definitively_invalid = bool((validation_result.metadata or {}).get("definitively_invalid"))
+            if definitively_invalid:
+                await self._record_invalid(symbol)
+            else:
+                await self.queue_background_validation([symbol], "system")
             
             # Step 4: Graceful degradation - return failed result with helpful info
             processing_time = time.time() - start_time
@@ -175,7 +211,8 @@ class AssetValidationService(IAssetValidationService):
                 metadata={
                     "source": "mixed_strategy",
                     "processing_time": processing_time,
-                    "background_queued": True,
+                    "background_queued": not definitively_invalid,
+                    "negative_cached": definitively_invalid,
                     "suggestion": "Check symbol spelling or try again later"
                 },
                 next_actions=["check_symbol_spelling", "try_alternative_providers", "wait_for_background_validation"]
@@ -246,25 +283,19 @@ class AssetValidationService(IAssetValidationService):
                         else:
                             return symbol, None, result.error
                     
-                    elif strategy == ValidationStrategy.MIXED:
-                        result = await self.validate_symbol_mixed_strategy(symbol)
-                        if result.metadata.get("source") == "cache":
-                            cache_hits += 1
-                        else:
-                            cache_misses += 1
-                        
-                        if result.success and result.data:
-                            return symbol, result.data, None
-                        else:
-                            return symbol, None, result.error
-                    
                     else:  # BACKGROUND
                         await self.queue_background_validation([symbol], "system")
                         return symbol, None, "Queued for background validation"
             
-            # Execute all validations concurrently
-            tasks = [validate_single_symbol(symbol) for symbol in symbols]
-            completed_results = await asyncio.gather(*tasks, return_exceptions=True)
+            if strategy == ValidationStrategy.MIXED:
+                # Batched cache lookups, provider calls and cache writes
+                completed_results, cache_hits, cache_misses = await self._validate_symbols_mixed_batched(
+                    symbols, concurrent_limit
+                )
+            else:
+                # Execute all validations concurrently
+                tasks = [validate_single_symbol(symbol) for symbol in symbols]
+                completed_results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Process results
             successful_validations = 0
@@ -383,6 +414,9 @@ class AssetValidationService(IAssetValidationService):
         Fallback: Alpha Vantage
         """
         symbol = symbol.upper()
+        # Providers that answered "not found" (as opposed to erroring or timing out)
+        yahoo_not_found = False
+        alpha_not_found = False
         
         try:
             # Try Yahoo Finance first (primary provider)
@@ -403,6 +437,7 @@ class AssetValidationService(IAssetValidationService):
                             metadata={"primary_provider": "yahoo_finance"},
                             next_actions=["cache_result", "use_validated_symbol"]
                         )
+                    yahoo_not_found = validation_result.error == SYMBOL_NOT_FOUND
                 
                 self._validation_stats["yahoo_failures"] += 1
                 logger.warning(f"Yahoo Finance validation failed for {symbol}")
@@ -432,6 +467,7 @@ class AssetValidationService(IAssetValidationService):
                             metadata={"fallback_provider": "alpha_vantage"},
                             next_actions=["cache_result", "use_validated_symbol"]
                         )
+                    alpha_not_found = validation_result.error == SYMBOL_NOT_FOUND
                 
                 self._validation_stats["alpha_vantage_failures"] += 1
                 
@@ -456,7 +492,10 @@ class AssetValidationService(IAssetValidationService):
                 ),
                 error="All validation providers failed",
                 message=f"Symbol {symbol} could not be validated by any provider",
-                metadata={"attempted_providers": ["yahoo_finance", "alpha_vantage"]},
+                metadata={
+                    "attempted_providers": ["yahoo_finance", "alpha_vantage"],
+                    "definitively_invalid": yahoo_not_found and alpha_not_found
+                },
                 next_actions=["check_symbol_spelling", "try_manual_validation", "queue_background_validation"]
             )
             
@@ -479,7 +518,7 @@ class AssetValidationService(IAssetValidationService):
             cached_data = await self.redis_client.get(cache_key)
             
             if cached_data:
-                validation_data = json.loads(cached_data)
+                validation_data = loads(cached_data)
                 validation_result = ValidationResult(**validation_data)
                 
                 return ServiceResult(
@@ -517,17 +556,10 @@ class AssetValidationService(IAssetValidationService):
         try:
             cache_key = self._get_cache_key(symbol)
             
-            # Convert ValidationResult to dict for JSON serialization
-            result_dict = result.model_dump()
-            if result_dict.get('timestamp'):
-                result_dict['timestamp'] = result_dict['timestamp'].isoformat()
-            if result_dict.get('asset_info') and result_dict['asset_info'].get('last_updated'):
-                result_dict['asset_info']['last_updated'] = result_dict['asset_info']['last_updated'].isoformat()
-            
             cached = await self.redis_client.setex(
                 cache_key,
                 ttl,
-                json.dumps(result_dict, default=str)
+                self._serialize_validation_result(result)
             )
             
             return ServiceResult(
@@ -683,6 +715,7 @@ class AssetValidationService(IAssetValidationService):
             
             enhanced_stats = {
                 **stats,
+                "invalid_symbol_filter": self.invalid_symbol_filter.get_stats(),
                 "cache_hit_ratio": cache_hit_ratio,
                 "yahoo_success_rate": yahoo_success_rate,
                 "alpha_vantage_success_rate": alpha_vantage_success_rate,
@@ -717,6 +750,9 @@ class AssetValidationService(IAssetValidationService):
             if symbols:
                 # Invalidate specific symbols
                 cache_keys = [self._get_cache_key(symbol.upper()) for symbol in symbols]
+                cache_keys += [self._get_negative_cache_key(symbol) for symbol in symbols]
+                for symbol in symbols:
+                    self.invalid_symbol_filter.clear(symbol)
                 deleted_count = await self.redis_client.delete(*cache_keys)
                 
                 return ServiceResult(
@@ -797,6 +833,278 @@ class AssetValidationService(IAssetValidationService):
                 message="Asset Validation Service health check failed"
             )
     
+    async def _validate_symbols_mixed_batched(
+        self,
+        symbols: List[str],
+        concurrent_limit: int
+    ) -> Tuple[List[Tuple[str, Optional[ValidationResult], Optional[str]]], int, int]:
+        """
+        Mixed strategy for many symbols with a fixed number of round trips:
+        1. Known-invalid symbols answered by the in-process filter
+        2. One MGET over the cache and negative cache keys
+        3. Cache misses validated in provider batches
+        4. Results written back in one pipeline, undecided symbols queued as one background job
+
+        Returns:
+            ((symbol, result, error) per requested symbol, cache hits, cache misses)
+        """
+        start_time = time.time()
+        unique_symbols = list(dict.fromkeys(symbols))
+        self._validation_stats["total_requests"] += len(symbols)
+
+        # symbol -> (validation result, error, answered from cache)
+        outcomes: Dict[str, Tuple[Optional[ValidationResult], Optional[str], bool]] = {}
+        lookup = []
+        for symbol in unique_symbols:
+            if self.invalid_symbol_filter.is_known_invalid(symbol):
+                outcomes[symbol] = (None, self._negative_cache_result(symbol, time.time() - start_time).error, False)
+            else:
+                lookup.append(symbol)
+
+        cached, shared_invalid = await self._get_cached_validations_bulk(lookup)
+        for symbol, result in cached.items():
+            result.source = "cache"
+            outcomes[symbol] = (result, None, True)
+        for symbol in shared_invalid:
+            outcomes[symbol] = (None, self._negative_cache_result(symbol, time.time() - start_time).error, False)
+        self._validation_stats["cache_hits"] += len(cached)
+
+        misses = [symbol for symbol in lookup if symbol not in outcomes]
+        self._validation_stats["cache_misses"] += len(misses)
+        valid, not_found = await self._validate_real_time_batched(misses, concurrent_limit)
+
+        undecided = []
+        for symbol in misses:
+            if symbol in valid:
+                outcomes[symbol] = (valid[symbol], None, False)
+            else:
+                outcomes[symbol] = (None, "All validation providers failed", False)
+                if symbol not in not_found:
+                    undecided.append(symbol)
+
+        await self._write_validation_results_bulk(valid, sorted(not_found))
+        if undecided:
+            await self.queue_background_validation(undecided, "system")
+
+        completed_results = []
+        cache_hits = 0
+        for symbol in symbols:
+            result, error, from_cache = outcomes[symbol]
+            cache_hits += from_cache
+            completed_results.append((symbol, result, error))
+        return completed_results, cache_hits, len(symbols) - cache_hits
+
+    async def _get_cached_validations_bulk(
+        self,
+        symbols: List[str]
+    ) -> Tuple[Dict[str, ValidationResult], List[str]]:
+        """
+        Cached results and shared negative entries for many symbols in one MGET
+
+        Returns:
+            (cached results by symbol, symbols found in the shared negative cache)
+        """
+        if not symbols:
+            return {}, []
+        try:
+            values = await self.redis_client.mget(
+                [self._get_cache_key(symbol) for symbol in symbols] +
+                [self._get_negative_cache_key(symbol) for symbol in symbols]
+            )
+        except Exception as e:
+            logger.warning(f"Bulk cache lookup failed for {len(symbols)} symbols: {e}")
+            return {}, []
+
+        cached = {}
+        invalid = {}
+        for symbol, cached_data, reason in zip(symbols, values[:len(symbols)], values[len(symbols):]):
+            if cached_data:
+                try:
+                    cached[symbol] = ValidationResult(**loads(cached_data))
+                    continue
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable cached validation for {symbol}: {e}")
+            if isinstance(reason, (str, bytes)):
+                invalid[symbol] = reason.decode() if isinstance(reason, bytes) else reason
+
+        if invalid:
+            # Seen invalid by another worker: remember locally for the remaining TTLs
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for symbol in invalid:
+                    pipe.ttl(self._get_negative_cache_key(symbol))
+                ttls = await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Negative cache TTL lookup failed for {len(invalid)} symbols: {e}")
+                ttls = [-1] * len(invalid)
+            for (symbol, reason), ttl in zip(invalid.items(), ttls):
+                self.invalid_symbol_filter.record_invalid(
+                    symbol, reason, ttl_seconds=ttl if isinstance(ttl, int) and ttl > 0 else None
+                )
+
+        return cached, list(invalid)
+
+    async def _validate_real_time_batched(
+        self,
+        symbols: List[str],
+        concurrent_limit: int,
+        timeout: int = 60
+    ) -> Tuple[Dict[str, ValidationResult], set]:
+        """
+        Real-time validation of many symbols in provider batches:
+        Yahoo Finance first, Alpha Vantage for the symbols it did not validate
+
+        Returns:
+            (valid results by symbol, symbols both providers reported as not found)
+        """
+        if not symbols:
+            return {}, set()
+        semaphore = asyncio.Semaphore(concurrent_limit)
+
+        async def validate_batch(provider, provider_name: str, batch: List[str]) -> Dict[str, ValidationResult]:
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(provider.validate_symbols(batch), timeout=timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"{provider_name} validation timeout for a batch of {len(batch)} symbols")
+                    return {}
+                except Exception as e:
+                    logger.warning(f"{provider_name} validation error for a batch of {len(batch)} symbols: {e}")
+                    return {}
+                return result.data if result.success and isinstance(result.data, dict) else {}
+
+        async def validate_with(provider, provider_name: str, pending: List[str]) -> Dict[str, Optional[ValidationResult]]:
+            batches = [
+                pending[index:index + self.provider_batch_size]
+                for index in range(0, len(pending), self.provider_batch_size)
+            ]
+            merged = {}
+            for data in await asyncio.gather(*(validate_batch(provider, provider_name, batch) for batch in batches)):
+                merged.update(data)
+            return {symbol: merged.get(symbol) for symbol in pending}
+
+        valid = {}
+        yahoo_not_found = set()
+        for symbol, result in (await validate_with(self.yahoo_provider, "Yahoo Finance", symbols)).items():
+            if result is not None and result.is_valid:
+                valid[symbol] = result
+                self._validation_stats["yahoo_success"] += 1
+            else:
+                self._validation_stats["yahoo_failures"] += 1
+                if result is not None and result.error == SYMBOL_NOT_FOUND:
+                    yahoo_not_found.add(symbol)
+
+        not_found = set()
+        fallback = [symbol for symbol in symbols if symbol not in valid]
+        if fallback:
+            for symbol, result in (await validate_with(self.alpha_vantage_provider, "Alpha Vantage", fallback)).items():
+                if result is not None and result.is_valid:
+                    valid[symbol] = result
+                    self._validation_stats["alpha_vantage_success"] += 1
+                else:
+                    self._validation_stats["alpha_vantage_failures"] += 1
+                    if symbol in yahoo_not_found and result is not None and result.error == SYMBOL_NOT_FOUND:
+                        not_found.add(symbol)
+
+        return valid, not_found
+
+    async def _write_validation_results_bulk(self, valid: Dict[str, ValidationResult], invalid: List[str]):
+        """Cache validated symbols and negative-cache not-found symbols in one pipeline"""
+        for symbol in valid:
+            self.invalid_symbol_filter.clear(symbol)
+        for symbol in invalid:
+            self.invalid_symbol_filter.record_invalid(symbol, ttl_seconds=self.negative_cache_ttl)
+        if not valid and not invalid:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for symbol, result in valid.items():
+                pipe.setex(self._get_cache_key(symbol), self.cache_ttl, self._serialize_validation_result(result))
+            for symbol in invalid:
+                pipe.setex(self._get_negative_cache_key(symbol), self.negative_cache_ttl, SYMBOL_NOT_FOUND)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to cache {len(valid) + len(invalid)} bulk validation results: {e}")
+
+    def _serialize_validation_result(self, result: ValidationResult) -> str:
+        """JSON for a cached validation result"""
+        return dumps_str(result.model_dump())
+
+    async def _is_known_invalid_shared(self, symbol: str) -> bool:
+        """Check the Redis negative cache shared by all workers"""
+        try:
+            reason = await self.redis_client.get(self._get_negative_cache_key(symbol))
+        except Exception as e:
+            logger.warning(f"Negative cache lookup failed for {symbol}: {e}")
+            return False
+        if not isinstance(reason, (str, bytes)):
+            return False
+        
+        # Seen invalid by another worker: remember it locally for the remaining TTL
+        ttl = await self._get_negative_cache_ttl_remaining(symbol)
+        self.invalid_symbol_filter.record_invalid(
+            symbol,
+            reason.decode() if isinstance(reason, bytes) else reason,
+            ttl_seconds=ttl if ttl > 0 else None
+        )
+        return True
+    
+    def _negative_cache_result(self, symbol: str, processing_time: float) -> ServiceResult[ValidationResult]:
+        """Failed validation answered from the negative cache (no provider calls)"""
+        self._validation_stats["negative_cache_hits"] += 1
+        self._validation_stats["upstream_calls_saved"] += 2  # Yahoo Finance + Alpha Vantage
+        self.invalid_symbol_filter.record_saved_calls(2)
+        
+        return ServiceResult(
+            success=False,
+            data=ValidationResult(
+                symbol=symbol,
+                is_valid=False,
+                provider="negative_cache",
+                timestamp=datetime.now(timezone.utc),
+                error=SYMBOL_NOT_FOUND,
+                confidence=0.0,
+                source="negative_cache"
+            ),
+            error=SYMBOL_NOT_FOUND,
+            message=f"Symbol {symbol} is known to be invalid",
+            metadata={
+                "source": "negative_cache",
+                "processing_time": processing_time,
+                "background_queued": False,
+                "negative_cache_ttl": self.negative_cache_ttl
+            },
+            next_actions=["check_symbol_spelling", "force_refresh_validation"]
+        )
+    
+    async def _record_invalid(self, symbol: str, reason: Optional[str] = None):
+        """Add a symbol to the local filter and the shared Redis negative cache"""
+        self.invalid_symbol_filter.record_invalid(symbol, reason, ttl_seconds=self.negative_cache_ttl)
+        try:
+            await self.redis_client.setex(
+                self._get_negative_cache_key(symbol),
+                self.negative_cache_ttl,
+                reason or SYMBOL_NOT_FOUND
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store negative cache entry for {symbol}: {e}")
+    
+    async def _clear_negative_cache(self, symbol: str):
+        """Drop a symbol from the shared negative cache (e.g. after a new listing validates)"""
+        try:
+            await self.redis_client.delete(self._get_negative_cache_key(symbol))
+        except Exception as e:
+            logger.warning(f"Failed to clear negative cache entry for {symbol}: {e}")
+    
+    async def _get_negative_cache_ttl_remaining(self, symbol: str) -> int:
+        """Get remaining TTL for a negative cache entry"""
+        try:
+            ttl = await self.redis_client.ttl(self._get_negative_cache_key(symbol))
+            return ttl if isinstance(ttl, int) else -1
+        except Exception:
+            return -1
+    
     async def _get_cache_ttl_remaining(self, symbol: str) -> int:
         """Get remaining TTL for cached symbol"""
         try:
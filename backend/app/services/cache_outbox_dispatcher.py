@@ -0,0 +1,215 @@
+"""
+Cache outbox dispatcher
+
+Turns pending cache outbox events (written by the flush listener in the same
+transaction as universe, snapshot and asset changes) into targeted cache
+updates:
+- created or changed snapshot: its timeline segment and snapshot entry are
+  rewritten from the database (warming instead of a cold miss)
+- deleted snapshot: its segment and snapshot entry are dropped
+- deleted universe: everything cached for it is dropped
+- removed, renamed or revoked asset: its cached validation results are dropped
+
+Events are coalesced per target and applied from the current database state,
+so replaying an event, or dispatching concurrently with another worker, is
+harmless. Events whose cache update fails stay pending and are retried up to
+max_attempts times, with exponential backoff (next_attempt_at) so a Redis
+outage does not use up the attempts within one run.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.cache_outbox import CacheOutboxEvent
+from ..models.universe_snapshot import UniverseSnapshot
+from .interfaces.base import ServiceResult
+from .interfaces.security import ITemporalCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheOutboxDispatcher:
+    """Applies pending cache outbox events to the temporal and validation caches"""
+
+    def __init__(
+        self,
+        db: Session,
+        temporal_cache: Optional[ITemporalCache] = None,
+        validation_service=None,
+        batch_size: int = 500,
+        max_attempts: int = 5,
+        retry_backoff_seconds: float = 60.0
+    ):
+        """
+        Initialize the dispatcher
+
+        Args:
+            db: Database session (pending events are marked processed on it)
+            temporal_cache: Universe timeline cache (created on first use by default)
+            validation_service: Asset validation service (created on first use by default)
+            batch_size: Events read per dispatch
+            max_attempts: Failed dispatches before an event is left for inspection
+            retry_backoff_seconds: Delay before the first retry, doubled per further failure
+        """
+        self.db = db
+        self._temporal_cache = temporal_cache
+        self._validation_service = validation_service
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+    @property
+    def temporal_cache(self) -> ITemporalCache:
+        if self._temporal_cache is None:
+            from .implementations.redis_temporal_cache import RedisTemporalCache
+            self._temporal_cache = RedisTemporalCache(redis_url=settings.redis_url)
+        return self._temporal_cache
+
+    @property
+    def validation_service(self):
+        if self._validation_service is None:
+            from .asset_validation_service import AssetValidationService
+            self._validation_service = AssetValidationService()
+        return self._validation_service
+
+    def _pending_events(self, universe_id: Optional[str]) -> List[CacheOutboxEvent]:
+        query = self.db.query(CacheOutboxEvent).filter(
+            and_(
+                CacheOutboxEvent.processed_at.is_(None),
+                CacheOutboxEvent.attempts < self.max_attempts,
+                or_(
+                    CacheOutboxEvent.next_attempt_at.is_(None),
+                    CacheOutboxEvent.next_attempt_at <= datetime.now(timezone.utc)
+                )
+            )
+        )
+        if universe_id is not None:
+            query = query.filter(CacheOutboxEvent.universe_id == universe_id)
+        # Concurrent dispatchers skip each other's rows (ignored by SQLite)
+        return query.order_by(CacheOutboxEvent.created_at).limit(self.batch_size).with_for_update(skip_locked=True).all()
+
+    async def dispatch_pending(self, universe_id: Optional[str] = None) -> ServiceResult:
+        """
+        Apply a batch of pending events and mark them processed
+
+        Args:
+            universe_id: Only dispatch this universe's events (e.g. right after
+                the caller's own commit), all pending events by default
+
+        Returns:
+            ServiceResult with counts of applied cache updates and failures
+        """
+        try:
+            events = self._pending_events(universe_id)
+            if not events:
+                self.db.commit()
+                return ServiceResult(success=True, data={"events": 0}, message="No pending cache outbox events")
+
+            # Coalesce into targets; a deleted universe supersedes its snapshot events
+            deleted_universes: Dict[str, List[CacheOutboxEvent]] = defaultdict(list)
+            snapshots: Dict[Tuple[str, str], List[CacheOutboxEvent]] = defaultdict(list)
+            symbols: Dict[str, List[CacheOutboxEvent]] = defaultdict(list)
+            for event in events:
+                payload = event.payload or {}
+                if event.entity_type == CacheOutboxEvent.UNIVERSE:
+                    deleted_universes[event.universe_id].append(event)
+                elif event.entity_type == CacheOutboxEvent.UNIVERSE_SNAPSHOT:
+                    for snapshot_date in payload.get("snapshot_dates", []):
+                        snapshots[(event.universe_id, snapshot_date)].append(event)
+                elif event.entity_type == CacheOutboxEvent.ASSET:
+                    for symbol in payload.get("symbols", []):
+                        symbols[symbol.upper()].append(event)
+            for target in [target for target in snapshots if target[0] in deleted_universes]:
+                deleted_universes[target[0]].extend(snapshots.pop(target))
+
+            failed: Dict[str, str] = {}
+            stats = {"universes_invalidated": 0, "segments_refreshed": 0, "segments_removed": 0, "symbols_invalidated": 0}
+
+            for deleted_universe_id, universe_events in deleted_universes.items():
+                if await self.temporal_cache.invalidate_universe_cache(deleted_universe_id):
+                    stats["universes_invalidated"] += 1
+                else:
+                    failed.update({event.id: "universe invalidation failed" for event in universe_events})
+
+            for (snapshot_universe_id, snapshot_date), snapshot_events in snapshots.items():
+                applied, action = await self._apply_snapshot(snapshot_universe_id, snapshot_date)
+                if applied:
+                    stats[action] += 1
+                else:
+                    failed.update({event.id: f"snapshot {snapshot_date} cache update failed" for event in snapshot_events})
+
+            if symbols:
+                result = await self.validation_service.invalidate_cache(sorted(symbols))
+                if result.success:
+                    stats["symbols_invalidated"] += len(symbols)
+                else:
+                    failed.update({event.id: result.error for target in symbols.values() for event in target})
+
+            now = datetime.now(timezone.utc)
+            for event in events:
+                if event.id in failed:
+                    event.attempts += 1
+                    event.last_error = failed[event.id]
+                    event.next_attempt_at = now + timedelta(
+                        seconds=self.retry_backoff_seconds * 2 ** (event.attempts - 1)
+                    )
+                else:
+                    event.processed_at = now
+            self.db.commit()
+
+            if failed:
+                logger.warning(f"Cache outbox: {len(failed)} of {len(events)} events failed, kept for retry")
+
+            return ServiceResult(
+                success=not failed,
+                data={"events": len(events), "failed": len(failed), **stats},
+                error=f"{len(failed)} cache outbox events failed" if failed else None,
+                message=f"Dispatched {len(events) - len(failed)} of {len(events)} cache outbox events",
+                metadata={"universe_id": universe_id, "batch_size": self.batch_size, "batch_full": len(events) == self.batch_size}
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Cache outbox dispatch failed: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                message="Failed to dispatch cache outbox events"
+            )
+
+    async def _apply_snapshot(self, universe_id: str, snapshot_date: str) -> Tuple[bool, str]:
+        """Rewrite a snapshot's cache entries from the database, or drop them if it is gone"""
+        snapshot = self.db.query(UniverseSnapshot).filter(
+            and_(
+                UniverseSnapshot.universe_id == universe_id,
+                UniverseSnapshot.snapshot_date == date.fromisoformat(snapshot_date)
+            )
+        ).first()
+
+        if snapshot is None:
+            return await self.temporal_cache.remove_timeline_segment(universe_id, snapshot_date), "segments_removed"
+
+        snapshot_data = snapshot.to_dict()
+        applied = await self.temporal_cache.add_timeline_segment(universe_id, snapshot_data)
+        if applied and hasattr(self.temporal_cache, "cache_snapshot"):
+            applied = await self.temporal_cache.cache_snapshot(
+                universe_id=universe_id,
+                snapshot_date=snapshot_date,
+                snapshot_data=snapshot_data
+            )
+        return applied, "segments_refreshed"
+
+    def purge_processed(self, retention_hours: int = 24) -> int:
+        """Delete events processed more than retention_hours ago, returns the count"""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+        deleted = self.db.query(CacheOutboxEvent).filter(
+            CacheOutboxEvent.processed_at < cutoff
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,151 @@
+"""
+Persisted per-series cache for economic indicators
+
+Each indicator series is stored once with its last observation date, so a
+refresh only asks upstream for observations after that date. Series are not
+re-checked upstream more often than their refresh interval, since macro data
+changes at most daily.
+"""
+
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..models.market_data import EconomicSeries, EconomicObservation
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between upstream checks per series
+DEFAULT_REFRESH_INTERVAL = timedelta(hours=24)
+SERIES_REFRESH_INTERVALS: Dict[str, timedelta] = {
+    "gdp": timedelta(hours=24),
+    "inflation": timedelta(hours=24),
+    "unemployment": timedelta(hours=24),
+    "interest_rates": timedelta(hours=6),
+    "vix": timedelta(hours=1),
+}
+
+
+def _default_session_factory() -> Session:
+    from ..core.database import SessionLocal
+    return SessionLocal()
+
+
+def _utc(timestamp: Optional[datetime]) -> Optional[datetime]:
+    if timestamp is None or timestamp.tzinfo:
+        return timestamp
+    return timestamp.replace(tzinfo=timezone.utc)
+
+
+def frame_to_observations(frame: pd.DataFrame) -> Dict[date, Dict[str, Any]]:
+    """Provider frame -> {observation date: JSON-safe column values}"""
+    if frame is None or frame.empty:
+        return {}
+
+    if "date" in frame.columns:
+        frame = frame.set_index("date")
+    dates = pd.to_datetime(frame.index).date
+    records = json.loads(frame.reset_index(drop=True).to_json(orient="records", date_format="iso"))
+    return dict(zip(dates, records))
+
+
+class EconomicSeriesStore:
+    """Database-backed economic series cache with last-observation tracking"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        refresh_intervals: Optional[Dict[str, timedelta]] = None
+    ):
+        """
+        Initialize economic series store
+
+        Args:
+            session_factory: Callable returning a new database session (defaults to SessionLocal)
+            refresh_intervals: Minimum time between upstream checks per series
+        """
+        self.session_factory = session_factory or _default_session_factory
+        self.refresh_intervals = {**SERIES_REFRESH_INTERVALS, **(refresh_intervals or {})}
+
+    def get_state(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """Refresh state of a series (None if never stored)"""
+        with self.session_factory() as db:
+            series = db.query(EconomicSeries).filter(EconomicSeries.series_id == series_id).first()
+            if series is None:
+                return None
+            return {
+                "last_observation_date": series.last_observation_date,
+                "last_checked_at": _utc(series.last_checked_at),
+                "observation_count": series.observation_count or 0
+            }
+
+    def needs_refresh(self, series_id: str, state: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+        """True if upstream should be asked for new observations"""
+        if state is None or state["last_checked_at"] is None:
+            return True
+        now = now or datetime.now(timezone.utc)
+        interval = self.refresh_intervals.get(series_id, DEFAULT_REFRESH_INTERVAL)
+        return now - state["last_checked_at"] >= interval
+
+    def merge_observations(self, series_id: str, frame: pd.DataFrame, provider: Optional[str] = None) -> int:
+        """
+        Upsert observations and mark the series as checked
+
+        Returns:
+            Number of observations inserted or revised
+        """
+        observations = frame_to_observations(frame)
+
+        with self.session_factory() as db:
+            series = db.query(EconomicSeries).filter(EconomicSeries.series_id == series_id).first()
+            if series is None:
+                series = EconomicSeries(series_id=series_id, observation_count=0)
+                db.add(series)
+
+            changed = 0
+            if observations:
+                existing = {
+                    row.observation_date: row
+                    for row in db.query(EconomicObservation).filter(
+                        EconomicObservation.series_id == series_id,
+                        EconomicObservation.observation_date >= min(observations)
+                    )
+                }
+                for observation_date, values in observations.items():
+                    row = existing.get(observation_date)
+                    if row is None:
+                        db.add(EconomicObservation(series_id=series_id, observation_date=observation_date, values=values))
+                        series.observation_count = (series.observation_count or 0) + 1
+                        changed += 1
+                    elif row.values != values:
+                        row.values = values
+                        changed += 1
+
+                latest = max(observations)
+                if series.last_observation_date is None or latest > series.last_observation_date:
+                    series.last_observation_date = latest
+
+            series.provider = provider or series.provider
+            series.last_checked_at = datetime.now(timezone.utc)
+            db.commit()
+
+        return changed
+
+    def load_series(self, series_id: str) -> pd.DataFrame:
+        """Stored observations as a date-indexed frame"""
+        with self.session_factory() as db:
+            rows = db.query(EconomicObservation.observation_date, EconomicObservation.values).filter(
+                EconomicObservation.series_id == series_id,
+                EconomicObservation.is_active.is_(True)
+            ).order_by(EconomicObservation.observation_date).all()
+
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            [row.values for row in rows],
+            index=pd.DatetimeIndex([row.observation_date for row in rows], name="date")
+        )
@@ -0,0 +1,244 @@
+"""
+Bulk fundamentals refresh
+
+Pulls fundamentals for many symbols per upstream call, writes them to the
+dated fundamentals_snapshots table in one bulk upsert and copies the latest
+values onto Asset with a single set-wise UPDATE. Screening then reads local
+data only.
+"""
+
+import json
+import logging
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from ..models.asset import Asset
+from ..models.market_data import FundamentalsSnapshot
+from .interfaces.base import ServiceResult
+
+logger = logging.getLogger(__name__)
+
+# Provider field names per snapshot column, first match wins
+FIELD_ALIASES: Dict[str, List[str]] = {
+    "market_cap": ["market_cap", "marketCap"],
+    "pe_ratio": ["pe_ratio", "pe_ratio_ttm", "trailingPE", "trailing_pe"],
+    "dividend_yield": ["dividend_yield", "dividend_yield_ttm", "dividendYield"],
+    "roic": ["return_on_invested_capital", "roic"],
+    "sector": ["sector"],
+    "industry": ["industry", "industry_category"],
+}
+
+# Rows per INSERT statement (keeps bound parameters under driver limits)
+UPSERT_CHUNK_SIZE = 500
+
+# Asset column limits: pe_ratio DECIMAL(8, 2), dividend_yield DECIMAL(5, 4)
+MAX_PE_RATIO = 999999.99
+MAX_DIVIDEND_YIELD = 9.9999
+
+
+def _first(raw: Dict[str, Any], column: str) -> Any:
+    for alias in FIELD_ALIASES[column]:
+        value = raw.get(alias)
+        if value is not None:
+            return value
+    return None
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number == number else None  # NaN -> None
+
+
+def normalize_fundamentals(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Snapshot columns from a provider payload, clipped to what Asset can store"""
+    market_cap = _number(_first(raw, "market_cap"))
+    pe_ratio = _number(_first(raw, "pe_ratio"))
+    dividend_yield = _number(_first(raw, "dividend_yield"))
+
+    if dividend_yield is not None and dividend_yield > 1:
+        dividend_yield /= 100  # Some providers report percent
+    if pe_ratio is not None and not (0 < pe_ratio <= MAX_PE_RATIO):
+        pe_ratio = None
+    if dividend_yield is not None and not (0 <= dividend_yield <= MAX_DIVIDEND_YIELD):
+        dividend_yield = None
+
+    return {
+        "market_cap": int(market_cap) if market_cap is not None and market_cap > 0 else None,
+        "pe_ratio": round(pe_ratio, 2) if pe_ratio is not None else None,
+        "dividend_yield": round(dividend_yield, 4) if dividend_yield is not None else None,
+        "roic": _number(_first(raw, "roic")),
+        "sector": _first(raw, "sector"),
+        "industry": _first(raw, "industry"),
+    }
+
+
+def _insert_for(db: Session):
+    """Dialect insert supporting ON CONFLICT upserts"""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+class FundamentalsRefreshService:
+    """Bulk fundamentals refresh into fundamentals_snapshots and Asset"""
+
+    def __init__(self, db: Session, provider=None, batch_size: int = 50):
+        """
+        Initialize fundamentals refresh service
+
+        Args:
+            db: Database session
+            provider: Provider exposing fetch_fundamentals_bulk (defaults to OpenBB)
+            batch_size: Symbols per upstream call
+        """
+        self.db = db
+        self.batch_size = batch_size
+        if provider is None:
+            from .implementations.openbb_data_provider import OpenBBDataProvider
+            provider = OpenBBDataProvider()
+        self.provider = provider
+
+    def _validated_symbols(self) -> List[str]:
+        rows = self.db.query(Asset.symbol).filter(
+            Asset.is_active.is_(True),
+            Asset.is_validated.is_(True)
+        ).order_by(Asset.symbol).all()
+        return [row.symbol for row in rows]
+
+    async def refresh(
+        self,
+        symbols: Optional[List[str]] = None,
+        snapshot_date: Optional[date] = None
+    ) -> ServiceResult[Dict[str, Any]]:
+        """
+        Refresh fundamentals snapshots and Asset metrics
+
+        Args:
+            symbols: Symbols to refresh (defaults to all validated active assets)
+            snapshot_date: Snapshot date (defaults to today, UTC)
+        """
+        snapshot_date = snapshot_date or datetime.now(timezone.utc).date()
+        try:
+            symbols = symbols if symbols is not None else self._validated_symbols()
+            if not symbols:
+                return ServiceResult(success=True, data={"snapshots": 0, "assets_updated": 0},
+                                     message="No symbols to refresh")
+
+            fetched = await self.provider.fetch_fundamentals_bulk(symbols, batch_size=self.batch_size)
+            if not fetched.success or not fetched.data:
+                return ServiceResult(
+                    success=False,
+                    error=fetched.error or "No fundamentals returned",
+                    message="Bulk fundamentals fetch failed",
+                    metadata={"symbols_requested": len(symbols)}
+                )
+
+            provider_name = (fetched.metadata or {}).get("provider")
+            written = self._upsert_snapshots(fetched.data, snapshot_date, provider_name)
+            assets_updated = self._update_assets(snapshot_date)
+            self.db.commit()
+
+            return ServiceResult(
+                success=True,
+                data={
+                    "snapshots": written,
+                    "assets_updated": assets_updated,
+                    "snapshot_date": snapshot_date.isoformat()
+                },
+                message=f"Refreshed fundamentals for {written}/{len(symbols)} symbols",
+                metadata={
+                    "symbols_requested": len(symbols),
+                    "missing_symbols": [symbol for symbol in symbols if symbol.upper() not in fetched.data]
+                }
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Fundamentals refresh failed: {e}")
+            return ServiceResult(success=False, error=str(e), message="Fundamentals refresh failed")
+
+    def _upsert_snapshots(self, payloads: Dict[str, Dict[str, Any]], snapshot_date: date, provider: Optional[str]) -> int:
+        """Write snapshots with bulk INSERT ... ON CONFLICT DO UPDATE statements"""
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "symbol": symbol.upper(),
+                "snapshot_date": snapshot_date,
+                "provider": provider,
+                "data": json.loads(json.dumps(raw, default=str)),
+                "created_at": now,
+                "updated_at": now,
+                "is_active": True,
+                **normalize_fundamentals(raw),
+            }
+            for symbol, raw in payloads.items()
+        ]
+        if not rows:
+            return 0
+
+        insert = _insert_for(self.db)
+        for index in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            statement = insert(FundamentalsSnapshot).values(rows[index:index + UPSERT_CHUNK_SIZE])
+            statement = statement.on_conflict_do_update(
+                index_elements=["symbol", "snapshot_date"],
+                set_={
+                    column: statement.excluded[column]
+                    for column in ["market_cap", "pe_ratio", "dividend_yield", "roic",
+                                   "sector", "industry", "provider", "data", "updated_at"]
+                }
+            )
+            self.db.execute(statement)
+        return len(rows)
+
+    def _update_assets(self, snapshot_date: date) -> int:
+        """Copy snapshot metrics onto Asset in a single set-wise UPDATE"""
+        def snapshot_value(column):
+            # Keep the current value when the provider did not report one
+            latest = select(column).where(
+                FundamentalsSnapshot.symbol == Asset.symbol,
+                FundamentalsSnapshot.snapshot_date == snapshot_date
+            ).scalar_subquery()
+            return func.coalesce(latest, getattr(Asset, column.key))
+
+        statement = (
+            update(Asset)
+            .where(Asset.symbol.in_(
+                select(FundamentalsSnapshot.symbol).where(FundamentalsSnapshot.snapshot_date == snapshot_date)
+            ))
+            .values(
+                market_cap=snapshot_value(FundamentalsSnapshot.market_cap),
+                pe_ratio=snapshot_value(FundamentalsSnapshot.pe_ratio),
+                dividend_yield=snapshot_value(FundamentalsSnapshot.dividend_yield),
+                updated_at=datetime.now(timezone.utc)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(statement).rowcount
+
+
+def latest_fundamentals(db: Session, symbols: List[str]) -> Dict[str, FundamentalsSnapshot]:
+    """Most recent stored snapshot per symbol"""
+    if not symbols:
+        return {}
+
+    latest = (
+        select(FundamentalsSnapshot.symbol, func.max(FundamentalsSnapshot.snapshot_date).label("snapshot_date"))
+        .where(FundamentalsSnapshot.symbol.in_(symbols), FundamentalsSnapshot.is_active.is_(True))
+        .group_by(FundamentalsSnapshot.symbol)
+        .subquery()
+    )
+    rows = db.query(FundamentalsSnapshot).join(
+        latest,
+        (FundamentalsSnapshot.symbol == latest.c.symbol) & (FundamentalsSnapshot.snapshot_date == latest.c.snapshot_date)
+    ).all()
+    return {row.symbol: row for row in rows}
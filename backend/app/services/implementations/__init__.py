@@ -3,10 +3,13 @@
 from .openbb_data_provider import OpenBBDataProvider, OPENBB_AVAILABLE
 from .yahoo_data_provider import YahooDataProvider
 from .alpha_vantage_provider import AlphaVantageProvider
+from .record_replay_provider import RecordReplayDataProvider, RecordReplayMode
 
 __all__ = [
     'OpenBBDataProvider',
     'YahooDataProvider', 
     'AlphaVantageProvider',
+    'RecordReplayDataProvider',
+    'RecordReplayMode',
     'OPENBB_AVAILABLE'
 ]
\ No newline at end of file
@@ -3,25 +3,47 @@ import aiohttp
 from typing import List, Dict, Optional, Any
 from datetime import date, datetime, timezone, timedelta
 import logging
-from alpha_vantage.timeseries import TimeSeries
-from alpha_vantage.fundamentaldata import FundamentalData
-import pandas as pd
 import os
+import threading
+import time
 
-from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult
+from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult, SYMBOL_NOT_FOUND
+from .provider_cache import ProviderCache
+from ...core.http_pool import HttpPoolRegistry, get_http_pool
 
 logger = logging.getLogger(__name__)
 
+ALPHA_VANTAGE_HOST = "www.alphavantage.co"
+ALPHA_VANTAGE_URL = f"https://{ALPHA_VANTAGE_HOST}/query"
+
+# Request schedule shared by every provider instance using the same API key -
+# the free tier budget is per key, not per provider instance
+_schedule_lock = threading.Lock()
+_next_request_slot: Dict[str, float] = {}
+
+
+class AlphaVantageError(Exception):
+    """Alpha Vantage answered with an error or rate-limit notice instead of data"""
+
+
 class AlphaVantageProvider(IDataProvider):
-    """Alpha Vantage implementation as fallback data provider"""
+    """Alpha Vantage implementation as fallback data provider (native async HTTP client)"""
     
-    def __init__(self, api_key: Optional[str] = None, requests_per_minute: int = 5):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 5,
+        cache: Optional[ProviderCache] = None,
+        http_pool: Optional[HttpPoolRegistry] = None
+    ):
         """
         Initialize Alpha Vantage data provider
         
         Args:
             api_key: Alpha Vantage API key (default from environment)
             requests_per_minute: Rate limit for requests (free tier: 5/min, 500/day)
+            cache: Shared provider cache (defaults to an in-process only cache)
+            http_pool: Connection-pool registry (defaults to the application-wide registry)
         """
         self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
         if not self.api_key:
@@ -29,30 +51,118 @@ class AlphaVantageProvider(IDataProvider):
         
         self.requests_per_minute = requests_per_minute
         self.request_interval = 60.0 / requests_per_minute  # Seconds between requests
-        self._last_request_time = 0.0
-        
-        # Initialize Alpha Vantage clients
-        if self.api_key:
-            self.timeseries = TimeSeries(key=self.api_key, output_format='pandas')
-            self.fundamentals = FundamentalData(key=self.api_key, output_format='pandas')
+        self.cache = cache or ProviderCache(namespace="alpha_vantage")
+        self.http_pool = http_pool or get_http_pool()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled keep-alive session for the Alpha Vantage host"""
+        return await self.http_pool.get_session(ALPHA_VANTAGE_HOST)
     
     async def _rate_limit(self):
-        """Respect Alpha Vantage rate limits (5 requests per minute for free tier)"""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last_request = current_time - self._last_request_time
-        if time_since_last_request < self.request_interval:
-            wait_time = self.request_interval - time_since_last_request
-            await asyncio.sleep(wait_time)
-        self._last_request_time = asyncio.get_event_loop().time()
+        """Reserve the next request slot in the per-key schedule shared by all instances"""
+        with _schedule_lock:
+            now = time.monotonic()
+            slot = max(now, _next_request_slot.get(self.api_key, 0.0))
+            _next_request_slot[self.api_key] = slot + self.request_interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
     
-    async def _run_blocking_call(self, func, *args, **kwargs):
-        """Run blocking Alpha Vantage calls in thread executor"""
-        loop = asyncio.get_event_loop()
+    async def _query(self, operation: str, function: str, **params) -> Dict[str, Any]:
+        """
+        Cached, rate-limited Alpha Vantage query returning the parsed JSON payload
+        
+        Cache hits skip the rate limiter entirely, which matters with a 5 requests/minute budget.
+        """
+        cache_key = self.cache.make_key(operation, function=function, **params)
+        cached_payload = await self.cache.aget(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+        
+        await self._rate_limit()
+        session = await self._get_session()
+        
+        async with session.get(
+            ALPHA_VANTAGE_URL,
+            params={"function": function, "apikey": self.api_key, **params}
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json(content_type=None)
+        
+        if not isinstance(payload, dict):
+            raise AlphaVantageError(f"Unexpected {function} response format")
+        for notice in ("Error Message", "Note", "Information"):
+            if notice in payload:
+                raise AlphaVantageError(payload[notice])
+        
+        if payload:
+            await self.cache.aset(cache_key, payload)
+        return payload
+    
+    @staticmethod
+    def _parse_number(value: Any) -> Optional[float]:
+        """Parse Alpha Vantage numeric strings ('None' and '-' mean missing)"""
+        if value in (None, "", "None", "-"):
+            return None
         try:
-            return await loop.run_in_executor(None, func, *args, **kwargs)
-        except Exception as e:
-            logger.error(f"Alpha Vantage API call failed: {e}")
-            raise
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    
+    def _parse_time_series(
+        self,
+        symbol: str,
+        payload: Dict[str, Any],
+        metadata: Dict[str, Any]
+    ) -> List[MarketData]:
+        """Convert a TIME_SERIES_* payload into MarketData bars in ascending time order"""
+        series_key = next((key for key in payload if "Time Series" in key), None)
+        if series_key is None:
+            return []
+        
+        bars = []
+        for timestamp, values in payload[series_key].items():
+            close = float(values.get("4. close", 0))
+            bars.append(MarketData(
+                symbol=symbol,
+                timestamp=datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc),
+                open=float(values.get("1. open", 0)),
+                high=float(values.get("2. high", 0)),
+                low=float(values.get("3. low", 0)),
+                close=close,
+                volume=int(float(values.get("6. volume", values.get("5. volume", 0)))),
+                adjusted_close=float(values.get("5. adjusted close", close)) if "6. volume" in values else close,
+                metadata=dict(metadata)
+            ))
+        
+        bars.sort(key=lambda bar: bar.timestamp)
+        return bars
+    
+    def _parse_overview(self, symbol: str, overview: Dict[str, Any]) -> Optional[AssetInfo]:
+        """Convert an OVERVIEW payload into AssetInfo (None if the symbol is unknown)"""
+        if not overview or "Symbol" not in overview:
+            return None
+        
+        return AssetInfo(
+            symbol=symbol,
+            name=overview.get('Name', symbol),
+            sector=overview.get('Sector'),
+            industry=overview.get('Industry'),
+            market_cap=self._parse_number(overview.get('MarketCapitalization')),
+            pe_ratio=self._parse_number(overview.get('PERatio')),
+            dividend_yield=self._parse_number(overview.get('DividendYield')),
+            is_valid=True,
+            last_updated=datetime.now(timezone.utc),
+            metadata={
+                "country": overview.get('Country'),
+                "currency": overview.get('Currency'),
+                "exchange": overview.get('Exchange'),
+                "description": overview.get('Description', '')[:200] if overview.get('Description') else None,
+                "52_week_high": overview.get('52WeekHigh'),
+                "52_week_low": overview.get('52WeekLow'),
+                "provider": "alpha_vantage"
+            }
+        )
     
     async def fetch_historical_data(
         self,
@@ -85,40 +195,23 @@ class AlphaVantageProvider(IDataProvider):
             
             for symbol in symbols:
                 try:
-                    await self._rate_limit()
+                    payload = await self._query(
+                        "historical_data",
+                        av_function,
+                        symbol=symbol,
+                        **({"outputsize": "full"} if av_function == "TIME_SERIES_DAILY_ADJUSTED" else {})
+                    )
                     
-                    if av_function == "TIME_SERIES_DAILY_ADJUSTED":
-                        data, metadata = await self._run_blocking_call(
-                            self.timeseries.get_daily_adjusted, symbol, outputsize='full'
-                        )
-                    elif av_function == "TIME_SERIES_WEEKLY_ADJUSTED":
-                        data, metadata = await self._run_blocking_call(
-                            self.timeseries.get_weekly_adjusted, symbol
-                        )
-                    elif av_function == "TIME_SERIES_MONTHLY_ADJUSTED":
-                        data, metadata = await self._run_blocking_call(
-                            self.timeseries.get_monthly_adjusted, symbol
-                        )
+                    bars = self._parse_time_series(
+                        symbol, payload, {"source": "alpha_vantage", "interval": interval}
+                    )
+                    
+                    # Filter data by date range
+                    range_start = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+                    range_end = datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
+                    market_data = [bar for bar in bars if range_start <= bar.timestamp <= range_end]
                     
-                    if data is not None and not data.empty:
-                        # Filter data by date range
-                        mask = (data.index >= pd.Timestamp(start_date)) & (data.index <= pd.Timestamp(end_date))
-                        filtered_data = data[mask]
-                        
-                        market_data = []
-                        for timestamp, row in filtered_data.iterrows():
-                            market_data.append(MarketData(
-                                symbol=symbol,
-                                timestamp=timestamp.tz_localize(timezone.utc) if timestamp.tz is None else timestamp.astimezone(timezone.utc),
-                                open=float(row.get('1. open', row.get('1. Open', 0))),
-                                high=float(row.get('2. high', row.get('2. High', 0))),
-                                low=float(row.get('3. low', row.get('3. Low', 0))),
-                                close=float(row.get('4. close', row.get('4. Close', 0))),
-                                volume=int(row.get('6. volume', row.get('6. Volume', 0))),
-                                adjusted_close=float(row.get('5. adjusted close', row.get('5. Adjusted Close', 0))),
-                                metadata={"source": "alpha_vantage", "interval": interval}
-                            ))
-                        
+                    if bars:
                         result[symbol] = market_data
                     else:
                         errors.append(f"No historical data found for {symbol}")
@@ -169,29 +262,17 @@ class AlphaVantageProvider(IDataProvider):
             
             for symbol in symbols:
                 try:
-                    await self._rate_limit()
-                    
                     # Get intraday data for most recent prices
-                    data, metadata = await self._run_blocking_call(
-                        self.timeseries.get_intraday, symbol, interval='5min', outputsize='compact'
+                    payload = await self._query(
+                        "real_time", "TIME_SERIES_INTRADAY", symbol=symbol, interval="5min", outputsize="compact"
+                    )
+                    bars = self._parse_time_series(
+                        symbol, payload, {"source": "alpha_vantage", "data_type": "intraday"}
                     )
                     
-                    if data is not None and not data.empty:
+                    if bars:
                         # Get the most recent data point
-                        latest_timestamp = data.index[0]  # Most recent
-                        latest_row = data.iloc[0]
-                        
-                        result[symbol] = MarketData(
-                            symbol=symbol,
-                            timestamp=latest_timestamp.tz_localize(timezone.utc) if latest_timestamp.tz is None else latest_timestamp.astimezone(timezone.utc),
-                            open=float(latest_row.get('1. open', 0)),
-                            high=float(latest_row.get('2. high', 0)),
-                            low=float(latest_row.get('3. low', 0)),
-                            close=float(latest_row.get('4. close', 0)),
-                            volume=int(latest_row.get('5. volume', 0)),
-                            adjusted_close=float(latest_row.get('4. close', 0)),  # Use close as adjusted for real-time
-                            metadata={"source": "alpha_vantage", "data_type": "intraday"}
-                        )
+                        result[symbol] = bars[-1]
                     else:
                         errors.append(f"No real-time data available for {symbol}")
                 
@@ -240,37 +321,12 @@ class AlphaVantageProvider(IDataProvider):
             
             for symbol in symbols:
                 try:
-                    await self._rate_limit()
-                    
                     # Get company overview
-                    overview, _ = await self._run_blocking_call(
-                        self.fundamentals.get_company_overview, symbol
-                    )
+                    overview = await self._query("asset_info", "OVERVIEW", symbol=symbol)
+                    asset_info = self._parse_overview(symbol, overview)
                     
-                    if overview is not None and not overview.empty:
-                        # Alpha Vantage returns a single row DataFrame for company overview
-                        data = overview.iloc[0] if len(overview) > 0 else overview.squeeze()
-                        
-                        result[symbol] = AssetInfo(
-                            symbol=symbol,
-                            name=data.get('Name', symbol),
-                            sector=data.get('Sector'),
-                            industry=data.get('Industry'),
-                            market_cap=float(data.get('MarketCapitalization', 0)) if data.get('MarketCapitalization') and data.get('MarketCapitalization') != 'None' else None,
-                            pe_ratio=float(data.get('PERatio', 0)) if data.get('PERatio') and data.get('PERatio') != 'None' else None,
-                            dividend_yield=float(data.get('DividendYield', 0)) if data.get('DividendYield') and data.get('DividendYield') != 'None' else None,
-                            is_valid=True,
-                            last_updated=datetime.now(timezone.utc),
-                            metadata={
-                                "country": data.get('Country'),
-                                "currency": data.get('Currency'),
-                                "exchange": data.get('Exchange'),
-                                "description": data.get('Description', '')[:200] if data.get('Description') else None,
-                                "52_week_high": data.get('52WeekHigh'),
-                                "52_week_low": data.get('52WeekLow'),
-                                "provider": "alpha_vantage"
-                            }
-                        )
+                    if asset_info is not None:
+                        result[symbol] = asset_info
                     else:
                         errors.append(f"No asset info found for {symbol}")
                         result[symbol] = AssetInfo(
@@ -331,29 +387,12 @@ class AlphaVantageProvider(IDataProvider):
             
             for symbol in symbols:
                 try:
-                    await self._rate_limit()
-                    
                     # Use company overview to validate symbol
-                    overview, _ = await self._run_blocking_call(
-                        self.fundamentals.get_company_overview, symbol
-                    )
+                    overview = await self._query("asset_info", "OVERVIEW", symbol=symbol)
+                    asset_info = self._parse_overview(symbol, overview)
                     
-                    if overview is not None and not overview.empty and len(overview) > 0:
+                    if asset_info is not None:
                         # Symbol is valid
-                        data = overview.iloc[0] if len(overview) > 0 else overview.squeeze()
-                        
-                        asset_info = AssetInfo(
-                            symbol=symbol,
-                            name=data.get('Name', symbol),
-                            sector=data.get('Sector'),
-                            industry=data.get('Industry'),
-                            market_cap=float(data.get('MarketCapitalization', 0)) if data.get('MarketCapitalization') and data.get('MarketCapitalization') != 'None' else None,
-                            pe_ratio=float(data.get('PERatio', 0)) if data.get('PERatio') and data.get('PERatio') != 'None' else None,
-                            dividend_yield=float(data.get('DividendYield', 0)) if data.get('DividendYield') and data.get('DividendYield') != 'None' else None,
-                            is_valid=True,
-                            last_updated=datetime.now(timezone.utc)
-                        )
-                        
                         result[symbol] = ValidationResult(
                             symbol=symbol,
                             is_valid=True,
@@ -369,7 +408,7 @@ class AlphaVantageProvider(IDataProvider):
                             is_valid=False,
                             provider="alpha_vantage",
                             timestamp=datetime.now(timezone.utc),
-                            error="Symbol not found or invalid",
+                            error=SYMBOL_NOT_FOUND,
                             confidence=0.0,
                             source="real_time"
                         )
@@ -504,4 +543,7 @@ class AlphaVantageProvider(IDataProvider):
                 data={"provider": "alpha_vantage", "status": "unhealthy"},
                 error=str(e),
                 message="Alpha Vantage provider is not accessible"
-            )
\ No newline at end of file
+            )
+    
+    async def cleanup(self):
+        """Clean up resources (the pooled session is owned by the application lifespan)"""
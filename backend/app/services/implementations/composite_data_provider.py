@@ -3,9 +3,9 @@ import logging
 import time
 import json
 from datetime import date, datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, Set, Deque, Callable, Awaitable
 from concurrent.futures import ThreadPoolExecutor
-from collections import defaultdict
+from collections import defaultdict, deque
 import statistics
 
 from ..interfaces.i_composite_data_provider import (
@@ -13,6 +13,7 @@ from ..interfaces.i_composite_data_provider import (
     ProviderPriority,
     DataSource,
     FailoverStrategy,
+    RoutingPolicy,
     ConflictResolution,
     CompositeProviderConfig,
     ProviderHealth,
@@ -23,9 +24,60 @@ from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, Val
 from .openbb_data_provider import OpenBBDataProvider
 from .yahoo_data_provider import YahooDataProvider
 from .alpha_vantage_provider import AlphaVantageProvider
+from .provider_cache import ProviderCache
+from .market_data_quality import (
+    bars_to_frame,
+    build_quality_report,
+    consensus_bars,
+    cross_source_deviation,
+    is_bar_series,
+    latest_bar_source,
+    weighted_average_bars
+)
+from ...core.http_pool import HttpPoolRegistry, get_http_pool
+from ...core.redis_pool import RedisPoolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Chunk size in days per interval for range-split historical fetches. Chunks are
+# aligned to a fixed calendar grid so interior chunks (and their cache entries)
+# are shared between requests with different start dates.
+HISTORICAL_CHUNK_DAYS: Dict[str, int] = {
+    "1m": 7,
+    "5m": 30,
+    "15m": 30,
+    "30m": 30,
+    "1h": 90,
+    "1d": 730,
+    "1wk": 3650,
+    "1mo": 3650,
+}
+HISTORICAL_CHUNK_ANCHOR = date(1970, 1, 1)
+
+# Symbols per multi-symbol provider call in bulk_data_optimization
+BULK_BATCH_SIZES: Dict[str, int] = {
+    "historical_data": 20,
+    "real_time": 50,
+    "asset_info": 25,
+    "validate_symbols": 25,
+    "fundamental_data": 10,
+}
+
+# Provider accuracy/consistency priors, also used as weights for weighted-average conflict resolution
+PROVIDER_QUALITY_SCORES: Dict[DataSource, Dict[str, float]] = {
+    DataSource.OPENBB: {"accuracy": 0.95, "consistency": 0.95},
+    DataSource.YAHOO: {"accuracy": 0.90, "consistency": 0.85},
+    DataSource.ALPHA_VANTAGE: {"accuracy": 0.85, "consistency": 0.90}
+}
+
+# Estimated request pricing (USD) - marginal cost applies after the free daily allowance
+PROVIDER_PRICING: Dict[DataSource, Dict[str, float]] = {
+    DataSource.OPENBB: {"cost_per_request": 0.001, "free_requests": 0},  # OpenBB Pro estimate (hypothetical)
+    DataSource.YAHOO: {"cost_per_request": 0.0, "free_requests": 0},  # Free, rate limited
+    DataSource.ALPHA_VANTAGE: {"cost_per_request": 0.01, "free_requests": 500}  # Free tier: 500 calls/day
+}
+
+
 class CompositeDataProvider(ICompositeDataProvider):
     """
     Triple-Provider Architecture: OpenBB → Yahoo Finance → Alpha Vantage
@@ -40,7 +92,11 @@ class CompositeDataProvider(ICompositeDataProvider):
         alpha_vantage_api_key: Optional[str] = None,
         enable_caching: bool = True,
         cache_ttl_seconds: int = 300,
-        max_workers: int = 10
+        max_workers: int = 10,
+        redis_client=None,
+        redis_pool: Optional[RedisPoolRegistry] = None,
+        http_pool: Optional[HttpPoolRegistry] = None,
+        providers: Optional[Dict[DataSource, IDataProvider]] = None
     ):
         """
         Initialize composite data provider with all three providers
@@ -51,22 +107,34 @@ class CompositeDataProvider(ICompositeDataProvider):
             enable_caching: Enable result caching for performance
             cache_ttl_seconds: Cache TTL in seconds
             max_workers: Maximum concurrent operations
+            redis_client: Optional binary redis.asyncio client for the shared cache layer
+            redis_pool: Redis pool registry backing the shared cache layer instead of
+                a fixed client (clients follow the running event loop)
+            http_pool: Connection-pool registry shared by the providers (defaults to the application-wide registry)
+            providers: Provider instances to use instead of the live providers
+                (e.g. record/replay providers for offline load and benchmark runs)
         """
+        self.http_pool = http_pool or get_http_pool()
+        
         # Initialize individual providers
-        self.providers: Dict[DataSource, IDataProvider] = {
+        self.providers: Dict[DataSource, IDataProvider] = providers if providers is not None else {
             DataSource.OPENBB: OpenBBDataProvider(
                 api_key=openbb_api_key,
                 enable_pro_features=bool(openbb_api_key),
                 max_workers=3,
-                request_delay=0.2
+                request_delay=0.2,
+                cache=ProviderCache(namespace="openbb", redis_client=redis_client, redis_pool=redis_pool)
             ),
             DataSource.YAHOO: YahooDataProvider(
                 max_workers=5,
-                request_delay=0.1
+                request_delay=0.1,
+                cache=ProviderCache(namespace="yahoo", redis_client=redis_client, redis_pool=redis_pool)
             ),
             DataSource.ALPHA_VANTAGE: AlphaVantageProvider(
                 api_key=alpha_vantage_api_key,
-                requests_per_minute=5  # Alpha Vantage has stricter limits
+                requests_per_minute=5,  # Alpha Vantage has stricter limits
+                cache=ProviderCache(namespace="alpha_vantage", redis_client=redis_client, redis_pool=redis_pool),
+                http_pool=self.http_pool
             )
         }
         
@@ -97,6 +165,18 @@ class CompositeDataProvider(ICompositeDataProvider):
         self.failure_counts: Dict[DataSource, int] = defaultdict(int)
         self.success_counts: Dict[DataSource, int] = defaultdict(int)
         
+        # Sliding window of (recorded_at monotonic, response_time_ms, success) per
+        # (provider, operation) for SLA routing, bounded by count and by age
+        self.operation_stats: Dict[Tuple[DataSource, str], Deque[Tuple[float, float, bool]]] = defaultdict(
+            lambda: deque(maxlen=self.config.routing_window_size)
+        )
+        
+        # Requests per provider on the current UTC day (free allowances are daily)
+        # and estimated spend accumulated request by request
+        self.daily_request_counts: Dict[DataSource, int] = defaultdict(int)
+        self.usage_day: date = datetime.now(timezone.utc).date()
+        self.estimated_costs: Dict[DataSource, float] = defaultdict(float)
+        
         # Circuit breakers - initialize with default settings for all providers
         self.circuit_breakers: Dict[DataSource, Dict[str, Any]] = {
             source: {
@@ -109,8 +189,17 @@ class CompositeDataProvider(ICompositeDataProvider):
             for source in DataSource
         }
         
-        # Caching
-        self.cache: Dict[str, Tuple[Any, datetime]] = {} if enable_caching else None
+        # Hedged requests - rolling window of hedge-eligible requests (True = hedge fired)
+        self.hedge_window: Deque[bool] = deque(maxlen=self.config.hedge_window_size)
+        self.hedge_stats: Dict[str, int] = defaultdict(int)
+        
+        # Caching - config.cache_ttl_seconds caps the per-operation TTLs
+        self.cache: Optional[ProviderCache] = ProviderCache(
+            namespace="composite",
+            default_ttl=cache_ttl_seconds,
+            redis_client=redis_client,
+            redis_pool=redis_pool
+        ) if enable_caching else None
         
         # Thread pool for concurrent operations
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
@@ -123,28 +212,20 @@ class CompositeDataProvider(ICompositeDataProvider):
         )
     
     def _get_cache_key(self, operation: str, **kwargs) -> str:
-        """Generate cache key for operation and parameters"""
-        key_data = {"op": operation, **kwargs}
-        return f"composite_{hash(json.dumps(key_data, sort_keys=True, default=str))}"
+        """Generate process-stable cache key for operation and parameters"""
+        return self.cache.make_key(operation, **kwargs)
     
-    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
+    async def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Get cached result if available and not expired"""
-        if not self.cache or cache_key not in self.cache:
-            return None
-        
-        data, timestamp = self.cache[cache_key]
-        ttl = timedelta(seconds=self.config.cache_ttl_seconds)
-        
-        if datetime.now(timezone.utc) - timestamp > ttl:
-            del self.cache[cache_key]
+        if self.cache is None:
             return None
-        
-        return data
+        return await self.cache.aget(cache_key)
     
-    def _cache_result(self, cache_key: str, data: Any):
-        """Cache operation result"""
-        if self.cache:
-            self.cache[cache_key] = (data, datetime.now(timezone.utc))
+    async def _cache_result(self, cache_key: str, operation: str, data: Any):
+        """Cache operation result with its per-operation TTL"""
+        if self.cache is not None:
+            ttl = min(self.cache.ttl_for(operation), self.config.cache_ttl_seconds)
+            await self.cache.aset(cache_key, data, ttl=ttl)
     
     def _is_provider_available(self, source: DataSource) -> bool:
         """Check if provider is available (not circuit broken)"""
@@ -172,6 +253,12 @@ class CompositeDataProvider(ICompositeDataProvider):
         success: bool
     ):
         """Record provider performance metrics"""
+        self.operation_stats[(source, operation)].append((time.monotonic(), response_time, success))
+        
+        # Charge the request against today's free allowance before counting it
+        self.estimated_costs[source] += self._marginal_request_cost(source)
+        self.daily_request_counts[source] += 1
+        
         # Update response times
         self.response_times[source].append(response_time)
         if len(self.response_times[source]) > 100:
@@ -210,6 +297,86 @@ class CompositeDataProvider(ICompositeDataProvider):
         health.last_failure = datetime.now(timezone.utc) if not success else health.last_failure
         health.consecutive_failures = health.consecutive_failures + 1 if not success else 0
     
+    def _requests_today(self, source: DataSource) -> int:
+        """Requests made to a provider on the current UTC day"""
+        today = datetime.now(timezone.utc).date()
+        if today != self.usage_day:
+            self.daily_request_counts.clear()
+            self.usage_day = today
+        return self.daily_request_counts[source]
+    
+    def _marginal_request_cost(self, source: DataSource) -> float:
+        """Estimated cost of one more request to a provider"""
+        pricing = PROVIDER_PRICING.get(source, {"cost_per_request": 0.0, "free_requests": 0})
+        return pricing["cost_per_request"] if self._requests_today(source) >= pricing["free_requests"] else 0.0
+    
+    def _routing_stats(self, source: DataSource, operation: str) -> Dict[str, Any]:
+        """p95 latency and error rate of a provider for an operation over the sliding window"""
+        window = self.operation_stats.get((source, operation))
+        
+        # Expired samples are dropped even if the provider is no longer called;
+        # with too few left it is treated as unmeasured and gets traffic again
+        cutoff = time.monotonic() - self.config.routing_window_seconds
+        while window and window[0][0] < cutoff:
+            window.popleft()
+        
+        if not window:
+            return {"samples": 0, "p95_latency_ms": None, "error_rate": None}
+        
+        latencies = [latency for _, latency, _ in window]
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) >= 2 else latencies[0]
+        return {
+            "samples": len(window),
+            "p95_latency_ms": p95,
+            "error_rate": sum(1 for *_, success in window if not success) / len(window)
+        }
+    
+    def _sla_for(self, operation: str) -> Dict[str, float]:
+        """Latency/error SLA for an operation"""
+        override = self.config.operation_slas.get(operation, {})
+        return {
+            "p95_latency_ms": override.get("p95_latency_ms", self.config.sla_p95_latency_ms),
+            "max_error_rate": override.get("max_error_rate", self.config.sla_max_error_rate)
+        }
+    
+    def _route_provider_chain(
+        self,
+        operation: str,
+        provider_chain: List[Tuple[ProviderPriority, DataSource]]
+    ) -> Tuple[List[Tuple[ProviderPriority, DataSource]], Dict[str, Any]]:
+        """
+        Order providers for a request
+        
+        Under COST_LATENCY, providers meeting the operation SLA (or without enough
+        samples yet) come first, cheapest then fastest; providers missing the SLA
+        follow in chain order, so failover is kept.
+        """
+        if self.config.routing_policy != RoutingPolicy.COST_LATENCY:
+            return provider_chain, {"policy": RoutingPolicy.PRIORITY.value}
+        
+        sla = self._sla_for(operation)
+        eligible = []
+        violating = []
+        
+        for index, (priority, source) in enumerate(provider_chain):
+            stats = self._routing_stats(source, operation)
+            if stats["samples"] < self.config.routing_min_samples:
+                # Unknown providers are assumed to sit at the SLA until measured
+                eligible.append((self._marginal_request_cost(source), sla["p95_latency_ms"], index, priority, source))
+            elif stats["p95_latency_ms"] <= sla["p95_latency_ms"] and stats["error_rate"] <= sla["max_error_rate"]:
+                eligible.append((self._marginal_request_cost(source), stats["p95_latency_ms"], index, priority, source))
+            else:
+                violating.append((priority, source))
+        
+        routed = [(priority, source) for *_, priority, source in sorted(eligible, key=lambda entry: entry[:3])]
+        routed.extend(violating)
+        
+        return routed, {
+            "policy": RoutingPolicy.COST_LATENCY.value,
+            "order": [source.value for _, source in routed],
+            "sla_violations": [source.value for _, source in violating]
+        }
+    
     async def configure_providers(
         self,
         config: CompositeProviderConfig
@@ -217,6 +384,8 @@ class CompositeDataProvider(ICompositeDataProvider):
         """Configure the composite provider with failover chain and policies"""
         try:
             self.config = config
+            if self.hedge_window.maxlen != config.hedge_window_size:
+                self.hedge_window = deque(self.hedge_window, maxlen=config.hedge_window_size)
             logger.info(f"CompositeDataProvider reconfigured: {config.provider_chain}")
             
             return ServiceResult(
@@ -288,22 +457,104 @@ class CompositeDataProvider(ICompositeDataProvider):
             
             return False, failed_result, response_time
     
+    def _get_hedge_delay_seconds(self, source: DataSource) -> float:
+        """Delay before hedging: the provider's observed p95 latency, or the configured default"""
+        samples = self.response_times[source]
+        if len(samples) >= max(self.config.hedge_min_samples, 2):
+            delay_ms = statistics.quantiles(samples, n=20)[-1]
+        else:
+            delay_ms = self.config.hedge_default_delay_ms
+        return max(delay_ms, self.config.hedge_min_delay_ms) / 1000.0
+    
+    def _hedge_budget_available(self) -> bool:
+        """Check that one more hedge keeps extra upstream load within hedge_budget_percent"""
+        window_requests = len(self.hedge_window) + 1  # include the current request
+        hedges_fired = sum(self.hedge_window) + 1
+        return hedges_fired <= window_requests * self.config.hedge_budget_percent / 100.0
+    
+    async def _execute_hedged(
+        self,
+        primary: DataSource,
+        secondary: DataSource,
+        operation: str,
+        **kwargs
+    ) -> Tuple[bool, Any, DataSource, Dict[DataSource, str]]:
+        """
+        Execute operation with primary, hedging with secondary once primary exceeds its p95
+        
+        The first successful answer wins and the other call is cancelled. Cancelled calls
+        are not recorded in performance metrics since their latency is unknown.
+        Returns: (success, result, answering_source, errors_by_source)
+        """
+        self.hedge_stats["eligible_requests"] += 1
+        tasks = {
+            asyncio.ensure_future(self._execute_with_provider(primary, operation, **kwargs)): primary
+        }
+        
+        done, _ = await asyncio.wait(set(tasks), timeout=self._get_hedge_delay_seconds(primary))
+        hedge_fired = False
+        if not done:
+            if self._hedge_budget_available():
+                hedge_fired = True
+                self.hedge_stats["hedges_fired"] += 1
+                logger.debug(f"Hedging {operation}: {primary.value} exceeded p95, firing {secondary.value}")
+                tasks[asyncio.ensure_future(self._execute_with_provider(secondary, operation, **kwargs))] = secondary
+            else:
+                self.hedge_stats["hedges_skipped_budget"] += 1
+        self.hedge_window.append(hedge_fired)
+        
+        errors: Dict[DataSource, str] = {}
+        last_result = None
+        last_source = primary
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                winner = None
+                for task in done:
+                    source = tasks[task]
+                    success, result, response_time = task.result()
+                    self._record_provider_performance(source, operation, response_time, success)
+                    
+                    if success:
+                        if winner is None or source == primary:
+                            winner = (source, result)
+                    else:
+                        errors[source] = result.error
+                        last_source, last_result = source, result
+                
+                if winner is not None:
+                    if winner[0] == secondary:
+                        self.hedge_stats["hedge_wins"] += 1
+                    return True, winner[1], winner[0], errors
+        finally:
+            for task in pending:
+                task.cancel()
+                self.hedge_stats["cancelled_calls"] += 1
+        
+        return False, last_result, last_source, errors
+    
     async def fetch_with_fallback(
         self,
         operation: str,
+        exclude_sources: Optional[Set[DataSource]] = None,
         **kwargs
     ) -> ServiceResult[CompositeResult]:
         """
         Execute data fetch operation with automatic failover
         
-        Implements <500ms failover switching for production reliability
+        Implements <500ms failover switching for production reliability.
+        Providers in exclude_sources are skipped (and the cache bypassed), e.g.
+        to ask the rest of the chain for symbols a provider did not return.
         """
         start_time = time.time()
         
         # Check cache first
-        if self.config.enable_caching:
+        use_cache = self.config.enable_caching and self.cache is not None and not exclude_sources
+        if use_cache:
             cache_key = self._get_cache_key(operation, **kwargs)
-            cached_result = self._get_cached_result(cache_key)
+            cached_result = await self._get_cached_result(cache_key)
             if cached_result:
                 logger.debug(f"Cache hit for {operation}")
                 return ServiceResult(
@@ -316,6 +567,16 @@ class CompositeDataProvider(ICompositeDataProvider):
         provider_chain = [
             (priority, source) for priority, source in sorted(self.config.provider_chain.items(), key=lambda x: x[0].value)
         ]
+        if exclude_sources:
+            provider_chain = [(priority, source) for priority, source in provider_chain if source not in exclude_sources]
+            if not provider_chain:
+                return ServiceResult(
+                    success=False,
+                    error="All providers excluded",
+                    message=f"No provider left to execute {operation}"
+                )
+        provider_chain, routing = self._route_provider_chain(operation, provider_chain)
+        routed_primary = provider_chain[0][1]
         
         errors = []
         contributing_sources = []
@@ -323,17 +584,42 @@ class CompositeDataProvider(ICompositeDataProvider):
         primary_source = None
         result_data = None
         
-        for priority, source in provider_chain:
+        attempted_sources = set()
+        
+        for index, (priority, source) in enumerate(provider_chain):
+            if source in attempted_sources:
+                continue
+            
             if not self._is_provider_available(source):
                 errors.append(f"Provider {source.value} unavailable (circuit breaker)")
                 continue
             
             logger.debug(f"Attempting {operation} with {source.value} (priority: {priority.name})")
             
-            success, result, response_time = await self._execute_with_provider(source, operation, **kwargs)
+            # Hedged strategy races the next available provider in the chain
+            hedge_source = None
+            if self.config.failover_strategy == FailoverStrategy.HEDGED:
+                hedge_source = next(
+                    (
+                        candidate for _, candidate in provider_chain[index + 1:]
+                        if candidate not in attempted_sources and self._is_provider_available(candidate)
+                    ),
+                    None
+                )
+            
+            if hedge_source is not None:
+                success, result, source, hedge_errors = await self._execute_hedged(
+                    source, hedge_source, operation, **kwargs
+                )
+                attempted_sources.update(hedge_errors)
+                errors.extend(f"{failed.value}: {error}" for failed, error in hedge_errors.items())
+            else:
+                success, result, response_time = await self._execute_with_provider(source, operation, **kwargs)
+                
+                # Record performance
+                self._record_provider_performance(source, operation, response_time, success)
             
-            # Record performance
-            self._record_provider_performance(source, operation, response_time, success)
+            attempted_sources.add(source)
             
             if success:
                 contributing_sources.append(source)
@@ -342,15 +628,15 @@ class CompositeDataProvider(ICompositeDataProvider):
                     primary_source = source
                     result_data = result.data
                 
-                # For primary provider success, we're done
-                if source == self.config.provider_chain[ProviderPriority.PRIMARY]:
+                # For primary (first routed) provider success, we're done
+                if source == routed_primary:
                     break
                 
                 # For secondary/tertiary success, we got a failover
                 failover_occurred = True
                 break
             
-            else:
+            elif hedge_source is None:
                 errors.append(f"{source.value}: {result.error}")
                 
                 # Handle retry strategy
@@ -365,7 +651,7 @@ class CompositeDataProvider(ICompositeDataProvider):
                         contributing_sources.append(source)
                         primary_source = source
                         result_data = result_retry.data
-                        failover_occurred = (source != self.config.provider_chain[ProviderPriority.PRIMARY])
+                        failover_occurred = (source != routed_primary)
                         break
                 
                 # Continue to next provider in chain
@@ -387,10 +673,12 @@ class CompositeDataProvider(ICompositeDataProvider):
         
         # Validate data quality
         quality = DataQuality()
+        quality_report = None
         if self.config.enable_validation:
             quality_result = await self.validate_data_quality(result_data, primary_source, operation)
             if quality_result.success:
                 quality = quality_result.data
+                quality_report = quality_result.metadata.get("quality_report")
         
         # Create composite result
         composite_result = CompositeResult(
@@ -404,13 +692,15 @@ class CompositeDataProvider(ICompositeDataProvider):
             metadata={
                 "operation": operation,
                 "providers_attempted": len([p for _, p in provider_chain]),
-                "errors": errors
+                "errors": errors,
+                "quality_report": quality_report,
+                "routing": routing
             }
         )
         
         # Cache successful result
-        if self.config.enable_caching:
-            self._cache_result(cache_key, composite_result)
+        if use_cache:
+            await self._cache_result(cache_key, operation, composite_result)
         
         return ServiceResult(
             success=True,
@@ -490,12 +780,23 @@ class CompositeDataProvider(ICompositeDataProvider):
         source: DataSource,
         operation: str
     ) -> ServiceResult[DataQuality]:
-        """Validate data quality from specific provider"""
+        """
+        Validate data quality from specific provider
+        
+        Price bar series are checked column-wise (gaps, outliers, stale bars,
+        invalid OHLC); the compact report is returned in metadata["quality_report"].
+        """
         try:
             quality = DataQuality()
+            quality_report = None
+            bar_series = self._bar_series(data)
             
             # Basic validation logic
-            if data is None:
+            if bar_series:
+                interval = next(iter(bar_series.values()))[0].metadata.get("interval", "1d")
+                quality_report = build_quality_report(bar_series, interval)
+                quality.completeness = quality_report["completeness"]
+            elif data is None:
                 quality.completeness = 0.0
                 quality.accuracy = 0.0
             elif isinstance(data, dict):
@@ -508,7 +809,6 @@ class CompositeDataProvider(ICompositeDataProvider):
                 quality.completeness = 1.0 if len(data) > 0 else 0.0
             
             # Freshness check
-            current_time = datetime.now(timezone.utc)
             if operation in ["real_time", "validate_symbols"]:
                 # Real-time data should be fresh
                 quality.freshness = 1.0  # Assume fresh for now
@@ -517,17 +817,16 @@ class CompositeDataProvider(ICompositeDataProvider):
                 quality.freshness = 0.9
             
             # Consistency and accuracy are provider-dependent
-            provider_quality_scores = {
-                DataSource.OPENBB: {"accuracy": 0.95, "consistency": 0.95},
-                DataSource.YAHOO: {"accuracy": 0.90, "consistency": 0.85},
-                DataSource.ALPHA_VANTAGE: {"accuracy": 0.85, "consistency": 0.90}
-            }
-            
-            if source in provider_quality_scores:
-                scores = provider_quality_scores[source]
+            if source in PROVIDER_QUALITY_SCORES:
+                scores = PROVIDER_QUALITY_SCORES[source]
                 quality.accuracy = scores["accuracy"]
                 quality.consistency = scores["consistency"]
             
+            # Measured anomalies scale the provider priors
+            if quality_report is not None:
+                quality.accuracy *= quality_report["accuracy"]
+                quality.consistency *= quality_report["consistency"]
+            
             # Recalculate overall score
             quality.overall_score = (
                 quality.completeness + quality.accuracy + 
@@ -541,7 +840,8 @@ class CompositeDataProvider(ICompositeDataProvider):
                 metadata={
                     "operation": operation,
                     "source": source.value,
-                    "quality_score": quality.overall_score
+                    "quality_score": quality.overall_score,
+                    "quality_report": quality_report
                 }
             )
         
@@ -553,6 +853,74 @@ class CompositeDataProvider(ICompositeDataProvider):
                 message="Failed to validate data quality"
             )
     
+    @staticmethod
+    def _bar_series(data: Any) -> Dict[str, List[MarketData]]:
+        """Price bar series in data keyed by symbol (empty if data holds no bar lists)"""
+        if is_bar_series(data):
+            return {data[0].symbol: data}
+        if isinstance(data, dict):
+            return {symbol: bars for symbol, bars in data.items() if is_bar_series(bars)}
+        return {}
+    
+    def _source_priority(self, sources) -> List[DataSource]:
+        """Sources ordered by provider chain priority"""
+        chain = [source for _, source in sorted(self.config.provider_chain.items(), key=lambda x: x[0].value)]
+        return [source for source in chain if source in sources] + [source for source in sources if source not in chain]
+    
+    def _resolve_bar_conflicts(
+        self,
+        bar_sources: Dict[DataSource, Dict[str, List[MarketData]]],
+        resolution_strategy: ConflictResolution,
+        single_series: bool
+    ) -> ServiceResult[Any]:
+        """Resolve price bar conflicts on timestamp-aligned columnar series"""
+        priority = self._source_priority(bar_sources)
+        weights = {source: PROVIDER_QUALITY_SCORES.get(source, {}).get("accuracy", 1.0) for source in priority}
+        symbols = list(dict.fromkeys(symbol for series in bar_sources.values() for symbol in series))
+        
+        resolved: Dict[str, List[MarketData]] = {}
+        winning_sources: Dict[str, str] = {}
+        deviations: Dict[str, Dict[str, Any]] = {}
+        
+        for symbol in symbols:
+            frames = {
+                source: bars_to_frame(series[symbol])
+                for source in priority
+                for series in [bar_sources[source]]
+                if symbol in series
+            }
+            deviations[symbol] = cross_source_deviation(frames)
+            
+            if len(frames) == 1 or resolution_strategy == ConflictResolution.PRIMARY_WINS:
+                winner = next(iter(frames))
+                resolved[symbol] = list(frames[winner]["bar"])
+                winning_sources[symbol] = winner.value
+            elif resolution_strategy == ConflictResolution.LATEST_TIMESTAMP:
+                winner = latest_bar_source(frames)
+                resolved[symbol] = list(frames[winner]["bar"])
+                winning_sources[symbol] = winner.value
+            elif resolution_strategy == ConflictResolution.WEIGHTED_AVERAGE:
+                resolved[symbol] = weighted_average_bars(frames, weights, priority, symbol)
+                winning_sources[symbol] = "weighted_average"
+            else:
+                resolved[symbol] = consensus_bars(frames, priority)
+                winning_sources[symbol] = "majority_consensus"
+        
+        conflicting_bars = sum(report["conflicting_bars"] for report in deviations.values())
+        
+        return ServiceResult(
+            success=True,
+            data=resolved[symbols[0]] if single_series and symbols else resolved,
+            message=f"Resolved {len(symbols)} series across {len(bar_sources)} providers "
+                    f"({conflicting_bars} conflicting bars)",
+            metadata={
+                "resolution_strategy": resolution_strategy.value,
+                "winning_sources": winning_sources,
+                "conflicting_bars": conflicting_bars,
+                "deviation": deviations
+            }
+        )
+    
     async def resolve_conflicts(
         self,
         data_sources: Dict[DataSource, Any],
@@ -568,6 +936,15 @@ class CompositeDataProvider(ICompositeDataProvider):
                     message="No conflicts to resolve"
                 )
             
+            # Price bar series are aligned on timestamp and resolved column-wise
+            bar_sources = {source: self._bar_series(data) for source, data in data_sources.items()}
+            if all(bar_sources.values()):
+                return self._resolve_bar_conflicts(
+                    bar_sources,
+                    resolution_strategy,
+                    single_series=all(is_bar_series(data) for data in data_sources.values())
+                )
+            
             if resolution_strategy == ConflictResolution.PRIMARY_WINS:
                 # Use data from highest priority provider
                 for priority in [ProviderPriority.PRIMARY, ProviderPriority.SECONDARY, ProviderPriority.TERTIARY]:
@@ -727,6 +1104,40 @@ class CompositeDataProvider(ICompositeDataProvider):
                     "circuit_breaker_open": self.circuit_breakers.get(source, {}).get("is_open", False)
                 }
             
+            metrics["hedging"] = {
+                "enabled": self.config.failover_strategy == FailoverStrategy.HEDGED,
+                "budget_percent": self.config.hedge_budget_percent,
+                "eligible_requests": self.hedge_stats["eligible_requests"],
+                "hedges_fired": self.hedge_stats["hedges_fired"],
+                "hedge_wins": self.hedge_stats["hedge_wins"],
+                "hedges_skipped_budget": self.hedge_stats["hedges_skipped_budget"],
+                "cancelled_calls": self.hedge_stats["cancelled_calls"],
+                "window_hedge_rate": sum(self.hedge_window) / max(len(self.hedge_window), 1)
+            }
+            
+            metrics["cache"] = {
+                "composite": self.cache.get_stats() if self.cache is not None else None,
+                "providers": {
+                    source.value: provider.cache.get_stats()
+                    for source, provider in self.providers.items()
+                    if isinstance(getattr(provider, "cache", None), ProviderCache)
+                }
+            }
+            
+            metrics["http_pools"] = self.http_pool.get_metrics()
+            
+            metrics["routing"] = {
+                "policy": self.config.routing_policy.value,
+                "windows": {
+                    f"{source.value}:{operation}": {
+                        **self._routing_stats(source, operation),
+                        "sla": self._sla_for(operation),
+                        "marginal_cost_usd": self._marginal_request_cost(source)
+                    }
+                    for source, operation in list(self.operation_stats.keys())
+                }
+            }
+            
             metrics["overall"]["overall_success_rate"] = total_successes / max(total_requests, 1)
             metrics["overall"]["avg_response_time"] = statistics.mean(all_response_times) if all_response_times else 0.0
             
@@ -752,6 +1163,139 @@ class CompositeDataProvider(ICompositeDataProvider):
     
     # Enhanced composite methods implementing ICompositeDataProvider interface
     
+    def _split_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        interval: str
+    ) -> List[Tuple[date, date]]:
+        """
+        Split a date range into grid-aligned chunks for parallel fetching
+        
+        Adjacent chunks share their boundary day so providers with exclusive end
+        dates don't drop bars; duplicates are removed when chunks are merged.
+        """
+        chunk_days = HISTORICAL_CHUNK_DAYS.get(interval, HISTORICAL_CHUNK_DAYS["1d"])
+        if (end_date - start_date).days <= chunk_days:
+            return [(start_date, end_date)]
+        
+        chunks = []
+        chunk_start = start_date
+        
+        while chunk_start < end_date:
+            offset = (chunk_start - HISTORICAL_CHUNK_ANCHOR).days
+            next_boundary = HISTORICAL_CHUNK_ANCHOR + timedelta(days=(offset // chunk_days + 1) * chunk_days)
+            chunk_end = min(next_boundary, end_date)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+        
+        return chunks
+    
+    async def _fetch_historical_chunk(
+        self,
+        symbol: str,
+        chunk_start: date,
+        chunk_end: date,
+        interval: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[CompositeResult]:
+        """Fetch one chunk, retrying independently; each attempt walks the provider chain"""
+        for attempt in range(self.config.chunk_retry_attempts + 1):
+            async with semaphore:
+                chunk_result = await self.fetch_with_fallback(
+                    "historical_data",
+                    symbols=[symbol],
+                    start_date=chunk_start,
+                    end_date=chunk_end,
+                    interval=interval
+                )
+            
+            if chunk_result.success:
+                return chunk_result.data
+            
+            logger.debug(
+                f"Historical chunk {symbol} {chunk_start}..{chunk_end} failed "
+                f"(attempt {attempt + 1}): {chunk_result.error}"
+            )
+        
+        return None
+    
+    async def _fetch_historical_range_split(
+        self,
+        symbol: str,
+        chunks: List[Tuple[date, date]],
+        interval: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[CompositeResult]:
+        """Fetch all chunks for a symbol concurrently and merge them in timestamp order"""
+        start_time = time.time()
+        
+        chunk_results = await asyncio.gather(*[
+            self._fetch_historical_chunk(symbol, chunk_start, chunk_end, interval, semaphore)
+            for chunk_start, chunk_end in chunks
+        ])
+        
+        bars_by_timestamp: Dict[datetime, MarketData] = {}
+        contributing_sources: List[DataSource] = []
+        source_counts: Dict[DataSource, int] = defaultdict(int)
+        failed_ranges = []
+        failover_occurred = False
+        
+        for (chunk_start, chunk_end), chunk_result in zip(chunks, chunk_results):
+            if chunk_result is None:
+                failed_ranges.append(f"{chunk_start} to {chunk_end}")
+                continue
+            
+            source_counts[chunk_result.primary_source] += 1
+            failover_occurred = failover_occurred or chunk_result.failover_occurred
+            for source in chunk_result.contributing_sources:
+                if source not in contributing_sources:
+                    contributing_sources.append(source)
+            
+            chunk_data = chunk_result.data or {}
+            for bar in chunk_data.get(symbol, []) if isinstance(chunk_data, dict) else []:
+                # Earlier chunks win on the shared boundary day
+                bars_by_timestamp.setdefault(bar.timestamp, bar)
+        
+        if not source_counts:
+            return None
+        
+        merged_bars = [bars_by_timestamp[ts] for ts in sorted(bars_by_timestamp)]
+        primary_source = max(source_counts, key=source_counts.get)
+        
+        quality = DataQuality()
+        quality_report = None
+        if self.config.enable_validation:
+            quality_result = await self.validate_data_quality({symbol: merged_bars}, primary_source, "historical_data")
+            if quality_result.success:
+                quality = quality_result.data
+                quality_report = quality_result.metadata.get("quality_report")
+        
+        # Missing chunks reduce completeness
+        chunk_completeness = (len(chunks) - len(failed_ranges)) / len(chunks)
+        quality.completeness = min(quality.completeness, chunk_completeness)
+        quality.overall_score = (
+            quality.completeness + quality.accuracy + quality.freshness + quality.consistency
+        ) / 4.0
+        
+        return CompositeResult(
+            data={symbol: merged_bars},
+            primary_source=primary_source,
+            contributing_sources=contributing_sources,
+            quality=quality,
+            failover_occurred=failover_occurred,
+            response_time_ms=(time.time() - start_time) * 1000,
+            metadata={
+                "operation": "historical_data",
+                "range_split": True,
+                "chunks_total": len(chunks),
+                "chunks_failed": len(failed_ranges),
+                "failed_ranges": failed_ranges,
+                "chunk_sources": {source.value: count for source, count in source_counts.items()},
+                "quality_report": quality_report
+            }
+        )
+    
     async def fetch_historical_data_composite(
         self,
         symbols: List[str],
@@ -759,21 +1303,45 @@ class CompositeDataProvider(ICompositeDataProvider):
         end_date: date,
         interval: str = "1d"
     ) -> ServiceResult[Dict[str, CompositeResult]]:
-        """Fetch historical data with multi-provider intelligence"""
+        """
+        Fetch historical data with multi-provider intelligence
+        
+        Long ranges are split into chunks fetched concurrently within the
+        max_parallel_chunks budget. Failed chunks are retried independently
+        (possibly on another provider) and the rest of the range is still returned.
+        """
         try:
             result = {}
+            chunks = self._split_date_range(start_date, end_date, interval)
             
-            for symbol in symbols:
-                composite_result = await self.fetch_with_fallback(
-                    "historical_data",
-                    symbols=[symbol],
-                    start_date=start_date,
-                    end_date=end_date,
-                    interval=interval
-                )
-                
-                if composite_result.success:
-                    result[symbol] = composite_result.data
+            if len(chunks) == 1:
+                for symbol in symbols:
+                    composite_result = await self.fetch_with_fallback(
+                        "historical_data",
+                        symbols=[symbol],
+                        start_date=start_date,
+                        end_date=end_date,
+                        interval=interval
+                    )
+                    
+                    if composite_result.success:
+                        result[symbol] = composite_result.data
+            else:
+                semaphore = asyncio.Semaphore(self.config.max_parallel_chunks)
+                symbol_results = await asyncio.gather(*[
+                    self._fetch_historical_range_split(symbol, chunks, interval, semaphore)
+                    for symbol in symbols
+                ])
+                result = {
+                    symbol: symbol_result
+                    for symbol, symbol_result in zip(symbols, symbol_results)
+                    if symbol_result is not None
+                }
+            
+            partial_symbols = [
+                symbol for symbol, composite_result in result.items()
+                if composite_result.metadata.get("chunks_failed")
+            ]
             
             return ServiceResult(
                 success=len(result) > 0,
@@ -782,9 +1350,13 @@ class CompositeDataProvider(ICompositeDataProvider):
                 metadata={
                     "date_range": f"{start_date} to {end_date}",
                     "interval": interval,
-                    "provider": "composite"
+                    "provider": "composite",
+                    "chunks_per_symbol": len(chunks),
+                    "partial_symbols": partial_symbols
                 },
-                next_actions=["analyze_price_trends", "calculate_indicators"] if result else ["retry_failed_symbols"]
+                next_actions=(
+                    ["analyze_price_trends", "calculate_indicators"] if result else ["retry_failed_symbols"]
+                ) + (["refetch_failed_ranges"] if partial_symbols else [])
             )
         
         except Exception as e:
@@ -1008,62 +1580,150 @@ class CompositeDataProvider(ICompositeDataProvider):
                 message=f"Failed to search for assets matching '{query}'"
             )
     
+    def _bulk_operation_params(self, operation: str) -> Optional[Dict[str, Any]]:
+        """Non-symbol parameters for a bulk operation, or None if unsupported"""
+        if operation == "historical_data":
+            return {
+                "start_date": date.today() - timedelta(days=365),
+                "end_date": date.today(),
+                "interval": "1d"
+            }
+        if operation in BULK_BATCH_SIZES:
+            return {}
+        return None
+    
     async def bulk_data_optimization(
         self,
         symbols: List[str],
         operations: List[str],
-        parallel_requests: int = 5
+        parallel_requests: int = 5,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> ServiceResult[Dict[str, Dict[str, CompositeResult]]]:
         """
         Optimized bulk data fetching for backtesting performance
-        Reduces API calls through intelligent batching and caching
-        Target: 5x faster backtesting through complete dataset optimization
+        
+        Each operation is issued as a few multi-symbol provider calls (chunks of
+        BULK_BATCH_SIZES symbols) instead of one call per symbol. Symbols with a
+        cached single-symbol result are skipped, and every batch result is split
+        back into single-symbol cache entries so later per-symbol requests hit.
+        
+        Args:
+            symbols: Symbols to fetch
+            operations: Operations to run for every symbol
+            parallel_requests: Maximum concurrent batch calls
+            batch_size: Override for symbols per batch call
+            progress_callback: Awaited after each chunk with a progress event
         """
         try:
             logger.info(f"Starting bulk optimization for {len(symbols)} symbols, {len(operations)} operations")
             
-            # Group requests by provider preference for efficiency
             semaphore = asyncio.Semaphore(parallel_requests)
-            results = {symbol: {} for symbol in symbols}
+            results: Dict[str, Dict[str, CompositeResult]] = {symbol: {} for symbol in symbols}
+            use_cache = self.config.enable_caching and self.cache is not None
+            cache_hits = 0
+            
+            # Plan batches: cache-first, then chunk the remaining symbols per operation
+            batches: List[Tuple[str, List[str], Dict[str, Any]]] = []
+            for operation in operations:
+                params = self._bulk_operation_params(operation)
+                if params is None:
+                    logger.warning(f"Unsupported bulk operation: {operation}")
+                    continue
+                
+                uncached_symbols = []
+                for symbol in symbols:
+                    cached = None
+                    if use_cache:
+                        cached = await self._get_cached_result(
+                            self._get_cache_key(operation, symbols=[symbol], **params)
+                        )
+                    if cached is not None:
+                        results[symbol][operation] = cached
+                        cache_hits += 1
+                    else:
+                        uncached_symbols.append(symbol)
+                
+                size = batch_size or BULK_BATCH_SIZES[operation]
+                for i in range(0, len(uncached_symbols), size):
+                    batches.append((operation, uncached_symbols[i:i + size], params))
+            
+            completed_batches = 0
+            failed_symbols: Dict[str, List[str]] = {}
             
-            async def _fetch_symbol_operation(symbol: str, operation: str):
+            async def _fetch_batch(index: int, operation: str, batch: List[str], params: Dict[str, Any]):
+                nonlocal completed_batches
+                successful = []
+                error = None
+                
                 async with semaphore:
                     try:
-                        # Build operation parameters
-                        if operation == "historical_data":
-                            kwargs = {
-                                "symbols": [symbol],
-                                "start_date": date.today() - timedelta(days=365),
-                                "end_date": date.today(),
-                                "interval": "1d"
-                            }
-                        elif operation == "real_time":
-                            kwargs = {"symbols": [symbol]}
-                        elif operation == "asset_info":
-                            kwargs = {"symbols": [symbol]}
-                        elif operation == "validate_symbols":
-                            kwargs = {"symbols": [symbol]}
-                        elif operation == "fundamental_data":
-                            kwargs = {"symbols": [symbol]}
-                        else:
-                            logger.warning(f"Unsupported bulk operation: {operation}")
-                            return
+                        # Symbols missing from a provider's answer go to the rest of the chain
+                        remaining = list(batch)
+                        excluded: Set[DataSource] = set()
+                        while remaining:
+                            result = await self.fetch_with_fallback(
+                                operation, exclude_sources=excluded or None, symbols=remaining, **params
+                            )
+                            if not result.success:
+                                error = result.error
+                                break
+                            batch_result = result.data
+                            batch_data = batch_result.data if isinstance(batch_result.data, dict) else {}
+                            
+                            for symbol in remaining:
+                                if symbol not in batch_data:
+                                    continue
+                                symbol_result = batch_result.model_copy(update={
+                                    "data": {symbol: batch_data[symbol]},
+                                    "metadata": {**batch_result.metadata, "batch_size": len(batch)}
+                                })
+                                results[symbol][operation] = symbol_result
+                                successful.append(symbol)
+                                
+                                if use_cache:
+                                    await self._cache_result(
+                                        self._get_cache_key(operation, symbols=[symbol], **params),
+                                        operation,
+                                        symbol_result
+                                    )
+                            
+                            remaining = [symbol for symbol in remaining if symbol not in batch_data]
+                            if batch_result.primary_source in excluded:
+                                break
+                            excluded.add(batch_result.primary_source)
                         
-                        result = await self.fetch_with_fallback(operation, **kwargs)
-                        if result.success:
-                            results[symbol][operation] = result.data
+                        if remaining and error is None:
+                            error = f"No provider returned {len(remaining)} symbols"
                     
                     except Exception as e:
-                        logger.error(f"Bulk operation failed for {symbol}/{operation}: {e}")
-            
-            # Create tasks for all symbol-operation combinations
-            tasks = []
-            for symbol in symbols:
-                for operation in operations:
-                    tasks.append(_fetch_symbol_operation(symbol, operation))
+                        error = str(e)
+                        logger.error(f"Bulk batch failed for {operation} ({len(batch)} symbols): {e}")
+                
+                failed = [symbol for symbol in batch if symbol not in successful]
+                if failed:
+                    failed_symbols.setdefault(operation, []).extend(failed)
+                completed_batches += 1
+                if progress_callback is not None:
+                    try:
+                        await progress_callback({
+                            "operation": operation,
+                            "batch_index": index,
+                            "symbols": batch,
+                            "successful_symbols": successful,
+                            "failed_symbols": failed,
+                            "error": error,
+                            "completed_batches": completed_batches,
+                            "total_batches": len(batches),
+                            "results": {symbol: results[symbol][operation] for symbol in successful}
+                        })
+                    except Exception as e:
+                        logger.warning(f"Bulk progress callback failed: {e}")
             
-            # Execute with controlled concurrency
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(
+                *[_fetch_batch(i, operation, batch, params) for i, (operation, batch, params) in enumerate(batches)],
+                return_exceptions=True
+            )
             
             # Calculate success metrics
             total_operations = len(symbols) * len(operations)
@@ -1081,7 +1741,10 @@ class CompositeDataProvider(ICompositeDataProvider):
                     "total_operations": total_operations,
                     "successful_operations": successful_operations,
                     "success_rate": successful_operations / max(total_operations, 1),
-                    "parallel_requests": parallel_requests
+                    "parallel_requests": parallel_requests,
+                    "batch_calls": len(batches),
+                    "cache_hits": cache_hits,
+                    "failed_symbols": failed_symbols
                 },
                 next_actions=["process_bulk_results", "cache_datasets"] if successful_operations > 0 else ["retry_failed_operations"]
             )
@@ -1108,20 +1771,12 @@ class CompositeDataProvider(ICompositeDataProvider):
             for source in DataSource:
                 requests_made = self.success_counts[source] + self.failure_counts[source]
                 
-                # Estimate costs based on provider pricing models
-                estimated_cost = 0.0
-                if source == DataSource.OPENBB:
-                    # OpenBB Pro pricing estimates (hypothetical)
-                    estimated_cost = requests_made * 0.001  # $0.001 per request
-                elif source == DataSource.ALPHA_VANTAGE:
-                    # Alpha Vantage free tier: 5 calls/minute, 500 calls/day
-                    estimated_cost = max(0, (requests_made - 500)) * 0.01  # $0.01 per excess call
-                elif source == DataSource.YAHOO:
-                    # Yahoo Finance is free but has rate limits
-                    estimated_cost = 0.0
+                # Accumulated per request, after each day's free allowance
+                estimated_cost = self.estimated_costs[source]
                 
                 cost_data[source] = {
                     "requests_made": requests_made,
+                    "requests_today": self._requests_today(source),
                     "estimated_cost_usd": estimated_cost,
                     "success_rate": self.success_counts[source] / max(requests_made, 1),
                     "avg_response_time": statistics.mean(self.response_times[source]) if self.response_times[source] else 0,
@@ -1268,7 +1923,7 @@ class CompositeDataProvider(ICompositeDataProvider):
                     for source, breaker in self.circuit_breakers.items()
                 },
                 "caching_enabled": self.config.enable_caching,
-                "cache_size": len(self.cache) if self.cache else 0
+                "cache_size": self.cache.get_stats()["size"] if self.cache is not None else 0
             }
             
             return ServiceResult(
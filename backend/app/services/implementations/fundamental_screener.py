@@ -9,13 +9,14 @@ Following Interface-First Design patterns from CLAUDE.md.
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
 from ..interfaces.screener import IScreener, ScreeningCriteria, ScreeningResult, ScreeningError
 from ..interfaces.base import ServiceResult
 from ...models.asset import Asset
 from ...core.database import SessionLocal
+from ..fundamentals_service import latest_fundamentals
 
 logger = logging.getLogger(__name__)
 
@@ -80,8 +81,11 @@ class FundamentalScreener(IScreener):
             start_time = datetime.now()
             matching_assets = []
             
+            # ROIC comes from the locally stored fundamentals snapshot when the asset has none
+            snapshot_roic = self._load_snapshot_roic(asset_pool, criteria)
+            
             for asset in asset_pool:
-                if await self._asset_meets_criteria(asset, criteria):
+                if await self._asset_meets_criteria(asset, criteria, snapshot_roic.get(asset.symbol)):
                     matching_assets.append(asset)
             
             end_time = datetime.now()
@@ -265,7 +269,24 @@ class FundamentalScreener(IScreener):
                 'total_assets': len(asset_pool) if asset_pool else 0
             }
     
-    async def _asset_meets_criteria(self, asset: Asset, criteria: ScreeningCriteria) -> bool:
+    def _load_snapshot_roic(self, asset_pool: List[Asset], criteria: ScreeningCriteria) -> Dict[str, float]:
+        """Latest snapshot ROIC per symbol, loaded in one query when a ROIC filter is active"""
+        if self.db is None or (criteria.min_roic is None and criteria.max_roic is None):
+            return {}
+        
+        try:
+            snapshots = latest_fundamentals(self.db, [asset.symbol for asset in asset_pool])
+        except Exception as e:
+            logger.warning(f"Could not load fundamentals snapshots for screening: {e}")
+            return {}
+        return {symbol: row.roic for symbol, row in snapshots.items() if row.roic is not None}
+    
+    async def _asset_meets_criteria(
+        self,
+        asset: Asset,
+        criteria: ScreeningCriteria,
+        snapshot_roic: Optional[float] = None
+    ) -> bool:
         """
         Check if individual asset meets all screening criteria.
         
@@ -307,11 +328,13 @@ class FundamentalScreener(IScreener):
             if asset.sector and asset.sector in criteria.sectors_exclude:
                 return False
         
-        # ROIC filters (stored in asset_metadata JSON field)
+        # ROIC filters (asset_metadata JSON field, falling back to the fundamentals snapshot)
         if criteria.min_roic is not None or criteria.max_roic is not None:
             roic = None
             if asset.asset_metadata and isinstance(asset.asset_metadata, dict):
                 roic = asset.asset_metadata.get('roic')
+            if roic is None:
+                roic = snapshot_roic
                 
             if criteria.min_roic is not None:
                 if roic is None or roic < criteria.min_roic:
@@ -0,0 +1,178 @@
+"""
+Known-invalid symbol filter
+
+A compact Bloom filter of symbols providers have reported as not found, in
+front of an exact negative cache with its own TTL. Validation paths consult it
+before any upstream call so typos and delisted tickers are not re-validated
+against every provider each time they are searched or added.
+
+The Bloom filter answers "definitely not known-invalid" without touching the
+exact cache; a positive is confirmed against the exact entry (Bloom filters
+cannot delete, so expired symbols stay in the filter until it is rebuilt).
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on a blake2b digest)"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def estimated_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+class InvalidSymbolFilter:
+    """Bloom filter + exact TTL cache of symbols known to be invalid"""
+
+    def __init__(
+        self,
+        negative_ttl_seconds: int = 6 * 3600,
+        max_entries: int = 50_000,
+        bloom_capacity: int = 100_000,
+        bloom_error_rate: float = 0.01
+    ):
+        """
+        Args:
+            negative_ttl_seconds: How long a symbol stays known-invalid
+            max_entries: Exact cache size (oldest entries evicted first)
+            bloom_capacity: Bloom filter sizing; the filter is rebuilt from live entries when exceeded
+            bloom_error_rate: Target Bloom false-positive rate
+        """
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        # symbol -> (expires_at, reason)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "checks": 0,
+            "bloom_rejections": 0,
+            "negative_hits": 0,
+            "bloom_false_positives": 0,
+            "recorded": 0,
+            "cleared": 0,
+            "upstream_calls_saved": 0,
+            "bloom_rebuilds": 0
+        }
+
+    def might_be_invalid(self, symbol: str) -> bool:
+        """Bloom check only: False means the symbol is definitely not known-invalid"""
+        return symbol.upper() in self._bloom
+
+    def is_known_invalid(self, symbol: str) -> bool:
+        """True if a provider reported the symbol invalid within the negative TTL"""
+        symbol = symbol.upper()
+        with self._lock:
+            self._stats["checks"] += 1
+            if symbol not in self._bloom:
+                self._stats["bloom_rejections"] += 1
+                return False
+
+            entry = self._entries.get(symbol)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[symbol]
+                self._stats["bloom_false_positives"] += 1
+                return False
+
+            self._stats["negative_hits"] += 1
+            return True
+
+    def record_invalid(self, symbol: str, reason: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        """Remember a symbol a provider definitively reported as invalid"""
+        symbol = symbol.upper()
+        expires_at = time.time() + (ttl_seconds if ttl_seconds is not None else self.negative_ttl_seconds)
+        with self._lock:
+            if symbol in self._entries:
+                self._entries.move_to_end(symbol)
+            self._entries[symbol] = (expires_at, reason)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            if self._bloom.count >= self.bloom_capacity:
+                self._rebuild_bloom()
+            if symbol not in self._bloom:
+                self._bloom.add(symbol)
+            self._stats["recorded"] += 1
+
+    def clear(self, symbol: str):
+        """Forget a symbol (e.g. it validated successfully after a listing)"""
+        with self._lock:
+            if self._entries.pop(symbol.upper(), None) is not None:
+                self._stats["cleared"] += 1
+
+    def record_saved_calls(self, count: int):
+        """Count upstream provider calls skipped thanks to the filter"""
+        with self._lock:
+            self._stats["upstream_calls_saved"] += count
+
+    def _rebuild_bloom(self):
+        """Rebuild the Bloom filter from live entries (drops expired and cleared symbols)"""
+        now = time.time()
+        live = [symbol for symbol, (expires_at, _) in self._entries.items() if expires_at > now]
+        self._bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        for symbol in live:
+            self._bloom.add(symbol)
+        self._stats["bloom_rebuilds"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Filter effectiveness and size metrics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "known_invalid_symbols": len(self._entries),
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+                "bloom_items": self._bloom.count,
+                "bloom_size_bytes": self._bloom.size_bytes,
+                "bloom_estimated_false_positive_rate": self._bloom.estimated_false_positive_rate()
+            }
+
+
+_invalid_symbol_filter: Optional[InvalidSymbolFilter] = None
+
+
+def get_invalid_symbol_filter() -> InvalidSymbolFilter:
+    """Process-wide filter shared by validation paths"""
+    global _invalid_symbol_filter
+    if _invalid_symbol_filter is None:
+        _invalid_symbol_filter = InvalidSymbolFilter()
+    return _invalid_symbol_filter
@@ -0,0 +1,264 @@
+"""
+Vectorized market data quality checks and cross-provider conflict resolution
+
+Bars from each provider are converted once into timestamp-indexed columnar
+frames; gap, outlier, stale-bar and OHLC-consistency checks and the
+cross-provider comparison then run as array operations, so validation stays
+affordable on multi-year histories and bulk loads.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..interfaces.data_provider import MarketData
+
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+# Nominal bar spacing per interval, used for gap detection
+INTERVAL_SECONDS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "1d": 86400,
+    "1wk": 7 * 86400,
+    "1mo": 31 * 86400,
+}
+
+# Robust z-score (median/MAD of log returns) above which a bar is an outlier
+OUTLIER_ZSCORE = 8.0
+
+# Floor for the MAD return scale so near-constant series do not flag every move
+MIN_RETURN_SCALE = 1e-4
+
+# Relative close deviation between providers above which a bar is in conflict
+DEFAULT_DEVIATION_TOLERANCE = 0.01
+
+
+def is_bar_series(data: Any) -> bool:
+    """True for a non-empty list of MarketData bars"""
+    return isinstance(data, list) and len(data) > 0 and isinstance(data[0], MarketData)
+
+
+def bars_to_frame(bars: Sequence[MarketData]) -> pd.DataFrame:
+    """Columnar frame of bars indexed by UTC timestamp, sorted, duplicates dropped"""
+    frame = pd.DataFrame(
+        {
+            "open": [bar.open for bar in bars],
+            "high": [bar.high for bar in bars],
+            "low": [bar.low for bar in bars],
+            "close": [bar.close for bar in bars],
+            "volume": [bar.volume for bar in bars],
+            "adjusted_close": [bar.adjusted_close for bar in bars],
+            "bar": list(bars),
+        },
+        index=pd.to_datetime([bar.timestamp for bar in bars], utc=True),
+    )
+    frame.index.name = "timestamp"
+    frame = frame[~frame.index.duplicated(keep="first")]
+    return frame.sort_index()
+
+
+def _count_missing_bars(index: pd.DatetimeIndex, interval: str) -> int:
+    """Expected bars missing between consecutive timestamps"""
+    if len(index) < 2:
+        return 0
+
+    if interval == "1d":
+        # Business days strictly between consecutive bars (exchange holidays count as gaps)
+        days = index.tz_convert(None).normalize().values.astype("datetime64[D]")
+        between = np.busday_count(days[:-1] + np.timedelta64(1, "D"), days[1:])
+        return int(np.clip(between, 0, None).sum())
+
+    step = INTERVAL_SECONDS.get(interval)
+    if step is None:
+        return 0
+
+    deltas = np.diff(index.asi8) / 1e9
+    missing = np.floor(deltas / step + 1e-9) - 1
+    if step < 86400:
+        # Intraday: overnight and weekend breaks are not gaps
+        same_day = index[1:].date == index[:-1].date
+        missing = np.where(same_day, missing, 0)
+    return int(np.clip(missing, 0, None).sum())
+
+
+def assess_frame(frame: pd.DataFrame, interval: str = "1d", duplicates: int = 0) -> Dict[str, Any]:
+    """Quality counts for one bar frame"""
+    bars = len(frame)
+    if bars == 0:
+        return {"bars": 0, "missing_bars": 0, "outliers": 0, "stale_bars": 0,
+                "invalid_ohlc": 0, "duplicates": duplicates}
+
+    prices = frame[PRICE_COLUMNS].to_numpy(dtype=float)
+    open_, high, low, close = prices.T
+
+    invalid = (
+        np.isnan(prices).any(axis=1)
+        | (low <= 0)
+        | (high < np.maximum(open_, close))
+        | (low > np.minimum(open_, close))
+    )
+
+    outliers = np.zeros(bars, dtype=bool)
+    if bars > 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(np.where(close > 0, close, np.nan)))
+        finite = np.isfinite(returns)
+        if finite.sum() > 2:
+            median = np.median(returns[finite])
+            mad = max(np.median(np.abs(returns[finite] - median)), MIN_RETURN_SCALE)
+            zscores = 0.6745 * np.abs(returns - median) / mad
+            outliers[1:] = np.nan_to_num(zscores, nan=0.0) > OUTLIER_ZSCORE
+
+    # Stale: identical OHLC to the previous bar, or no volume and no price change
+    stale = np.zeros(bars, dtype=bool)
+    if bars > 1:
+        repeated = (prices[1:] == prices[:-1]).all(axis=1)
+        volume = frame["volume"].to_numpy(dtype=float)
+        no_trading = (volume[1:] == 0) & (close[1:] == close[:-1])
+        stale[1:] = repeated | no_trading
+
+    return {
+        "bars": bars,
+        "missing_bars": _count_missing_bars(frame.index, interval),
+        "outliers": int(outliers.sum()),
+        "stale_bars": int(stale.sum()),
+        "invalid_ohlc": int(invalid.sum()),
+        "duplicates": duplicates,
+    }
+
+
+def build_quality_report(series_by_symbol: Dict[str, List[MarketData]], interval: str = "1d") -> Dict[str, Any]:
+    """
+    Compact quality report across symbols
+
+    Returns totals, derived completeness/accuracy/consistency ratios and the
+    symbols with the most anomalies.
+    """
+    totals = {"bars": 0, "missing_bars": 0, "outliers": 0, "stale_bars": 0, "invalid_ohlc": 0, "duplicates": 0}
+    anomalies_by_symbol: Dict[str, int] = {}
+
+    for symbol, bars in series_by_symbol.items():
+        if not is_bar_series(bars):
+            continue
+        frame = bars_to_frame(bars)
+        counts = assess_frame(frame, interval, duplicates=len(bars) - len(frame))
+        for key in totals:
+            totals[key] += counts[key]
+        anomalies = counts["missing_bars"] + counts["outliers"] + counts["stale_bars"] + counts["invalid_ohlc"]
+        if anomalies:
+            anomalies_by_symbol[symbol] = anomalies
+
+    bars = totals["bars"]
+    return {
+        "symbols": len(series_by_symbol),
+        "interval": interval,
+        **totals,
+        "completeness": bars / (bars + totals["missing_bars"]) if bars else 0.0,
+        "accuracy": 1.0 - (totals["invalid_ohlc"] + totals["outliers"]) / bars if bars else 0.0,
+        "consistency": 1.0 - (totals["stale_bars"] + totals["duplicates"]) / bars if bars else 0.0,
+        "worst_symbols": sorted(anomalies_by_symbol, key=anomalies_by_symbol.get, reverse=True)[:5],
+    }
+
+
+def align_sources(frames: Dict[Any, pd.DataFrame], column: str = "close") -> pd.DataFrame:
+    """One column per source, outer-aligned on timestamp (NaN where a source has no bar)"""
+    return pd.DataFrame({source: frame[column] for source, frame in frames.items()})
+
+
+def cross_source_deviation(
+    frames: Dict[Any, pd.DataFrame],
+    tolerance: float = DEFAULT_DEVIATION_TOLERANCE
+) -> Dict[str, Any]:
+    """Per-source close deviation from the cross-source median on shared timestamps"""
+    closes = align_sources(frames)
+    shared = closes.dropna()
+    if shared.empty or shared.shape[1] < 2:
+        return {"shared_bars": 0, "conflicting_bars": 0, "max_deviation": 0.0, "by_source": {}}
+
+    median = shared.median(axis=1)
+    deviation = shared.sub(median, axis=0).abs().div(median.where(median != 0), axis=0).fillna(0.0)
+    conflicting = (deviation > tolerance).any(axis=1)
+
+    return {
+        "shared_bars": int(len(shared)),
+        "conflicting_bars": int(conflicting.sum()),
+        "max_deviation": float(deviation.to_numpy().max()),
+        "by_source": {
+            getattr(source, "value", str(source)): {
+                "mean_deviation": float(deviation[source].mean()),
+                "max_deviation": float(deviation[source].max()),
+                "bars_over_tolerance": int((deviation[source] > tolerance).sum()),
+            }
+            for source in shared.columns
+        },
+    }
+
+
+def consensus_bars(frames: Dict[Any, pd.DataFrame], priority: List[Any]) -> List[MarketData]:
+    """
+    Per timestamp, the bar from the source whose close is nearest the cross-source median
+
+    Ties (including timestamps only one source has) go to the higher-priority source.
+    """
+    ordered = [source for source in priority if source in frames]
+    closes = align_sources(frames)[ordered]
+    distance = closes.sub(closes.median(axis=1), axis=0).abs()
+
+    values = distance.to_numpy()
+    # Absent bars can never win; argmin returns the first (highest-priority) minimum
+    chosen = np.argmin(np.where(np.isnan(values), np.inf, values), axis=1)
+
+    objects = pd.DataFrame({source: frames[source]["bar"] for source in ordered}).reindex(closes.index)
+    return list(objects.to_numpy()[np.arange(len(objects)), chosen])
+
+
+def weighted_average_bars(
+    frames: Dict[Any, pd.DataFrame],
+    weights: Dict[Any, float],
+    priority: List[Any],
+    symbol: str
+) -> List[MarketData]:
+    """Reliability-weighted average of prices per timestamp; volume from the highest-priority source"""
+    ordered = [source for source in priority if source in frames]
+    index = align_sources(frames).index
+    weight_vector = np.array([weights.get(source, 1.0) for source in ordered])
+
+    averaged: Dict[str, np.ndarray] = {}
+    for column in PRICE_COLUMNS + ["adjusted_close"]:
+        values = np.column_stack([
+            frames[source][column].reindex(index).to_numpy(dtype=float) for source in ordered
+        ])
+        present = ~np.isnan(values)
+        total_weight = (present * weight_vector).sum(axis=1)
+        with np.errstate(invalid="ignore"):
+            averaged[column] = np.nansum(values * weight_vector, axis=1) / total_weight
+
+    volume = frames[ordered[0]]["volume"].reindex(index)
+    for source in ordered[1:]:
+        volume = volume.fillna(frames[source]["volume"].reindex(index))
+
+    return [
+        MarketData.model_construct(
+            symbol=symbol,
+            timestamp=timestamp,
+            open=float(averaged["open"][i]),
+            high=float(averaged["high"][i]),
+            low=float(averaged["low"][i]),
+            close=float(averaged["close"][i]),
+            volume=int(volume.iloc[i]) if not pd.isna(volume.iloc[i]) else 0,
+            adjusted_close=None if np.isnan(averaged["adjusted_close"][i]) else float(averaged["adjusted_close"][i]),
+            metadata={"source": "weighted_average", "sources": [getattr(s, "value", str(s)) for s in ordered]},
+        )
+        for i, timestamp in enumerate(index.to_pydatetime())
+    ]
+
+
+def latest_bar_source(frames: Dict[Any, pd.DataFrame]) -> Optional[Any]:
+    """Source whose series ends latest"""
+    non_empty = {source: frame.index[-1] for source, frame in frames.items() if len(frame)}
+    return max(non_empty, key=non_empty.get) if non_empty else None
@@ -5,7 +5,6 @@ from datetime import date, datetime, timezone, timedelta
 from typing import List, Dict, Optional, Any
 from concurrent.futures import ThreadPoolExecutor
 import time
-import aiohttp
 from functools import lru_cache
 
 try:
@@ -21,10 +20,22 @@ except ImportError:
         OPENBB_AVAILABLE = False
         obb = None
 
-from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult
+from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult, SYMBOL_NOT_FOUND
+from .provider_cache import ProviderCache
+from .invalid_symbol_filter import InvalidSymbolFilter, get_invalid_symbol_filter
+from ..economic_series_store import EconomicSeriesStore
 
 logger = logging.getLogger(__name__)
 
+# Economic indicators and the OpenBB endpoints serving them
+ECONOMIC_INDICATORS = {
+    "gdp": lambda **kwargs: obb.economy.gdp(provider="fred", **kwargs),
+    "inflation": lambda **kwargs: obb.economy.cpi(provider="fred", **kwargs),
+    "unemployment": lambda **kwargs: obb.economy.unemployment(provider="fred", **kwargs),
+    "interest_rates": lambda **kwargs: obb.fixedincome.rate.dgs10(provider="fred", **kwargs),
+    "vix": lambda **kwargs: obb.equity.index.price.historical(symbol="^VIX", provider="yfinance", **kwargs)
+}
+
 class OpenBBDataProvider(IDataProvider):
     """OpenBB Terminal SDK implementation providing professional-grade financial data"""
     
@@ -33,7 +44,10 @@ class OpenBBDataProvider(IDataProvider):
         max_workers: int = 3,
         request_delay: float = 0.2,  # Configuration-compliant delay
         api_key: Optional[str] = None,
-        enable_pro_features: bool = False
+        enable_pro_features: bool = False,
+        cache: Optional[ProviderCache] = None,
+        economic_store: Optional[EconomicSeriesStore] = None,
+        invalid_symbols: Optional[InvalidSymbolFilter] = None
     ):
         """
         Initialize OpenBB Terminal data provider
@@ -43,6 +57,9 @@ class OpenBBDataProvider(IDataProvider):
             request_delay: Delay between requests to respect rate limits
             api_key: OpenBB Pro API key for enhanced features
             enable_pro_features: Enable professional-grade features
+            cache: Shared provider cache (defaults to an in-process only cache)
+            economic_store: Persisted economic series cache (defaults to the application database)
+            invalid_symbols: Known-invalid symbol filter (defaults to the process-wide filter)
         """
         if not OPENBB_AVAILABLE:
             logger.warning(
@@ -60,9 +77,9 @@ class OpenBBDataProvider(IDataProvider):
         self._last_request_time = 0.0
         
         # Performance optimizations
-        self._session = None
-        self._cache = {}  # Simple in-memory cache
-        self._cache_ttl = 300  # 5 minutes cache TTL
+        self.cache = cache or ProviderCache(namespace="openbb")
+        self.economic_store = economic_store or EconomicSeriesStore()
+        self.invalid_symbols = invalid_symbols or get_invalid_symbol_filter()
         
         # Initialize OpenBB with API key if provided
         if api_key:
@@ -73,69 +90,26 @@ class OpenBBDataProvider(IDataProvider):
                 logger.warning(f"Failed to set OpenBB API key: {e}")
                 self.enable_pro_features = False
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with connection pooling"""
-        if self._session is None or self._session.closed:
-            # Configure connection pool for optimal performance
-            connector = aiohttp.TCPConnector(
-                limit=20,  # Total pool size
-                limit_per_host=5,  # Per-host limit
-                keepalive_timeout=30,
-                enable_cleanup_closed=True
-            )
-            
-            timeout = aiohttp.ClientTimeout(
-                total=30,  # Total timeout
-                connect=10,  # Connection timeout
-                sock_read=10  # Socket read timeout
-            )
-            
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers={
-                    'User-Agent': 'BubblePlatform/1.0'
-                }
-            )
-        
-        return self._session
-    
-    async def _close_session(self):
-        """Close HTTP session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-    
     def _get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate cache key for operation"""
-        import hashlib
-        key_data = f"{operation}:{':'.join(f'{k}={v}' for k, v in sorted(kwargs.items()))}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return self.cache.make_key(operation, **kwargs)
     
     def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Get cached result if available and not expired"""
-        if cache_key in self._cache:
-            result, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self._cache_ttl:
-                return result
-            else:
-                del self._cache[cache_key]
-        return None
+        return self.cache.get(cache_key)
     
     def _cache_result(self, cache_key: str, result: Any):
-        """Cache result with timestamp"""
-        self._cache[cache_key] = (result, time.time())
-        # Simple LRU: remove oldest entries if cache gets too large
-        if len(self._cache) > 1000:  # Max 1000 cached items
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+        """Cache result with its per-operation TTL"""
+        self.cache.set(cache_key, result)
     
     async def _rate_limit(self):
-        """Respect OpenBB API rate limits"""
+        """Respect OpenBB API rate limits (concurrent callers are spaced request_delay apart)"""
         current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        if time_since_last_request < self.request_delay:
-            await asyncio.sleep(self.request_delay - time_since_last_request)
-        self._last_request_time = time.time()
+        # Reserve the next request slot before sleeping so concurrent callers queue up
+        slot = max(current_time, self._last_request_time + self.request_delay)
+        self._last_request_time = slot
+        if slot > current_time:
+            await asyncio.sleep(slot - current_time)
     
     def _run_in_executor(self, func, *args):
         """Run blocking OpenBB operations in thread executor"""
@@ -217,24 +191,21 @@ class OpenBBDataProvider(IDataProvider):
             logger.warning(f"Failed to get historical data for {symbol}: {e}")
             return pd.DataFrame()
     
-    def _get_quote_data(self, symbol: str) -> Dict:
-        """Get quote data - blocking operation with aggressive caching for SLA compliance"""
-        # Check aggressive cache first for performance SLA compliance
-        cache_key = f"quote_{symbol}"
-        current_time = time.time()
-        
-        if hasattr(self, '_quote_cache') and cache_key in self._quote_cache:
-            cached_data, cache_time = self._quote_cache[cache_key]
-            # Use 60-second cache for aggressive performance (vs 5 minutes default)
-            if current_time - cache_time < 60:
-                logger.debug(f"Cache hit for {symbol} quote (age: {current_time - cache_time:.1f}s)")
-                return cached_data
+    def _get_quote_data(self, symbol: str, raise_errors: bool = False) -> Dict:
+        """
+        Get quote data - blocking operation with aggressive caching for SLA compliance
+
+        Upstream errors give an empty quote unless raise_errors is set (validation
+        must not mistake a failed request for an unknown symbol).
+        """
+        # Check aggressive cache first for performance SLA compliance (60s quote TTL)
+        cache_key = self._get_cache_key("quote", symbol=symbol)
+        cached_data = self._get_cached_result(cache_key)
+        if cached_data is not None:
+            logger.debug(f"Cache hit for {symbol} quote")
+            return cached_data
         
         try:
-            # Initialize cache if not present
-            if not hasattr(self, '_quote_cache'):
-                self._quote_cache = {}
-            
             start_time = time.time()
             quote = obb.equity.price.quote(symbol=symbol, provider="yfinance")
             api_time = time.time() - start_time
@@ -253,17 +224,14 @@ class OpenBBDataProvider(IDataProvider):
             
             # Aggressively cache successful results
             if result_data:
-                self._quote_cache[cache_key] = (result_data, current_time)
-                
-                # Clean old entries (simple LRU)
-                if len(self._quote_cache) > 100:
-                    oldest_key = min(self._quote_cache.keys(), key=lambda k: self._quote_cache[k][1])
-                    del self._quote_cache[oldest_key]
+                self._cache_result(cache_key, result_data)
             
             return result_data
             
         except Exception as e:
             logger.warning(f"Failed to get quote for {symbol}: {e}")
+            if raise_errors:
+                raise
             return {}
     
     async def _fetch_single_quote_optimized(self, symbol: str) -> Optional[MarketData]:
@@ -405,6 +373,80 @@ class OpenBBDataProvider(IDataProvider):
         
         return result
     
+    def _get_fundamental_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get fundamental data for many symbols with one upstream call per endpoint - blocking operation"""
+        joined = ",".join(symbols)
+        result: Dict[str, Dict] = {symbol: {} for symbol in symbols}
+
+        endpoints = [
+            ("profile", lambda: obb.equity.profile(symbol=joined, provider="yfinance")),
+            ("metrics", lambda: obb.equity.fundamental.metrics(symbol=joined, provider="yfinance")),
+        ]
+        for name, call in endpoints:
+            try:
+                data = call()
+            except Exception as e:
+                logger.debug(f"Batch {name} request failed for {len(symbols)} symbols: {e}")
+                continue
+
+            items = getattr(data, 'results', None) or []
+            for item in items if isinstance(items, list) else [items]:
+                if hasattr(item, 'model_dump'):
+                    record = item.model_dump()
+                elif hasattr(item, '__dict__'):
+                    record = dict(item.__dict__)
+                else:
+                    record = dict(item)
+
+                symbol = str(record.get('symbol', '')).upper()
+                if symbol in result:
+                    # Earlier endpoints win for fields both return
+                    for key, value in record.items():
+                        if value is not None:
+                            result[symbol].setdefault(key, value)
+
+        return {symbol: data for symbol, data in result.items() if data}
+
+    async def fetch_fundamentals_bulk(
+        self,
+        symbols: List[str],
+        batch_size: int = 50
+    ) -> ServiceResult[Dict[str, Dict]]:
+        """
+        Fetch fundamental data for many symbols in multi-symbol upstream calls
+
+        Used by the bulk fundamentals refresh; per-symbol requests stay on
+        fetch_fundamental_data.
+        """
+        if not OPENBB_AVAILABLE:
+            return ServiceResult(
+                success=False,
+                error="OpenBB Terminal SDK not available",
+                message="Bulk fundamentals require the OpenBB SDK",
+                metadata={"provider": "openbb_terminal"}
+            )
+
+        result: Dict[str, Dict] = {}
+        for index in range(0, len(symbols), batch_size):
+            batch = [symbol.upper() for symbol in symbols[index:index + batch_size]]
+            await self._rate_limit()
+            try:
+                result.update(await self._run_in_executor(self._get_fundamental_data_batch, batch))
+            except Exception as e:
+                logger.error(f"Bulk fundamentals batch failed for {len(batch)} symbols: {e}")
+
+        missing = [symbol for symbol in symbols if symbol.upper() not in result]
+        return ServiceResult(
+            success=len(result) > 0,
+            data=result,
+            message=f"Fetched fundamentals for {len(result)}/{len(symbols)} symbols in bulk via OpenBB",
+            metadata={
+                "provider": "openbb_terminal",
+                "batches": (len(symbols) + batch_size - 1) // batch_size,
+                "missing_symbols": missing
+            }
+        )
+    
     async def fetch_historical_data(
         self,
         symbols: List[str],
@@ -725,7 +767,68 @@ class OpenBBDataProvider(IDataProvider):
         self,
         symbols: List[str]
     ) -> ServiceResult[Dict[str, ValidationResult]]:
-        """Validate asset symbols using OpenBB Terminal SDK with bulk optimization"""
+        """
+        Validate asset symbols using OpenBB Terminal SDK with bulk optimization
+
+        Symbols already known to be invalid are answered from the invalid-symbol
+        filter without an upstream call. The filter is only read here: an empty
+        OpenBB quote is not a definitive "not found", so negatives are recorded
+        by the Yahoo Finance + Alpha Vantage consensus in AssetValidationService.
+        """
+        known_invalid = {
+            symbol: ValidationResult(
+                symbol=symbol,
+                is_valid=False,
+                provider="openbb_terminal",
+                timestamp=datetime.now(timezone.utc),
+                error=SYMBOL_NOT_FOUND,
+                confidence=0.0,
+                source="cache"
+            )
+            for symbol in symbols
+            if self.invalid_symbols.is_known_invalid(symbol)
+        }
+        if known_invalid:
+            self.invalid_symbols.record_saved_calls(len(known_invalid))
+
+        to_validate = [symbol for symbol in symbols if symbol not in known_invalid]
+        if not to_validate:
+            return ServiceResult(
+                success=True,
+                data=known_invalid,
+                message=f"Validated 0/{len(symbols)} symbols via OpenBB (all known invalid)",
+                metadata={
+                    "provider": "openbb_terminal",
+                    "total_symbols": len(symbols),
+                    "valid_symbols": 0,
+                    "invalid_symbols": len(symbols),
+                    "known_invalid_symbols": len(known_invalid)
+                },
+                next_actions=["check_symbol_spellings"]
+            )
+
+        result = await self._validate_symbols_upstream(to_validate)
+        if not result.success:
+            return result
+
+        for symbol, validation in result.data.items():
+            if validation.is_valid:
+                self.invalid_symbols.clear(symbol)
+
+        if known_invalid:
+            result.data.update(known_invalid)
+            result.metadata.update({
+                "total_symbols": len(symbols),
+                "invalid_symbols": len(symbols) - result.metadata.get("valid_symbols", 0),
+                "known_invalid_symbols": len(known_invalid)
+            })
+        return result
+
+    async def _validate_symbols_upstream(
+        self,
+        symbols: List[str]
+    ) -> ServiceResult[Dict[str, ValidationResult]]:
+        """Validate symbols against OpenBB (no negative-cache short-circuit)"""
         try:
             # Bulk optimization: Single rate limit for the entire batch
             await self._rate_limit()
@@ -739,14 +842,13 @@ class OpenBBDataProvider(IDataProvider):
                 async def validate_single_symbol(symbol: str) -> tuple[str, ValidationResult]:
                     try:
                         # Use cached data first for aggressive performance
-                        cache_key = f"validation_{symbol}"
-                        if hasattr(self, '_quote_cache') and cache_key in self._quote_cache:
-                            cached_result, cache_time = self._quote_cache[cache_key]
-                            if time.time() - cache_time < 300:  # 5 minute cache for validation
-                                return symbol, cached_result
+                        cache_key = self._get_cache_key("validation", symbol=symbol)
+                        cached_result = self._get_cached_result(cache_key)
+                        if cached_result is not None:  # 5 minute cache for validation
+                            return symbol, cached_result
                         
                         # Use quote data to validate symbol
-                        quote_data = await self._run_in_executor(self._get_quote_data, symbol)
+                        quote_data = await self._run_in_executor(self._get_quote_data, symbol, True)
                         
                         if quote_data and 'last_price' in quote_data:
                             # Symbol is valid - get additional info
@@ -777,9 +879,7 @@ class OpenBBDataProvider(IDataProvider):
                             )
                             
                             # Cache successful validation
-                            if not hasattr(self, '_quote_cache'):
-                                self._quote_cache = {}
-                            self._quote_cache[cache_key] = (validation_result, time.time())
+                            self._cache_result(cache_key, validation_result)
                             
                             return symbol, validation_result
                         else:
@@ -788,7 +888,7 @@ class OpenBBDataProvider(IDataProvider):
                                 is_valid=False,
                                 provider="openbb_terminal",
                                 timestamp=datetime.now(timezone.utc),
-                                error="Symbol not found or invalid",
+                                error=SYMBOL_NOT_FOUND,
                                 confidence=0.0,
                                 source="real_time"
                             )
@@ -842,14 +942,13 @@ class OpenBBDataProvider(IDataProvider):
                         async def validate_chunk_symbol(sym: str) -> tuple[str, ValidationResult]:
                             try:
                                 # Use cached data first for aggressive performance
-                                cache_key = f"validation_{sym}"
-                                if hasattr(self, '_quote_cache') and cache_key in self._quote_cache:
-                                    cached_result, cache_time = self._quote_cache[cache_key]
-                                    if time.time() - cache_time < 300:  # 5 minute cache for validation
-                                        return sym, cached_result
+                                cache_key = self._get_cache_key("validation", symbol=sym)
+                                cached_result = self._get_cached_result(cache_key)
+                                if cached_result is not None:  # 5 minute cache for validation
+                                    return sym, cached_result
                                 
                                 # Use quote data to validate symbol
-                                quote_data = await self._run_in_executor(self._get_quote_data, sym)
+                                quote_data = await self._run_in_executor(self._get_quote_data, sym, True)
                                 
                                 if quote_data and 'last_price' in quote_data:
                                     # Symbol is valid - get additional info
@@ -880,9 +979,7 @@ class OpenBBDataProvider(IDataProvider):
                                     )
                                     
                                     # Cache successful validation
-                                    if not hasattr(self, '_quote_cache'):
-                                        self._quote_cache = {}
-                                    self._quote_cache[cache_key] = (validation_result, time.time())
+                                    self._cache_result(cache_key, validation_result)
                                     
                                     return sym, validation_result
                                 else:
@@ -891,7 +988,7 @@ class OpenBBDataProvider(IDataProvider):
                                         is_valid=False,
                                         provider="openbb_terminal",
                                         timestamp=datetime.now(timezone.utc),
-                                        error="Symbol not found or invalid",
+                                        error=SYMBOL_NOT_FOUND,
                                         confidence=0.0,
                                         source="real_time"
                                     )
@@ -1097,6 +1194,69 @@ class OpenBBDataProvider(IDataProvider):
                 metadata={"provider": "openbb_terminal", "symbols": symbols}
             )
     
+    @staticmethod
+    def _get_economic_data(indicator: str, start_date: Optional[date] = None) -> pd.DataFrame:
+        """
+        Fetch an economic series from OpenBB, only observations from start_date if given
+
+        Upstream errors propagate so a failed fetch is never mistaken for
+        "no new observations".
+        """
+        fetch = ECONOMIC_INDICATORS.get(indicator.lower())
+        if fetch is None:
+            logger.warning(f"Economic indicator '{indicator}' not supported")
+            return pd.DataFrame()
+
+        data = fetch(start_date=start_date.isoformat()) if start_date else fetch()
+        if hasattr(data, 'to_df'):
+            return data.to_df()
+        return pd.DataFrame()
+
+    async def _fetch_economic_series(self, indicator: str) -> Dict[str, Any]:
+        """
+        Serve one indicator from the series cache, requesting only new observations upstream
+
+        Returns:
+            {"data": frame, "upstream": whether OpenBB was called, "new_observations": count,
+             "error": upstream error if the stored series was served instead}
+        """
+        series_id = indicator.lower()
+        try:
+            state = await asyncio.to_thread(self.economic_store.get_state, series_id)
+        except Exception as e:
+            # Without the store, fall back to a full upstream fetch
+            logger.warning(f"Economic series cache unavailable for {indicator}: {e}")
+            await self._rate_limit()
+            data = await self._run_in_executor(self._get_economic_data, indicator, None)
+            return {"data": data, "upstream": True, "new_observations": len(data)}
+
+        if not self.economic_store.needs_refresh(series_id, state):
+            data = await asyncio.to_thread(self.economic_store.load_series, series_id)
+            return {"data": data, "upstream": False, "new_observations": 0}
+
+        start_date = None
+        if state and state["last_observation_date"]:
+            start_date = state["last_observation_date"] + timedelta(days=1)
+
+        await self._rate_limit()
+        try:
+            fresh = await self._run_in_executor(self._get_economic_data, indicator, start_date)
+        except Exception as e:
+            if state is None:
+                raise
+            # Serve what is stored; not merged or stamped as checked, so the next request retries
+            logger.warning(f"Failed to refresh economic indicator {indicator}, serving stored series: {e}")
+            data = await asyncio.to_thread(self.economic_store.load_series, series_id)
+            return {"data": data, "upstream": True, "new_observations": 0, "error": str(e)}
+
+        if fresh.empty and state is None:
+            # Nothing stored and nothing upstream - don't record the series as checked
+            return {"data": fresh, "upstream": True, "new_observations": 0}
+
+        changed = await asyncio.to_thread(self.economic_store.merge_observations, series_id, fresh, "openbb_terminal")
+        data = await asyncio.to_thread(self.economic_store.load_series, series_id)
+        return {"data": data, "upstream": True, "new_observations": changed}
+
     async def fetch_economic_indicators(
         self,
         indicators: List[str]
@@ -1104,52 +1264,36 @@ class OpenBBDataProvider(IDataProvider):
         """
         Fetch economic indicators using OpenBB Terminal SDK
         Professional feature for macro-economic analysis
+
+        Series are served from the persisted series cache; upstream is only asked
+        for observations after the last stored one, and indicators resolve
+        concurrently under the provider rate limit.
         """
         try:
-            def _get_economic_data(indicator: str):
-                try:
-                    # Map common indicators to OpenBB functions
-                    indicator_mapping = {
-                        "gdp": lambda: obb.economy.gdp(provider="fred"),
-                        "inflation": lambda: obb.economy.cpi(provider="fred"), 
-                        "unemployment": lambda: obb.economy.unemployment(provider="fred"),
-                        "interest_rates": lambda: obb.fixedincome.rate.dgs10(provider="fred"),
-                        "vix": lambda: obb.equity.index.price.historical(symbol="^VIX", provider="yfinance")
-                    }
-                    
-                    if indicator.lower() in indicator_mapping:
-                        data = indicator_mapping[indicator.lower()]()
-                        if hasattr(data, 'to_df'):
-                            return data.to_df()
-                        return pd.DataFrame()
-                    else:
-                        logger.warning(f"Economic indicator '{indicator}' not supported")
-                        return pd.DataFrame()
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to fetch economic indicator {indicator}: {e}")
-                    return pd.DataFrame()
-            
-            await self._rate_limit()
-            
+            outcomes = await asyncio.gather(
+                *(self._fetch_economic_series(indicator) for indicator in indicators),
+                return_exceptions=True
+            )
+
             result = {}
             errors = []
-            
-            for indicator in indicators:
-                try:
-                    data = await self._run_in_executor(_get_economic_data, indicator)
-                    if not data.empty:
-                        result[indicator] = data
-                    else:
-                        errors.append(f"No data available for {indicator}")
-                        
-                except Exception as e:
-                    errors.append(f"Error fetching {indicator}: {str(e)}")
-                    logger.error(f"Error fetching economic indicator {indicator}: {e}")
-                
-                # Rate limiting
-                if len(indicators) > 1:
-                    await asyncio.sleep(self.request_delay)
+            upstream_calls = 0
+            new_observations = 0
+
+            for indicator, outcome in zip(indicators, outcomes):
+                if isinstance(outcome, Exception):
+                    errors.append(f"Error fetching {indicator}: {str(outcome)}")
+                    logger.error(f"Error fetching economic indicator {indicator}: {outcome}")
+                    continue
+
+                upstream_calls += outcome["upstream"]
+                if outcome.get("error"):
+                    errors.append(f"Refresh failed for {indicator}, served stored series: {outcome['error']}")
+                new_observations += outcome["new_observations"]
+                if not outcome["data"].empty:
+                    result[indicator] = outcome["data"]
+                else:
+                    errors.append(f"No data available for {indicator}")
             
             return ServiceResult(
                 success=len(result) > 0,
@@ -1160,7 +1304,10 @@ class OpenBBDataProvider(IDataProvider):
                     "requested_indicators": len(indicators),
                     "successful": len(result),
                     "errors": errors,
-                    "supported_indicators": ["gdp", "inflation", "unemployment", "interest_rates", "vix"]
+                    "upstream_calls": upstream_calls,
+                    "served_from_cache": len(indicators) - upstream_calls,
+                    "new_observations": new_observations,
+                    "supported_indicators": list(ECONOMIC_INDICATORS)
                 },
                 next_actions=["analyze_economic_trends", "correlate_with_assets"] if result else ["check_indicator_names"]
             )
@@ -1223,6 +1370,5 @@ class OpenBBDataProvider(IDataProvider):
     
     async def cleanup(self):
         """Clean up resources"""
-        await self._close_session()
         if hasattr(self, 'executor'):
             self.executor.shutdown(wait=False)
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""
+Tiered cache shared by all market data providers
+
+L1: bounded in-process LRU with per-entry TTL (O(1) get, set and eviction)
+L2: optional shared Redis layer so results are reused across API workers and
+    Celery processes and survive restarts. Values are stored as JSON from the
+    shared serializer; provider result models are tagged with their name and
+    rebuilt on read (only the models in CACHED_MODELS)
+
+Keys are stable across processes (sha256 over the canonical JSON of the
+parameters) and embed the operation name, which selects the entry TTL.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..interfaces.data_provider import MarketData, AssetInfo, ValidationResult
+from ..interfaces.i_composite_data_provider import CompositeResult, DataQuality
+from ...utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Per-operation TTLs in seconds; operations not listed use the cache default_ttl
+DEFAULT_OPERATION_TTLS: Dict[str, int] = {
+    "real_time": 60,
+    "quote": 60,
+    "validate_symbols": 300,
+    "validation": 300,
+    "historical_data": 3600,
+    "asset_info": 3600,
+    "ticker_info": 3600,
+    "search_assets": 3600,
+    "fundamental_data": 3600,
+    "economic_indicators": 3600,
+}
+
+# Models that can appear in cached provider results, rebuilt by name on read
+CACHED_MODELS: Dict[str, type] = {
+    model.__name__: model for model in (MarketData, AssetInfo, ValidationResult, DataQuality, CompositeResult)
+}
+
+
+def _encode(value: Any) -> Any:
+    """JSON-safe encoding that keeps model types, nested models included"""
+    if isinstance(value, BaseModel):
+        name = type(value).__name__
+        if name not in CACHED_MODELS:
+            raise TypeError(f"{name} cannot be stored in the shared provider cache")
+        return {"__model__": name, **{field: _encode(getattr(value, field)) for field in type(value).model_fields}}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode"""
+    if isinstance(value, dict):
+        if "__model__" in value:
+            model = CACHED_MODELS[value["__model__"]]
+            return model.model_validate({key: _decode(item) for key, item in value.items() if key != "__model__"})
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class ProviderCache:
+    """
+    Two-tier LRU/TTL cache for provider results
+
+    The in-process layer is synchronous and thread-safe so it can be used from
+    provider executor threads; the async ``aget``/``aset`` methods add the
+    optional Redis layer. Redis failures, and values that cannot be encoded or
+    decoded, are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 1000,
+        default_ttl: int = 300,
+        operation_ttls: Optional[Dict[str, int]] = None,
+        redis_client=None,
+        redis_key_prefix: str = "bubble:provider_cache:v2",
+        redis_pool=None
+    ):
+        """
+        Initialize provider cache
+
+        Args:
+            namespace: Key namespace, usually the provider name
+            max_entries: Maximum entries kept in the in-process layer
+            default_ttl: TTL for operations without a specific TTL
+            operation_ttls: Per-operation TTL overrides (merged over DEFAULT_OPERATION_TTLS)
+            redis_client: Optional binary redis.asyncio client (decode_responses=False) for the shared layer
+            redis_key_prefix: Prefix for keys stored in Redis
+            redis_pool: RedisPoolRegistry whose binary client for the running event
+                loop backs the shared layer (for caches outliving event loops)
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.operation_ttls = {**DEFAULT_OPERATION_TTLS, **(operation_ttls or {})}
+        self._redis_client = redis_client
+        self.redis_pool = redis_pool
+        self.redis_key_prefix = redis_key_prefix
+
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats: Dict[str, int] = defaultdict(int)
+
+    def make_key(self, operation: str, **params) -> str:
+        """Build a process-stable cache key for an operation and its parameters"""
+        canonical = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+        return f"{self.namespace}:{operation}:{digest}"
+
+    def ttl_for(self, operation: str) -> int:
+        """TTL in seconds for an operation"""
+        return self.operation_ttls.get(operation, self.default_ttl)
+
+    def _ttl_for_key(self, key: str) -> int:
+        """TTL for a key built by make_key (operation is the second key segment)"""
+        parts = key.split(":", 2)
+        return self.ttl_for(parts[1]) if len(parts) == 3 else self.default_ttl
+
+    # In-process layer
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the in-process layer, or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["l1_hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value in the in-process layer, evicting least recently used entries"""
+        ttl = self._ttl_for_key(key) if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            self._stats["sets"] += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def delete(self, key: str):
+        """Remove a key from the in-process layer"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate) -> int:
+        """Remove in-process entries whose key matches predicate; returns the number removed"""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        """Drop all in-process entries"""
+        with self._lock:
+            self._entries.clear()
+
+    # Shared Redis layer
+
+    @property
+    def redis_client(self):
+        """Injected Redis client, the pool's client for the running loop, or None"""
+        if self._redis_client is not None:
+            return self._redis_client
+        if self.redis_pool is not None:
+            return self.redis_pool.get_client(decode_responses=False)
+        return None
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.redis_key_prefix}:{key}"
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get a value from the in-process layer, falling back to Redis"""
+        value = self.get(key)
+        redis_client = self.redis_client
+        if value is not None or redis_client is None:
+            return value
+
+        try:
+            payload = await redis_client.get(self._redis_key(key))
+            if payload is None:
+                return None
+
+            entry = loads(payload)
+            remaining = entry["expires_at"] - time.time()
+            if remaining <= 0:
+                return None
+
+            # Promote into L1 for the remaining lifetime of the shared entry
+            value = _decode(entry["value"])
+            self.set(key, value, ttl=remaining)
+            self._stats["l2_hits"] += 1
+            return value
+
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Provider cache Redis read failed for {key}: {e}")
+            return None
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value in the in-process layer and in Redis"""
+        ttl = self._ttl_for_key(key) if ttl is None else ttl
+        self.set(key, value, ttl=ttl)
+
+        redis_client = self.redis_client
+        if redis_client is None or ttl <= 0:
+            return
+
+        try:
+            payload = dumps({"expires_at": time.time() + ttl, "value": _encode(value)})
+            await redis_client.setex(self._redis_key(key), max(int(ttl), 1), payload)
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Provider cache Redis write failed for {key}: {e}")
+
+    async def adelete(self, key: str):
+        """Remove a key from both layers"""
+        self.delete(key)
+        redis_client = self.redis_client
+        if redis_client is None:
+            return
+        try:
+            await redis_client.delete(self._redis_key(key))
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Provider cache Redis delete failed for {key}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction metrics for monitoring"""
+        with self._lock:
+            size = len(self._entries)
+            stats = dict(self._stats)
+
+        hits = stats.get("l1_hits", 0) + stats.get("l2_hits", 0)
+        lookups = stats.get("l1_hits", 0) + stats.get("misses", 0)
+        return {
+            "namespace": self.namespace,
+            "size": size,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "l1_hits": stats.get("l1_hits", 0),
+            "l2_hits": stats.get("l2_hits", 0),
+            "misses": stats.get("misses", 0) - stats.get("l2_hits", 0),
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "sets": stats.get("sets", 0),
+            "evictions": stats.get("evictions", 0),
+            "expirations": stats.get("expirations", 0),
+            "redis_enabled": self._redis_client is not None or self.redis_pool is not None,
+            "redis_errors": stats.get("redis_errors", 0),
+        }
@@ -0,0 +1,355 @@
+"""
+Record/replay data provider for offline load tests and benchmarks
+
+In record mode the provider wraps a live provider and appends every response
+to a gzip-compressed JSON-lines recording. In replay mode it serves those
+recordings without network access, with optional latency and error injection
+driven by a seeded RNG so benchmark runs are reproducible.
+
+Replay matches calls on operation and parameters. Symbol-list calls that were
+recorded with a different batching are assembled from per-symbol entries, so
+cache hits, batching and range splitting upstream do not break replay.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import random
+import threading
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult
+from ..interfaces.i_composite_data_provider import DataSource
+
+logger = logging.getLogger(__name__)
+
+# Models that can appear in provider results, rebuilt by name on replay
+REPLAY_MODELS: Dict[str, type] = {
+    "MarketData": MarketData,
+    "AssetInfo": AssetInfo,
+    "ValidationResult": ValidationResult,
+}
+
+
+class RecordReplayMode(Enum):
+    """Provider mode"""
+    RECORD = "record"  # Call the wrapped live provider and capture responses
+    REPLAY = "replay"  # Serve captured responses offline
+
+
+def _encode(value: Any) -> Any:
+    """JSON-safe encoding that keeps model types for replay"""
+    if isinstance(value, BaseModel):
+        return {"__model__": type(value).__name__, **value.model_dump(mode="json")}
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode"""
+    if isinstance(value, dict):
+        model_name = value.get("__model__")
+        if model_name in REPLAY_MODELS:
+            fields = {key: item for key, item in value.items() if key != "__model__"}
+            return REPLAY_MODELS[model_name].model_validate(fields)
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _params_key(params: Dict[str, Any]) -> str:
+    """Canonical, order-independent parameter key"""
+    return json.dumps(_encode(params), sort_keys=True, separators=(",", ":"))
+
+
+class RecordReplayDataProvider(IDataProvider):
+    """IDataProvider that records a live provider's responses or replays them offline"""
+
+    def __init__(
+        self,
+        recording_path: str,
+        mode: RecordReplayMode = RecordReplayMode.REPLAY,
+        delegate: Optional[IDataProvider] = None,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        name: str = "record_replay"
+    ):
+        """
+        Initialize record/replay provider
+
+        Args:
+            recording_path: gzip JSON-lines recording file (e.g. recordings/yahoo_finance.jsonl.gz)
+            mode: RECORD (wrap delegate and capture) or REPLAY (serve the recording)
+            delegate: Live provider to record (required in RECORD mode)
+            latency_ms: Mean injected latency per replayed call
+            latency_jitter_ms: Standard deviation of the injected latency
+            error_rate: Fraction of replayed calls that fail (0.0 - 1.0)
+            seed: RNG seed for reproducible latency/error injection
+            name: Provider name reported in metadata and health checks
+        """
+        if mode == RecordReplayMode.RECORD and delegate is None:
+            raise ValueError("Record mode requires a delegate provider")
+
+        self.recording_path = recording_path
+        self.mode = mode
+        self.delegate = delegate
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.name = name
+        self._rng = random.Random(seed)
+        self._write_lock = threading.Lock()
+
+        # (operation, params key) -> encoded ServiceResult
+        self._recordings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # (operation, params key without symbols, symbol) -> encoded per-symbol value
+        self._symbol_index: Dict[Tuple[str, str, str], Any] = {}
+        self._stats: Dict[str, int] = {"calls": 0, "recorded": 0, "replayed": 0, "misses": 0, "injected_errors": 0}
+
+        if os.path.exists(recording_path):
+            self._load()
+        elif mode == RecordReplayMode.REPLAY:
+            logger.warning(f"Recording {recording_path} not found - replay will return misses")
+
+    # Recording storage
+
+    def _load(self):
+        """Load recorded entries (later entries override earlier ones)"""
+        entries = 0
+        with gzip.open(self.recording_path, "rt", encoding="utf-8") as recording:
+            for line in recording:
+                if line.strip():
+                    self._index(json.loads(line))
+                    entries += 1
+        logger.info(f"Loaded {entries} recorded responses from {self.recording_path}")
+
+    def _index(self, entry: Dict[str, Any]):
+        operation, params, result = entry["operation"], entry["params"], entry["result"]
+        self._recordings[(operation, _params_key(params))] = result
+
+        data = result.get("data")
+        if "symbols" in params and isinstance(data, dict):
+            rest = _params_key({key: value for key, value in params.items() if key != "symbols"})
+            for symbol, value in data.items():
+                self._symbol_index[(operation, rest, symbol)] = value
+
+    def _append(self, operation: str, params: Dict[str, Any], result: ServiceResult):
+        entry = {
+            "operation": operation,
+            "params": _encode(params),
+            "result": _encode({
+                "success": result.success,
+                "data": result.data,
+                "error": result.error,
+                "message": result.message,
+                "metadata": result.metadata,
+                "next_actions": result.next_actions
+            }),
+            "recorded_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._index(entry)
+
+        # gzip members can be appended; each record is flushed as its own member
+        with self._write_lock:
+            directory = os.path.dirname(self.recording_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with gzip.open(self.recording_path, "at", encoding="utf-8") as recording:
+                recording.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._stats["recorded"] += 1
+
+    # Replay
+
+    def _lookup(self, operation: str, params: Dict[str, Any]) -> Optional[ServiceResult]:
+        """Exact recorded response, or one assembled from per-symbol entries"""
+        encoded_params = _encode(params)
+        recorded = self._recordings.get((operation, _params_key(encoded_params)))
+        if recorded is not None:
+            return ServiceResult(**_decode(recorded))
+
+        symbols = params.get("symbols")
+        if not symbols:
+            return None
+
+        rest = _params_key({key: value for key, value in encoded_params.items() if key != "symbols"})
+        data = {
+            symbol: _decode(self._symbol_index[(operation, rest, symbol)])
+            for symbol in symbols
+            if (operation, rest, symbol) in self._symbol_index
+        }
+        if not data:
+            return None
+
+        return ServiceResult(
+            success=True,
+            data=data,
+            message=f"Replayed {operation} for {len(data)}/{len(symbols)} symbols",
+            metadata={"provider": self.name, "replayed": True, "assembled_from_symbols": True}
+        )
+
+    async def _inject_faults(self) -> Optional[ServiceResult]:
+        """Apply configured latency; return an injected failure if drawn"""
+        if self.latency_ms or self.latency_jitter_ms:
+            delay_ms = max(0.0, self._rng.gauss(self.latency_ms, self.latency_jitter_ms))
+            await asyncio.sleep(delay_ms / 1000.0)
+
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self._stats["injected_errors"] += 1
+            return ServiceResult(
+                success=False,
+                error="Injected replay failure",
+                message=f"{self.name} replay error injection",
+                metadata={"provider": self.name, "injected": True}
+            )
+        return None
+
+    async def _call(self, operation: str, method: str, **params) -> ServiceResult:
+        """Route a provider call through record or replay"""
+        self._stats["calls"] += 1
+
+        if self.mode == RecordReplayMode.RECORD:
+            delegate_method = getattr(self.delegate, method, None)
+            if delegate_method is None:
+                return ServiceResult(
+                    success=False,
+                    error=f"{method} not supported by recorded provider",
+                    message=f"Cannot record {operation}"
+                )
+            result = await delegate_method(**params)
+            self._append(operation, params, result)
+            return result
+
+        injected = await self._inject_faults()
+        if injected is not None:
+            return injected
+
+        result = self._lookup(operation, params)
+        if result is None:
+            self._stats["misses"] += 1
+            return ServiceResult(
+                success=False,
+                error=f"No recording for {operation}",
+                message=f"{self.name} has no recorded response for {operation}",
+                metadata={"provider": self.name, "params": _encode(params)}
+            )
+
+        self._stats["replayed"] += 1
+        return result
+
+    # IDataProvider
+
+    async def fetch_historical_data(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        interval: str = "1d"
+    ) -> ServiceResult[Dict[str, List[MarketData]]]:
+        """Fetch historical price data (recorded or replayed)"""
+        return await self._call(
+            "historical_data", "fetch_historical_data",
+            symbols=symbols, start_date=start_date, end_date=end_date, interval=interval
+        )
+
+    async def fetch_real_time_data(self, symbols: List[str]) -> ServiceResult[Dict[str, MarketData]]:
+        """Fetch current market data (recorded or replayed)"""
+        return await self._call("real_time", "fetch_real_time_data", symbols=symbols)
+
+    async def fetch_asset_info(self, symbols: List[str]) -> ServiceResult[Dict[str, AssetInfo]]:
+        """Fetch asset information (recorded or replayed)"""
+        return await self._call("asset_info", "fetch_asset_info", symbols=symbols)
+
+    async def validate_symbols(self, symbols: List[str]) -> ServiceResult[Dict[str, ValidationResult]]:
+        """Validate symbols (recorded or replayed)"""
+        return await self._call("validate_symbols", "validate_symbols", symbols=symbols)
+
+    async def search_assets(self, query: str, limit: int = 10) -> ServiceResult[List[AssetInfo]]:
+        """Search assets (recorded or replayed)"""
+        return await self._call("search_assets", "search_assets", query=query, limit=limit)
+
+    async def fetch_fundamental_data(self, symbols: List[str]) -> ServiceResult[Dict[str, Any]]:
+        """Fetch fundamental data (recorded or replayed)"""
+        return await self._call("fundamental_data", "fetch_fundamental_data", symbols=symbols)
+
+    async def fetch_economic_indicators(self, indicators: List[str]) -> ServiceResult[Dict[str, Any]]:
+        """Fetch economic indicators (recorded or replayed)"""
+        return await self._call("economic_indicators", "fetch_economic_indicators", indicators=indicators)
+
+    async def health_check(self) -> ServiceResult[Dict[str, Any]]:
+        """Replay health reflects the recording; record health is the delegate's"""
+        if self.mode == RecordReplayMode.RECORD:
+            return await self.delegate.health_check()
+
+        healthy = bool(self._recordings)
+        return ServiceResult(
+            success=healthy,
+            data={
+                "provider": self.name,
+                "status": "healthy" if healthy else "unconfigured",
+                "mode": self.mode.value,
+                "recorded_responses": len(self._recordings),
+                "latency_ms": self.latency_ms,
+                "error_rate": self.error_rate
+            },
+            error=None if healthy else "Recording is empty",
+            message=f"Replay provider {self.name} serving {len(self._recordings)} recorded responses"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Call, replay and injection counters"""
+        return {**self._stats, "mode": self.mode.value, "recorded_responses": len(self._recordings)}
+
+
+def recording_path_for(directory: str, source: DataSource) -> str:
+    """Conventional recording file for a composite provider source"""
+    return os.path.join(directory, f"{source.value}.jsonl.gz")
+
+
+def build_recording_providers(
+    providers: Dict[DataSource, IDataProvider],
+    directory: str
+) -> Dict[DataSource, RecordReplayDataProvider]:
+    """Wrap live providers so a composite run records every response"""
+    return {
+        source: RecordReplayDataProvider(
+            recording_path_for(directory, source),
+            mode=RecordReplayMode.RECORD,
+            delegate=provider,
+            name=source.value
+        )
+        for source, provider in providers.items()
+    }
+
+
+def build_replay_providers(
+    directory: str,
+    latency_ms: Optional[Dict[DataSource, float]] = None,
+    error_rate: Optional[Dict[DataSource, float]] = None,
+    seed: Optional[int] = None
+) -> Dict[DataSource, RecordReplayDataProvider]:
+    """Replay providers for every composite source from a recording directory"""
+    return {
+        source: RecordReplayDataProvider(
+            recording_path_for(directory, source),
+            mode=RecordReplayMode.REPLAY,
+            latency_ms=(latency_ms or {}).get(source, 0.0),
+            error_rate=(error_rate or {}).get(source, 0.0),
+            seed=None if seed is None else seed + index,
+            name=source.value
+        )
+        for index, source in enumerate(DataSource)
+    }
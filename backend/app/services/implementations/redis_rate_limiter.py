@@ -15,6 +15,7 @@ from redis.exceptions import RedisError
 
 from ..interfaces.security import IRateLimiter, RateLimitInfo
 from ..interfaces.base import ServiceResult
+from ...core.redis_pool import get_redis_pool
 
 
 class RedisRateLimiter(IRateLimiter):
@@ -34,14 +35,13 @@ class RedisRateLimiter(IRateLimiter):
         Initialize Redis rate limiter.
         
         Args:
-            redis_client: Redis client instance (defaults to localhost)
+            redis_client: Redis client instance (defaults to the application-wide pool)
             key_prefix: Key prefix for Redis keys
         """
-        if redis_client is None:
-            # Default Redis connection for development
-            redis_client = redis.from_url("redis://localhost:6379", decode_responses=True)
-        
-        self.redis = redis_client
+        # Without an injected client the shared pool's client for the running
+        # event loop is looked up per call (the limiter outlives event loops
+        # when held by middleware)
+        self._redis = redis_client
         self.key_prefix = key_prefix
         
         # Default rate limits per endpoint (requests per minute)
@@ -55,6 +55,13 @@ class RedisRateLimiter(IRateLimiter):
             "default": 100
         }
     
+    @property
+    def redis(self) -> redis.Redis:
+        """Injected Redis client, or the application-wide pool's client"""
+        if self._redis is not None:
+            return self._redis
+        return get_redis_pool().get_client(decode_responses=True)
+    
     def _get_key(self, identifier: str, endpoint: str) -> str:
         """Generate Redis key for rate limit tracking."""
         return f"{self.key_prefix}:{endpoint}:{identifier}"
@@ -6,15 +6,63 @@ intelligent invalidation, and performance optimization.
 
 Following Interface-First Design methodology from planning/0_dev.md
 """
-import json
+import asyncio
 import hashlib
+import math
 import os
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta, timezone
+import random
+import time
+import uuid
+import weakref
+from collections import Counter
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple, Callable, Awaitable
+from datetime import date, datetime, timedelta, timezone
 import redis.asyncio as redis
 from redis.exceptions import RedisError
 
 from ..interfaces.security import ITemporalCache
+from ...core.redis_pool import get_redis_pool
+from .temporal_cache_codec import TemporalCacheCodec
+from .temporal_l1_cache import TemporalL1Cache, get_temporal_l1_cache
+
+
+def _text(value: Any) -> str:
+    """Redis member as str (the client returns bytes)"""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# async (start_date, end_date) -> (snapshots, covered end date or None if open-ended)
+SegmentLoader = Callable[[str, str], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]]
+
+# Deletes the lock only if it still holds the caller's token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Per-process recompute locks, shared by all cache instances
+_recompute_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Running background refreshes (referenced so they are not garbage collected)
+_background_refreshes: set = set()
+
+
+def _local_recompute_lock(key: str) -> asyncio.Lock:
+    lock = _recompute_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _recompute_locks[key] = lock
+    return lock
+
+
+class SegmentCoverage(NamedTuple):
+    """Covered date span of a universe's segments"""
+    start: date
+    end: Optional[date]
+    soft_expires_at: float
+    compute_seconds: float
 
 
 class RedisTemporalCache(ITemporalCache):
@@ -24,9 +72,27 @@ class RedisTemporalCache(ITemporalCache):
     Features:
     - Intelligent cache key generation with date range hashing
     - Multi-TTL strategy for different data types
-    - Memory-efficient compression for large datasets
+    - Binary codec (orjson + zstd above a size threshold) for large datasets
     - Cache warming and pre-computation
     - Detailed performance metrics and monitoring
+    
+    Every cached key is registered in a per-type sorted set scored by its
+    expiry time, so statistics and cleanup use ZCOUNT / ZREMRANGEBYSCORE
+    instead of scanning the keyspace.
+    
+    Timelines are also cached as one segment per snapshot, indexed by date
+    per universe, with a coverage marker for the date span whose snapshots
+    are all indexed. Any range inside the coverage is assembled from its
+    segments, and a new snapshot only writes its own segment. Segment misses
+    are recomputed once per universe under a local and a Redis lock; expired
+    or early-refreshed spans are served stale while one worker refreshes them.
+    
+    Reads are served from an in-process L1 first. Invalidations are published
+    on a Redis channel so every process drops its L1 entries of the universe.
+    
+    Timeline reads are counted per universe and per date range (buffered in
+    process, flushed to sorted sets); warm_cache recomputes the hottest
+    entries through a loader, and invalidated universes are queued for it.
     """
     
     def __init__(
@@ -35,7 +101,20 @@ class RedisTemporalCache(ITemporalCache):
         redis_url: str = None,
         key_prefix: str = "bubble:temporal",
         default_ttl: int = 3600,
-        enable_compression: bool = True
+        enable_compression: bool = True,
+        codec: Optional[TemporalCacheCodec] = None,
+        track_access: bool = True,
+        access_flush_interval_seconds: float = 5.0,
+        access_retention_seconds: int = 7 * 86400,
+        enable_l1: bool = True,
+        l1_cache: Optional[TemporalL1Cache] = None,
+        stale_while_revalidate: bool = True,
+        stale_ttl_seconds: int = 1800,
+        early_refresh_beta: float = 1.0,
+        recompute_lock_ttl_seconds: float = 30.0,
+        recompute_lock_wait_seconds: float = 2.0,
+        recompute_lock_poll_seconds: float = 0.05,
+        registry_prune_interval_seconds: float = 60.0
     ):
         """
         Initialize Redis temporal cache.
@@ -46,12 +125,59 @@ class RedisTemporalCache(ITemporalCache):
             key_prefix: Prefix for all cache keys
             default_ttl: Default TTL in seconds
             enable_compression: Enable data compression
+            codec: Payload codec (defaults to the best available compressor)
+            track_access: Count timeline reads for access-driven warming
+            access_flush_interval_seconds: How often buffered access counts are written to Redis
+            access_retention_seconds: Expiry of access counters for universes no longer read
+            enable_l1: Serve repeated reads from an in-process L1
+            l1_cache: L1 to use (defaults to the process-wide L1 when the cache connects
+                by URL, and to a private L1 for an injected client)
+            stale_while_revalidate: Serve expired timeline segments while one worker refreshes them
+            stale_ttl_seconds: How long past expiry segments are kept for stale serving
+            early_refresh_beta: XFetch aggressiveness (higher refreshes earlier)
+            recompute_lock_ttl_seconds: Expiry of the cross-process recompute lock
+            recompute_lock_wait_seconds: How long a miss waits for another process's recompute
+            recompute_lock_poll_seconds: Poll interval while waiting
+            registry_prune_interval_seconds: How often a key registry drops its expired entries
+        
+        The Redis client must not decode responses (values are binary).
         """
         self.redis_client = redis_client
+        self._owns_connection = redis_client is None
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
         self.key_prefix = key_prefix
         self.default_ttl = default_ttl
         self.enable_compression = enable_compression
+        self.codec = codec or TemporalCacheCodec(compression="auto" if enable_compression else "none")
+        
+        # In-process L1; the invalidation listener only runs for URL-owned connections
+        if enable_l1 and l1_cache is None:
+            l1_cache = get_temporal_l1_cache() if self._owns_connection else TemporalL1Cache()
+        self.l1_cache = l1_cache if enable_l1 else None
+        
+        # Stampede protection for timeline segment misses
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.early_refresh_beta = early_refresh_beta
+        self.recompute_lock_ttl_seconds = recompute_lock_ttl_seconds
+        self.recompute_lock_wait_seconds = recompute_lock_wait_seconds
+        self.recompute_lock_poll_seconds = recompute_lock_poll_seconds
+        self._stampede_stats: Counter = Counter()
+        
+        # Access tracking for warming: universe -> reads, (universe, "start:end") -> reads
+        self.track_access = track_access
+        self.access_flush_interval_seconds = access_flush_interval_seconds
+        self.access_retention_seconds = access_retention_seconds
+        self._universe_access: Counter = Counter()
+        self._range_access: Counter = Counter()
+        self._last_access_flush = time.monotonic()
+        
+        # Key registries are pruned on write, at most once per interval per type
+        self.registry_prune_interval_seconds = registry_prune_interval_seconds
+        self._registry_pruned_at: Dict[str, float] = {}
+        
+        # Computes a timeline on warm-up: (universe_id, start_date, end_date) -> data or None
+        self.timeline_loader: Optional[Callable[[str, str, str], Awaitable[Optional[Dict[str, Any]]]]] = None
         
         # Performance tracking
         self._hit_count = 0
@@ -61,9 +187,10 @@ class RedisTemporalCache(ITemporalCache):
         # TTL strategies for different data types
         self.ttl_strategies = {
             "timeline": 1800,      # 30 minutes - frequently changing
-            "snapshot": 3600,      # 1 hour - more stable
+            "snapshot": 86400,     # 1 day - kept current by the cache outbox
             "universe_meta": 7200, # 2 hours - configuration data
             "screening": 900,      # 15 minutes - dynamic screening results
+            "segment": 86400,      # 1 day - kept current by the cache outbox
         }
     
     async def _ensure_connection(self) -> redis.Redis:
@@ -75,18 +202,15 @@ class RedisTemporalCache(ITemporalCache):
         """
         if self.redis_client is None:
             try:
-                self.redis_client = redis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5
-                )
+                self.redis_client = get_redis_pool().get_client(decode_responses=False, redis_url=self.redis_url)
                 # Test connection
                 await self.redis_client.ping()
             except RedisError as e:
                 self._error_count += 1
                 raise Exception(f"Failed to connect to Redis: {e}")
+            
+            if self.l1_cache is not None:
+                self.l1_cache.start_listener(self.redis_url, self._invalidation_channel())
         
         return self.redis_client
     
@@ -128,36 +252,31 @@ class RedisTemporalCache(ITemporalCache):
         
         return ":".join(key_parts)
     
-    def _compress_data(self, data: Dict[str, Any]) -> str:
+    def _compress_data(self, data: Dict[str, Any]) -> bytes:
         """
-        Compress data for storage optimization.
+        Encode data for storage (versioned, compressed above the codec threshold).
         
         Args:
             data: Data to compress
             
         Returns:
-            Compressed JSON string
+            Encoded payload
         """
-        if not self.enable_compression:
-            return json.dumps(data, default=str)
-        
-        # Simple JSON compression - could be enhanced with gzip
-        json_str = json.dumps(data, default=str, separators=(',', ':'))
-        return json_str
+        return self.codec.encode(data)
     
-    def _decompress_data(self, compressed_data: str) -> Dict[str, Any]:
+    def _decompress_data(self, compressed_data: Any) -> Dict[str, Any]:
         """
-        Decompress cached data.
+        Decode cached data (codec payloads and legacy JSON strings).
         
         Args:
-            compressed_data: Compressed JSON string
+            compressed_data: Stored value
             
         Returns:
             Decompressed data dictionary
         """
         try:
-            return json.loads(compressed_data)
-        except json.JSONDecodeError:
+            return self.codec.decode(compressed_data)
+        except Exception:
             raise ValueError("Invalid cached data format")
     
     def _get_ttl_for_type(self, cache_type: str) -> int:
@@ -172,6 +291,147 @@ class RedisTemporalCache(ITemporalCache):
         """
         return self.ttl_strategies.get(cache_type, self.default_ttl)
     
+    def _registry_key(self, cache_type: str) -> str:
+        """Sorted set of cached keys of one type, scored by expiry time"""
+        return f"{self.key_prefix}:registry:{cache_type}"
+    
+    def _cache_type_of(self, cache_key: Any) -> str:
+        """Cache type embedded in a key built by _generate_cache_key"""
+        if isinstance(cache_key, bytes):
+            cache_key = cache_key.decode()
+        return cache_key[len(self.key_prefix) + 1:].split(":", 1)[0]
+    
+    async def _register_key(self, redis_client: redis.Redis, cache_type: str, cache_key: str, ttl_seconds: int):
+        """
+        Record a written key and its expiry in the per-type registry
+
+        Expired entries are dropped on write, so a registry holds little more
+        than the live keys of its type without a scheduled cleanup.
+        """
+        registry_key = self._registry_key(cache_type)
+        now = time.time()
+        if time.monotonic() - self._registry_pruned_at.get(cache_type, float("-inf")) >= self.registry_prune_interval_seconds:
+            self._registry_pruned_at[cache_type] = time.monotonic()
+            await redis_client.zremrangebyscore(registry_key, "-inf", now)
+        await redis_client.zadd(registry_key, {cache_key: now + ttl_seconds})
+    
+    def _registered_types(self) -> List[str]:
+        """Cache types that can have registered keys"""
+        return sorted(set(self.ttl_strategies) | {"timeline", "snapshot"})
+    
+    def _segment_key(self, universe_id: str, snapshot_date: str) -> str:
+        """Serialized snapshot of one date"""
+        return f"{self.key_prefix}:segment:{universe_id}:{snapshot_date}"
+    
+    def _segment_index_key(self, universe_id: str) -> str:
+        """Sorted set of a universe's segment dates, scored by date ordinal"""
+        return f"{self.key_prefix}:segment_index:{universe_id}"
+    
+    def _segment_coverage_key(self, universe_id: str) -> str:
+        """Date span ("start:end", end empty when open-ended) whose snapshots are all indexed"""
+        return f"{self.key_prefix}:segment_coverage:{universe_id}"
+    
+    def _invalidation_channel(self) -> str:
+        """Pub/sub channel carrying invalidated universe ids"""
+        return f"{self.key_prefix}:invalidations"
+    
+    def _l1_get(self, key: str) -> Optional[Any]:
+        return self.l1_cache.get(key) if self.l1_cache is not None else None
+    
+    def _l1_set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        if self.l1_cache is not None:
+            self.l1_cache.set(key, value, ttl_seconds)
+    
+    async def _publish_invalidation(self, redis_client: redis.Redis, universe_id: str):
+        """Drop the universe from this process's L1 and tell other processes to do the same"""
+        if self.l1_cache is not None:
+            self.l1_cache.invalidate_universe(universe_id)
+        await redis_client.publish(self._invalidation_channel(), universe_id)
+    
+    def _access_key(self, universe_id: Optional[str] = None) -> str:
+        """Sorted set of read counts per universe, or per date range of one universe"""
+        if universe_id is None:
+            return f"{self.key_prefix}:access:universes"
+        return f"{self.key_prefix}:access:ranges:{universe_id}"
+    
+    def _warm_pending_key(self) -> str:
+        """Set of invalidated universes waiting to be re-warmed"""
+        return f"{self.key_prefix}:warm_pending"
+    
+    def _record_access(self, universe_id: str, start_date: str, end_date: str):
+        """Count a timeline read in the in-process buffer"""
+        if self.track_access:
+            self._universe_access[universe_id] += 1
+            self._range_access[(universe_id, f"{start_date}:{end_date}")] += 1
+    
+    async def flush_access_counts(self, force: bool = True) -> int:
+        """
+        Write buffered access counts to Redis.
+        
+        Args:
+            force: Flush even if the flush interval has not elapsed
+            
+        Returns:
+            Number of counters written
+        """
+        if not self._universe_access:
+            return 0
+        if not force and time.monotonic() - self._last_access_flush < self.access_flush_interval_seconds:
+            return 0
+        
+        universe_access, self._universe_access = self._universe_access, Counter()
+        range_access, self._range_access = self._range_access, Counter()
+        self._last_access_flush = time.monotonic()
+        
+        redis_client = await self._ensure_connection()
+        universes_key = self._access_key()
+        for universe_id, count in universe_access.items():
+            await redis_client.zincrby(universes_key, count, universe_id)
+        for (universe_id, date_range), count in range_access.items():
+            await redis_client.zincrby(self._access_key(universe_id), count, date_range)
+        for universe_id in universe_access:
+            await redis_client.expire(self._access_key(universe_id), self.access_retention_seconds)
+        await redis_client.expire(universes_key, self.access_retention_seconds)
+        
+        return len(universe_access) + len(range_access)
+    
+    async def get_hot_universes(self, limit: int = 10) -> List[Tuple[str, float]]:
+        """Most read universes with their (decayed) read counts"""
+        redis_client = await self._ensure_connection()
+        entries = await redis_client.zrevrange(self._access_key(), 0, limit - 1, withscores=True)
+        return [(_text(member), float(score)) for member, score in entries]
+    
+    async def get_hot_ranges(self, universe_id: str, limit: int = 3) -> List[Dict[str, str]]:
+        """Most read timeline date ranges of a universe"""
+        redis_client = await self._ensure_connection()
+        members = await redis_client.zrevrange(self._access_key(universe_id), 0, limit - 1)
+        ranges = []
+        for member in members:
+            start_date, _, end_date = _text(member).partition(":")
+            ranges.append({"start_date": start_date, "end_date": end_date})
+        return ranges
+    
+    async def get_warming_candidates(self, max_universes: int = 10) -> List[str]:
+        """Universes to warm: invalidated hot universes first, then the hottest ones"""
+        redis_client = await self._ensure_connection()
+        hot = [universe_id for universe_id, _ in await self.get_hot_universes(max_universes * 2)]
+        pending = {_text(member) for member in await redis_client.smembers(self._warm_pending_key())}
+        
+        candidates = [universe_id for universe_id in hot if universe_id in pending]
+        candidates += [universe_id for universe_id in hot if universe_id not in pending]
+        return candidates[:max_universes]
+    
+    async def clear_warm_pending(self, universe_id: str):
+        """Remove a universe from the re-warming queue"""
+        redis_client = await self._ensure_connection()
+        await redis_client.srem(self._warm_pending_key(), universe_id)
+    
+    async def decay_access_counts(self, factor: float = 0.5):
+        """Scale universe read counts so popularity follows recent traffic"""
+        redis_client = await self._ensure_connection()
+        key = self._access_key()
+        await redis_client.zunionstore(key, {key: factor})
+    
     async def get_timeline(
         self,
         universe_id: str,
@@ -190,19 +450,26 @@ class RedisTemporalCache(ITemporalCache):
             Cached timeline data if available
         """
         try:
-            redis_client = await self._ensure_connection()
             cache_key = self._generate_cache_key(
                 "timeline", 
                 universe_id, 
                 start_date, 
                 end_date
             )
+            self._record_access(universe_id, start_date, end_date)
             
-            cached_data = await redis_client.get(cache_key)
+            decompressed_data = self._l1_get(cache_key)
+            if decompressed_data is None:
+                redis_client = await self._ensure_connection()
+                cached_data = await redis_client.get(cache_key)
+                await self._flush_access_counts_quietly()
+                if cached_data:
+                    decompressed_data = self._decompress_data(cached_data)
+                    self._l1_set(cache_key, decompressed_data)
             
-            if cached_data:
+            if decompressed_data is not None:
                 self._hit_count += 1
-                decompressed_data = self._decompress_data(cached_data)
+                decompressed_data = dict(decompressed_data)
                 
                 # Add cache metadata
                 decompressed_data["_cache_meta"] = {
@@ -222,6 +489,13 @@ class RedisTemporalCache(ITemporalCache):
             print(f"Cache get error for timeline {universe_id}: {e}")
             return None
     
+    async def _flush_access_counts_quietly(self):
+        """Periodic flush from the read path; tracking must never fail a read"""
+        try:
+            await self.flush_access_counts(force=False)
+        except Exception as e:
+            print(f"Cache access tracking flush error: {e}")
+    
     async def set_timeline(
         self,
         universe_id: str,
@@ -271,6 +545,8 @@ class RedisTemporalCache(ITemporalCache):
             
             # Set with TTL
             await redis_client.setex(cache_key, ttl_seconds, compressed_data)
+            await self._register_key(redis_client, "timeline", cache_key, ttl_seconds)
+            self._l1_set(cache_key, enriched_data, ttl_seconds)
             
             # Also set a universe index for invalidation
             universe_index_key = f"{self.key_prefix}:universe_index:{universe_id}"
@@ -284,6 +560,423 @@ class RedisTemporalCache(ITemporalCache):
             print(f"Cache set error for timeline {universe_id}: {e}")
             return False
     
+    async def _get_segment_coverage(self, redis_client: redis.Redis, universe_id: str) -> Optional[SegmentCoverage]:
+        """Indexed date span of a universe and its freshness (None when nothing is covered)"""
+        coverage = await redis_client.get(self._segment_coverage_key(universe_id))
+        if not coverage:
+            return None
+        parts = _text(coverage).split(":")
+        return SegmentCoverage(
+            start=date.fromisoformat(parts[0]),
+            end=date.fromisoformat(parts[1]) if parts[1] else None,
+            soft_expires_at=float(parts[2]) if len(parts) > 2 else float("inf"),
+            compute_seconds=float(parts[3]) if len(parts) > 3 else 0.0
+        )
+    
+    def _coverage_state(self, coverage: SegmentCoverage) -> str:
+        """
+        Freshness of a covered span: "fresh", "early" or "stale".
+        
+        Past the soft expiry the span is stale (still served, refreshed in the
+        background). Before it, XFetch picks an early refresh with a probability
+        that rises as expiry approaches and with the cost of the last recompute.
+        """
+        now = time.time()
+        if now >= coverage.soft_expires_at:
+            return "stale"
+        if coverage.compute_seconds > 0:
+            gap = -coverage.compute_seconds * self.early_refresh_beta * math.log(1.0 - random.random())
+            if now + gap >= coverage.soft_expires_at:
+                return "early"
+        return "fresh"
+    
+    async def _read_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        record_access: bool = True
+    ) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """Cached snapshots of a range and their freshness ("miss" when not fully cached)"""
+        try:
+            if record_access:
+                self._record_access(universe_id, start_date, end_date)
+            l1_key = f"{self.key_prefix}:segments:{universe_id}:{start_date}:{end_date}"
+            snapshots = self._l1_get(l1_key)
+            if snapshots is not None:
+                self._hit_count += 1
+                return list(snapshots), "fresh"
+            
+            redis_client = await self._ensure_connection()
+            await self._flush_access_counts_quietly()
+            
+            start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+            coverage = await self._get_segment_coverage(redis_client, universe_id)
+            if coverage is None or start < coverage.start or (coverage.end is not None and end > coverage.end):
+                self._miss_count += 1
+                return None, "miss"
+            state = self._coverage_state(coverage)
+            
+            snapshot_dates = await redis_client.zrangebyscore(
+                self._segment_index_key(universe_id), start.toordinal(), end.toordinal()
+            )
+            if snapshot_dates:
+                cached_segments = await redis_client.mget(
+                    [self._segment_key(universe_id, _text(snapshot_date)) for snapshot_date in snapshot_dates]
+                )
+                if any(segment is None for segment in cached_segments):
+                    # A segment expired: the coverage no longer holds
+                    await redis_client.delete(self._segment_coverage_key(universe_id))
+                    self._miss_count += 1
+                    return None, "miss"
+                snapshots = [self._decompress_data(segment) for segment in cached_segments]
+            else:
+                snapshots = []
+            
+            self._hit_count += 1
+            if state == "fresh":
+                self._l1_set(l1_key, snapshots)
+            return list(snapshots), state
+            
+        except Exception as e:
+            self._error_count += 1
+            print(f"Cache get error for timeline segments {universe_id}: {e}")
+            return None, "miss"
+    
+    async def get_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Assemble a timeline's snapshots from cached segments.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Timeline start date (ISO format)
+            end_date: Timeline end date (ISO format)
+            
+        Returns:
+            Snapshots in date order (stale ones included), or None if the range is not fully cached
+        """
+        snapshots, _ = await self._read_segments(universe_id, start_date, end_date)
+        return snapshots
+    
+    async def get_or_load_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        loader: SegmentLoader,
+        refresh_loader: Optional[SegmentLoader] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Cached snapshots of a range, loading them at most once per universe on a miss.
+        
+        - Miss: one caller per process (asyncio lock) and across processes (Redis
+          SET NX lock) runs the loader; the others wait for its segments.
+        - Stale or picked for early refresh: the cached snapshots are returned
+          and a single background refresh runs under the Redis lock.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Timeline start date (ISO format)
+            end_date: Timeline end date (ISO format)
+            loader: async (start_date, end_date) -> (snapshots, covered end or None if open-ended)
+            refresh_loader: Loader for background refreshes (defaults to loader); these
+                outlive the caller's request, so it must not use request-scoped
+                resources such as the caller's database session
+            
+        Returns:
+            (snapshots of the range in date order, True if served from cache)
+        """
+        snapshots, state = await self._read_segments(universe_id, start_date, end_date)
+        if snapshots is not None and (state != "stale" or self.stale_while_revalidate):
+            if state != "fresh":
+                self._stampede_stats["stale_served" if state == "stale" else "early_refreshes"] += 1
+                await self._schedule_refresh(universe_id, start_date, end_date, refresh_loader or loader)
+            return snapshots, True
+        
+        async with _local_recompute_lock(f"{self.key_prefix}:{universe_id}"):
+            # Another coroutine of this process may have loaded it meanwhile
+            snapshots, state = await self._read_segments(universe_id, start_date, end_date, record_access=False)
+            if snapshots is not None and state != "stale":
+                self._stampede_stats["local_waits"] += 1
+                return snapshots, True
+            
+            token = await self._acquire_recompute_lock(universe_id)
+            if token is None:
+                # Another process is loading: wait for its segments
+                self._stampede_stats["lock_waits"] += 1
+                snapshots = await self._wait_for_segments(universe_id, start_date, end_date)
+                if snapshots is not None:
+                    return snapshots, True
+            
+            try:
+                self._stampede_stats["recomputes"] += 1
+                return await self._load_and_store(universe_id, start_date, end_date, loader), False
+            finally:
+                if token is not None:
+                    await self._release_recompute_lock(universe_id, token)
+    
+    async def refresh_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        loader: SegmentLoader
+    ) -> List[Dict[str, Any]]:
+        """Load a range through the loader and cache its segments unconditionally (warming)"""
+        return await self._load_and_store(universe_id, start_date, end_date, loader)
+    
+    async def _load_and_store(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        loader: SegmentLoader
+    ) -> List[Dict[str, Any]]:
+        """Run the loader, cache its snapshots with the measured recompute time"""
+        started = time.perf_counter()
+        snapshots, covered_end = await loader(start_date, end_date)
+        await self.set_timeline_segments(
+            universe_id, start_date, covered_end, snapshots,
+            compute_seconds=time.perf_counter() - started
+        )
+        return [snapshot for snapshot in snapshots if start_date <= snapshot["snapshot_date"] <= end_date]
+    
+    def _recompute_lock_key(self, universe_id: str) -> str:
+        return f"{self.key_prefix}:lock:segments:{universe_id}"
+    
+    async def _acquire_recompute_lock(self, universe_id: str) -> Optional[str]:
+        """Cross-process recompute lock token, or None if another process holds it"""
+        token = uuid.uuid4().hex
+        try:
+            redis_client = await self._ensure_connection()
+            acquired = await redis_client.set(
+                self._recompute_lock_key(universe_id), token,
+                nx=True, px=int(self.recompute_lock_ttl_seconds * 1000)
+            )
+        except Exception as e:
+            # Without Redis there is nothing to coordinate with
+            print(f"Cache recompute lock error for universe {universe_id}: {e}")
+            return token
+        return token if acquired else None
+    
+    async def _release_recompute_lock(self, universe_id: str, token: str):
+        """Release the lock if this caller still holds it"""
+        try:
+            redis_client = await self._ensure_connection()
+            await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, self._recompute_lock_key(universe_id), token)
+        except Exception as e:
+            print(f"Cache recompute lock release error for universe {universe_id}: {e}")
+    
+    async def _wait_for_segments(self, universe_id: str, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+        """Poll for segments being loaded by the lock holder (None after the wait budget)"""
+        deadline = time.monotonic() + self.recompute_lock_wait_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.recompute_lock_poll_seconds)
+            snapshots, state = await self._read_segments(universe_id, start_date, end_date, record_access=False)
+            if snapshots is not None and state != "stale":
+                return snapshots
+        return None
+    
+    async def _schedule_refresh(self, universe_id: str, start_date: str, end_date: str, loader: SegmentLoader):
+        """Refresh a range in the background unless another worker already is"""
+        token = await self._acquire_recompute_lock(universe_id)
+        if token is None:
+            return
+        
+        self._stampede_stats["background_refreshes"] += 1
+        task = asyncio.ensure_future(self._refresh_in_background(universe_id, start_date, end_date, loader, token))
+        _background_refreshes.add(task)
+        task.add_done_callback(_background_refreshes.discard)
+    
+    async def _refresh_in_background(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        loader: SegmentLoader,
+        token: str
+    ):
+        try:
+            await self._load_and_store(universe_id, start_date, end_date, loader)
+        except Exception as e:
+            self._error_count += 1
+            print(f"Background timeline refresh failed for universe {universe_id}: {e}")
+        finally:
+            await self._release_recompute_lock(universe_id, token)
+    
+    async def _write_segments(
+        self,
+        redis_client: redis.Redis,
+        universe_id: str,
+        snapshots: List[Dict[str, Any]],
+        ttl_seconds: int
+    ):
+        """Store snapshot segments and index them by date"""
+        index_key = self._segment_index_key(universe_id)
+        universe_index_key = f"{self.key_prefix}:universe_index:{universe_id}"
+        
+        for snapshot_data in snapshots:
+            snapshot_date = snapshot_data["snapshot_date"]
+            segment_key = self._segment_key(universe_id, snapshot_date)
+            await redis_client.setex(segment_key, ttl_seconds, self._compress_data(snapshot_data))
+            await self._register_key(redis_client, "segment", segment_key, ttl_seconds)
+            await redis_client.sadd(universe_index_key, segment_key)
+        
+        if snapshots:
+            await redis_client.zadd(index_key, {
+                snapshot_data["snapshot_date"]: date.fromisoformat(snapshot_data["snapshot_date"]).toordinal()
+                for snapshot_data in snapshots
+            })
+        await redis_client.expire(index_key, ttl_seconds)
+        await redis_client.sadd(universe_index_key, index_key, self._segment_coverage_key(universe_id))
+        await redis_client.expire(universe_index_key, ttl_seconds + 3600)
+    
+    async def set_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: Optional[str],
+        snapshots: List[Dict[str, Any]],
+        ttl_seconds: int = None,
+        compute_seconds: float = 0.0
+    ) -> bool:
+        """
+        Cache every snapshot of a date range as segments and mark the range covered.
+        
+        The coverage is fresh for ttl_seconds and kept (served stale) for
+        stale_ttl_seconds more.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Range start date (ISO format)
+            end_date: Range end date (ISO format), None if snapshots include all later dates
+            snapshots: All snapshots of the range (dicts with an ISO snapshot_date)
+            ttl_seconds: Time to live in seconds
+            compute_seconds: Time the snapshots took to load (drives early refresh)
+            
+        Returns:
+            True if caching successful
+        """
+        try:
+            redis_client = await self._ensure_connection()
+            if ttl_seconds is None:
+                ttl_seconds = self._get_ttl_for_type("segment")
+            hard_ttl_seconds = ttl_seconds + self.stale_ttl_seconds
+            
+            await self._write_segments(redis_client, universe_id, snapshots, hard_ttl_seconds)
+            
+            # Extend the covered span when the ranges touch, replace it otherwise
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date) if end_date else None
+            coverage = await self._get_segment_coverage(redis_client, universe_id)
+            if coverage is not None:
+                touches = ((coverage.end is None or start <= coverage.end + timedelta(days=1)) and
+                           (end is None or coverage.start <= end + timedelta(days=1)))
+                if touches:
+                    start = min(start, coverage.start)
+                    end = None if end is None or coverage.end is None else max(end, coverage.end)
+            
+            await redis_client.setex(
+                self._segment_coverage_key(universe_id),
+                hard_ttl_seconds,
+                f"{start.isoformat()}:{end.isoformat() if end else ''}:"
+                f"{time.time() + ttl_seconds:.3f}:{compute_seconds:.4f}"
+            )
+            return True
+            
+        except Exception as e:
+            self._error_count += 1
+            print(f"Cache set error for timeline segments {universe_id}: {e}")
+            return False
+    
+    async def add_timeline_segment(
+        self,
+        universe_id: str,
+        snapshot_data: Dict[str, Any],
+        ttl_seconds: int = None
+    ) -> bool:
+        """
+        Cache a newly created snapshot as one segment.
+        
+        Covered ranges stay valid, so no other cached segment is touched. If
+        the write fails the coverage is dropped so the range is reloaded.
+        
+        Args:
+            universe_id: Universe identifier
+            snapshot_data: Snapshot dict with an ISO snapshot_date
+            ttl_seconds: Time to live in seconds
+            
+        Returns:
+            True if caching successful
+        """
+        try:
+            redis_client = await self._ensure_connection()
+            if ttl_seconds is None:
+                ttl_seconds = self._get_ttl_for_type("segment")
+            
+            await self._write_segments(redis_client, universe_id, [snapshot_data], ttl_seconds + self.stale_ttl_seconds)
+            
+            # Assembled ranges that include the new date are stale in every process
+            await self._publish_invalidation(redis_client, universe_id)
+            return True
+            
+        except Exception as e:
+            self._error_count += 1
+            print(f"Cache set error for timeline segment {universe_id}: {e}")
+            if self.redis_client is not None:
+                try:
+                    await self.redis_client.delete(self._segment_coverage_key(universe_id))
+                except Exception:
+                    pass
+            return False
+    
+    async def remove_timeline_segment(
+        self,
+        universe_id: str,
+        snapshot_date: str
+    ) -> bool:
+        """
+        Drop the cached segment and snapshot entry of a deleted snapshot.
+        
+        The covered span stays valid without the date, so other segments are
+        kept; assembled ranges are dropped from every process's L1.
+        
+        Args:
+            universe_id: Universe identifier
+            snapshot_date: Snapshot date (ISO format)
+            
+        Returns:
+            True if removal successful
+        """
+        try:
+            redis_client = await self._ensure_connection()
+            segment_key = self._segment_key(universe_id, snapshot_date)
+            snapshot_key = self._generate_cache_key("snapshot", universe_id, snapshot_date=snapshot_date)
+            
+            await redis_client.delete(segment_key, snapshot_key)
+            await redis_client.zrem(self._segment_index_key(universe_id), snapshot_date)
+            await redis_client.zrem(self._registry_key("segment"), segment_key)
+            await redis_client.zrem(self._registry_key("snapshot"), snapshot_key)
+            await redis_client.srem(f"{self.key_prefix}:universe_index:{universe_id}", segment_key, snapshot_key)
+            await self._publish_invalidation(redis_client, universe_id)
+            return True
+            
+        except Exception as e:
+            self._error_count += 1
+            print(f"Cache removal error for timeline segment {universe_id}: {e}")
+            # Without the coverage the range is reloaded rather than served with the deleted date
+            if self.redis_client is not None:
+                try:
+                    await self.redis_client.delete(self._segment_coverage_key(universe_id))
+                except Exception:
+                    pass
+            return False
+    
     async def cache_snapshot(
         self,
         universe_id: str,
@@ -326,6 +1019,8 @@ class RedisTemporalCache(ITemporalCache):
             
             compressed_data = self._compress_data(enriched_data)
             await redis_client.setex(cache_key, ttl_seconds, compressed_data)
+            await self._register_key(redis_client, "snapshot", cache_key, ttl_seconds)
+            self._l1_set(cache_key, enriched_data, ttl_seconds)
             
             # Update universe index
             universe_index_key = f"{self.key_prefix}:universe_index:{universe_id}"
@@ -355,18 +1050,23 @@ class RedisTemporalCache(ITemporalCache):
             Cached snapshot data if available
         """
         try:
-            redis_client = await self._ensure_connection()
             cache_key = self._generate_cache_key(
                 "snapshot",
                 universe_id,
                 snapshot_date=snapshot_date
             )
             
-            cached_data = await redis_client.get(cache_key)
+            snapshot_data = self._l1_get(cache_key)
+            if snapshot_data is None:
+                redis_client = await self._ensure_connection()
+                cached_data = await redis_client.get(cache_key)
+                if cached_data:
+                    snapshot_data = self._decompress_data(cached_data)
+                    self._l1_set(cache_key, snapshot_data)
             
-            if cached_data:
+            if snapshot_data is not None:
                 self._hit_count += 1
-                return self._decompress_data(cached_data)
+                return dict(snapshot_data)
             else:
                 self._miss_count += 1
                 return None
@@ -400,8 +1100,18 @@ class RedisTemporalCache(ITemporalCache):
                 # Delete all cached data
                 await redis_client.delete(*cache_keys)
                 
+                keys_by_type: Dict[str, List[Any]] = {}
+                for key in cache_keys:
+                    keys_by_type.setdefault(self._cache_type_of(key), []).append(key)
+                for cache_type, keys in keys_by_type.items():
+                    await redis_client.zrem(self._registry_key(cache_type), *keys)
+                
             # Delete the index itself
             await redis_client.delete(universe_index_key)
+            await self._publish_invalidation(redis_client, universe_id)
+            
+            # Queue the universe for re-warming (done only if it is read often)
+            await redis_client.sadd(self._warm_pending_key(), universe_id)
             
             return True
             
@@ -413,25 +1123,49 @@ class RedisTemporalCache(ITemporalCache):
     async def warm_cache(
         self,
         universe_ids: List[str],
-        date_ranges: List[Dict[str, str]]
+        date_ranges: List[Dict[str, str]],
+        loader: Optional[Callable[[str, str, str], Awaitable[Optional[Dict[str, Any]]]]] = None,
+        max_items: Optional[int] = None
     ) -> Dict[str, bool]:
         """
         Pre-warm cache for commonly accessed data.
         
+        Computes each (universe, date range) timeline through the loader and
+        stores it, at most max_items timelines per call.
+        
         Args:
             universe_ids: List of universe IDs to warm
             date_ranges: List of date ranges to pre-compute
+            loader: Timeline loader (defaults to timeline_loader)
+            max_items: Cap on timelines computed by this call
             
         Returns:
-            Dictionary of warming results per universe
+            Dictionary of warming results per universe (False if nothing could be computed)
         """
+        loader = loader or self.timeline_loader
         warming_results = {}
+        budget = max_items if max_items is not None else len(universe_ids) * len(date_ranges)
         
         for universe_id in universe_ids:
+            if loader is None or budget <= 0:
+                warming_results[universe_id] = False
+                continue
+            
             try:
-                # This would typically trigger background computation
-                # For now, just mark as warmed
-                warming_results[universe_id] = True
+                warmed = True
+                for date_range in date_ranges:
+                    if budget <= 0:
+                        break
+                    budget -= 1
+                    start_date, end_date = date_range["start_date"], date_range["end_date"]
+                    timeline_data = await loader(universe_id, start_date, end_date)
+                    if timeline_data is None:
+                        warmed = False
+                        continue
+                    warmed = await self.set_timeline(universe_id, start_date, end_date, timeline_data) and warmed
+                
+                await self.clear_warm_pending(universe_id)
+                warming_results[universe_id] = warmed
                 
             except Exception as e:
                 warming_results[universe_id] = False
@@ -456,25 +1190,28 @@ class RedisTemporalCache(ITemporalCache):
             total_requests = self._hit_count + self._miss_count
             hit_rate = (self._hit_count / total_requests) if total_requests > 0 else 0.0
             
-            # Count cache keys by type
-            cache_keys = await redis_client.keys(f"{self.key_prefix}:*")
+            # Count live keys per type from the registries (O(log n) each)
+            now = time.time()
             key_counts = {}
-            
-            for key in cache_keys:
-                key_type = key.split(":")[2] if len(key.split(":")) > 2 else "unknown"
-                key_counts[key_type] = key_counts.get(key_type, 0) + 1
+            for cache_type in self._registered_types():
+                count = await redis_client.zcount(self._registry_key(cache_type), now, "+inf")
+                if count:
+                    key_counts[cache_type] = count
             
             return {
                 "hit_count": self._hit_count,
                 "miss_count": self._miss_count,
                 "error_count": self._error_count,
                 "hit_rate": round(hit_rate, 4),
-                "total_keys": len(cache_keys),
+                "total_keys": sum(key_counts.values()),
                 "keys_by_type": key_counts,
                 "redis_memory_used": redis_info.get("used_memory_human", "unknown"),
                 "redis_memory_peak": redis_info.get("used_memory_peak_human", "unknown"),
                 "ttl_strategies": self.ttl_strategies,
-                "compression_enabled": self.enable_compression
+                "compression_enabled": self.enable_compression,
+                "codec": self.codec.get_stats(),
+                "l1": self.l1_cache.get_stats() if self.l1_cache is not None else None,
+                "stampede": dict(self._stampede_stats)
             }
             
         except Exception as e:
@@ -490,20 +1227,20 @@ class RedisTemporalCache(ITemporalCache):
         """
         Manually cleanup expired keys for memory optimization.
         
+        Redis expires the cached values itself; this drops expired entries
+        from the per-type registries (writes prune them too, so this only
+        matters for types no longer written to).
+        
         Returns:
             Number of keys cleaned up
         """
         try:
             redis_client = await self._ensure_connection()
             
-            # Get all our cache keys
-            cache_keys = await redis_client.keys(f"{self.key_prefix}:*")
+            now = time.time()
             expired_count = 0
-            
-            for key in cache_keys:
-                ttl = await redis_client.ttl(key)
-                if ttl == -2:  # Key expired
-                    expired_count += 1
+            for cache_type in self._registered_types():
+                expired_count += await redis_client.zremrangebyscore(self._registry_key(cache_type), "-inf", now)
             
             return expired_count
             
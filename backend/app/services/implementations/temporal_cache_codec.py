@@ -0,0 +1,150 @@
+"""
+Binary codec for temporal cache payloads
+
+Encoded values are ``MAGIC | codec id | body``:
+- the body is JSON from the shared serializer (orjson when installed)
+- bodies above a size threshold are compressed with zstd (zlib when
+  zstandard is not installed)
+
+Values written before the codec existed are plain JSON text; they never start
+with the magic byte, so they are still decoded.
+"""
+
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from ...utils.serialization import SERIALIZER, dumps as _dumps, loads as _loads
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+# Format version byte; JSON text never starts with it
+MAGIC = 0x01
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+CODEC_NAMES = {CODEC_NONE: "none", CODEC_ZLIB: "zlib", CODEC_ZSTD: "zstd"}
+
+
+def _default_codec() -> int:
+    return CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB
+
+
+class TemporalCacheCodec:
+    """Serializer + size-thresholded compressor with encode/decode metrics"""
+
+    def __init__(
+        self,
+        compression: str = "auto",
+        threshold_bytes: int = 1024,
+        level: Optional[int] = None
+    ):
+        """
+        Args:
+            compression: "auto", "zstd", "zlib" or "none"
+            threshold_bytes: Serialized size from which bodies are compressed
+            level: Compression level (codec default when None)
+        """
+        codecs = {"auto": _default_codec(), "zstd": CODEC_ZSTD, "zlib": CODEC_ZLIB, "none": CODEC_NONE}
+        if compression not in codecs:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.codec = codecs[compression]
+        if self.codec == CODEC_ZSTD and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self.threshold_bytes = threshold_bytes
+        self.level = level
+        self._lock = threading.Lock()
+        self._stats = {
+            "encoded": 0,
+            "decoded": 0,
+            "compressed": 0,
+            "legacy_reads": 0,
+            "raw_bytes": 0,
+            "stored_bytes": 0,
+            "encode_seconds": 0.0,
+            "decode_seconds": 0.0
+        }
+
+    @property
+    def name(self) -> str:
+        return CODEC_NAMES[self.codec]
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=self.level or 3).compress(body)
+        return zlib.compress(body, self.level or 6)
+
+    @staticmethod
+    def _decompress(codec: int, body: bytes) -> bytes:
+        if codec == CODEC_NONE:
+            return body
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(body)
+        if codec == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise ValueError("Cached value is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(body)
+        raise ValueError(f"Unknown cache codec id: {codec}")
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize (and compress above the threshold) for storage"""
+        start = time.perf_counter()
+        body = _dumps(data)
+        raw_size = len(body)
+        codec = CODEC_NONE
+        if self.codec != CODEC_NONE and raw_size >= self.threshold_bytes:
+            compressed = self._compress(body)
+            if len(compressed) < raw_size:
+                body, codec = compressed, self.codec
+        payload = bytes((MAGIC, codec)) + body
+
+        with self._lock:
+            self._stats["encoded"] += 1
+            self._stats["compressed"] += codec != CODEC_NONE
+            self._stats["raw_bytes"] += raw_size
+            self._stats["stored_bytes"] += len(payload)
+            self._stats["encode_seconds"] += time.perf_counter() - start
+        return payload
+
+    def decode(self, payload: Any) -> Any:
+        """Decode a stored value (codec format or legacy JSON text)"""
+        start = time.perf_counter()
+        if isinstance(payload, str):
+            data = _loads(payload)
+            legacy = True
+        elif payload[:1] == bytes((MAGIC,)):
+            data = _loads(self._decompress(payload[1], payload[2:]))
+            legacy = False
+        else:
+            data = _loads(payload)
+            legacy = True
+
+        with self._lock:
+            self._stats["decoded"] += 1
+            self._stats["legacy_reads"] += legacy
+            self._stats["decode_seconds"] += time.perf_counter() - start
+        return data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compression ratio and average encode/decode time"""
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            "codec": self.name,
+            "serializer": SERIALIZER,
+            "threshold_bytes": self.threshold_bytes,
+            **stats,
+            "compression_ratio": round(stats["raw_bytes"] / stats["stored_bytes"], 3) if stats["stored_bytes"] else None,
+            "avg_encode_ms": round(stats["encode_seconds"] * 1000 / stats["encoded"], 4) if stats["encoded"] else 0.0,
+            "avg_decode_ms": round(stats["decode_seconds"] * 1000 / stats["decoded"], 4) if stats["decoded"] else 0.0
+        }
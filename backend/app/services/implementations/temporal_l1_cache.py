@@ -0,0 +1,135 @@
+"""
+In-process L1 for temporal cache reads
+
+Decoded timelines and snapshots are kept in a bounded per-process LRU so
+repeated reads of the same universe skip the Redis round trip and payload
+decode. Processes stay coherent through a Redis pub/sub channel: every
+universe invalidation is published, and a listener thread in each process
+drops that universe's L1 entries. Entries also expire after a short TTL, which
+bounds staleness if a message is missed while the listener reconnects.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+import redis as sync_redis
+
+from .provider_cache import ProviderCache
+
+logger = logging.getLogger(__name__)
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class TemporalL1Cache:
+    """Bounded LRU of decoded temporal cache values with pub/sub invalidation"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 30.0, reconnect_delay_seconds: float = 5.0):
+        """
+        Args:
+            max_entries: Maximum entries kept in process
+            ttl_seconds: Upper bound on how long an entry is served without Redis
+            reconnect_delay_seconds: Listener back-off after a pub/sub connection failure
+        """
+        self.ttl_seconds = ttl_seconds
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self.entries = ProviderCache("temporal_l1", max_entries=max_entries, default_ttl=int(ttl_seconds))
+        self._listeners: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = defaultdict(int)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """Store a value for at most the L1 TTL"""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self.entries.set(key, value, ttl=ttl)
+
+    def invalidate_universe(self, universe_id: str) -> int:
+        """Drop every entry of a universe (keys embed the universe id as a segment)"""
+        marker = f":{universe_id}:"
+        removed = self.entries.delete_where(lambda key: marker in f"{key}:")
+        with self._lock:
+            self._stats["invalidations"] += 1
+            self._stats["entries_invalidated"] += removed
+        return removed
+
+    def start_listener(self, redis_url: str, channel: str):
+        """Subscribe this process to invalidation messages (once per URL and channel)"""
+        listener_id = f"{redis_url}|{channel}"
+        with self._lock:
+            listener = self._listeners.get(listener_id)
+            if listener is not None and listener.is_alive():
+                return
+            listener = threading.Thread(
+                target=self._listen,
+                args=(redis_url, channel),
+                name="temporal-l1-invalidation",
+                daemon=True
+            )
+            self._listeners[listener_id] = listener
+        listener.start()
+
+    def _listen(self, redis_url: str, channel: str):
+        """Listener thread: apply published invalidations, reconnecting on failure"""
+        while True:
+            try:
+                client = sync_redis.from_url(redis_url, socket_connect_timeout=5)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        with self._lock:
+                            self._stats["messages_received"] += 1
+                        self.invalidate_universe(_text(message["data"]))
+            except Exception as e:
+                logger.warning(f"Temporal L1 invalidation listener error on {channel}: {e}")
+
+            # Messages may have been missed while disconnected
+            self.entries.clear()
+            with self._lock:
+                self._stats["listener_reconnects"] += 1
+            time.sleep(self.reconnect_delay_seconds)
+
+    def clear(self):
+        """Drop all entries"""
+        self.entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """L1 hit/eviction metrics and invalidation counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            listening = any(listener.is_alive() for listener in self._listeners.values())
+        entry_stats = self.entries.get_stats()
+        return {
+            "size": entry_stats["size"],
+            "max_entries": entry_stats["max_entries"],
+            "hits": entry_stats["l1_hits"],
+            "misses": entry_stats["misses"],
+            "hit_rate": entry_stats["hit_rate"],
+            "evictions": entry_stats["evictions"],
+            "ttl_seconds": self.ttl_seconds,
+            "listening": listening,
+            "invalidations": stats.get("invalidations", 0),
+            "entries_invalidated": stats.get("entries_invalidated", 0),
+            "messages_received": stats.get("messages_received", 0),
+            "listener_reconnects": stats.get("listener_reconnects", 0)
+        }
+
+
+_temporal_l1_cache: Optional[TemporalL1Cache] = None
+
+
+def get_temporal_l1_cache() -> TemporalL1Cache:
+    """Process-wide L1 shared by temporal cache instances"""
+    global _temporal_l1_cache
+    if _temporal_l1_cache is None:
+        _temporal_l1_cache = TemporalL1Cache()
+    return _temporal_l1_cache
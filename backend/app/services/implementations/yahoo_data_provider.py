@@ -7,25 +7,33 @@ import logging
 from concurrent.futures import ThreadPoolExecutor
 import time
 
-from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult
+from ..interfaces.data_provider import IDataProvider, MarketData, AssetInfo, ValidationResult, ServiceResult, SYMBOL_NOT_FOUND
+from .provider_cache import ProviderCache
 
 logger = logging.getLogger(__name__)
 
 class YahooDataProvider(IDataProvider):
     """Yahoo Finance implementation of data provider using yfinance 0.2.65+"""
     
-    def __init__(self, max_workers: int = 5, request_delay: float = 0.1):
+    def __init__(
+        self,
+        max_workers: int = 5,
+        request_delay: float = 0.1,
+        cache: Optional[ProviderCache] = None
+    ):
         """
         Initialize Yahoo Finance data provider
         
         Args:
             max_workers: Maximum number of concurrent requests
             request_delay: Delay between requests to respect rate limits
+            cache: Shared provider cache (defaults to an in-process only cache)
         """
         self.max_workers = max_workers
         self.request_delay = request_delay
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self._last_request_time = 0.0
+        self.cache = cache or ProviderCache(namespace="yahoo")
     
     async def _rate_limit(self):
         """Respect Yahoo Finance rate limits (approximately 60/minute for prices)"""
@@ -41,20 +49,37 @@ class YahooDataProvider(IDataProvider):
         return loop.run_in_executor(self.executor, func, *args)
     
     def _get_ticker_info(self, symbol: str) -> Dict:
-        """Get ticker info - blocking operation"""
+        """Get ticker info - blocking operation, cached per symbol"""
+        cache_key = self.cache.make_key("ticker_info", symbol=symbol)
+        cached_info = self.cache.get(cache_key)
+        if cached_info is not None:
+            return cached_info
+        
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
-            return info if info and 'symbol' in info else {}
+            if info and 'symbol' in info:
+                self.cache.set(cache_key, info)
+                return info
+            return {}
         except Exception as e:
             logger.warning(f"Failed to get info for {symbol}: {e}")
             return {}
     
     def _get_ticker_history(self, symbol: str, start_date: date, end_date: date, interval: str) -> pd.DataFrame:
-        """Get ticker history - blocking operation"""
+        """Get ticker history - blocking operation, cached per symbol and range"""
+        cache_key = self.cache.make_key(
+            "historical_data", symbol=symbol, start_date=start_date, end_date=end_date, interval=interval
+        )
+        cached_history = self.cache.get(cache_key)
+        if cached_history is not None:
+            return cached_history
+        
         try:
             ticker = yf.Ticker(symbol)
             hist = ticker.history(start=start_date, end=end_date, interval=interval)
+            if not hist.empty:
+                self.cache.set(cache_key, hist)
             return hist
         except Exception as e:
             logger.warning(f"Failed to get history for {symbol}: {e}")
@@ -325,7 +350,7 @@ class YahooDataProvider(IDataProvider):
                             is_valid=False,
                             provider="yahoo_finance",
                             timestamp=datetime.now(timezone.utc),
-                            error="Symbol not found or invalid",
+                            error=SYMBOL_NOT_FOUND,
                             confidence=0.0,
                             source="real_time"
                         )
@@ -4,6 +4,10 @@ from datetime import datetime, date
 from pydantic import BaseModel
 from .base import BaseService, ServiceResult
 
+# ValidationResult.error for symbols a provider definitively does not know
+# (as opposed to timeouts and request errors)
+SYMBOL_NOT_FOUND = "Symbol not found or invalid"
+
 class MarketData(BaseModel):
     """Market data structure for OHLCV information"""
     symbol: str
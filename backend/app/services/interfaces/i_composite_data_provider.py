@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
 from datetime import date, datetime
 from enum import Enum
 from pydantic import BaseModel
@@ -24,6 +24,12 @@ class FailoverStrategy(Enum):
     FAST_FAIL = "fast_fail"          # Fail quickly, move to next provider
     RETRY_ONCE = "retry_once"        # Retry failed provider once before moving
     CIRCUIT_BREAKER = "circuit_breaker"  # Temporarily disable failing providers
+    HEDGED = "hedged"                # Race next provider once primary exceeds its p95 latency
+
+class RoutingPolicy(Enum):
+    """How the provider order is chosen for each request"""
+    PRIORITY = "priority"            # Fixed provider_chain order
+    COST_LATENCY = "cost_latency"    # Cheapest provider meeting the latency/error SLA, chain order as fallback
 
 class ConflictResolution(Enum):
     """Strategies for resolving data conflicts between providers"""
@@ -43,6 +49,26 @@ class CompositeProviderConfig(BaseModel):
     cache_ttl_seconds: int = 300
     enable_validation: bool = True
     quality_threshold: float = 0.8
+    
+    # Hedged requests (FailoverStrategy.HEDGED)
+    hedge_budget_percent: float = 10.0  # Max extra upstream calls, as % of hedge-eligible requests
+    hedge_window_size: int = 100  # Recent requests the hedge budget is measured over
+    hedge_min_samples: int = 20  # Latency samples needed before the observed p95 is trusted
+    hedge_default_delay_ms: float = 1000.0  # Hedge delay used until enough samples exist
+    hedge_min_delay_ms: float = 50.0  # Floor on the hedge delay to avoid hedging every call
+    
+    # Range splitting for long historical requests
+    max_parallel_chunks: int = 4  # Concurrent chunk fetches across all symbols (rate budget)
+    chunk_retry_attempts: int = 2  # Extra attempts for a failed chunk (each walks the provider chain)
+    
+    # Latency- and cost-aware routing (RoutingPolicy.COST_LATENCY)
+    routing_policy: RoutingPolicy = RoutingPolicy.PRIORITY
+    routing_window_size: int = 100  # Recent calls per (provider, operation) the SLA is measured over
+    routing_window_seconds: float = 600.0  # Older calls are dropped, so a demoted provider is re-measured
+    routing_min_samples: int = 10  # Calls needed before a provider's SLA is judged
+    sla_p95_latency_ms: float = 2000.0
+    sla_max_error_rate: float = 0.1
+    operation_slas: Dict[str, Dict[str, float]] = {}  # Per-operation overrides, e.g. {"real_time": {"p95_latency_ms": 500}}
 
 class ProviderHealth(BaseModel):
     """Health status tracking for individual providers"""
@@ -229,12 +255,17 @@ class ICompositeDataProvider(BaseService):
         self,
         symbols: List[str],
         operations: List[str],
-        parallel_requests: int = 5
+        parallel_requests: int = 5,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> ServiceResult[Dict[str, Dict[str, CompositeResult]]]:
         """
         Optimized bulk data fetching for backtesting performance
-        Reduces API calls through intelligent batching and caching
+        Reduces API calls through multi-symbol batch calls and caching
         Target: 5x faster backtesting through complete dataset optimization
+        
+        Args:
+            progress_callback: Awaited with a progress event after each batch completes
         """
         pass
     
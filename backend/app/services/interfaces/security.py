@@ -10,7 +10,7 @@ Interface-First Design for enterprise security features including:
 Following the Interface-First Design methodology from planning/0_dev.md
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
@@ -365,6 +365,113 @@ class ITemporalCache(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Assemble a timeline's snapshots from per-snapshot cached segments.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Timeline start date (ISO format)
+            end_date: Timeline end date (ISO format)
+            
+        Returns:
+            Snapshots in date order, or None if the range is not fully cached
+        """
+        pass
+    
+    @abstractmethod
+    async def get_or_load_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: str,
+        loader: Callable[[str, str], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]],
+        refresh_loader: Optional[Callable[[str, str], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]]] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Cached snapshots of a range, loading them once (not once per caller) on a miss.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Timeline start date (ISO format)
+            end_date: Timeline end date (ISO format)
+            loader: Loads (snapshots, covered end date or None if open-ended) for a range
+            refresh_loader: Loader for background refreshes, which outlive the caller's
+                request (defaults to loader)
+            
+        Returns:
+            Snapshots of the range and whether they were served from cache
+        """
+        pass
+    
+    @abstractmethod
+    async def set_timeline_segments(
+        self,
+        universe_id: str,
+        start_date: str,
+        end_date: Optional[str],
+        snapshots: List[Dict[str, Any]],
+        ttl_seconds: int = None
+    ) -> bool:
+        """
+        Cache every snapshot of a date range as segments.
+        
+        Args:
+            universe_id: Universe identifier
+            start_date: Range start date (ISO format)
+            end_date: Range end date (ISO format), None for open-ended
+            snapshots: All snapshots of the range
+            ttl_seconds: Time to live in seconds
+            
+        Returns:
+            True if caching successful
+        """
+        pass
+    
+    @abstractmethod
+    async def add_timeline_segment(
+        self,
+        universe_id: str,
+        snapshot_data: Dict[str, Any],
+        ttl_seconds: int = None
+    ) -> bool:
+        """
+        Cache a newly created snapshot as one segment.
+        
+        Args:
+            universe_id: Universe identifier
+            snapshot_data: Snapshot data
+            ttl_seconds: Time to live in seconds
+            
+        Returns:
+            True if caching successful
+        """
+        pass
+    
+    @abstractmethod
+    async def remove_timeline_segment(
+        self,
+        universe_id: str,
+        snapshot_date: str
+    ) -> bool:
+        """
+        Drop the cached segment of a deleted snapshot.
+        
+        Args:
+            universe_id: Universe identifier
+            snapshot_date: Snapshot date (ISO format)
+            
+        Returns:
+            True if removal successful
+        """
+        pass
+    
     @abstractmethod
     async def invalidate_universe_cache(
         self,
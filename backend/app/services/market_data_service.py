@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import date, datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 
 from .interfaces.base import BaseService, ServiceResult
@@ -9,6 +9,7 @@ from .interfaces.data_provider import IDataProvider, MarketData, AssetInfo, Vali
 from .interfaces.i_composite_data_provider import ICompositeDataProvider, CompositeResult, DataSource
 from .implementations.composite_data_provider import CompositeDataProvider
 from .implementations.provider_health_monitor import ProviderHealthMonitor
+from .quote_snapshot_service import QuoteSnapshotService
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,13 @@ class MarketDataService(BaseService):
         enable_monitoring: bool = True,
         enable_caching: bool = True,
         cache_ttl_seconds: int = 300,
-        max_workers: int = 10
+        max_workers: int = 10,
+        enable_quote_snapshot: bool = True,
+        quote_refresh_interval_seconds: float = 60.0,
+        quote_max_age_seconds: float = 120.0,
+        composite_provider: Optional[CompositeDataProvider] = None,
+        redis_client=None,
+        redis_pool=None
     ):
         """
         Initialize market data service with composite provider
@@ -44,14 +51,23 @@ class MarketDataService(BaseService):
             enable_caching: Enable data caching for performance
             cache_ttl_seconds: Cache TTL in seconds
             max_workers: Maximum concurrent operations
+            enable_quote_snapshot: Serve real-time quotes from a background-refreshed snapshot
+            quote_refresh_interval_seconds: Snapshot refresh interval
+            quote_max_age_seconds: Oldest snapshot quote served without a provider round trip
+            composite_provider: Preconfigured composite provider (e.g. running on recorded providers)
+            redis_client: Optional binary redis.asyncio client for the shared provider cache
+                (shared with Celery jobs such as the pre-market warmup)
+            redis_pool: Redis pool registry backing the shared provider cache instead of redis_client
         """
         # Initialize composite provider
-        self.composite_provider = CompositeDataProvider(
+        self.composite_provider = composite_provider or CompositeDataProvider(
             openbb_api_key=openbb_api_key,
             alpha_vantage_api_key=alpha_vantage_api_key,
             enable_caching=enable_caching,
             cache_ttl_seconds=cache_ttl_seconds,
-            max_workers=max_workers
+            max_workers=max_workers,
+            redis_client=redis_client,
+            redis_pool=redis_pool
         )
         
         # Initialize health monitor
@@ -61,6 +77,13 @@ class MarketDataService(BaseService):
             enable_alerts=enable_monitoring
         ) if enable_monitoring else None
         
+        # Background quote snapshot for symbols in active universes
+        self.quote_snapshot = QuoteSnapshotService(
+            self.composite_provider,
+            refresh_interval_seconds=quote_refresh_interval_seconds
+        ) if enable_quote_snapshot else None
+        self.quote_max_age_seconds = quote_max_age_seconds
+        
         self.enable_monitoring = enable_monitoring
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
@@ -89,6 +112,10 @@ class MarketDataService(BaseService):
                     recovery_timeout_seconds=300
                 )
             
+            # Start background quote snapshot poller
+            if self.quote_snapshot:
+                await self.quote_snapshot.start()
+            
             logger.info("MarketDataService initialization completed")
             
             return ServiceResult(
@@ -98,6 +125,7 @@ class MarketDataService(BaseService):
                 metadata={
                     "providers_configured": len(self.composite_provider.providers),
                     "monitoring_enabled": self.enable_monitoring,
+                    "quote_snapshot_enabled": self.quote_snapshot is not None,
                     "circuit_breakers_enabled": True
                 }
             )
@@ -117,6 +145,10 @@ class MarketDataService(BaseService):
             if self.health_monitor:
                 await self.health_monitor.stop_monitoring()
             
+            # Stop quote snapshot poller
+            if self.quote_snapshot:
+                await self.quote_snapshot.stop()
+            
             # Shutdown thread pool
             self.executor.shutdown(wait=True)
             
@@ -138,39 +170,55 @@ class MarketDataService(BaseService):
     
     async def fetch_real_time_data_with_fallback(
         self,
-        symbols: List[str]
+        symbols: List[str],
+        max_age_seconds: Optional[float] = None
     ) -> ServiceResult[Dict[str, MarketData]]:
         """
         Fetch real-time market data with intelligent failover
         
+        Quotes are served from the background snapshot when younger than
+        max_age_seconds; only missing or stale symbols hit the providers.
         Returns raw MarketData for compatibility with existing code
         """
         try:
             logger.info(f"Fetching real-time data for {len(symbols)} symbols with fallback")
             
-            # Use composite provider for fallback capability
-            composite_result = await self.composite_provider.fetch_real_time_data_composite(symbols)
-            
-            if not composite_result.success:
-                return ServiceResult(
-                    success=False,
-                    error=composite_result.error,
-                    message=composite_result.message,
-                    metadata={"provider": "composite", "symbols_requested": len(symbols)}
+            market_data: Dict[str, MarketData] = {}
+            quote_ages: Dict[str, float] = {}
+            to_fetch = list(symbols)
+            
+            if self.quote_snapshot is not None:
+                max_age = self.quote_max_age_seconds if max_age_seconds is None else max_age_seconds
+                market_data, quote_ages, to_fetch = self.quote_snapshot.get_quotes(symbols, max_age)
+            
+            snapshot_hits = len(market_data)
+            failover_occurred = False
+            
+            if to_fetch:
+                # Use composite provider for fallback capability
+                composite_result = await self.composite_provider.fetch_real_time_data_composite(to_fetch)
+                
+                if not composite_result.success and not market_data:
+                    return ServiceResult(
+                        success=False,
+                        error=composite_result.error,
+                        message=composite_result.message,
+                        metadata={"provider": "composite", "symbols_requested": len(symbols)}
+                    )
+                
+                fetched = self._extract_market_data(composite_result.data or {})
+                for symbol in fetched:
+                    quote_ages[symbol] = 0.0
+                market_data.update(fetched)
+                failover_occurred = any(
+                    getattr(cd, 'failover_occurred', False) 
+                    for cd in (composite_result.data or {}).values()
                 )
-            
-            # Extract MarketData from CompositeResult
-            market_data = {}
-            for symbol, composite_data in composite_result.data.items():
-                if isinstance(composite_data.data, dict) and symbol in composite_data.data:
-                    market_data[symbol] = composite_data.data[symbol]
-                elif hasattr(composite_data, 'data') and composite_data.data:
-                    # Handle different data structures
-                    data = composite_data.data
-                    if isinstance(data, dict) and len(data) == 1:
-                        market_data[symbol] = next(iter(data.values()))
-                    else:
-                        market_data[symbol] = data
+                
+                if self.quote_snapshot is not None:
+                    await self.quote_snapshot.record(
+                        {symbol: quote for symbol, quote in fetched.items() if isinstance(quote, MarketData)}
+                    )
             
             return ServiceResult(
                 success=True,
@@ -180,10 +228,9 @@ class MarketDataService(BaseService):
                     "provider": "composite",
                     "symbols_successful": len(market_data),
                     "symbols_requested": len(symbols),
-                    "failover_occurred": any(
-                        getattr(cd, 'failover_occurred', False) 
-                        for cd in composite_result.data.values()
-                    )
+                    "snapshot_hits": snapshot_hits,
+                    "quote_age_seconds": quote_ages,
+                    "failover_occurred": failover_occurred
                 },
                 next_actions=["update_portfolios", "calculate_indicators"] if market_data else ["retry_failed_symbols"]
             )
@@ -196,6 +243,22 @@ class MarketDataService(BaseService):
                 message="Failed to fetch real-time data with fallback"
             )
     
+    @staticmethod
+    def _extract_market_data(composite_data_by_symbol: Dict[str, CompositeResult]) -> Dict[str, MarketData]:
+        """Extract MarketData from per-symbol CompositeResults"""
+        market_data = {}
+        for symbol, composite_data in composite_data_by_symbol.items():
+            if isinstance(composite_data.data, dict) and symbol in composite_data.data:
+                market_data[symbol] = composite_data.data[symbol]
+            elif hasattr(composite_data, 'data') and composite_data.data:
+                # Handle different data structures
+                data = composite_data.data
+                if isinstance(data, dict) and len(data) == 1:
+                    market_data[symbol] = next(iter(data.values()))
+                else:
+                    market_data[symbol] = data
+        return market_data
+    
     async def fetch_historical_data_with_fallback(
         self,
         symbols: List[str],
@@ -588,6 +651,59 @@ class MarketDataService(BaseService):
                 message="Failed to execute bulk data fetch"
             )
     
+    async def stream_bulk_data_fetch(
+        self,
+        symbols: List[str],
+        operations: List[str],
+        parallel_requests: int = 5
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Bulk data fetch yielding a progress event per completed provider batch
+        
+        Yields {"event": "progress", ...} for each batch (including that batch's
+        results) and a final {"event": "complete", ...} summary.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        
+        async def _on_progress(progress: Dict[str, Any]):
+            await events.put({"event": "progress", **progress})
+        
+        async def _run():
+            try:
+                result = await self.composite_provider.bulk_data_optimization(
+                    symbols=symbols,
+                    operations=operations,
+                    parallel_requests=parallel_requests,
+                    progress_callback=_on_progress
+                )
+                await events.put({
+                    "event": "complete",
+                    "success": result.success,
+                    "error": result.error,
+                    "message": result.message,
+                    "metadata": result.metadata,
+                    "next_actions": ["process_bulk_results", "start_backtest"] if result.success else ["retry_failed_operations"]
+                })
+            except Exception as e:
+                logger.error(f"Streaming bulk data fetch failed: {e}")
+                await events.put({
+                    "event": "complete",
+                    "success": False,
+                    "error": str(e),
+                    "message": "Failed to execute bulk data fetch"
+                })
+        
+        task = asyncio.create_task(_run())
+        try:
+            while True:
+                event = await events.get()
+                yield event
+                if event["event"] == "complete":
+                    break
+        finally:
+            if not task.done():
+                task.cancel()
+    
     async def get_provider_health(self) -> ServiceResult[Dict[str, Any]]:
         """Get current provider health status and performance metrics"""
         try:
@@ -618,7 +734,8 @@ class MarketDataService(BaseService):
                     "health_status": health_result.data,
                     "performance_metrics": metrics_result.data if metrics_result.success else {},
                     "provider_rankings": rankings_result.data if rankings_result.success else [],
-                    "active_alerts": alerts_result.data if alerts_result.success else []
+                    "active_alerts": alerts_result.data if alerts_result.success else [],
+                    "quote_snapshot": self.quote_snapshot.get_stats() if self.quote_snapshot else None
                 },
                 message="Provider health information retrieved successfully",
                 metadata={
@@ -0,0 +1,190 @@
+"""
+Pre-market warmup of universe symbols
+
+At the open every dashboard requests the same symbols at once. Shortly before
+the open this service prefetches, in batched provider calls, what those
+requests need for the distinct symbols across all active universes:
+- history top-ups into the local price store (only bars after the last stored one)
+- fundamentals into today's fundamentals snapshot
+- quotes into the shared provider cache and quote snapshot
+"""
+
+import logging
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.market_data import PriceBar
+from .interfaces.base import ServiceResult
+from .implementations.composite_data_provider import BULK_BATCH_SIZES
+from .price_history_service import PriceHistoryService
+from .quote_snapshot_service import load_active_universe_symbols
+
+logger = logging.getLogger(__name__)
+
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+MARKET_OPEN = dt_time(9, 30)
+
+
+def minutes_to_open(now: Optional[datetime] = None) -> float:
+    """Minutes until today's US equity open (negative once the market has opened)"""
+    now = (now or datetime.now(timezone.utc)).astimezone(MARKET_TIMEZONE)
+    open_at = datetime.combine(now.date(), MARKET_OPEN, tzinfo=MARKET_TIMEZONE)
+    return (open_at - now).total_seconds() / 60
+
+
+class PremarketWarmupService:
+    """Batched prefetch of history, fundamentals and quotes for active-universe symbols"""
+
+    def __init__(
+        self,
+        db: Session,
+        composite_provider=None,
+        fundamentals_service=None,
+        quote_snapshot=None,
+        symbol_loader: Optional[Callable[[], List[str]]] = None,
+        history_lookback_days: int = 365,
+        parallel_requests: int = 5
+    ):
+        """
+        Initialize pre-market warmup service
+
+        Args:
+            db: Database session
+            composite_provider: CompositeDataProvider, ideally Redis-backed so API workers share the warmed cache
+            fundamentals_service: FundamentalsRefreshService (defaults to one on db)
+            quote_snapshot: QuoteSnapshotService receiving the warmed quotes (optional)
+            symbol_loader: Callable returning the symbols to warm (defaults to symbols of active universes)
+            history_lookback_days: History fetched for symbols with no stored bars
+            parallel_requests: Maximum concurrent batch calls for quotes
+        """
+        self.db = db
+        if composite_provider is None:
+            from .implementations.composite_data_provider import CompositeDataProvider
+            composite_provider = CompositeDataProvider()
+        self.composite_provider = composite_provider
+        if fundamentals_service is None:
+            from .fundamentals_service import FundamentalsRefreshService
+            fundamentals_service = FundamentalsRefreshService(db)
+        self.fundamentals_service = fundamentals_service
+        self.quote_snapshot = quote_snapshot
+        self.symbol_loader = symbol_loader or load_active_universe_symbols
+        self.history_lookback_days = history_lookback_days
+        self.parallel_requests = parallel_requests
+        self.price_history = PriceHistoryService(db)
+
+    async def run(self, symbols: Optional[List[str]] = None, today: Optional[date] = None) -> ServiceResult[Dict[str, Any]]:
+        """
+        Warm history, fundamentals and quotes for the given symbols
+
+        Args:
+            symbols: Symbols to warm (defaults to the distinct symbols of active universes)
+            today: Trading date (defaults to today, UTC)
+        """
+        today = today or datetime.now(timezone.utc).date()
+        symbols = sorted({symbol.upper() for symbol in (symbols if symbols is not None else self.symbol_loader())})
+        if not symbols:
+            return ServiceResult(success=True, data={"symbols": 0}, message="No universe symbols to warm")
+
+        steps = {
+            "history": self._warm_history,
+            "fundamentals": self._warm_fundamentals,
+            "quotes": self._warm_quotes,
+        }
+        data: Dict[str, Any] = {"symbols": len(symbols)}
+        failed_steps = []
+        for name, step in steps.items():
+            try:
+                data[name] = await step(symbols, today)
+            except Exception as e:
+                logger.error(f"Pre-market warmup step {name} failed: {e}")
+                data[name] = {"error": str(e)}
+            if "error" in data[name]:
+                failed_steps.append(name)
+
+        return ServiceResult(
+            success=len(failed_steps) < len(steps),
+            data=data,
+            message=f"Warmed {len(symbols)} symbols" + (f" ({', '.join(failed_steps)} failed)" if failed_steps else ""),
+            metadata={"failed_steps": failed_steps, "trading_date": today.isoformat()}
+        )
+
+    def _history_start_dates(self, symbols: List[str], today: date) -> Dict[date, List[str]]:
+        """Group symbols by the first date missing from the price store"""
+        last_stored = dict(
+            self.db.query(PriceBar.symbol, func.max(PriceBar.timestamp))
+            .filter(PriceBar.symbol.in_(symbols), PriceBar.interval == "1d")
+            .group_by(PriceBar.symbol)
+            .all()
+        )
+
+        groups: Dict[date, List[str]] = {}
+        default_start = today - timedelta(days=self.history_lookback_days)
+        for symbol in symbols:
+            last = last_stored.get(symbol)
+            start = last.date() + timedelta(days=1) if last is not None else default_start
+            if start < today:
+                groups.setdefault(start, []).append(symbol)
+        return groups
+
+    async def _warm_history(self, symbols: List[str], today: date) -> Dict[str, Any]:
+        """Top up stored daily bars, batching symbols that share a start date"""
+        groups = self._history_start_dates(symbols, today)
+        batch_size = BULK_BATCH_SIZES["historical_data"]
+        stats = {"symbols_up_to_date": len(symbols) - sum(len(group) for group in groups.values()),
+                 "batch_calls": 0, "bars_inserted": 0, "failed_batches": 0}
+
+        for start, group in sorted(groups.items()):
+            for index in range(0, len(group), batch_size):
+                batch = group[index:index + batch_size]
+                stats["batch_calls"] += 1
+                result = await self.composite_provider.fetch_with_fallback(
+                    "historical_data", symbols=batch, start_date=start, end_date=today, interval="1d"
+                )
+                bars = getattr(result.data, "data", None) if result.success else None
+                if not isinstance(bars, dict):
+                    stats["failed_batches"] += 1
+                    continue
+
+                stored = await self.price_history.store_bars(bars, source=result.data.primary_source.value)
+                if stored.success:
+                    stats["bars_inserted"] += stored.data["inserted"]
+                else:
+                    stats["failed_batches"] += 1
+
+        if stats["batch_calls"] and stats["failed_batches"] == stats["batch_calls"]:
+            stats["error"] = "All history batches failed"
+        return stats
+
+    async def _warm_fundamentals(self, symbols: List[str], today: date) -> Dict[str, Any]:
+        """Refresh today's fundamentals snapshot in bulk provider calls"""
+        result = await self.fundamentals_service.refresh(symbols, snapshot_date=today)
+        if not result.success:
+            return {"error": result.error or "Fundamentals refresh failed"}
+        return {**result.data, "missing_symbols": len((result.metadata or {}).get("missing_symbols", []))}
+
+    async def _warm_quotes(self, symbols: List[str], today: date) -> Dict[str, Any]:
+        """Fetch quotes in batches; results land in the per-symbol provider cache and the quote snapshot"""
+        result = await self.composite_provider.bulk_data_optimization(
+            symbols, ["real_time"], parallel_requests=self.parallel_requests
+        )
+        if not result.success:
+            return {"error": result.error or "No quotes fetched"}
+
+        quotes = {}
+        for symbol, operations in result.data.items():
+            composite = operations.get("real_time")
+            quote = (getattr(composite, "data", None) or {}).get(symbol)
+            if quote is not None:
+                quotes[symbol] = quote
+        if self.quote_snapshot is not None and quotes:
+            await self.quote_snapshot.record(quotes)
+
+        return {
+            "quotes": len(quotes),
+            "batch_calls": result.metadata.get("batch_calls", 0),
+            "cache_hits": result.metadata.get("cache_hits", 0)
+        }
@@ -0,0 +1,334 @@
+"""
+Local price store with read-time corporate-action adjustment
+
+Bars are stored exactly as the provider delivered them. Splits and dividends
+are kept as corporate actions, and cumulative adjustment factors are applied
+lazily when history is read. Recording a new action is a single-row write,
+and stored history is never rewritten or re-downloaded.
+
+Adjustment conventions follow the providers' adjusted series:
+- open/high/low/close and volume are split-adjusted
+- adjusted_close is split- and dividend-adjusted
+"""
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ..models.market_data import PriceBar, CorporateAction
+from .interfaces.base import ServiceResult
+from .interfaces.data_provider import MarketData
+
+logger = logging.getLogger(__name__)
+
+
+def cumulative_adjustment_factors(
+    bar_dates: np.ndarray,
+    ex_dates: np.ndarray,
+    factors: np.ndarray
+) -> np.ndarray:
+    """
+    Product of the factors of every action whose ex-date falls after each bar
+
+    Args:
+        bar_dates: datetime64[D] dates of the bars
+        ex_dates: datetime64[D] ex-dates of the actions, sorted ascending
+        factors: Price multiplier of each action
+
+    Returns:
+        One cumulative factor per bar
+    """
+    if len(ex_dates) == 0:
+        return np.ones(len(bar_dates))
+
+    # suffix[k] = product of factors[k:], suffix[n] = 1
+    suffix = np.append(np.cumprod(factors[::-1])[::-1], 1.0)
+    return suffix[np.searchsorted(ex_dates, bar_dates, side="right")]
+
+
+def _utc(timestamp: datetime) -> datetime:
+    """Stored timestamps come back naive on SQLite"""
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+class PriceHistoryService:
+    """Local OHLCV store with lazily applied split/dividend adjustments"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def store_bars(
+        self,
+        bars_by_symbol: Dict[str, List[MarketData]],
+        interval: str = "1d",
+        source: Optional[str] = None
+    ) -> ServiceResult[Dict[str, int]]:
+        """
+        Store unadjusted bars, replacing bars already stored at the same timestamp
+
+        Args:
+            bars_by_symbol: Provider bars per symbol (as returned by fetch_historical_data)
+            interval: Bar interval
+            source: Provider that delivered the bars
+        """
+        try:
+            counts = {"inserted": 0, "updated": 0}
+            for symbol, bars in bars_by_symbol.items():
+                if not bars:
+                    continue
+
+                timestamps = [_utc(bar.timestamp) for bar in bars]
+                existing = {
+                    _utc(row.timestamp): row
+                    for row in self.db.query(PriceBar).filter(
+                        PriceBar.symbol == symbol,
+                        PriceBar.interval == interval,
+                        PriceBar.timestamp >= min(timestamps),
+                        PriceBar.timestamp <= max(timestamps)
+                    )
+                }
+
+                for bar, timestamp in zip(bars, timestamps):
+                    values = {
+                        "open": bar.open,
+                        "high": bar.high,
+                        "low": bar.low,
+                        "close": bar.close,
+                        "volume": bar.volume,
+                        "source": source or bar.metadata.get("source")
+                    }
+                    row = existing.get(timestamp)
+                    if row is None:
+                        row = PriceBar(symbol=symbol, interval=interval, timestamp=timestamp, **values)
+                        self.db.add(row)
+                        existing[timestamp] = row
+                        counts["inserted"] += 1
+                    else:
+                        for key, value in values.items():
+                            setattr(row, key, value)
+                        counts["updated"] += 1
+
+            self.db.commit()
+            return ServiceResult(
+                success=True,
+                data=counts,
+                message=f"Stored {counts['inserted']} new and {counts['updated']} updated bars"
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to store price bars: {e}")
+            return ServiceResult(success=False, error=str(e), message="Failed to store price bars")
+
+    async def record_corporate_action(
+        self,
+        symbol: str,
+        ex_date: date,
+        action_type: str,
+        value: float,
+        source: Optional[str] = None
+    ) -> ServiceResult[Dict[str, Any]]:
+        """
+        Record a split or cash dividend
+
+        Only the action row is written; stored bars are left untouched and
+        pick up the new factor on their next read.
+
+        Args:
+            symbol: Asset symbol
+            ex_date: First trading day without the entitlement
+            action_type: CorporateAction.SPLIT or CorporateAction.DIVIDEND
+            value: Split ratio (4.0 for a 4:1 split) or cash amount per share
+            source: Where the action came from
+        """
+        if action_type not in (CorporateAction.SPLIT, CorporateAction.DIVIDEND):
+            return ServiceResult(
+                success=False,
+                error=f"Unsupported corporate action type: {action_type}",
+                message="Corporate action must be a split or dividend"
+            )
+        if value <= 0:
+            return ServiceResult(
+                success=False,
+                error="Corporate action value must be positive",
+                message="Invalid corporate action"
+            )
+
+        try:
+            price_factor = self._price_factor(symbol, ex_date, action_type, value)
+
+            action = self.db.query(CorporateAction).filter(
+                CorporateAction.symbol == symbol,
+                CorporateAction.ex_date == ex_date,
+                CorporateAction.action_type == action_type
+            ).first()
+            if action is None:
+                action = CorporateAction(symbol=symbol, ex_date=ex_date, action_type=action_type)
+                self.db.add(action)
+
+            action.value = value
+            action.price_factor = price_factor
+            action.source = source
+            action.is_active = True
+
+            self.db.commit()
+            return ServiceResult(
+                success=True,
+                data=action.to_dict(),
+                message=f"Recorded {action_type} for {symbol} on {ex_date.isoformat()}",
+                metadata={"price_factor": price_factor, "factor_resolved": price_factor is not None}
+            )
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to record corporate action for {symbol}: {e}")
+            return ServiceResult(success=False, error=str(e), message="Failed to record corporate action")
+
+    def _price_factor(self, symbol: str, ex_date: date, action_type: str, value: float) -> Optional[float]:
+        """Price multiplier for bars before ex_date (None if the previous close is not stored yet)"""
+        if action_type == CorporateAction.SPLIT:
+            return 1.0 / value
+
+        previous = self.db.query(PriceBar.close).filter(
+            PriceBar.symbol == symbol,
+            PriceBar.interval == "1d",
+            PriceBar.timestamp < datetime.combine(ex_date, datetime.min.time(), tzinfo=timezone.utc)
+        ).order_by(PriceBar.timestamp.desc()).first()
+
+        if previous is None or previous.close <= value:
+            return None
+        return 1.0 - value / previous.close
+
+    async def get_adjusted_history(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        interval: str = "1d",
+        adjust: bool = True
+    ) -> ServiceResult[Dict[str, List[MarketData]]]:
+        """
+        Read stored history with corporate-action adjustments applied
+
+        Args:
+            symbols: Symbols to read
+            start_date: First bar date (inclusive)
+            end_date: Last bar date (inclusive)
+            interval: Bar interval
+            adjust: Apply split/dividend adjustments (False returns bars as stored)
+        """
+        try:
+            start = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+            end = datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
+
+            rows = self.db.query(PriceBar).filter(
+                PriceBar.symbol.in_(symbols),
+                PriceBar.interval == interval,
+                PriceBar.is_active.is_(True),
+                PriceBar.timestamp >= start,
+                PriceBar.timestamp <= end
+            ).order_by(PriceBar.symbol, PriceBar.timestamp).all()
+
+            bars_by_symbol: Dict[str, List[PriceBar]] = {}
+            for row in rows:
+                bars_by_symbol.setdefault(row.symbol, []).append(row)
+
+            # Only actions after the window start can affect bars in it
+            actions_by_symbol: Dict[str, List[CorporateAction]] = {}
+            if adjust and bars_by_symbol:
+                actions = self.db.query(CorporateAction).filter(
+                    CorporateAction.symbol.in_(list(bars_by_symbol)),
+                    CorporateAction.is_active.is_(True),
+                    CorporateAction.ex_date > start_date
+                ).order_by(CorporateAction.ex_date).all()
+                for action in actions:
+                    actions_by_symbol.setdefault(action.symbol, []).append(action)
+
+            data = {
+                symbol: self._adjust(symbol, bars, actions_by_symbol.get(symbol, []))
+                for symbol, bars in bars_by_symbol.items()
+            }
+            missing = [symbol for symbol in symbols if symbol not in data]
+
+            return ServiceResult(
+                success=True,
+                data=data,
+                message=f"Loaded stored history for {len(data)}/{len(symbols)} symbols",
+                metadata={
+                    "bars": len(rows),
+                    "corporate_actions_applied": sum(len(actions) for actions in actions_by_symbol.values()),
+                    "missing_symbols": missing,
+                    "adjusted": adjust
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to read stored price history: {e}")
+            return ServiceResult(success=False, error=str(e), message="Failed to read stored price history")
+
+    def _adjust(self, symbol: str, bars: List[PriceBar], actions: List[CorporateAction]) -> List[MarketData]:
+        """Apply cumulative split and dividend factors to one symbol's bars"""
+        timestamps = [_utc(bar.timestamp) for bar in bars]
+        prices = np.array([[bar.open, bar.high, bar.low, bar.close] for bar in bars], dtype=float)
+        volumes = np.array([bar.volume for bar in bars], dtype=float)
+
+        split_factors, total_factors = self._factor_arrays(timestamps, prices[:, 3], actions)
+
+        split_prices = prices * split_factors[:, None]
+        split_volumes = np.rint(volumes / split_factors)
+        adjusted_close = prices[:, 3] * total_factors
+
+        return [
+            MarketData(
+                symbol=symbol,
+                timestamp=timestamp,
+                open=float(split_prices[i, 0]),
+                high=float(split_prices[i, 1]),
+                low=float(split_prices[i, 2]),
+                close=float(split_prices[i, 3]),
+                volume=int(split_volumes[i]),
+                adjusted_close=float(adjusted_close[i]),
+                metadata={
+                    "source": "price_store",
+                    "provider": bars[i].source,
+                    "adjustment_factor": float(total_factors[i])
+                }
+            )
+            for i, timestamp in enumerate(timestamps)
+        ]
+
+    @staticmethod
+    def _factor_arrays(
+        timestamps: List[datetime],
+        closes: np.ndarray,
+        actions: List[CorporateAction]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(split-only factors, split and dividend factors) per bar"""
+        bar_dates = np.array([timestamp.date() for timestamp in timestamps], dtype="datetime64[D]")
+        if not actions:
+            ones = np.ones(len(bar_dates))
+            return ones, ones
+
+        ex_dates = np.array([action.ex_date for action in actions], dtype="datetime64[D]")
+        factors = np.array(
+            [action.price_factor if action.price_factor is not None else np.nan for action in actions],
+            dtype=float
+        )
+
+        # Dividends recorded before their previous close was stored: resolve from the loaded bars
+        unresolved = np.isnan(factors)
+        if unresolved.any():
+            previous = np.searchsorted(bar_dates, ex_dates[unresolved], side="left") - 1
+            values = np.array([action.value for action in actions])[unresolved]
+            previous_close = np.where(previous >= 0, closes[np.clip(previous, 0, None)], np.nan)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                resolved = 1.0 - values / previous_close
+            factors[unresolved] = np.where(np.isfinite(resolved) & (resolved > 0), resolved, 1.0)
+
+        is_split = np.array([action.action_type == CorporateAction.SPLIT for action in actions])
+        split_factors = cumulative_adjustment_factors(bar_dates, ex_dates[is_split], factors[is_split])
+        total_factors = cumulative_adjustment_factors(bar_dates, ex_dates, factors)
+        return split_factors, total_factors
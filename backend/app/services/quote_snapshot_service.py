@@ -0,0 +1,416 @@
+"""
+Background real-time quote snapshot service
+
+Keeps the latest quote for every symbol held in an active universe in memory
+and in Redis, refreshed by a background poller in provider-sized batches.
+Real-time reads are served from the snapshot (with the quote's age) and only
+symbols missing from it, or older than the caller allows, go to the providers.
+
+Only one poller refreshes at a time across API workers: the leader holds a
+Redis lock, the other workers reload the shared snapshot from Redis.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from ..core.redis_pool import get_redis_pool
+from .interfaces.base import ServiceResult
+from .interfaces.data_provider import MarketData
+from ..utils.serialization import dumps_str, loads
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_REDIS_KEY = "bubble:quote_snapshot"
+POLLER_LOCK_KEY = "bubble:quote_snapshot:poller_lock"
+
+
+def load_active_universe_symbols() -> List[str]:
+    """Distinct symbols of active assets held in active universes"""
+    from ..core.database import SessionLocal
+    from ..models.asset import Asset, UniverseAsset
+    from ..models.universe import Universe
+
+    with SessionLocal() as db:
+        rows = (
+            db.query(Asset.symbol)
+            .join(UniverseAsset, UniverseAsset.asset_id == Asset.id)
+            .join(Universe, Universe.id == UniverseAsset.universe_id)
+            .filter(Universe.is_active.is_(True), Asset.is_active.is_(True))
+            .distinct()
+            .all()
+        )
+    return sorted(row.symbol for row in rows)
+
+
+class QuoteSnapshotService:
+    """In-memory + Redis snapshot of latest quotes for active-universe symbols"""
+
+    def __init__(
+        self,
+        composite_provider,
+        redis_client: Optional[redis.Redis] = None,
+        symbol_loader: Optional[Callable[[], Awaitable[List[str]]]] = None,
+        refresh_interval_seconds: float = 60.0,
+        batch_size: int = 50,
+        max_symbols_per_cycle: int = 2000,
+        batch_delay_seconds: float = 0.5,
+        snapshot_ttl_seconds: int = 900,
+        tracked_symbol_ttl_seconds: float = 3600.0,
+        max_tracked_symbols: int = 1000
+    ):
+        """
+        Initialize quote snapshot service
+
+        Args:
+            composite_provider: CompositeDataProvider used for batched quote fetches
+            redis_client: Redis client (decode_responses=True) for the shared snapshot
+                (defaults to the application-wide pool)
+            symbol_loader: Async callable returning the symbols to keep fresh
+                (defaults to symbols of active universes)
+            refresh_interval_seconds: Time between refresh cycles
+            batch_size: Symbols per provider call
+            max_symbols_per_cycle: Rate budget - symbols refreshed per cycle, stalest first
+            batch_delay_seconds: Pause between batches to spread provider load
+            snapshot_ttl_seconds: Redis expiry of the shared snapshot
+            tracked_symbol_ttl_seconds: Stop polling an on-demand symbol not requested for this long
+            max_tracked_symbols: On-demand symbols polled at most (least recently requested dropped first)
+        """
+        self.composite_provider = composite_provider
+        # Without an injected client the shared pool's client for the running
+        # event loop is looked up per call (the service is created at import
+        # time and by Celery tasks before their loop runs)
+        self._redis_client = redis_client
+        self._use_redis_pool = redis_client is None
+        self.symbol_loader = symbol_loader or (lambda: asyncio.to_thread(load_active_universe_symbols))
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.batch_size = batch_size
+        self.max_symbols_per_cycle = max_symbols_per_cycle
+        self.batch_delay_seconds = batch_delay_seconds
+        self.snapshot_ttl_seconds = snapshot_ttl_seconds
+        self.tracked_symbol_ttl_seconds = tracked_symbol_ttl_seconds
+        self.max_tracked_symbols = max_tracked_symbols
+
+        # symbol -> (quote, fetched_at epoch seconds)
+        self._quotes: Dict[str, Tuple[MarketData, float]] = {}
+        # Symbols requested on demand -> last requested epoch seconds, least
+        # recently requested first; polled alongside the universe symbols
+        self._tracked_symbols: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats: Dict[str, Any] = {
+            "cycles": 0,
+            "cycles_as_follower": 0,
+            "symbols_refreshed": 0,
+            "refresh_errors": 0,
+            "tracked_symbols_expired": 0,
+            "snapshot_hits": 0,
+            "snapshot_misses": 0,
+            "last_cycle_at": None,
+            "last_cycle_duration_ms": 0.0
+        }
+
+    def _create_redis_client(self) -> Optional[redis.Redis]:
+        """Get the application-wide pool's client for the running event loop"""
+        try:
+            return get_redis_pool().get_client(decode_responses=True)
+        except Exception as e:
+            logger.error(f"Failed to get Redis client for quote snapshot: {e}")
+            return None
+
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """Injected Redis client, or the application-wide pool's client"""
+        if self._use_redis_pool:
+            return self._create_redis_client()
+        return self._redis_client
+
+    @redis_client.setter
+    def redis_client(self, redis_client: Optional[redis.Redis]):
+        # An assigned client (None disables the shared snapshot) replaces the pool
+        self._redis_client = redis_client
+        self._use_redis_pool = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self) -> ServiceResult[bool]:
+        """Start the background poller"""
+        if self._running:
+            return ServiceResult(success=True, data=True, message="Quote snapshot poller already running")
+
+        self._running = True
+        self._task = asyncio.create_task(self._poll_loop())
+        logger.info(f"Quote snapshot poller started (interval={self.refresh_interval_seconds}s)")
+
+        return ServiceResult(
+            success=True,
+            data=True,
+            message="Quote snapshot poller started",
+            metadata={
+                "refresh_interval_seconds": self.refresh_interval_seconds,
+                "batch_size": self.batch_size,
+                "max_symbols_per_cycle": self.max_symbols_per_cycle
+            }
+        )
+
+    async def stop(self) -> ServiceResult[bool]:
+        """Stop the background poller"""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        logger.info("Quote snapshot poller stopped")
+        return ServiceResult(success=True, data=True, message="Quote snapshot poller stopped")
+
+    async def _poll_loop(self):
+        """Refresh loop"""
+        while self._running:
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                self._stats["refresh_errors"] += 1
+                logger.error(f"Quote snapshot refresh cycle failed: {e}")
+
+            await asyncio.sleep(self.refresh_interval_seconds)
+
+    async def _acquire_poller_lock(self) -> bool:
+        """Leader election - only one worker polls providers per cycle"""
+        if self.redis_client is None:
+            return True
+        try:
+            acquired = await self.redis_client.set(
+                POLLER_LOCK_KEY,
+                str(os.getpid()),
+                nx=True,
+                ex=max(int(self.refresh_interval_seconds), 1)
+            )
+            return bool(acquired)
+        except Exception as e:
+            # Without Redis every worker polls its own snapshot
+            logger.warning(f"Quote snapshot lock unavailable, polling locally: {e}")
+            return True
+
+    async def refresh_once(self) -> ServiceResult[Dict[str, Any]]:
+        """Run one refresh cycle (poll providers if leader, otherwise reload from Redis)"""
+        start_time = time.time()
+
+        if not await self._acquire_poller_lock():
+            loaded = await self._load_from_redis()
+            self._stats["cycles_as_follower"] += 1
+            return ServiceResult(
+                success=True,
+                data={"refreshed": 0, "loaded_from_redis": loaded},
+                message=f"Loaded {loaded} quotes from shared snapshot"
+            )
+
+        self._expire_tracked_symbols()
+        symbols = set(await self.symbol_loader()) | set(self._tracked_symbols)
+        await self._prune_snapshot(symbols)
+
+        # Stalest first so symbols beyond the per-cycle budget rotate through
+        ordered = sorted(symbols, key=lambda symbol: (self._quotes.get(symbol, (None, 0.0))[1], symbol))
+        selected = ordered[:self.max_symbols_per_cycle]
+
+        refreshed = 0
+        failed_batches = 0
+        for index in range(0, len(selected), self.batch_size):
+            batch = selected[index:index + self.batch_size]
+            quotes = await self._fetch_batch(batch)
+            if quotes:
+                await self._store(quotes)
+                refreshed += len(quotes)
+            else:
+                failed_batches += 1
+
+            if index + self.batch_size < len(selected):
+                await asyncio.sleep(self.batch_delay_seconds)
+
+        duration_ms = (time.time() - start_time) * 1000
+        self._stats["cycles"] += 1
+        self._stats["symbols_refreshed"] += refreshed
+        self._stats["last_cycle_at"] = time.time()
+        self._stats["last_cycle_duration_ms"] = duration_ms
+
+        return ServiceResult(
+            success=failed_batches == 0,
+            data={
+                "refreshed": refreshed,
+                "symbols_total": len(symbols),
+                "symbols_deferred": len(symbols) - len(selected),
+                "failed_batches": failed_batches
+            },
+            message=f"Refreshed {refreshed}/{len(selected)} quotes in {duration_ms:.0f}ms",
+            metadata={"duration_ms": duration_ms}
+        )
+
+    async def _fetch_batch(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Fetch one batch of quotes through the composite provider"""
+        try:
+            result = await self.composite_provider.fetch_with_fallback("real_time", symbols=symbols)
+            if not result.success or result.data is None:
+                self._stats["refresh_errors"] += 1
+                return {}
+
+            data = getattr(result.data, "data", result.data)
+            if not isinstance(data, dict):
+                return {}
+            return {symbol: quote for symbol, quote in data.items() if isinstance(quote, MarketData)}
+
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            logger.warning(f"Quote snapshot batch fetch failed for {len(symbols)} symbols: {e}")
+            return {}
+
+    async def _store(self, quotes: Dict[str, MarketData], fetched_at: Optional[float] = None):
+        """Store quotes in memory and in the shared Redis snapshot"""
+        fetched_at = fetched_at or time.time()
+        for symbol, quote in quotes.items():
+            self._quotes[symbol] = (quote, fetched_at)
+
+        if self.redis_client is None:
+            return
+        try:
+            mapping = {
+                symbol: dumps_str({"quote": quote.model_dump(), "fetched_at": fetched_at})
+                for symbol, quote in quotes.items()
+            }
+            pipe = self.redis_client.pipeline()
+            pipe.hset(SNAPSHOT_REDIS_KEY, mapping=mapping)
+            pipe.expire(SNAPSHOT_REDIS_KEY, self.snapshot_ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to write quote snapshot to Redis: {e}")
+
+    async def _load_from_redis(self) -> int:
+        """Reload the shared snapshot written by the leader"""
+        if self.redis_client is None:
+            return 0
+        try:
+            entries = await self.redis_client.hgetall(SNAPSHOT_REDIS_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to read quote snapshot from Redis: {e}")
+            return 0
+
+        # Quotes the leader pruned from the shared snapshot
+        for symbol in [symbol for symbol in self._quotes if symbol not in entries]:
+            del self._quotes[symbol]
+
+        loaded = 0
+        for symbol, raw in entries.items():
+            try:
+                entry = loads(raw)
+                fetched_at = float(entry["fetched_at"])
+                current = self._quotes.get(symbol)
+                if current is None or current[1] < fetched_at:
+                    self._quotes[symbol] = (MarketData(**entry["quote"]), fetched_at)
+                    loaded += 1
+            except Exception as e:
+                logger.debug(f"Skipping malformed snapshot entry for {symbol}: {e}")
+        return loaded
+
+    async def _prune_snapshot(self, polled: set):
+        """
+        Drop quotes nobody polls or requested within the tracking TTL
+
+        Applies to the shared Redis snapshot too, where other workers record
+        their on-demand quotes; those stay while the workers keep re-fetching them.
+        """
+        cutoff = time.time() - self.tracked_symbol_ttl_seconds
+        for symbol in [symbol for symbol, (_, fetched_at) in self._quotes.items()
+                       if symbol not in polled and fetched_at < cutoff]:
+            del self._quotes[symbol]
+
+        if self.redis_client is None:
+            return
+        try:
+            stale = []
+            for symbol, raw in (await self.redis_client.hgetall(SNAPSHOT_REDIS_KEY)).items():
+                if symbol not in polled and float(loads(raw)["fetched_at"]) < cutoff:
+                    stale.append(symbol)
+            if stale:
+                await self.redis_client.hdel(SNAPSHOT_REDIS_KEY, *stale)
+        except Exception as e:
+            logger.warning(f"Failed to prune quote snapshot in Redis: {e}")
+
+    def _expire_tracked_symbols(self):
+        """Stop polling on-demand symbols not requested within the tracking TTL"""
+        cutoff = time.time() - self.tracked_symbol_ttl_seconds
+        expired = [symbol for symbol, requested_at in self._tracked_symbols.items() if requested_at < cutoff]
+        for symbol in expired:
+            del self._tracked_symbols[symbol]
+        self._stats["tracked_symbols_expired"] += len(expired)
+
+    def track_symbols(self, symbols: Iterable[str]):
+        """Keep symbols requested on demand fresh in subsequent cycles"""
+        now = time.time()
+        for symbol in symbols:
+            # Re-insert so the dict stays ordered by last request
+            self._tracked_symbols.pop(symbol, None)
+            self._tracked_symbols[symbol] = now
+
+        overflow = len(self._tracked_symbols) - self.max_tracked_symbols
+        if overflow > 0:
+            for symbol in list(self._tracked_symbols)[:overflow]:
+                del self._tracked_symbols[symbol]
+            self._stats["tracked_symbols_expired"] += overflow
+
+    async def record(self, quotes: Dict[str, MarketData]):
+        """Add quotes fetched on demand to the snapshot"""
+        if quotes:
+            await self._store(quotes)
+            self.track_symbols(quotes.keys())
+
+    def get_quotes(
+        self,
+        symbols: List[str],
+        max_age_seconds: Optional[float] = None
+    ) -> Tuple[Dict[str, MarketData], Dict[str, float], List[str]]:
+        """
+        Read quotes from the snapshot
+
+        Returns:
+            (quotes, quote ages in seconds, symbols missing or older than max_age_seconds)
+        """
+        now = time.time()
+        quotes: Dict[str, MarketData] = {}
+        ages: Dict[str, float] = {}
+        missing: List[str] = []
+
+        for symbol in symbols:
+            entry = self._quotes.get(symbol)
+            if entry is not None:
+                age = now - entry[1]
+                if max_age_seconds is None or age <= max_age_seconds:
+                    quotes[symbol] = entry[0]
+                    ages[symbol] = round(age, 3)
+                    continue
+            missing.append(symbol)
+
+        # Snapshot hits keep on-demand symbols tracked as long as they are read
+        self.track_symbols(symbol for symbol in quotes if symbol in self._tracked_symbols)
+
+        self._stats["snapshot_hits"] += len(quotes)
+        self._stats["snapshot_misses"] += len(missing)
+        return quotes, ages, missing
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Poller and snapshot metrics"""
+        lookups = self._stats["snapshot_hits"] + self._stats["snapshot_misses"]
+        return {
+            **self._stats,
+            "running": self._running,
+            "snapshot_size": len(self._quotes),
+            "tracked_symbols": len(self._tracked_symbols),
+            "hit_rate": self._stats["snapshot_hits"] / lookups if lookups else 0.0
+        }
@@ -20,9 +20,13 @@ from ..models.universe import Universe
 from ..models.universe_snapshot import UniverseSnapshot
 from ..models.asset import Asset, UniverseAsset
 from ..models.user import User
+from ..core.config import settings
 from .interfaces.base import ServiceResult
+from .interfaces.security import ITemporalCache
 from .interfaces.screener import IScreener, ScreeningCriteria, ScreeningResult
 from .implementations.fundamental_screener import FundamentalScreener
+from .implementations.redis_temporal_cache import RedisTemporalCache
+from .cache_outbox_dispatcher import CacheOutboxDispatcher
 
 
 class ScheduleConfig:
@@ -87,8 +91,10 @@ class TemporalUniverseService:
     - Asset stability tracking over time
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, temporal_cache: ITemporalCache = None):
         self.db = db
+        self.temporal_cache = temporal_cache or RedisTemporalCache(redis_url=settings.redis_url)
+        self.cache_outbox = CacheOutboxDispatcher(db, temporal_cache=self.temporal_cache)
     
     def _set_rls_context(self, user_id: str):
         """Set Row-Level Security context for multi-tenant isolation"""
@@ -318,6 +324,7 @@ class TemporalUniverseService:
                 self.db.refresh(snapshot)
                 
                 snapshot_data = snapshot.to_dict()
+                await self.cache_outbox.dispatch_pending(universe_id)
             
             return ServiceResult(
                 success=True,
@@ -3,7 +3,7 @@ Universe Management Service - Phase 2 Step 2 Implementation
 Following architecture specifications from phase2_implementation.md
 """
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import and_, text, select
@@ -13,12 +13,13 @@ from ..models.universe import Universe
 from ..models.universe_snapshot import UniverseSnapshot
 from ..models.asset import Asset, UniverseAsset
 from ..models.user import User
-from ..core.database import get_db
+from ..core.database import get_db, SessionLocal
 from .interfaces.base import ServiceResult
 from .interfaces.screener import IScreener, ScreeningCriteria, ScreeningResult
 from .implementations.fundamental_screener import FundamentalScreener
 from .interfaces.security import ITemporalCache, IConcurrentProcessor, ITurnoverOptimizer
 from .implementations.redis_temporal_cache import RedisTemporalCache
+from .cache_outbox_dispatcher import CacheOutboxDispatcher
 from ..core.config import settings
 from .implementations.memory_concurrent_processor import UniverseCalculationProcessor
 from .implementations.advanced_turnover_optimizer import AdvancedTurnoverOptimizer
@@ -72,10 +73,14 @@ class UniverseService:
         db: Session, 
         temporal_cache: ITemporalCache = None,
         concurrent_processor: IConcurrentProcessor = None,
-        turnover_optimizer: ITurnoverOptimizer = None
+        turnover_optimizer: ITurnoverOptimizer = None,
+        session_factory: Callable[[], Session] = SessionLocal
     ):
         self.db = db
+        # Sessions for work outliving the request (background cache refreshes)
+        self.session_factory = session_factory
         self.temporal_cache = temporal_cache or RedisTemporalCache(redis_url=settings.redis_url)
+        self.cache_outbox = CacheOutboxDispatcher(db, temporal_cache=self.temporal_cache)
         self.concurrent_processor = concurrent_processor or UniverseCalculationProcessor()
         self.turnover_optimizer = turnover_optimizer or AdvancedTurnoverOptimizer()
     
@@ -1650,17 +1655,9 @@ class UniverseService:
             self.db.commit()
             self.db.refresh(snapshot)
             
-            # Invalidate temporal cache after snapshot creation
-            # New snapshot changes timeline data, so cache must be refreshed
-            await self.temporal_cache.invalidate_universe_cache(universe_id)
-            
-            # Also cache this individual snapshot for future retrieval
-            await self.temporal_cache.cache_snapshot(
-                universe_id=universe_id,
-                snapshot_date=snapshot_date.isoformat(),
-                snapshot_data=snapshot.to_dict(),
-                ttl_seconds=3600  # 1 hour TTL for snapshot data
-            )
+            # Cache the new segment and snapshot now rather than at the next
+            # outbox run, so the caller's next timeline read includes them
+            await self.cache_outbox.dispatch_pending(universe_id)
             
             return ServiceResult(
                 success=True,
@@ -1745,19 +1742,39 @@ class UniverseService:
             if end_date is None:
                 end_date = date.today()  # Default to today
             
-            # Check temporal cache first for performance optimization
-            cached_timeline = await self.temporal_cache.get_timeline(
+            # Assemble from cached per-snapshot segments; misses are loaded once
+            # per universe, expired segments are served while refreshing
+            snapshots, cache_hit = await self.temporal_cache.get_or_load_timeline_segments(
                 universe_id=universe_id,
                 start_date=start_date.isoformat(),
-                end_date=end_date.isoformat()
+                end_date=end_date.isoformat(),
+                loader=self._timeline_segment_loader(universe),
+                refresh_loader=self._timeline_segment_loader(universe, own_session=True)
             )
             
-            if cached_timeline:
+            timeline_result_data = self._build_timeline_data(universe, start_date, end_date, snapshots)
+            snapshot_count = len(snapshots)
+            
+            if not snapshot_count:
+                # Instead of failing, return an empty successful result
+                timeline_result_data.pop("_performance")
+                return ServiceResult(
+                    success=True,
+                    data=timeline_result_data,
+                    message=f"No snapshots found for {start_date} to {end_date}",
+                    next_actions=[
+                        "create_initial_snapshot",
+                        "backfill_historical_data",
+                        "adjust_date_range"
+                    ]
+                )
+            
+            if cache_hit:
                 # Return cached data with performance metadata
                 return ServiceResult(
                     success=True,
                     data={
-                        **cached_timeline,
+                        **timeline_result_data,
                         "_cache_hit": True,
                         "_performance": {
                             "cache_enabled": True,
@@ -1766,7 +1783,7 @@ class UniverseService:
                             "retrieval_time_ms": "< 50ms"
                         }
                     },
-                    message=f"Timeline retrieved from cache for {len(cached_timeline.get('snapshots', []))} snapshots",
+                    message=f"Timeline retrieved from cache for {snapshot_count} snapshots",
                     next_actions=[
                         "analyze_turnover_patterns",
                         "identify_stable_assets", 
@@ -1774,118 +1791,18 @@ class UniverseService:
                         "export_timeline_data"
                     ],
                     metadata={
-                        **cached_timeline.get("_cache_meta", {}),
+                        "universe_id": universe_id,
+                        "period_start": start_date.isoformat(),
+                        "period_end": end_date.isoformat(),
                         "cache_performance": "high",
                         "data_freshness": "cached"
                     }
                 )
             
-            # Get snapshots in date range
-            snapshots = self.db.query(UniverseSnapshot).filter(
-                and_(
-                    UniverseSnapshot.universe_id == universe_id,
-                    UniverseSnapshot.snapshot_date >= start_date,
-                    UniverseSnapshot.snapshot_date <= end_date
-                )
-            ).order_by(UniverseSnapshot.snapshot_date.asc()).all()
-            
-            if not snapshots:
-                # Instead of failing, return an empty successful result
-                return ServiceResult(
-                    success=True,
-                    data={
-                        "snapshots": [],  # API expects "snapshots" key, not "timeline"
-                        "universe_info": {
-                            "id": universe_id,
-                            "name": universe.name,
-                            "description": universe.description
-                        },
-                        "period_analysis": {
-                            "start_date": start_date.isoformat(),
-                            "end_date": end_date.isoformat(),
-                            "snapshot_count": 0,
-                            "average_turnover": 0.0,
-                            "max_turnover": 0.0,
-                            "average_asset_count": 0,
-                            "total_days": (end_date - start_date).days,
-                            "evolution_stability": 1.0
-                        }
-                    },
-                    message=f"No snapshots found for {start_date} to {end_date}",
-                    next_actions=[
-                        "create_initial_snapshot",
-                        "backfill_historical_data",
-                        "adjust_date_range"
-                    ]
-                )
-            
-            # Calculate timeline statistics
-            timeline_data = []
-            total_turnover = 0.0
-            asset_count_changes = []
-            
-            for i, snapshot in enumerate(snapshots):
-                snapshot_dict = snapshot.to_dict()
-                
-                # Add evolution metadata
-                if i > 0:
-                    prev_snapshot = snapshots[i-1]
-                    asset_count_change = len(snapshot.assets) - len(prev_snapshot.assets)
-                    asset_count_changes.append(asset_count_change)
-                    
-                    snapshot_dict['evolution'] = {
-                        'asset_count_change': asset_count_change,
-                        'days_since_previous': (snapshot.snapshot_date - prev_snapshot.snapshot_date).days,
-                        'composition_stability': 1.0 - float(snapshot.turnover_rate or 0.0)
-                    }
-                
-                timeline_data.append(snapshot_dict)
-                total_turnover += float(snapshot.turnover_rate or 0.0)
-            
-            # Calculate aggregate statistics
-            avg_turnover = total_turnover / len(snapshots) if snapshots else 0.0
-            max_turnover = max((float(s.turnover_rate or 0.0) for s in snapshots), default=0.0)
-            avg_asset_count = sum(len(s.assets) for s in snapshots) / len(snapshots)
-            
-            # Prepare data for response and caching
-            timeline_result_data = {
-                "snapshots": timeline_data,  # API expects "snapshots" key
-                "universe_info": {
-                    "id": universe_id,
-                    "name": universe.name,
-                    "description": universe.description
-                },
-                "period_analysis": {
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                    "snapshot_count": len(snapshots),
-                    "average_turnover": avg_turnover,
-                    "max_turnover": max_turnover,
-                    "average_asset_count": avg_asset_count,
-                    "total_days": (end_date - start_date).days,
-                    "evolution_stability": 1.0 - avg_turnover
-                },
-                "_performance": {
-                    "cache_enabled": True,
-                    "cache_hit": False,
-                    "data_source": "database",
-                    "computation_time": "database_query"
-                }
-            }
-            
-            # Cache the computed timeline data asynchronously for future requests
-            await self.temporal_cache.set_timeline(
-                universe_id=universe_id,
-                start_date=start_date.isoformat(),
-                end_date=end_date.isoformat(),
-                timeline_data=timeline_result_data,
-                ttl_seconds=1800  # 30 minutes TTL for timeline data
-            )
-            
             return ServiceResult(
                 success=True,
                 data=timeline_result_data,
-                message=f"Retrieved {len(snapshots)} snapshots for timeline analysis",
+                message=f"Retrieved {snapshot_count} snapshots for timeline analysis",
                 next_actions=[
                     "analyze_turnover_patterns",
                     "identify_stable_assets", 
@@ -1896,7 +1813,7 @@ class UniverseService:
                     "universe_id": universe_id,
                     "period_start": start_date.isoformat(),
                     "period_end": end_date.isoformat(),
-                    "data_quality": "high" if len(snapshots) > 4 else "limited"
+                    "data_quality": "high" if snapshot_count > 4 else "limited"
                 }
             )
             
@@ -1907,6 +1824,190 @@ class UniverseService:
                 message="Failed to retrieve universe timeline"
             )
     
+    def _timeline_segment_loader(self, universe: Universe, own_session: bool = False):
+        """
+        Loader of a universe's snapshots for the segment cache.
+        
+        Ranges reaching today are loaded open-ended (including any later-dated
+        snapshots) so the cached coverage stays valid as new snapshots arrive.
+        
+        With own_session the loader opens (and closes) its own database session
+        instead of using the request's, which is closed when the request ends
+        and may carry the requester's RLS context.
+        """
+        universe_id = universe.id
+        
+        async def load(start_date: str, end_date: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            db = self.session_factory() if own_session else self.db
+            try:
+                open_ended = date.fromisoformat(end_date) >= date.today()
+                query = db.query(UniverseSnapshot).filter(
+                    UniverseSnapshot.universe_id == universe_id,
+                    UniverseSnapshot.snapshot_date >= date.fromisoformat(start_date)
+                )
+                if not open_ended:
+                    query = query.filter(UniverseSnapshot.snapshot_date <= date.fromisoformat(end_date))
+                snapshots = query.order_by(UniverseSnapshot.snapshot_date.asc()).all()
+                return [snapshot.to_dict() for snapshot in snapshots], None if open_ended else end_date
+            finally:
+                if own_session:
+                    db.close()
+        
+        return load
+    
+    def _build_timeline_data(
+        self,
+        universe: Universe,
+        start_date: date,
+        end_date: date,
+        snapshots: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Assemble timeline data (evolution metadata and period analysis) from snapshot dicts.
+        
+        Args:
+            universe: Universe the timeline belongs to
+            start_date: Timeline start date
+            end_date: Timeline end date
+            snapshots: Snapshot dicts of the range in date order
+            
+        Returns:
+            Timeline data in the API format
+        """
+        # Calculate timeline statistics
+        timeline_data = []
+        total_turnover = 0.0
+        
+        for i, snapshot in enumerate(snapshots):
+            snapshot_dict = dict(snapshot)
+            turnover_rate = float(snapshot.get('turnover_rate') or 0.0)
+            
+            # Add evolution metadata
+            if i > 0:
+                prev_snapshot = snapshots[i-1]
+                snapshot_dict['evolution'] = {
+                    'asset_count_change': len(snapshot['assets']) - len(prev_snapshot['assets']),
+                    'days_since_previous': (
+                        date.fromisoformat(snapshot['snapshot_date']) - date.fromisoformat(prev_snapshot['snapshot_date'])
+                    ).days,
+                    'composition_stability': 1.0 - turnover_rate
+                }
+            
+            timeline_data.append(snapshot_dict)
+            total_turnover += turnover_rate
+        
+        # Calculate aggregate statistics
+        avg_turnover = total_turnover / len(snapshots) if snapshots else 0.0
+        max_turnover = max((float(s.get('turnover_rate') or 0.0) for s in snapshots), default=0.0)
+        avg_asset_count = sum(len(s['assets']) for s in snapshots) / len(snapshots) if snapshots else 0
+        
+        return {
+            "snapshots": timeline_data,  # API expects "snapshots" key
+            "universe_info": {
+                "id": universe.id,
+                "name": universe.name,
+                "description": universe.description
+            },
+            "period_analysis": {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "snapshot_count": len(snapshots),
+                "average_turnover": avg_turnover,
+                "max_turnover": max_turnover,
+                "average_asset_count": avg_asset_count,
+                "total_days": (end_date - start_date).days,
+                "evolution_stability": 1.0 - avg_turnover
+            },
+            "_performance": {
+                "cache_enabled": True,
+                "cache_hit": False,
+                "data_source": "database",
+                "computation_time": "database_query"
+            }
+        }
+    
+    async def warm_temporal_cache(
+        self,
+        max_universes: int = 10,
+        max_ranges_per_universe: int = 3,
+        max_items: int = 25
+    ) -> ServiceResult:
+        """
+        Recompute the most read timelines into the temporal cache.
+        
+        Candidates come from the cache's access counts, with recently invalidated
+        universes first. Each warmed universe also gets
+        its latest snapshot composition cached. At most max_items entries are
+        computed per run.
+        
+        Args:
+            max_universes: Number of hot universes considered
+            max_ranges_per_universe: Hot date ranges warmed per universe
+            max_items: Cap on timelines and snapshots computed by this run
+            
+        Returns:
+            ServiceResult with per-universe warming results
+        """
+        if not hasattr(self.temporal_cache, "get_warming_candidates"):
+            return ServiceResult(
+                success=False,
+                error="Temporal cache does not track access",
+                message="Cache warming requires an access-tracking temporal cache"
+            )
+        
+        try:
+            await self.temporal_cache.flush_access_counts()
+            candidates = await self.temporal_cache.get_warming_candidates(max_universes)
+            
+            budget = max_items
+            results = {}
+            for universe_id in candidates:
+                if budget <= 0:
+                    break
+                date_ranges = await self.temporal_cache.get_hot_ranges(universe_id, max_ranges_per_universe)
+                date_ranges = date_ranges[:budget]
+                budget -= len(date_ranges)
+                
+                universe = self.db.query(Universe).filter(Universe.id == universe_id).first()
+                if universe:
+                    for date_range in date_ranges:
+                        await self.temporal_cache.refresh_timeline_segments(
+                            universe_id, date_range["start_date"], date_range["end_date"],
+                            self._timeline_segment_loader(universe)
+                        )
+                await self.temporal_cache.clear_warm_pending(universe_id)
+                results[universe_id] = {"timelines": len(date_ranges), "warmed": universe is not None}
+                
+                if budget > 0:
+                    latest_snapshot = self.db.query(UniverseSnapshot).filter(
+                        UniverseSnapshot.universe_id == universe_id
+                    ).order_by(UniverseSnapshot.snapshot_date.desc()).first()
+                    if latest_snapshot:
+                        budget -= 1
+                        results[universe_id]["snapshot_cached"] = await self.temporal_cache.cache_snapshot(
+                            universe_id=universe_id,
+                            snapshot_date=latest_snapshot.snapshot_date.isoformat(),
+                            snapshot_data=latest_snapshot.to_dict()
+                        )
+            
+            return ServiceResult(
+                success=True,
+                data={"universes": results},
+                message=f"Warmed temporal cache for {len(results)} universes",
+                metadata={
+                    "candidates": len(candidates),
+                    "items_computed": max_items - budget,
+                    "max_items": max_items
+                }
+            )
+            
+        except Exception as e:
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                message="Failed to warm temporal cache"
+            )
+    
     async def backfill_universe_history(
         self,
         universe_id: str,
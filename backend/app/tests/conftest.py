@@ -75,6 +75,12 @@ def event_loop():
     yield loop
     loop.close()
 
+@pytest.fixture(autouse=True)
+def fresh_invalid_symbol_filter(monkeypatch):
+    """Give each test its own process-wide invalid-symbol filter (no negatives leak between tests)"""
+    from app.services.implementations import invalid_symbol_filter
+    monkeypatch.setattr(invalid_symbol_filter, "_invalid_symbol_filter", None)
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database session for each test."""
@@ -0,0 +1,146 @@
+"""
+Tests for the async-native Alpha Vantage provider
+
+Tests cover:
+- JSON payload parsing for time series and company overview
+- Cache hits skipping the shared rate schedule
+- Error / rate-limit notices surfaced as failures
+- Request schedule shared across provider instances
+"""
+
+import time
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.implementations import alpha_vantage_provider as av_module
+from app.services.implementations.alpha_vantage_provider import AlphaVantageProvider, AlphaVantageError
+
+
+DAILY_PAYLOAD = {
+    "Meta Data": {"2. Symbol": "AAPL"},
+    "Time Series (Daily)": {
+        "2024-01-03": {
+            "1. open": "184.22", "2. high": "185.88", "3. low": "183.43", "4. close": "184.25",
+            "5. adjusted close": "183.90", "6. volume": "58414460", "7. dividend amount": "0.0000"
+        },
+        "2024-01-02": {
+            "1. open": "187.15", "2. high": "188.44", "3. low": "183.89", "4. close": "185.64",
+            "5. adjusted close": "185.29", "6. volume": "82488674", "7. dividend amount": "0.0000"
+        },
+        "2023-12-29": {
+            "1. open": "193.90", "2. high": "194.40", "3. low": "191.73", "4. close": "192.53",
+            "5. adjusted close": "192.17", "6. volume": "42628802", "7. dividend amount": "0.0000"
+        },
+    }
+}
+
+OVERVIEW_PAYLOAD = {
+    "Symbol": "AAPL",
+    "Name": "Apple Inc",
+    "Sector": "TECHNOLOGY",
+    "Industry": "ELECTRONIC COMPUTERS",
+    "MarketCapitalization": "2950000000000",
+    "PERatio": "30.5",
+    "DividendYield": "None",
+    "Exchange": "NASDAQ",
+    "Currency": "USD",
+}
+
+
+def mock_session(payload):
+    """aiohttp-like session whose get() yields a response returning payload"""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = AsyncMock(return_value=payload)
+
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+
+    session = MagicMock()
+    session.get = MagicMock(return_value=context)
+    return session
+
+
+@pytest.fixture
+def provider():
+    """Provider with a unique API key so the shared schedule starts empty"""
+    return AlphaVantageProvider(api_key=f"test-key-{time.monotonic_ns()}", requests_per_minute=600)
+
+
+class TestAlphaVantageParsing:
+    """Test parsing of Alpha Vantage JSON payloads"""
+
+    @pytest.mark.asyncio
+    async def test_historical_data_parsed_and_filtered(self, provider):
+        session = mock_session(DAILY_PAYLOAD)
+        with patch.object(provider, "_get_session", AsyncMock(return_value=session)):
+            result = await provider.fetch_historical_data(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert result.success
+        bars = result.data["AAPL"]
+        assert [bar.timestamp.date() for bar in bars] == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert bars[0].close == 185.64
+        assert bars[0].adjusted_close == 185.29
+        assert bars[0].volume == 82488674
+
+        params = session.get.call_args.kwargs["params"]
+        assert params["function"] == "TIME_SERIES_DAILY_ADJUSTED"
+        assert params["outputsize"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_asset_info_parses_missing_numbers(self, provider):
+        with patch.object(provider, "_get_session", AsyncMock(return_value=mock_session(OVERVIEW_PAYLOAD))):
+            result = await provider.fetch_asset_info(["AAPL"])
+
+        info = result.data["AAPL"]
+        assert info.is_valid
+        assert info.name == "Apple Inc"
+        assert info.pe_ratio == 30.5
+        assert info.dividend_yield is None
+
+    @pytest.mark.asyncio
+    async def test_error_notice_marks_symbol_failed(self, provider):
+        notice = {"Note": "Thank you for using Alpha Vantage! Our standard API rate limit is 25 requests per day."}
+        with patch.object(provider, "_get_session", AsyncMock(return_value=mock_session(notice))):
+            result = await provider.fetch_real_time_data(["AAPL"])
+
+        assert not result.success
+        assert "rate limit" in result.metadata["errors"][0]
+
+        with patch.object(provider, "_get_session", AsyncMock(return_value=mock_session(notice))):
+            with pytest.raises(AlphaVantageError):
+                await provider._query("real_time", "TIME_SERIES_INTRADAY", symbol="AAPL")
+
+
+class TestAlphaVantageRateLimiting:
+    """Test caching and the shared request schedule"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_rate_limit_and_http(self, provider):
+        session = mock_session(OVERVIEW_PAYLOAD)
+        with patch.object(provider, "_get_session", AsyncMock(return_value=session)):
+            await provider.fetch_asset_info(["AAPL"])
+
+            with patch.object(provider, "_rate_limit", AsyncMock()) as rate_limit:
+                result = await provider.validate_symbols(["AAPL"])
+
+        assert result.data["AAPL"].is_valid
+        rate_limit.assert_not_called()
+        assert session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_schedule_shared_between_instances(self):
+        api_key = f"shared-key-{time.monotonic_ns()}"
+        first = AlphaVantageProvider(api_key=api_key, requests_per_minute=5)
+        second = AlphaVantageProvider(api_key=api_key, requests_per_minute=5)
+
+        with patch.object(av_module.asyncio, "sleep", AsyncMock()) as sleep:
+            await first._rate_limit()
+            await second._rate_limit()
+
+        # The second instance waits for the slot reserved by the first one
+        assert sleep.call_count == 1
+        assert sleep.call_args.args[0] == pytest.approx(12.0, abs=0.5)
@@ -8,7 +8,7 @@ from typing import Dict, List
 
 from app.services.asset_validation_service import AssetValidationService
 from app.services.interfaces.asset_validation import ValidationStrategy, ValidationStatus, BulkValidationResult
-from app.services.interfaces.data_provider import ValidationResult, AssetInfo, ServiceResult
+from app.services.interfaces.data_provider import ValidationResult, AssetInfo, ServiceResult, SYMBOL_NOT_FOUND
 from app.services.implementations.yahoo_data_provider import YahooDataProvider
 from app.services.implementations.alpha_vantage_provider import AlphaVantageProvider
 
@@ -34,6 +34,10 @@ async def mock_redis_client():
     mock_redis.lpush = AsyncMock(return_value=1)
     mock_redis.ttl = AsyncMock(return_value=-1)
     mock_redis.info = AsyncMock(return_value={"used_memory_human": "1.5M"})
+    mock_redis.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
     return mock_redis
 
 @pytest_asyncio.fixture
@@ -316,6 +320,53 @@ class TestBulkValidation:
         assert len(result.data.results) == 3
         assert result.data.cache_misses == 3
 
+    @pytest.mark.asyncio
+    async def test_validate_symbols_bulk_mixed_batches_round_trips(self, validation_service, mock_redis_client, valid_validation_result):
+        """Test bulk mixed validation uses one MGET, batched provider calls and one pipelined write"""
+        symbols = ["AAPL", "ZZZQ", "BADX"] + [f"STOCK{i}" for i in range(55)]
+        cached_data = valid_validation_result.model_dump(mode="json")
+        cache = {
+            "asset_validation:AAPL": json.dumps(cached_data),
+            "asset_validation:invalid:ZZZQ": SYMBOL_NOT_FOUND
+        }
+        mock_redis_client.mget.side_effect = lambda keys: [cache.get(key) for key in keys]
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = [[300], [True] * 56]
+
+        def provider_result(symbols, provider):
+            return ServiceResult(success=True, data={
+                symbol: valid_validation_result.model_copy(update={"symbol": symbol}) if symbol != "BADX" else
+                ValidationResult(symbol=symbol, is_valid=False, provider=provider, timestamp=datetime.now(timezone.utc),
+                                 error=SYMBOL_NOT_FOUND, confidence=0.0, source="real_time")
+                for symbol in symbols
+            })
+
+        validation_service.yahoo_provider.validate_symbols.side_effect = lambda symbols: provider_result(symbols, "yahoo_finance")
+        validation_service.alpha_vantage_provider.validate_symbols.side_effect = lambda symbols: provider_result(symbols, "alpha_vantage")
+
+        with patch.object(validation_service, "queue_background_validation", AsyncMock()) as queue:
+            result = await validation_service.validate_symbols_bulk(symbols, ValidationStrategy.MIXED)
+
+        assert result.data.successful_validations == 56
+        assert result.data.failed_validations == 2
+        assert result.data.cache_hits == 1
+        assert result.data.results["AAPL"].source == "cache"
+
+        mock_redis_client.mget.assert_awaited_once()
+        mock_redis_client.get.assert_not_awaited()
+        mock_redis_client.setex.assert_not_awaited()
+        yahoo_batches = [call.args[0] for call in validation_service.yahoo_provider.validate_symbols.call_args_list]
+        assert sorted(len(batch) for batch in yahoo_batches) == [6, 25, 25]
+        validation_service.alpha_vantage_provider.validate_symbols.assert_called_once_with(["BADX"])
+
+        pipe.ttl.assert_called_once_with("asset_validation:invalid:ZZZQ")
+        assert pipe.setex.call_count == 56
+        pipe.setex.assert_any_call("asset_validation:invalid:BADX", validation_service.negative_cache_ttl, SYMBOL_NOT_FOUND)
+        assert pipe.execute.await_count == 2
+        queue.assert_not_awaited()
+        assert validation_service.invalid_symbol_filter.is_known_invalid("ZZZQ")
+        assert validation_service.invalid_symbol_filter.is_known_invalid("BADX")
+
     @pytest.mark.asyncio
     async def test_validate_symbols_bulk_cache_only(self, validation_service, mock_redis_client, valid_validation_result):
         """Test bulk validation with cache-only strategy"""
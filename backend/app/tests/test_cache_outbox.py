@@ -0,0 +1,188 @@
+"""
+Tests for the cache outbox
+
+Tests cover:
+- Outbox rows written with (and only with) committed changes
+- Dispatch into targeted segment, snapshot and validation cache updates
+- Retry of events whose cache update failed, with backoff across task runs
+- Inline dispatch after snapshot creation
+"""
+
+from datetime import date
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.cache_outbox import CacheOutboxEvent
+from app.models.universe import Universe
+from app.models.universe_snapshot import UniverseSnapshot
+from app.models.user import User, UserRole, SubscriptionTier
+from app.services.cache_outbox_dispatcher import CacheOutboxDispatcher
+from app.services.interfaces.base import ServiceResult
+from app.services.universe_service import UniverseService
+from app.workers.cache_outbox_worker import dispatch_cache_outbox
+
+
+@pytest.fixture
+def universe(db_session: Session):
+    user = User(email="outbox@test.com", hashed_password="hashed123", full_name="Outbox User",
+                role=UserRole.USER, subscription_tier=SubscriptionTier.FREE)
+    db_session.add(user)
+    db_session.commit()
+    universe = Universe(name="Outbox Universe", owner_id=user.id)
+    db_session.add(universe)
+    db_session.commit()
+    return universe
+
+
+@pytest.fixture
+def temporal_cache():
+    cache = MagicMock()
+    for method in ("add_timeline_segment", "cache_snapshot", "remove_timeline_segment", "invalidate_universe_cache"):
+        setattr(cache, method, AsyncMock(return_value=True))
+    return cache
+
+
+def add_snapshot(db_session: Session, universe: Universe, snapshot_date: date) -> UniverseSnapshot:
+    snapshot = UniverseSnapshot(universe_id=universe.id, snapshot_date=snapshot_date,
+                                assets=[{"symbol": "AAPL", "name": "Apple Inc"}])
+    db_session.add(snapshot)
+    db_session.commit()
+    return snapshot
+
+
+def pending_events(db_session: Session):
+    return db_session.query(CacheOutboxEvent).filter(CacheOutboxEvent.processed_at.is_(None)).all()
+
+
+class TestCacheOutboxRecording:
+    """Test outbox rows written by the flush listener"""
+
+    def test_snapshot_changes_recorded_with_transaction(self, db_session: Session, universe):
+        snapshot = add_snapshot(db_session, universe, date(2024, 3, 31))
+        snapshot.snapshot_date = date(2024, 4, 30)
+        db_session.commit()
+
+        db_session.add(UniverseSnapshot(universe_id=universe.id, snapshot_date=date(2024, 5, 31), assets=[]))
+        db_session.flush()
+        db_session.rollback()
+
+        events = db_session.query(CacheOutboxEvent).order_by(CacheOutboxEvent.created_at).all()
+        assert [(event.entity_type, event.operation) for event in events] == [
+            ("universe_snapshot", "insert"), ("universe_snapshot", "update")
+        ]
+        assert all(event.universe_id == universe.id and event.entity_id == snapshot.id for event in events)
+        assert events[0].payload == {"snapshot_dates": ["2024-03-31"]}
+        assert events[1].payload == {"snapshot_dates": ["2024-04-30", "2024-03-31"]}
+
+    def test_asset_changes_recorded_only_when_validation_cache_is_stale(self, db_session: Session):
+        asset = Asset(symbol="AAPL", name="Apple Inc", is_validated=False)
+        db_session.add(asset)
+        db_session.commit()
+        asset.is_validated = True
+        asset.name = "Apple"
+        db_session.commit()
+        assert pending_events(db_session) == []
+
+        asset.is_validated = False
+        db_session.commit()
+        asset.symbol = "AAPL.US"
+        db_session.commit()
+
+        assert [event.payload["symbols"] for event in pending_events(db_session)] == [["AAPL"], ["AAPL.US", "AAPL"]]
+
+
+class TestCacheOutboxDispatcher:
+    """Test dispatch of pending events"""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_refreshes_and_removes_segments(self, db_session: Session, universe, temporal_cache):
+        kept = add_snapshot(db_session, universe, date(2024, 3, 31))
+        removed = add_snapshot(db_session, universe, date(2024, 4, 30))
+        db_session.delete(removed)
+        db_session.commit()
+
+        result = await CacheOutboxDispatcher(db_session, temporal_cache=temporal_cache).dispatch_pending()
+
+        assert result.success is True
+        assert result.data["events"] == 3
+        assert result.data["segments_refreshed"] == 1 and result.data["segments_removed"] == 1
+        temporal_cache.add_timeline_segment.assert_awaited_once_with(universe.id, kept.to_dict())
+        temporal_cache.cache_snapshot.assert_awaited_once()
+        temporal_cache.remove_timeline_segment.assert_awaited_once_with(universe.id, "2024-04-30")
+        assert pending_events(db_session) == []
+
+    @pytest.mark.asyncio
+    async def test_universe_deletion_supersedes_snapshot_events(self, db_session: Session, universe, temporal_cache):
+        add_snapshot(db_session, universe, date(2024, 3, 31))
+        db_session.delete(universe)
+        db_session.commit()
+
+        result = await CacheOutboxDispatcher(db_session, temporal_cache=temporal_cache).dispatch_pending()
+
+        assert result.data["universes_invalidated"] == 1
+        temporal_cache.invalidate_universe_cache.assert_awaited_once_with(universe.id)
+        temporal_cache.add_timeline_segment.assert_not_awaited()
+        temporal_cache.remove_timeline_segment.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_updates_stay_pending_for_retry(self, db_session: Session, universe, temporal_cache):
+        asset = Asset(symbol="MSFT", name="Microsoft Corp", is_validated=True)
+        db_session.add(asset)
+        db_session.commit()
+        db_session.delete(asset)
+        add_snapshot(db_session, universe, date(2024, 3, 31))
+        temporal_cache.add_timeline_segment.return_value = False
+        validation_service = MagicMock()
+        validation_service.invalidate_cache = AsyncMock(return_value=ServiceResult(success=True, data=1))
+        dispatcher = CacheOutboxDispatcher(db_session, temporal_cache=temporal_cache,
+                                           validation_service=validation_service, max_attempts=2,
+                                           retry_backoff_seconds=0)
+
+        result = await dispatcher.dispatch_pending()
+
+        assert result.success is False
+        validation_service.invalidate_cache.assert_awaited_once_with(["MSFT"])
+        [event] = pending_events(db_session)
+        assert event.entity_type == "universe_snapshot" and event.attempts == 1
+
+        temporal_cache.add_timeline_segment.return_value = True
+        assert (await dispatcher.dispatch_pending()).success is True
+        assert pending_events(db_session) == []
+
+    def test_failed_full_batch_retried_on_a_later_run(self, db_session: Session, universe, temporal_cache):
+        for day in (1, 2):
+            add_snapshot(db_session, universe, date(2024, 3, day))
+        temporal_cache.add_timeline_segment.return_value = False
+
+        with patch("app.workers.cache_outbox_worker.SessionLocal", return_value=db_session), \
+                patch("app.workers.cache_outbox_worker.CacheOutboxDispatcher",
+                      partial(CacheOutboxDispatcher, temporal_cache=temporal_cache)):
+            result = dispatch_cache_outbox(batch_size=2, max_batches=10)
+
+            assert result["batches"] == 1 and result["failed"] == 2
+            events = pending_events(db_session)
+            assert [event.attempts for event in events] == [1, 1]
+            assert all(event.next_attempt_at is not None for event in events)
+
+            # Backing off: the next run does not touch them
+            assert dispatch_cache_outbox(batch_size=2)["events"] == 0
+        assert temporal_cache.add_timeline_segment.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_snapshot_dispatches_its_universe_inline(self, db_session: Session, universe, temporal_cache):
+        other = Universe(name="Other Universe", owner_id=universe.owner_id)
+        db_session.add(other)
+        db_session.commit()
+        add_snapshot(db_session, other, date(2024, 1, 31))
+        service = UniverseService(db_session, temporal_cache=temporal_cache)
+
+        result = await service.create_universe_snapshot(universe_id=universe.id, snapshot_date=date(2024, 3, 31))
+
+        assert result.success is True
+        temporal_cache.add_timeline_segment.assert_awaited_once()
+        assert temporal_cache.add_timeline_segment.await_args.args[0] == universe.id
+        assert [event.universe_id for event in pending_events(db_session)] == [other.id]
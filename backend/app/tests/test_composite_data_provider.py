@@ -19,10 +19,12 @@ from datetime import date, datetime, timezone, timedelta
 from typing import Dict, List, Any
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
+
 from app.services.implementations.composite_data_provider import CompositeDataProvider
 from app.services.implementations.provider_health_monitor import ProviderHealthMonitor, HealthStatus
 from app.services.interfaces.i_composite_data_provider import (
-    DataSource, ProviderPriority, FailoverStrategy, ConflictResolution,
+    DataSource, ProviderPriority, FailoverStrategy, ConflictResolution, RoutingPolicy,
     CompositeProviderConfig, ProviderHealth
 )
 from app.services.interfaces.data_provider import ServiceResult, MarketData, AssetInfo, ValidationResult
@@ -209,6 +211,210 @@ class TestCompositeDataProvider:
             assert composite_result.failover_occurred
             assert composite_result.primary_source == DataSource.YAHOO
     
+    @pytest.mark.asyncio
+    async def test_hedged_failover_races_slow_primary(self, composite_provider, mock_providers):
+        """Test that a slow primary is hedged with the secondary once past its p95"""
+        async def slow_validate(**kwargs):
+            await asyncio.sleep(2.0)
+            return ServiceResult(success=True, data={"AAPL": "openbb"})
+
+        mock_providers[DataSource.OPENBB].validate_symbols.side_effect = slow_validate
+        mock_providers[DataSource.YAHOO].validate_symbols.return_value = ServiceResult(
+            success=True, data={"AAPL": "yahoo"}
+        )
+        composite_provider.providers = mock_providers
+        composite_provider.config.failover_strategy = FailoverStrategy.HEDGED
+        composite_provider.config.enable_validation = False
+
+        # Observed primary p95 of ~50ms and enough prior requests to have hedge budget
+        composite_provider.response_times[DataSource.OPENBB] = [50.0] * 30
+        composite_provider.hedge_window.extend([False] * 20)
+
+        start_time = time.time()
+        result = await composite_provider.fetch_with_fallback("validate_symbols", symbols=["AAPL"])
+        elapsed_time = (time.time() - start_time) * 1000
+
+        assert result.success
+        assert result.data.primary_source == DataSource.YAHOO
+        assert result.data.failover_occurred
+        assert elapsed_time < 500, f"Hedged request took {elapsed_time:.2f}ms"
+        assert composite_provider.hedge_stats["hedges_fired"] == 1
+        assert composite_provider.hedge_stats["hedge_wins"] == 1
+        assert composite_provider.hedge_stats["cancelled_calls"] == 1
+
+        metrics = await composite_provider.get_performance_metrics()
+        assert metrics.data["hedging"]["hedges_fired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cost_latency_routing_prefers_cheapest_within_sla(self, composite_provider, mock_providers):
+        """Test that routing picks the cheapest provider meeting the SLA and keeps failover"""
+        for source, name in [(DataSource.OPENBB, "openbb"), (DataSource.YAHOO, "yahoo"), (DataSource.ALPHA_VANTAGE, "alpha")]:
+            mock_providers[source].validate_symbols.return_value = ServiceResult(success=True, data={"AAPL": name})
+        composite_provider.providers = mock_providers
+        composite_provider.config.routing_policy = RoutingPolicy.COST_LATENCY
+        composite_provider.config.enable_validation = False
+        composite_provider.config.enable_caching = False
+        
+        # Free Yahoo is within SLA; paid OpenBB is faster but costs more
+        for _ in range(20):
+            composite_provider._record_provider_performance(DataSource.OPENBB, "validate_symbols", 100.0, True)
+            composite_provider._record_provider_performance(DataSource.YAHOO, "validate_symbols", 400.0, True)
+        
+        result = await composite_provider.fetch_with_fallback("validate_symbols", symbols=["AAPL"])
+        assert result.data.primary_source == DataSource.YAHOO
+        assert not result.data.failover_occurred
+        assert result.data.metadata["routing"]["order"][0] == DataSource.YAHOO.value
+        mock_providers[DataSource.OPENBB].validate_symbols.assert_not_called()
+        
+        # Yahoo breaches a tighter per-operation SLA and is demoted behind compliant providers
+        composite_provider.config.operation_slas = {"validate_symbols": {"p95_latency_ms": 200.0}}
+        chain, routing = composite_provider._route_provider_chain(
+            "validate_symbols",
+            sorted(composite_provider.config.provider_chain.items(), key=lambda x: x[0].value)
+        )
+        assert [source for _, source in chain] == [DataSource.ALPHA_VANTAGE, DataSource.OPENBB, DataSource.YAHOO]
+        assert routing["sla_violations"] == [DataSource.YAHOO.value]
+        
+        # Failing routed primary still fails over along the routed order
+        mock_providers[DataSource.ALPHA_VANTAGE].validate_symbols.return_value = ServiceResult(
+            success=False, error="rate limited"
+        )
+        result = await composite_provider.fetch_with_fallback("validate_symbols", symbols=["AAPL"])
+        assert result.data.primary_source == DataSource.OPENBB
+        assert result.data.failover_occurred
+    
+    def test_demoted_provider_recovers_and_free_allowance_resets_daily(self, composite_provider):
+        """Test that SLA samples expire by age and free allowances apply per UTC day"""
+        composite_provider.config.routing_policy = RoutingPolicy.COST_LATENCY
+        chain = sorted(composite_provider.config.provider_chain.items(), key=lambda x: x[0].value)
+        for _ in range(20):
+            composite_provider._record_provider_performance(DataSource.YAHOO, "real_time", 5000.0, False)
+
+        _, routing = composite_provider._route_provider_chain("real_time", chain)
+        assert routing["sla_violations"] == [DataSource.YAHOO.value]
+
+        # Yahoo is no longer called; its samples age out and it is re-measured
+        window = composite_provider.operation_stats[(DataSource.YAHOO, "real_time")]
+        expired = composite_provider.config.routing_window_seconds + 1
+        aged = [(recorded_at - expired, latency, success) for recorded_at, latency, success in window]
+        window.clear()
+        window.extend(aged)
+
+        routed, routing = composite_provider._route_provider_chain("real_time", chain)
+        assert routing["sla_violations"] == []
+        assert routed[0][1] == DataSource.YAHOO
+        assert composite_provider._routing_stats(DataSource.YAHOO, "real_time")["samples"] == 0
+
+        # Alpha Vantage's 500 free calls are spent for today, not for the process lifetime
+        composite_provider.daily_request_counts[DataSource.ALPHA_VANTAGE] = 500
+        assert composite_provider._marginal_request_cost(DataSource.ALPHA_VANTAGE) == 0.01
+        composite_provider._record_provider_performance(DataSource.ALPHA_VANTAGE, "real_time", 100.0, True)
+        assert composite_provider.estimated_costs[DataSource.ALPHA_VANTAGE] == 0.01
+
+        composite_provider.usage_day -= timedelta(days=1)
+        assert composite_provider._marginal_request_cost(DataSource.ALPHA_VANTAGE) == 0.0
+        assert composite_provider.daily_request_counts[DataSource.ALPHA_VANTAGE] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedged_failover_respects_budget(self, composite_provider, mock_providers):
+        """Test that hedges are not fired once the extra-load budget is spent"""
+        async def slow_validate(**kwargs):
+            await asyncio.sleep(0.2)
+            return ServiceResult(success=True, data={"AAPL": "openbb"})
+
+        mock_providers[DataSource.OPENBB].validate_symbols.side_effect = slow_validate
+        mock_providers[DataSource.YAHOO].validate_symbols.return_value = ServiceResult(
+            success=True, data={"AAPL": "yahoo"}
+        )
+        composite_provider.providers = mock_providers
+        composite_provider.config.failover_strategy = FailoverStrategy.HEDGED
+        composite_provider.config.enable_caching = False
+        composite_provider.config.enable_validation = False
+        composite_provider.config.hedge_budget_percent = 10.0
+        composite_provider.response_times[DataSource.OPENBB] = [50.0] * 30
+
+        # Budget already spent: 2 hedges in the last 19 requests
+        composite_provider.hedge_window.extend([True, True] + [False] * 17)
+
+        result = await composite_provider.fetch_with_fallback("validate_symbols", symbols=["AAPL"])
+
+        assert result.success
+        assert result.data.primary_source == DataSource.OPENBB
+        assert composite_provider.hedge_stats["hedges_fired"] == 0
+        assert composite_provider.hedge_stats["hedges_skipped_budget"] == 1
+        mock_providers[DataSource.YAHOO].validate_symbols.assert_not_called()
+
+    def test_split_date_range(self, composite_provider):
+        """Test that long ranges are split into grid-aligned, boundary-sharing chunks"""
+        # Short ranges are not split
+        assert composite_provider._split_date_range(date(2024, 1, 1), date(2024, 6, 1), "1d") == [
+            (date(2024, 1, 1), date(2024, 6, 1))
+        ]
+
+        chunks = composite_provider._split_date_range(date(2004, 3, 15), date(2024, 3, 15), "1d")
+        assert len(chunks) > 1
+        assert chunks[0][0] == date(2004, 3, 15)
+        assert chunks[-1][1] == date(2024, 3, 15)
+        for (_, previous_end), (next_start, _) in zip(chunks, chunks[1:]):
+            assert previous_end == next_start
+
+        # Interior chunks are identical regardless of the requested start date
+        other_chunks = composite_provider._split_date_range(date(2005, 7, 1), date(2024, 3, 15), "1d")
+        assert chunks[1:] == other_chunks[1:]
+
+        # Intraday intervals use much smaller chunks
+        assert len(composite_provider._split_date_range(date(2024, 1, 1), date(2024, 3, 1), "5m")) >= 2
+
+    @pytest.mark.asyncio
+    async def test_range_split_historical_fetch_recovers_failed_chunks(self, composite_provider, mock_providers):
+        """Test parallel chunk fetch with independent retry and ordered merge"""
+        failed_once = set()
+        chunks = composite_provider._split_date_range(date(2004, 6, 1), date(2010, 6, 1), "1d")
+        flaky_chunk_start = chunks[1][0]
+
+        async def chunked_history(symbols, start_date, end_date, interval="1d"):
+            # First attempt of the second chunk fails on every provider
+            if start_date == flaky_chunk_start and start_date not in failed_once:
+                failed_once.add(start_date)
+                return ServiceResult(success=False, error="upstream timeout")
+            bars = [
+                MarketData(
+                    symbol=symbols[0],
+                    timestamp=datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc),
+                    open=1.0, high=1.0, low=1.0, close=1.0, volume=100
+                )
+                for day in (start_date, end_date)
+            ]
+            return ServiceResult(success=True, data={symbols[0]: bars})
+
+        mock_providers[DataSource.OPENBB].fetch_historical_data.side_effect = chunked_history
+        mock_providers[DataSource.YAHOO].fetch_historical_data.return_value = ServiceResult(
+            success=False, error="unavailable"
+        )
+        mock_providers[DataSource.ALPHA_VANTAGE].fetch_historical_data.return_value = ServiceResult(
+            success=False, error="unavailable"
+        )
+        composite_provider.providers = mock_providers
+
+        result = await composite_provider.fetch_historical_data_composite(
+            symbols=["AAPL"],
+            start_date=date(2004, 6, 1),
+            end_date=date(2010, 6, 1),
+            interval="1d"
+        )
+
+        assert result.success
+        composite_result = result.data["AAPL"]
+        assert composite_result.metadata["chunks_total"] == len(chunks)
+        assert composite_result.metadata["chunks_failed"] == 0
+        assert flaky_chunk_start in failed_once
+
+        # Merged in order with shared boundary days de-duplicated
+        timestamps = [bar.timestamp for bar in composite_result.data["AAPL"]]
+        assert timestamps == sorted(set(timestamps))
+        assert len(timestamps) == len(chunks) + 1
+        assert result.metadata["partial_symbols"] == []
+
     @pytest.mark.asyncio
     async def test_bulk_optimization_performance(self, composite_provider):
         """Test bulk data optimization for backtesting performance"""
@@ -236,6 +442,72 @@ class TestCompositeDataProvider:
             assert "successful_operations" in metadata
             assert "total_operations" in metadata
     
+    @pytest.mark.asyncio
+    async def test_bulk_optimization_uses_batched_calls(self, composite_provider, mock_providers):
+        """Test that bulk fetch issues multi-symbol batch calls and seeds per-symbol cache"""
+        async def batch_asset_info(symbols):
+            return ServiceResult(success=True, data={
+                symbol: AssetInfo(symbol=symbol, name=symbol, is_valid=True) for symbol in symbols
+            })
+
+        mock_providers[DataSource.OPENBB].fetch_asset_info.side_effect = batch_asset_info
+        composite_provider.providers = mock_providers
+        symbols = [f"SYM{i}" for i in range(7)]
+        progress_events = []
+
+        async def on_progress(event):
+            progress_events.append(event)
+
+        result = await composite_provider.bulk_data_optimization(
+            symbols=symbols,
+            operations=["asset_info"],
+            parallel_requests=2,
+            batch_size=3,
+            progress_callback=on_progress
+        )
+
+        assert result.success
+        assert result.metadata["successful_operations"] == 7
+        assert result.metadata["batch_calls"] == 3
+        assert mock_providers[DataSource.OPENBB].fetch_asset_info.call_count == 3
+        assert result.data["SYM4"]["asset_info"].data == {"SYM4": AssetInfo(symbol="SYM4", name="SYM4", is_valid=True)}
+        assert len(progress_events) == 3
+        assert progress_events[-1]["completed_batches"] == 3
+
+        # Batch results were split into single-symbol cache entries
+        single = await composite_provider.fetch_with_fallback("asset_info", symbols=["SYM4"])
+        assert single.message == "Retrieved asset_info from cache"
+
+        repeat = await composite_provider.bulk_data_optimization(symbols=symbols, operations=["asset_info"])
+        assert repeat.metadata["cache_hits"] == 7
+        assert repeat.metadata["batch_calls"] == 0
+        assert mock_providers[DataSource.OPENBB].fetch_asset_info.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_optimization_falls_back_for_missing_symbols(self, composite_provider, mock_providers):
+        """Test that symbols missing from a batch answer are asked of the next providers"""
+        def partial_asset_info(known):
+            async def fetch(symbols):
+                return ServiceResult(success=True, data={
+                    symbol: AssetInfo(symbol=symbol, name=symbol, is_valid=True) for symbol in symbols if symbol in known
+                })
+            return fetch
+
+        mock_providers[DataSource.OPENBB].fetch_asset_info.side_effect = partial_asset_info({"AAPL"})
+        mock_providers[DataSource.YAHOO].fetch_asset_info.side_effect = partial_asset_info({"MSFT"})
+        mock_providers[DataSource.ALPHA_VANTAGE].fetch_asset_info.side_effect = partial_asset_info(set())
+        composite_provider.providers = mock_providers
+
+        result = await composite_provider.bulk_data_optimization(
+            symbols=["AAPL", "MSFT", "NOPE"], operations=["asset_info"]
+        )
+
+        assert result.data["AAPL"]["asset_info"].primary_source == DataSource.OPENBB
+        assert result.data["MSFT"]["asset_info"].primary_source == DataSource.YAHOO
+        assert result.data["NOPE"] == {}
+        assert result.metadata["failed_symbols"] == {"asset_info": ["NOPE"]}
+        assert mock_providers[DataSource.YAHOO].fetch_asset_info.await_args.kwargs["symbols"] == ["MSFT", "NOPE"]
+
     @pytest.mark.asyncio
     async def test_cost_monitoring(self, composite_provider):
         """Test provider cost monitoring and optimization"""
@@ -292,6 +564,83 @@ class TestCompositeDataProvider:
         assert 0 <= quality.accuracy <= 1
         assert 0 <= quality.freshness <= 1
         assert 0 <= quality.consistency <= 1
+    
+    @staticmethod
+    def _daily_bars(closes, start=date(2024, 1, 1), symbol="AAPL"):
+        """Business-day bars with open=close and a 1% high/low band"""
+        days = [d for d in (start + timedelta(days=i) for i in range(len(closes) * 2)) if d.weekday() < 5]
+        return [
+            MarketData(
+                symbol=symbol,
+                timestamp=datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc),
+                open=close, high=close * 1.01, low=close * 0.99, close=close,
+                volume=1000, metadata={"interval": "1d"}
+            )
+            for day, close in zip(days, closes)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_vectorized_quality_report(self, composite_provider):
+        """Gaps, outliers, stale bars and invalid OHLC are counted column-wise"""
+        rng = np.random.default_rng(7)
+        closes = list(100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 60))))
+        closes[30] = closes[29] * 4  # outlier spike
+        bars = self._daily_bars(closes)
+        bars[10] = bars[10].model_copy(update={"high": bars[10].low - 1})  # invalid OHLC
+        bars[20] = bars[19].model_copy(update={"timestamp": bars[20].timestamp})  # stale repeat
+        del bars[40:42]  # two missing business days
+        
+        result = await composite_provider.validate_data_quality(
+            data={"AAPL": bars},
+            source=DataSource.YAHOO,
+            operation="historical_data"
+        )
+        
+        assert result.success
+        report = result.metadata["quality_report"]
+        assert report["bars"] == 58
+        assert report["missing_bars"] == 2
+        assert report["invalid_ohlc"] == 1
+        assert report["stale_bars"] == 1
+        # The spike produces two extreme returns (up and back down)
+        assert report["outliers"] == 2
+        assert report["worst_symbols"] == ["AAPL"]
+        assert result.data.completeness == pytest.approx(58 / 60)
+        assert result.data.accuracy < 0.90
+    
+    @pytest.mark.asyncio
+    async def test_resolve_conflicts_on_aligned_series(self, composite_provider):
+        """Conflicting bars are detected per timestamp and resolved by consensus or weighting"""
+        closes = [100.0 + i for i in range(10)]
+        openbb_bars = self._daily_bars(closes)
+        yahoo_bars = self._daily_bars(closes)
+        alpha_bars = self._daily_bars(closes)
+        openbb_bars[3] = openbb_bars[3].model_copy(update={"close": 150.0, "high": 151.0})
+        del yahoo_bars[7]  # yahoo misses a bar the others have
+        
+        data_sources = {
+            DataSource.OPENBB: {"AAPL": openbb_bars},
+            DataSource.YAHOO: {"AAPL": yahoo_bars},
+            DataSource.ALPHA_VANTAGE: {"AAPL": alpha_bars}
+        }
+        
+        consensus = await composite_provider.resolve_conflicts(data_sources, ConflictResolution.MAJORITY_CONSENSUS)
+        assert consensus.success
+        assert consensus.metadata["conflicting_bars"] == 1
+        assert consensus.metadata["deviation"]["AAPL"]["by_source"]["openbb_terminal"]["bars_over_tolerance"] == 1
+        resolved = consensus.data["AAPL"]
+        assert len(resolved) == 10
+        assert resolved[3].close == 103.0
+        assert [bar.close for bar in resolved] == closes
+        
+        primary = await composite_provider.resolve_conflicts(data_sources, ConflictResolution.PRIMARY_WINS)
+        assert primary.data["AAPL"][3].close == 150.0
+        assert primary.metadata["winning_sources"]["AAPL"] == "openbb_terminal"
+        
+        weighted = await composite_provider.resolve_conflicts(data_sources, ConflictResolution.WEIGHTED_AVERAGE)
+        assert len(weighted.data["AAPL"]) == 10
+        assert 103.0 < weighted.data["AAPL"][3].close < 150.0
+        assert weighted.data["AAPL"][0].close == pytest.approx(100.0)
 
 class TestProviderHealthMonitor:
     """Test provider health monitoring system"""
@@ -0,0 +1,129 @@
+"""
+Tests for the bulk fundamentals refresh
+
+Tests cover:
+- Normalizing provider payloads to Asset-compatible values
+- Bulk snapshot upsert and set-wise Asset update
+- Screening reading ROIC from the local snapshot
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.asset import Asset
+from app.models.market_data import FundamentalsSnapshot
+from app.services.interfaces.base import ServiceResult
+from app.services.interfaces.screener import ScreeningCriteria
+from app.services.fundamentals_service import FundamentalsRefreshService, normalize_fundamentals
+from app.services.implementations.fundamental_screener import FundamentalScreener
+
+
+def bulk_provider(payloads):
+    provider = MagicMock()
+    provider.fetch_fundamentals_bulk = AsyncMock(return_value=ServiceResult(
+        success=True, data=payloads, metadata={"provider": "openbb_terminal"}
+    ))
+    return provider
+
+
+def add_assets(db_session, *symbols):
+    for symbol in symbols:
+        db_session.add(Asset(symbol=symbol, name=symbol, is_validated=True, market_cap=1))
+    db_session.commit()
+
+
+class TestNormalizeFundamentals:
+    """Test payload normalization"""
+
+    def test_aliases_and_ranges(self):
+        normalized = normalize_fundamentals({
+            "marketCap": 3.0e12,
+            "trailingPE": 31.456,
+            "dividend_yield": 0.52,  # already a fraction
+            "return_on_invested_capital": 0.45,
+            "sector": "Technology"
+        })
+
+        assert normalized["market_cap"] == 3_000_000_000_000
+        assert normalized["pe_ratio"] == 31.46
+        assert normalized["dividend_yield"] == 0.52
+        assert normalized["roic"] == 0.45
+
+    def test_out_of_range_values_dropped(self):
+        normalized = normalize_fundamentals({"pe_ratio": -5, "dividend_yield": 2500, "market_cap": "n/a"})
+
+        assert normalized["pe_ratio"] is None
+        assert normalized["dividend_yield"] is None
+        assert normalized["market_cap"] is None
+
+
+class TestFundamentalsRefresh:
+    """Test the bulk refresh"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_upserts_snapshots_and_updates_assets(self, db_session):
+        add_assets(db_session, "AAPL", "MSFT", "TSLA")
+        provider = bulk_provider({
+            "AAPL": {"market_cap": 3.0e12, "pe_ratio": 30.0, "dividend_yield": 0.005},
+            "MSFT": {"market_cap": 2.8e12, "pe_ratio": None},
+        })
+        service = FundamentalsRefreshService(db_session, provider=provider)
+
+        result = await service.refresh(snapshot_date=date(2024, 6, 3))
+
+        assert result.success
+        assert result.data["snapshots"] == 2
+        assert result.data["assets_updated"] == 2
+        assert result.metadata["missing_symbols"] == ["TSLA"]
+        provider.fetch_fundamentals_bulk.assert_awaited_once_with(["AAPL", "MSFT", "TSLA"], batch_size=50)
+
+        db_session.expire_all()
+        assets = {asset.symbol: asset for asset in db_session.query(Asset)}
+        assert assets["AAPL"].market_cap == 3_000_000_000_000
+        assert float(assets["AAPL"].pe_ratio) == 30.0
+        assert assets["MSFT"].pe_ratio is None
+        assert assets["TSLA"].market_cap == 1  # untouched
+
+        # Same-day refresh updates the snapshot in place
+        provider.fetch_fundamentals_bulk.return_value = ServiceResult(
+            success=True, data={"AAPL": {"market_cap": 3.1e12}}
+        )
+        await service.refresh(["AAPL"], snapshot_date=date(2024, 6, 3))
+
+        db_session.expire_all()
+        snapshots = db_session.query(FundamentalsSnapshot).filter(FundamentalsSnapshot.symbol == "AAPL").all()
+        assert len(snapshots) == 1
+        assert snapshots[0].market_cap == 3_100_000_000_000
+        assert float(db_session.query(Asset).filter(Asset.symbol == "AAPL").one().pe_ratio) == 30.0
+
+    @pytest.mark.asyncio
+    async def test_refresh_reports_provider_failure(self, db_session):
+        add_assets(db_session, "AAPL")
+        provider = MagicMock()
+        provider.fetch_fundamentals_bulk = AsyncMock(return_value=ServiceResult(success=False, error="down"))
+
+        result = await FundamentalsRefreshService(db_session, provider=provider).refresh()
+
+        assert not result.success
+        assert db_session.query(FundamentalsSnapshot).count() == 0
+
+
+class TestScreeningOnSnapshots:
+    """Test screening against locally stored fundamentals"""
+
+    @pytest.mark.asyncio
+    async def test_roic_filter_uses_latest_snapshot(self, db_session):
+        add_assets(db_session, "AAPL", "MSFT")
+        service = FundamentalsRefreshService(db_session, provider=bulk_provider({"AAPL": {"roic": 0.1}, "MSFT": {"roic": 0.3}}))
+        await service.refresh(snapshot_date=date(2024, 6, 3))
+        service.provider = bulk_provider({"AAPL": {"roic": 0.4}})
+        await service.refresh(["AAPL"], snapshot_date=date(2024, 6, 4))
+
+        screener = FundamentalScreener(db_session)
+        result = await screener.screen_universe(
+            db_session.query(Asset).all(), ScreeningCriteria(min_roic=0.35), datetime.now(timezone.utc)
+        )
+
+        assert [asset.symbol for asset in result.matching_assets] == ["AAPL"]
@@ -0,0 +1,93 @@
+"""
+Tests for the central HTTP connection-pool registry
+
+Tests cover:
+- One reused session per upstream host and event loop
+- Per-host pool configuration
+- Utilization metrics
+- Shutdown closing every pooled session
+- Worker event loops closing their own sessions, and dropped closed loops
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.http_pool import HttpPoolRegistry, HostPoolConfig
+
+
+class TestHttpPoolRegistry:
+    """Test per-host session pooling"""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_per_host(self):
+        registry = HttpPoolRegistry()
+        try:
+            first = await registry.get_session("api.example.com")
+            second = await registry.get_session("api.example.com")
+            other = await registry.get_session("data.example.com")
+
+            assert first is second
+            assert other is not first
+
+            metrics = registry.get_metrics()
+            assert metrics["total_hosts"] == 2
+            assert metrics["hosts"]["api.example.com"]["sessions_created"] == 1
+            assert metrics["hosts"]["api.example.com"]["session_reuses"] == 1
+            assert metrics["hosts"]["api.example.com"]["in_use"] == 0
+        finally:
+            await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_host_config_applied(self):
+        registry = HttpPoolRegistry()
+        registry.configure_host("slow.example.com", HostPoolConfig(limit_per_host=3, total_timeout=5.0))
+        try:
+            session = await registry.get_session("slow.example.com")
+
+            assert session.connector.limit_per_host == 3
+            assert session.timeout.total == 5.0
+            assert registry.get_metrics()["hosts"]["slow.example.com"]["limit_per_host"] == 3
+        finally:
+            await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_sessions(self):
+        registry = HttpPoolRegistry()
+        session = await registry.get_session("api.example.com")
+
+        await registry.close_all()
+
+        assert session.closed
+        assert registry.get_metrics()["total_hosts"] == 0
+        # A closed registry hands out a fresh session on next use
+        replacement = await registry.get_session("api.example.com")
+        assert replacement is not session and not replacement.closed
+        await registry.close_all()
+
+    def test_sessions_per_event_loop(self):
+        registry = HttpPoolRegistry()
+        worker_loop = asyncio.new_event_loop()
+        abandoned_loop = asyncio.new_event_loop()
+        app_loop = asyncio.new_event_loop()
+        try:
+            worker_session = worker_loop.run_until_complete(registry.get_session("api.example.com"))
+            abandoned_session = abandoned_loop.run_until_complete(registry.get_session("api.example.com"))
+
+            assert abandoned_session is not worker_session
+            assert registry.get_metrics()["hosts"]["api.example.com"]["loops"] == 2
+
+            worker_loop.run_until_complete(registry.close_loop_sessions())
+            assert worker_session.closed
+            assert registry.get_metrics()["hosts"]["api.example.com"]["loops"] == 1
+
+            # A loop closed without close_loop_sessions is dropped on next use
+            abandoned_loop.close()
+            app_loop.run_until_complete(registry.get_session("api.example.com"))
+            metrics = registry.get_metrics()["hosts"]["api.example.com"]
+            assert metrics["loops"] == 1
+            assert metrics["sessions_created"] == 3 and metrics["sessions_abandoned"] == 1
+        finally:
+            app_loop.run_until_complete(registry.close_all())
+            for loop in (worker_loop, abandoned_loop, app_loop):
+                loop.close()
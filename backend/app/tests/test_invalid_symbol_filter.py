@@ -0,0 +1,186 @@
+"""
+Tests for the known-invalid symbol filter
+
+Tests cover:
+- Bloom filter membership and exact negative cache TTL
+- Asset validation skipping providers for known-invalid symbols
+- OpenBB validation short-circuiting known-invalid symbols without recording its own
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.asset_validation_service import AssetValidationService
+from app.services.interfaces.data_provider import ValidationResult, ServiceResult, SYMBOL_NOT_FOUND
+from app.services.implementations.invalid_symbol_filter import BloomFilter, InvalidSymbolFilter
+from app.services.implementations.openbb_data_provider import OpenBBDataProvider
+
+
+def not_found(symbol, provider):
+    return ServiceResult(success=True, data={symbol: ValidationResult(
+        symbol=symbol,
+        is_valid=False,
+        provider=provider,
+        timestamp=datetime.now(timezone.utc),
+        error=SYMBOL_NOT_FOUND,
+        confidence=0.0,
+        source="real_time"
+    )})
+
+
+@pytest.fixture
+def redis_client():
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=None)
+    client.setex = AsyncMock(return_value=True)
+    client.delete = AsyncMock(return_value=1)
+    client.ttl = AsyncMock(return_value=-2)
+    client.info = AsyncMock(return_value={})
+    return client
+
+
+@pytest.fixture
+def validation_service(redis_client):
+    yahoo = AsyncMock()
+    yahoo.validate_symbols = AsyncMock(side_effect=lambda symbols: not_found(symbols[0], "yahoo_finance"))
+    alpha_vantage = AsyncMock()
+    alpha_vantage.validate_symbols = AsyncMock(side_effect=lambda symbols: not_found(symbols[0], "alpha_vantage"))
+    return AssetValidationService(
+        redis_client=redis_client,
+        yahoo_provider=yahoo,
+        alpha_vantage_provider=alpha_vantage,
+        invalid_symbol_filter=InvalidSymbolFilter(),
+        negative_cache_ttl=600
+    )
+
+
+class TestInvalidSymbolFilter:
+    """Test Bloom filter and negative cache behaviour"""
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f"SYM{index}")
+
+        assert all(f"SYM{index}" in bloom for index in range(1000))
+        false_positives = sum(f"OTHER{index}" in bloom for index in range(1000))
+        assert false_positives < 50
+
+    def test_known_invalid_until_ttl_expires(self):
+        invalid_filter = InvalidSymbolFilter(negative_ttl_seconds=60)
+        invalid_filter.record_invalid("aaplx", "yahoo_finance")
+
+        assert invalid_filter.is_known_invalid("AAPLX")
+        assert not invalid_filter.is_known_invalid("AAPL")
+
+        with patch("app.services.implementations.invalid_symbol_filter.time.time", return_value=datetime.now().timestamp() + 61):
+            assert not invalid_filter.is_known_invalid("AAPLX")
+
+        stats = invalid_filter.get_stats()
+        assert stats["negative_hits"] == 1
+        assert stats["bloom_rejections"] == 1
+        assert stats["known_invalid_symbols"] == 0
+
+    def test_clear_and_rebuild(self):
+        invalid_filter = InvalidSymbolFilter(bloom_capacity=2)
+        invalid_filter.record_invalid("AAA")
+        invalid_filter.clear("AAA")
+        invalid_filter.record_invalid("BBB")
+        invalid_filter.record_invalid("CCC")  # Capacity reached, rebuilt from live entries
+
+        assert not invalid_filter.is_known_invalid("AAA")
+        assert invalid_filter.is_known_invalid("BBB")
+        assert invalid_filter.is_known_invalid("CCC")
+        stats = invalid_filter.get_stats()
+        assert stats["bloom_rebuilds"] == 1
+        assert stats["bloom_items"] == 2
+
+
+class TestAssetValidationNegativeCache:
+    """Test the validation service skipping providers for known-invalid symbols"""
+
+    @pytest.mark.asyncio
+    async def test_not_found_by_both_providers_is_negative_cached(self, validation_service, redis_client):
+        first = await validation_service.validate_symbol_mixed_strategy("ZZZQ")
+
+        assert first.success is False
+        assert first.metadata["negative_cached"] is True
+        assert first.metadata["background_queued"] is False
+        redis_client.setex.assert_awaited_once_with("asset_validation:invalid:ZZZQ", 600, SYMBOL_NOT_FOUND)
+
+        second = await validation_service.validate_symbol_mixed_strategy("zzzq")
+
+        assert second.success is False
+        assert second.metadata["source"] == "negative_cache"
+        assert validation_service.yahoo_provider.validate_symbols.await_count == 1
+        assert validation_service.alpha_vantage_provider.validate_symbols.await_count == 1
+
+        stats = (await validation_service.get_validation_stats()).data
+        assert stats["negative_cache_hits"] == 1
+        assert stats["upstream_calls_saved"] == 2
+        assert stats["invalid_symbol_filter"]["upstream_calls_saved"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_negative_entry_is_used(self, validation_service, redis_client):
+        redis_client.get = AsyncMock(side_effect=lambda key: SYMBOL_NOT_FOUND if key == "asset_validation:invalid:ZZZQ" else None)
+        redis_client.ttl = AsyncMock(return_value=300)
+
+        result = await validation_service.validate_symbol_mixed_strategy("ZZZQ")
+
+        assert result.metadata["source"] == "negative_cache"
+        validation_service.yahoo_provider.validate_symbols.assert_not_awaited()
+        assert validation_service.invalid_symbol_filter.is_known_invalid("ZZZQ")
+
+    @pytest.mark.asyncio
+    async def test_provider_errors_are_not_negative_cached(self, validation_service, redis_client):
+        validation_service.yahoo_provider.validate_symbols = AsyncMock(
+            return_value=ServiceResult(success=False, error="Yahoo Finance error")
+        )
+
+        with patch.object(validation_service, "queue_background_validation", AsyncMock()) as queue:
+            result = await validation_service.validate_symbol_mixed_strategy("ZZZQ")
+
+        assert result.metadata["negative_cached"] is False
+        queue.assert_awaited_once()
+        redis_client.setex.assert_not_awaited()
+        assert not validation_service.invalid_symbol_filter.is_known_invalid("ZZZQ")
+
+
+class TestOpenBBNegativeCache:
+    """Test OpenBB validation skipping known-invalid symbols"""
+
+    @pytest.mark.asyncio
+    async def test_known_invalid_symbols_skip_upstream(self):
+        invalid_filter = InvalidSymbolFilter()
+        invalid_filter.record_invalid("ZZZQ")
+        provider = OpenBBDataProvider(invalid_symbols=invalid_filter)
+        provider._validate_symbols_upstream = AsyncMock()
+
+        result = await provider.validate_symbols(["ZZZQ"])
+
+        provider._validate_symbols_upstream.assert_not_awaited()
+        assert result.data["ZZZQ"].is_valid is False
+        assert result.data["ZZZQ"].source == "cache"
+        assert result.metadata["known_invalid_symbols"] == 1
+        assert invalid_filter.get_stats()["upstream_calls_saved"] == 1
+
+    @pytest.mark.asyncio
+    async def test_openbb_answers_not_recorded_as_invalid(self):
+        invalid_filter = InvalidSymbolFilter()
+        provider = OpenBBDataProvider(invalid_symbols=invalid_filter)
+        provider._get_cached_result = lambda cache_key: None
+
+        def get_quote_data(symbol, raise_errors=False):
+            if symbol == "AAPL":
+                raise ConnectionError("upstream timeout")
+            return {}
+        provider._get_quote_data = get_quote_data
+
+        result = await provider.validate_symbols(["ZZZQ", "AAPL"])
+
+        # An empty quote or a failed request is no definitive "not found"
+        assert result.data["ZZZQ"].error == SYMBOL_NOT_FOUND
+        assert result.data["AAPL"].error == "upstream timeout"
+        assert invalid_filter.get_stats()["known_invalid_symbols"] == 0
@@ -560,4 +560,98 @@ class TestOpenBBRealDataValidation:
             time_diff = abs((now - market_data.timestamp).total_seconds())
             
             # Real-time data should be within last 24 hours (flexible for weekends/holidays)
-            assert time_diff < 86400, f"Timestamp {market_data.timestamp} too old"
\ No newline at end of file
+            assert time_diff < 86400, f"Timestamp {market_data.timestamp} too old"
+
+@pytest.fixture
+def economic_store(tmp_path):
+    """Economic series store on an isolated database (one connection per worker thread)"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.models.base import Base
+    from app.services.economic_series_store import EconomicSeriesStore
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'economic.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield EconomicSeriesStore(session_factory=sessionmaker(bind=engine))
+    engine.dispose()
+
+
+def economic_frame(start: date, values: List[float]):
+    import pandas as pd
+    return pd.DataFrame(
+        {"date": [start + timedelta(days=30 * i) for i in range(len(values))], "value": values}
+    )
+
+
+class TestOpenBBEconomicSeriesCache:
+    """Test the incremental economic series cache"""
+
+    async def test_only_new_observations_requested(self, economic_store, monkeypatch):
+        from unittest.mock import MagicMock
+
+        provider = OpenBBDataProvider(request_delay=0, economic_store=economic_store)
+        upstream = MagicMock(side_effect=[
+            economic_frame(date(2024, 1, 1), [1.0, 2.0]),
+            economic_frame(date(2024, 3, 1), [3.0]),
+        ])
+        monkeypatch.setattr(provider, "_get_economic_data", upstream)
+
+        first = await provider.fetch_economic_indicators(["gdp"])
+        # Force the next call past the refresh interval
+        economic_store.refresh_intervals["gdp"] = timedelta(0)
+        second = await provider.fetch_economic_indicators(["gdp"])
+
+        assert first.metadata["new_observations"] == 2
+        assert upstream.call_args_list[0].args == ("gdp", None)
+        assert upstream.call_args_list[1].args == ("gdp", date(2024, 1, 31) + timedelta(days=1))
+        assert list(second.data["gdp"]["value"]) == [1.0, 2.0, 3.0]
+        assert second.metadata["new_observations"] == 1
+
+    async def test_fresh_series_served_without_upstream(self, economic_store, monkeypatch):
+        from unittest.mock import MagicMock
+
+        provider = OpenBBDataProvider(request_delay=0, economic_store=economic_store)
+        upstream = MagicMock(return_value=economic_frame(date(2024, 1, 1), [1.0]))
+        monkeypatch.setattr(provider, "_get_economic_data", upstream)
+
+        await provider.fetch_economic_indicators(["gdp", "inflation"])
+        result = await provider.fetch_economic_indicators(["gdp", "inflation"])
+
+        assert upstream.call_count == 2
+        assert result.metadata["upstream_calls"] == 0
+        assert result.metadata["served_from_cache"] == 2
+        assert set(result.data) == {"gdp", "inflation"}
+
+    async def test_upstream_failure_not_recorded_as_checked(self, economic_store, monkeypatch):
+        from unittest.mock import MagicMock
+
+        provider = OpenBBDataProvider(request_delay=0, economic_store=economic_store)
+        upstream = MagicMock(side_effect=[RuntimeError("FRED unavailable"), economic_frame(date(2024, 1, 1), [1.0])])
+        monkeypatch.setattr(provider, "_get_economic_data", upstream)
+
+        failed = await provider.fetch_economic_indicators(["gdp"])
+
+        assert failed.success is False
+        assert "FRED unavailable" in failed.metadata["errors"][0]
+        assert economic_store.get_state("gdp") is None
+
+        await provider.fetch_economic_indicators(["gdp"])
+        economic_store.refresh_intervals["gdp"] = timedelta(0)
+        checked_at = economic_store.get_state("gdp")["last_checked_at"]
+        upstream.side_effect = RuntimeError("FRED unavailable")
+
+        stale = await provider.fetch_economic_indicators(["gdp"])
+
+        # Stored series still served, but the failed refresh is reported and not stamped
+        assert list(stale.data["gdp"]["value"]) == [1.0]
+        assert "FRED unavailable" in stale.metadata["errors"][0]
+        assert economic_store.get_state("gdp")["last_checked_at"] == checked_at
+
+    async def test_concurrent_requests_spaced_by_rate_limit(self):
+        import time
+
+        provider = OpenBBDataProvider(request_delay=0.05)
+        start = time.time()
+        await asyncio.gather(*(provider._rate_limit() for _ in range(4)))
+
+        assert time.time() - start >= 0.15
@@ -0,0 +1,125 @@
+"""
+Tests for the pre-market warmup
+
+Tests cover:
+- Pre-open window detection across daylight saving
+- History top-ups batched by first missing date
+- Quotes pushed into the quote snapshot, failed steps reported
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.market_data import PriceBar
+from app.services.interfaces.base import ServiceResult
+from app.services.interfaces.data_provider import MarketData
+from app.services.interfaces.i_composite_data_provider import CompositeResult, DataQuality, DataSource
+from app.services.premarket_warmup_service import PremarketWarmupService, minutes_to_open
+
+
+def bar(symbol, day, close=100.0):
+    return MarketData(
+        symbol=symbol,
+        timestamp=datetime(day.year, day.month, day.day, tzinfo=timezone.utc),
+        open=close, high=close, low=close, close=close, volume=1000
+    )
+
+
+def composite(data):
+    return CompositeResult(
+        data=data,
+        primary_source=DataSource.YAHOO,
+        contributing_sources=[DataSource.YAHOO],
+        quality=DataQuality()
+    )
+
+
+@pytest.fixture
+def composite_provider():
+    provider = MagicMock()
+
+    async def fetch_with_fallback(operation, symbols, start_date, end_date, interval):
+        return ServiceResult(success=True, data=composite({symbol: [bar(symbol, end_date)] for symbol in symbols}))
+
+    provider.fetch_with_fallback = AsyncMock(side_effect=fetch_with_fallback)
+    provider.bulk_data_optimization = AsyncMock(side_effect=lambda symbols, operations, parallel_requests: ServiceResult(
+        success=True,
+        data={symbol: {"real_time": composite({symbol: bar(symbol, date(2024, 6, 4))})} for symbol in symbols},
+        metadata={"batch_calls": 1, "cache_hits": 0}
+    ))
+    return provider
+
+
+@pytest.fixture
+def fundamentals_service():
+    service = MagicMock()
+    service.refresh = AsyncMock(return_value=ServiceResult(
+        success=True, data={"snapshots": 2, "assets_updated": 2}, metadata={"missing_symbols": []}
+    ))
+    return service
+
+
+class TestPremarketWindow:
+    """Test pre-open window detection"""
+
+    def test_minutes_to_open_follows_daylight_saving(self):
+        # 13:05 UTC is 09:05 EDT in summer and 08:05 EST in winter
+        assert minutes_to_open(datetime(2024, 6, 3, 13, 5, tzinfo=timezone.utc)) == 25
+        assert minutes_to_open(datetime(2024, 1, 8, 13, 5, tzinfo=timezone.utc)) == 85
+        assert minutes_to_open(datetime(2024, 1, 8, 14, 5, tzinfo=timezone.utc)) == 25
+
+
+class TestPremarketWarmup:
+    """Test the warmup run"""
+
+    @pytest.mark.asyncio
+    async def test_history_top_up_batches_by_missing_date(self, db_session, composite_provider, fundamentals_service):
+        db_session.add(PriceBar(
+            symbol="AAPL", interval="1d", timestamp=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            open=1, high=1, low=1, close=1, volume=1
+        ))
+        db_session.commit()
+        quote_snapshot = MagicMock()
+        quote_snapshot.record = AsyncMock()
+
+        service = PremarketWarmupService(
+            db_session,
+            composite_provider=composite_provider,
+            fundamentals_service=fundamentals_service,
+            quote_snapshot=quote_snapshot,
+            symbol_loader=lambda: ["msft", "AAPL", "NVDA"],
+            history_lookback_days=30
+        )
+        result = await service.run(today=date(2024, 6, 4))
+
+        assert result.success
+        calls = [call.kwargs for call in composite_provider.fetch_with_fallback.await_args_list]
+        assert [(call["symbols"], call["start_date"]) for call in calls] == [
+            (["MSFT", "NVDA"], date(2024, 5, 5)),
+            (["AAPL"], date(2024, 6, 2)),
+        ]
+        assert result.data["history"]["bars_inserted"] == 3
+        assert db_session.query(PriceBar).count() == 4
+
+        fundamentals_service.refresh.assert_awaited_once_with(["AAPL", "MSFT", "NVDA"], snapshot_date=date(2024, 6, 4))
+        assert set(quote_snapshot.record.await_args.args[0]) == {"AAPL", "MSFT", "NVDA"}
+        assert result.data["quotes"]["quotes"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_reported(self, db_session, composite_provider, fundamentals_service):
+        fundamentals_service.refresh.return_value = ServiceResult(success=False, error="provider down")
+
+        service = PremarketWarmupService(
+            db_session,
+            composite_provider=composite_provider,
+            fundamentals_service=fundamentals_service,
+            symbol_loader=lambda: ["AAPL"]
+        )
+        result = await service.run(today=date(2024, 6, 4))
+
+        assert result.success
+        assert result.metadata["failed_steps"] == ["fundamentals"]
+        assert result.data["fundamentals"] == {"error": "provider down"}
+        assert result.data["quotes"]["quotes"] == 1
@@ -0,0 +1,103 @@
+"""
+Tests for the local price store and corporate-action adjustment
+
+Tests cover:
+- Vectorized cumulative adjustment factors
+- Storing bars idempotently
+- Split and dividend adjustment applied at read time without touching stored bars
+- Dividends recorded before their previous close is stored
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.models.market_data import PriceBar, CorporateAction
+from app.services.interfaces.data_provider import MarketData
+from app.services.price_history_service import PriceHistoryService, cumulative_adjustment_factors
+
+
+def make_bars(symbol: str, closes, start: date = date(2024, 1, 1)):
+    return [
+        MarketData(
+            symbol=symbol,
+            timestamp=datetime.combine(start + timedelta(days=i), datetime.min.time(), tzinfo=timezone.utc),
+            open=close, high=close, low=close, close=close, volume=100
+        )
+        for i, close in enumerate(closes)
+    ]
+
+
+class TestAdjustmentFactors:
+    """Test the vectorized factor computation"""
+
+    def test_factors_apply_to_bars_before_each_ex_date(self):
+        bar_dates = np.array(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"], dtype="datetime64[D]")
+        ex_dates = np.array(["2024-01-02", "2024-01-04"], dtype="datetime64[D]")
+
+        factors = cumulative_adjustment_factors(bar_dates, ex_dates, np.array([0.5, 0.9]))
+
+        np.testing.assert_allclose(factors, [0.45, 0.9, 0.9, 1.0])
+
+    def test_no_actions(self):
+        bar_dates = np.array(["2024-01-01"], dtype="datetime64[D]")
+        empty = np.array([], dtype="datetime64[D]")
+
+        np.testing.assert_allclose(cumulative_adjustment_factors(bar_dates, empty, np.array([])), [1.0])
+
+
+class TestPriceHistoryService:
+    """Test storage and read-time adjustment"""
+
+    @pytest.mark.asyncio
+    async def test_store_bars_is_idempotent(self, db_session):
+        service = PriceHistoryService(db_session)
+
+        first = await service.store_bars({"AAPL": make_bars("AAPL", [100.0, 101.0])}, source="yahoo_finance")
+        second = await service.store_bars({"AAPL": make_bars("AAPL", [100.0, 102.0])})
+
+        assert first.data == {"inserted": 2, "updated": 0}
+        assert second.data == {"inserted": 0, "updated": 2}
+        assert db_session.query(PriceBar).count() == 2
+
+    @pytest.mark.asyncio
+    async def test_split_and_dividend_applied_lazily(self, db_session):
+        service = PriceHistoryService(db_session)
+        await service.store_bars({"AAPL": make_bars("AAPL", [400.0, 400.0, 100.0, 100.0])})
+
+        split = await service.record_corporate_action("AAPL", date(2024, 1, 3), CorporateAction.SPLIT, 4.0)
+        dividend = await service.record_corporate_action("AAPL", date(2024, 1, 4), CorporateAction.DIVIDEND, 1.0)
+
+        assert split.metadata["price_factor"] == 0.25
+        assert dividend.metadata["price_factor"] == pytest.approx(0.99)
+
+        result = await service.get_adjusted_history(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 4))
+        bars = result.data["AAPL"]
+
+        assert [bar.close for bar in bars] == [100.0, 100.0, 100.0, 100.0]
+        assert [bar.volume for bar in bars] == [400, 400, 100, 100]
+        assert [bar.adjusted_close for bar in bars] == pytest.approx([99.0, 99.0, 99.0, 100.0])
+        assert result.metadata["missing_symbols"] == ["MSFT"]
+        # Stored bars stay unadjusted
+        assert db_session.query(PriceBar).filter(PriceBar.close == 400.0).count() == 2
+
+    @pytest.mark.asyncio
+    async def test_dividend_resolved_when_previous_close_arrives_later(self, db_session):
+        service = PriceHistoryService(db_session)
+
+        recorded = await service.record_corporate_action("MSFT", date(2024, 1, 2), CorporateAction.DIVIDEND, 2.0)
+        await service.store_bars({"MSFT": make_bars("MSFT", [200.0, 198.0])})
+
+        result = await service.get_adjusted_history(["MSFT"], date(2024, 1, 1), date(2024, 1, 2))
+
+        assert recorded.metadata["factor_resolved"] is False
+        assert [bar.adjusted_close for bar in result.data["MSFT"]] == pytest.approx([198.0, 198.0])
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_action(self, db_session):
+        service = PriceHistoryService(db_session)
+
+        result = await service.record_corporate_action("AAPL", date(2024, 1, 3), "spinoff", 1.0)
+
+        assert not result.success
@@ -0,0 +1,162 @@
+"""
+Tests for the tiered provider cache shared by all market data providers
+
+Tests cover:
+- Stable, parameter-order independent keys
+- O(1) LRU eviction and per-operation TTL expiry
+- Optional Redis layer (read-through promotion, write-through, failure tolerance)
+- Redis values as tagged JSON (provider result models rebuilt, nothing unpickled)
+- Hit/miss/eviction metrics
+"""
+
+import pickle
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.implementations.provider_cache import ProviderCache, DEFAULT_OPERATION_TTLS
+from app.services.interfaces.data_provider import MarketData
+from app.services.interfaces.i_composite_data_provider import CompositeResult, DataQuality, DataSource
+from app.utils.serialization import dumps
+
+
+class TestProviderCacheKeys:
+    """Test cache key generation"""
+
+    def test_keys_are_stable_and_order_independent(self):
+        cache = ProviderCache(namespace="openbb")
+
+        key_a = cache.make_key("historical_data", symbol="AAPL", start_date=date(2024, 1, 1), interval="1d")
+        key_b = cache.make_key("historical_data", interval="1d", start_date=date(2024, 1, 1), symbol="AAPL")
+
+        assert key_a == key_b
+        assert key_a.startswith("openbb:historical_data:")
+        # Independent of the process: a fresh instance yields the same key
+        assert ProviderCache(namespace="openbb").make_key(
+            "historical_data", symbol="AAPL", start_date=date(2024, 1, 1), interval="1d"
+        ) == key_a
+
+    def test_keys_differ_by_parameters_and_namespace(self):
+        cache = ProviderCache(namespace="openbb")
+
+        assert cache.make_key("quote", symbol="AAPL") != cache.make_key("quote", symbol="MSFT")
+        assert cache.make_key("quote", symbol="AAPL") != ProviderCache(namespace="yahoo").make_key("quote", symbol="AAPL")
+
+
+class TestProviderCacheInProcess:
+    """Test the in-process LRU/TTL layer"""
+
+    def test_lru_eviction(self):
+        cache = ProviderCache(namespace="test", max_entries=2)
+
+        cache.set(cache.make_key("asset_info", symbol="A"), "a")
+        cache.set(cache.make_key("asset_info", symbol="B"), "b")
+        # Touch A so B becomes least recently used
+        assert cache.get(cache.make_key("asset_info", symbol="A")) == "a"
+        cache.set(cache.make_key("asset_info", symbol="C"), "c")
+
+        assert cache.get(cache.make_key("asset_info", symbol="B")) is None
+        assert cache.get(cache.make_key("asset_info", symbol="A")) == "a"
+        assert cache.get(cache.make_key("asset_info", symbol="C")) == "c"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_per_operation_ttls(self):
+        cache = ProviderCache(namespace="test", default_ttl=123, operation_ttls={"quote": 5})
+
+        assert cache.ttl_for("quote") == 5
+        assert cache.ttl_for("asset_info") == DEFAULT_OPERATION_TTLS["asset_info"]
+        assert cache.ttl_for("unknown_operation") == 123
+
+    def test_entries_expire(self):
+        cache = ProviderCache(namespace="test", operation_ttls={"quote": 10})
+        key = cache.make_key("quote", symbol="AAPL")
+
+        with patch("app.services.implementations.provider_cache.time.monotonic", return_value=1000.0):
+            cache.set(key, {"last_price": 1.0})
+        with patch("app.services.implementations.provider_cache.time.monotonic", return_value=1005.0):
+            assert cache.get(key) == {"last_price": 1.0}
+        with patch("app.services.implementations.provider_cache.time.monotonic", return_value=1011.0):
+            assert cache.get(key) is None
+
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+
+class TestProviderCacheRedisLayer:
+    """Test the optional shared Redis layer"""
+
+    @pytest.mark.asyncio
+    async def test_write_through_and_promotion(self):
+        mock_redis = AsyncMock()
+        writer = ProviderCache(namespace="test", redis_client=mock_redis)
+        key = writer.make_key("asset_info", symbol="AAPL")
+
+        await writer.aset(key, {"name": "Apple"})
+
+        redis_key, ttl, payload = mock_redis.setex.call_args.args
+        assert redis_key == f"bubble:provider_cache:v2:{key}"
+        assert ttl == DEFAULT_OPERATION_TTLS["asset_info"]
+
+        # Another process with a cold L1 reads through Redis and promotes into L1
+        mock_redis.get.return_value = payload
+        reader = ProviderCache(namespace="test", redis_client=mock_redis)
+
+        assert await reader.aget(key) == {"name": "Apple"}
+        assert reader.get(key) == {"name": "Apple"}
+        assert reader.get_stats()["l2_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_redis_payload_is_a_miss(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = dumps({"expires_at": time.time() - 1, "value": {"stale": True}})
+        cache = ProviderCache(namespace="test", redis_client=mock_redis)
+
+        assert await cache.aget(cache.make_key("quote", symbol="AAPL")) is None
+
+    @pytest.mark.asyncio
+    async def test_provider_results_rebuilt_from_json(self):
+        mock_redis = AsyncMock()
+        writer = ProviderCache(namespace="composite", redis_client=mock_redis)
+        key = writer.make_key("real_time", symbols=["AAPL"])
+        quote = MarketData(symbol="AAPL", timestamp=datetime(2024, 3, 1, 15, 30, tzinfo=timezone.utc),
+                           open=180.0, high=182.5, low=179.0, close=181.2, volume=52_000_000)
+        result = CompositeResult(data={"AAPL": quote}, primary_source=DataSource.YAHOO,
+                                 contributing_sources=[DataSource.YAHOO], quality=DataQuality(accuracy=0.9))
+
+        await writer.aset(key, result)
+
+        payload = mock_redis.setex.call_args.args[2]
+        assert not payload.startswith(b"\x80")  # JSON, not a pickle
+        mock_redis.get.return_value = payload
+        cached = await ProviderCache(namespace="composite", redis_client=mock_redis).aget(key)
+        assert cached == result
+        assert isinstance(cached.data["AAPL"], MarketData)
+        assert cached.primary_source is DataSource.YAHOO
+
+    @pytest.mark.asyncio
+    async def test_pickled_payload_is_never_unpickled(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = pickle.dumps(({"injected": True}, time.time() + 60))
+        cache = ProviderCache(namespace="test", redis_client=mock_redis)
+
+        with patch("pickle.loads") as unpickle:
+            assert await cache.aget(cache.make_key("quote", symbol="AAPL")) is None
+        unpickle.assert_not_called()
+        assert cache.get_stats()["redis_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_in_process(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = ConnectionError("redis down")
+        mock_redis.setex.side_effect = ConnectionError("redis down")
+        cache = ProviderCache(namespace="test", redis_client=mock_redis)
+        key = cache.make_key("quote", symbol="AAPL")
+
+        await cache.aset(key, {"last_price": 1.0})
+        assert await cache.aget(key) == {"last_price": 1.0}
+        assert await cache.aget(cache.make_key("quote", symbol="MSFT")) is None
+        assert cache.get_stats()["redis_errors"] == 2
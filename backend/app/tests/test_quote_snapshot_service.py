@@ -0,0 +1,218 @@
+"""
+Tests for the background quote snapshot service
+
+Tests cover:
+- Batched refresh within the per-cycle symbol budget
+- Snapshot reads with quote ages and staleness limits
+- Redis leader lock (followers reload the shared snapshot)
+- Expiry and cap of symbols tracked on demand
+- MarketDataService serving real-time quotes from the snapshot
+- Poller started and stopped by the application lifespan
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.interfaces.base import ServiceResult
+from app.services.interfaces.data_provider import MarketData
+from app.services.quote_snapshot_service import QuoteSnapshotService, SNAPSHOT_REDIS_KEY
+
+
+def make_quote(symbol: str, price: float = 100.0) -> MarketData:
+    return MarketData(
+        symbol=symbol,
+        timestamp=datetime.now(timezone.utc),
+        open=price, high=price, low=price, close=price, volume=1000
+    )
+
+
+def batch_fetcher():
+    """Composite fetch_with_fallback mock returning a quote for every requested symbol"""
+    async def fetch(operation, symbols):
+        return ServiceResult(
+            success=True,
+            data=MagicMock(data={symbol: make_quote(symbol) for symbol in symbols})
+        )
+    return AsyncMock(side_effect=fetch)
+
+
+@pytest.fixture
+def composite_provider():
+    provider = MagicMock()
+    provider.fetch_with_fallback = batch_fetcher()
+    return provider
+
+
+def make_service(composite_provider, symbols, redis_client=None, **kwargs):
+    return QuoteSnapshotService(
+        composite_provider,
+        redis_client=redis_client,
+        symbol_loader=AsyncMock(return_value=symbols),
+        batch_delay_seconds=0,
+        **kwargs
+    )
+
+
+class TestQuoteSnapshotRefresh:
+    """Test the refresh cycle"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_in_batches_within_budget(self, composite_provider):
+        symbols = [f"SYM{i}" for i in range(7)]
+        service = make_service(composite_provider, symbols, batch_size=2, max_symbols_per_cycle=5)
+        service.redis_client = None
+
+        result = await service.refresh_once()
+
+        assert result.success
+        assert result.data["refreshed"] == 5
+        assert result.data["symbols_deferred"] == 2
+        assert composite_provider.fetch_with_fallback.call_count == 3
+        assert all(len(call.kwargs["symbols"]) <= 2 for call in composite_provider.fetch_with_fallback.call_args_list)
+
+        # Next cycle starts with the symbols that were never refreshed
+        await service.refresh_once()
+        second_cycle_first_batch = composite_provider.fetch_with_fallback.call_args_list[3].kwargs["symbols"]
+        assert set(second_cycle_first_batch) == {"SYM5", "SYM6"}
+
+    @pytest.mark.asyncio
+    async def test_follower_reloads_shared_snapshot(self, composite_provider):
+        mock_redis = AsyncMock()
+        mock_redis.set.return_value = None  # lock held by another worker
+        mock_redis.hgetall.return_value = {
+            "AAPL": json.dumps({"quote": make_quote("AAPL", 190.0).model_dump(mode="json"), "fetched_at": time.time() - 5})
+        }
+        service = make_service(composite_provider, ["AAPL"], redis_client=mock_redis)
+
+        result = await service.refresh_once()
+
+        assert result.data["loaded_from_redis"] == 1
+        composite_provider.fetch_with_fallback.assert_not_called()
+        quotes, ages, missing = service.get_quotes(["AAPL"])
+        assert quotes["AAPL"].close == 190.0
+        assert 4 <= ages["AAPL"] <= 10
+        assert missing == []
+
+    @pytest.mark.asyncio
+    async def test_leader_writes_snapshot_to_redis(self, composite_provider):
+        mock_redis = MagicMock()
+        mock_redis.set = AsyncMock(return_value=True)
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline.return_value = pipe
+        service = make_service(composite_provider, ["AAPL", "MSFT"], redis_client=mock_redis)
+
+        await service.refresh_once()
+
+        assert pipe.hset.call_args.args[0] == SNAPSHOT_REDIS_KEY
+        assert set(pipe.hset.call_args.kwargs["mapping"]) == {"AAPL", "MSFT"}
+        pipe.execute.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_tracked_symbols_expire_and_are_capped(self, composite_provider):
+        service = make_service(composite_provider, ["AAPL"], tracked_symbol_ttl_seconds=60, max_tracked_symbols=2)
+        service.redis_client = None
+        await service.record({"MSFT": make_quote("MSFT"), "TSLA": make_quote("TSLA")})
+        service.track_symbols(["NVDA"])
+
+        # Least recently requested symbol dropped beyond the cap
+        assert list(service._tracked_symbols) == ["TSLA", "NVDA"]
+
+        # TSLA not requested within the TTL: no longer polled, its quote dropped
+        service._tracked_symbols["TSLA"] -= 120
+        service._quotes["TSLA"] = (service._quotes["TSLA"][0], time.time() - 120)
+        result = await service.refresh_once()
+
+        assert result.data["symbols_total"] == 2
+        assert set(composite_provider.fetch_with_fallback.call_args.kwargs["symbols"]) == {"AAPL", "NVDA"}
+        assert set(service._quotes) == {"AAPL", "MSFT", "NVDA"}
+        assert service.get_stats()["tracked_symbols_expired"] == 2
+
+    @pytest.mark.asyncio
+    async def test_leader_prunes_unpolled_quotes_from_redis(self, composite_provider):
+        mock_redis = MagicMock()
+        mock_redis.set = AsyncMock(return_value=True)
+        mock_redis.hgetall = AsyncMock(return_value={
+            "AAPL": json.dumps({"quote": {}, "fetched_at": time.time() - 7200}),
+            "MSFT": json.dumps({"quote": {}, "fetched_at": time.time() - 30}),
+            "TSLA": json.dumps({"quote": {}, "fetched_at": time.time() - 7200})
+        })
+        mock_redis.hdel = AsyncMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline.return_value = pipe
+        service = make_service(composite_provider, ["AAPL"], redis_client=mock_redis)
+
+        await service.refresh_once()
+
+        # Recently fetched on demand by another worker (MSFT) or polled (AAPL) stay
+        mock_redis.hdel.assert_awaited_once_with(SNAPSHOT_REDIS_KEY, "TSLA")
+
+
+class TestQuoteSnapshotReads:
+    """Test snapshot reads"""
+
+    @pytest.mark.asyncio
+    async def test_stale_quotes_reported_missing(self, composite_provider):
+        service = make_service(composite_provider, [])
+        service.redis_client = None
+        await service._store({"AAPL": make_quote("AAPL")}, fetched_at=time.time() - 300)
+        await service._store({"MSFT": make_quote("MSFT")})
+
+        quotes, ages, missing = service.get_quotes(["AAPL", "MSFT", "TSLA"], max_age_seconds=60)
+
+        assert set(quotes) == {"MSFT"}
+        assert missing == ["AAPL", "TSLA"]
+        assert service.get_stats()["snapshot_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_market_data_service_serves_snapshot(self, composite_provider):
+        from app.services.market_data_service import MarketDataService
+
+        service = MarketDataService(enable_monitoring=False)
+        service.quote_snapshot.redis_client = None
+        await service.quote_snapshot._store({"AAPL": make_quote("AAPL", 190.0)})
+        service.composite_provider.fetch_real_time_data_composite = AsyncMock(return_value=ServiceResult(
+            success=True,
+            data={"MSFT": MagicMock(data={"MSFT": make_quote("MSFT", 410.0)}, failover_occurred=False)}
+        ))
+
+        result = await service.fetch_real_time_data_with_fallback(["AAPL", "MSFT"])
+
+        assert result.success
+        assert result.data["AAPL"].close == 190.0
+        assert result.data["MSFT"].close == 410.0
+        assert result.metadata["snapshot_hits"] == 1
+        assert result.metadata["quote_age_seconds"]["MSFT"] == 0.0
+        service.composite_provider.fetch_real_time_data_composite.assert_awaited_once_with(["MSFT"])
+        # On-demand symbols join the snapshot and future refresh cycles
+        assert "MSFT" in service.quote_snapshot._tracked_symbols
+
+
+class TestMarketDataLifespan:
+    """Test the background services' lifecycle in the API process"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("environment, started", [("production", True), ("testing", False)])
+    async def test_lifespan_starts_and_stops_market_data_service(self, monkeypatch, environment, started):
+        from app.api.v1 import market_data
+        from app.main import app, lifespan
+        from app.core.config import settings
+
+        monkeypatch.setenv("ENVIRONMENT", environment)
+        monkeypatch.setattr(settings, "environment", environment)
+        initialize = AsyncMock(return_value=ServiceResult(success=True, data=True))
+        shutdown = AsyncMock(return_value=ServiceResult(success=True, data=True))
+        monkeypatch.setattr(market_data.market_data_service, "initialize", initialize)
+        monkeypatch.setattr(market_data.market_data_service, "shutdown", shutdown)
+
+        async with lifespan(app):
+            assert initialize.await_count == int(started)
+            shutdown.assert_not_awaited()
+
+        assert shutdown.await_count == int(started)
@@ -0,0 +1,152 @@
+"""
+Tests for the record/replay data provider
+
+Tests cover:
+- Recording live responses and replaying them offline
+- Replaying symbol lists assembled from per-symbol recordings
+- Seeded latency and error injection
+- CompositeDataProvider running unchanged on replay providers
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.interfaces.base import ServiceResult
+from app.services.interfaces.data_provider import MarketData, ValidationResult
+from app.services.interfaces.i_composite_data_provider import DataSource
+from app.services.implementations.record_replay_provider import (
+    RecordReplayDataProvider,
+    RecordReplayMode,
+    build_recording_providers,
+    build_replay_providers,
+)
+
+
+def make_bar(symbol: str, close: float = 100.0) -> MarketData:
+    return MarketData(
+        symbol=symbol,
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        open=close, high=close + 1, low=close - 1, close=close, volume=1000
+    )
+
+
+def live_provider():
+    provider = MagicMock()
+
+    async def fetch_real_time_data(symbols):
+        return ServiceResult(
+            success=True,
+            data={symbol: make_bar(symbol, 100.0 + i) for i, symbol in enumerate(symbols)},
+            message="live"
+        )
+
+    async def fetch_historical_data(symbols, start_date, end_date, interval="1d"):
+        return ServiceResult(success=True, data={symbol: [make_bar(symbol)] for symbol in symbols})
+
+    provider.fetch_real_time_data = AsyncMock(side_effect=fetch_real_time_data)
+    provider.fetch_historical_data = AsyncMock(side_effect=fetch_historical_data)
+    return provider
+
+
+class TestRecordReplay:
+    """Test recording and replaying responses"""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay_round_trip(self, tmp_path):
+        path = str(tmp_path / "yahoo_finance.jsonl.gz")
+        delegate = live_provider()
+        recorder = RecordReplayDataProvider(path, mode=RecordReplayMode.RECORD, delegate=delegate)
+
+        await recorder.fetch_real_time_data(["AAPL", "MSFT"])
+        await recorder.fetch_historical_data(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        replay = RecordReplayDataProvider(path)
+        quotes = await replay.fetch_real_time_data(["AAPL", "MSFT"])
+        history = await replay.fetch_historical_data(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert quotes.success
+        assert isinstance(quotes.data["MSFT"], MarketData)
+        assert quotes.data["MSFT"].close == 101.0
+        assert history.data["AAPL"][0].timestamp == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert replay.get_stats()["replayed"] == 2
+        assert delegate.fetch_real_time_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_assembles_symbols_across_batches(self, tmp_path):
+        path = str(tmp_path / "recording.jsonl.gz")
+        recorder = RecordReplayDataProvider(path, mode=RecordReplayMode.RECORD, delegate=live_provider())
+        await recorder.fetch_real_time_data(["AAPL"])
+        await recorder.fetch_real_time_data(["MSFT", "TSLA"])
+
+        replay = RecordReplayDataProvider(path)
+        result = await replay.fetch_real_time_data(["TSLA", "AAPL", "NVDA"])
+
+        assert result.success
+        assert set(result.data) == {"TSLA", "AAPL"}
+        assert result.metadata["assembled_from_symbols"] is True
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_fails(self, tmp_path):
+        replay = RecordReplayDataProvider(str(tmp_path / "missing.jsonl.gz"))
+
+        result = await replay.validate_symbols(["AAPL"])
+
+        assert not result.success
+        assert "No recording" in result.error
+        assert replay.get_stats()["misses"] == 1
+        assert not (await replay.health_check()).success
+
+    def test_record_mode_requires_delegate(self, tmp_path):
+        with pytest.raises(ValueError):
+            RecordReplayDataProvider(str(tmp_path / "x.jsonl.gz"), mode=RecordReplayMode.RECORD)
+
+
+class TestFaultInjection:
+    """Test seeded latency and error injection"""
+
+    @pytest.mark.asyncio
+    async def test_error_injection_is_reproducible(self, tmp_path):
+        path = str(tmp_path / "recording.jsonl.gz")
+        recorder = RecordReplayDataProvider(path, mode=RecordReplayMode.RECORD, delegate=live_provider())
+        await recorder.fetch_real_time_data(["AAPL"])
+
+        async def outcomes(seed):
+            replay = RecordReplayDataProvider(path, error_rate=0.3, seed=seed)
+            return [(await replay.fetch_real_time_data(["AAPL"])).success for _ in range(50)]
+
+        first, second = await outcomes(42), await outcomes(42)
+
+        assert first == second
+        assert 0 < first.count(False) < 50
+
+
+class TestCompositeOnReplay:
+    """Test the composite provider running on recorded providers"""
+
+    @pytest.mark.asyncio
+    async def test_composite_replays_recorded_chain(self, tmp_path):
+        from app.services.implementations.composite_data_provider import CompositeDataProvider
+
+        directory = str(tmp_path)
+        openbb = MagicMock()
+        openbb.validate_symbols = AsyncMock(return_value=ServiceResult(success=False, error="OpenBB down"))
+        yahoo = MagicMock()
+        yahoo.validate_symbols = AsyncMock(return_value=ServiceResult(
+            success=True,
+            data={"AAPL": ValidationResult(
+                symbol="AAPL", is_valid=True, provider="yahoo_finance", timestamp=datetime.now(timezone.utc)
+            )}
+        ))
+        recorders = build_recording_providers({DataSource.OPENBB: openbb, DataSource.YAHOO: yahoo}, directory)
+        await recorders[DataSource.OPENBB].validate_symbols(["AAPL"])
+        await recorders[DataSource.YAHOO].validate_symbols(["AAPL"])
+
+        composite = CompositeDataProvider(enable_caching=False, providers=build_replay_providers(directory))
+        result = await composite.fetch_with_fallback("validate_symbols", symbols=["AAPL"])
+
+        assert result.success
+        assert result.data.primary_source == DataSource.YAHOO
+        assert result.data.failover_occurred
+        assert result.data.data["AAPL"].is_valid
@@ -0,0 +1,148 @@
+"""
+Tests for the central Redis connection-pool registry
+
+Tests cover:
+- One shared async pool per event loop and decode mode
+- One shared sync pool per process
+- Saturation metrics
+- Shutdown disconnecting every pool
+- Per-loop pools disconnected, or released once their loop is closed
+- Rate limiter and services resolving clients in the running loop
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.redis_pool import RedisPoolRegistry, get_redis_pool
+
+
+class TestRedisPoolRegistry:
+    """Test shared Redis pools"""
+
+    @pytest.mark.asyncio
+    async def test_async_client_shared_per_decode_mode(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379", max_connections=4)
+        try:
+            first = registry.get_client()
+            second = registry.get_client()
+            binary = registry.get_client(decode_responses=False)
+
+            assert first is second
+            assert binary is not first
+            assert first.connection_pool.max_connections == 4
+            assert first.connection_pool.connection_kwargs["decode_responses"] is True
+
+            metrics = registry.get_metrics()
+            assert metrics["total_pools"] == 2
+            assert metrics["pools_created"] == 2
+            assert metrics["client_reuses"] == 1
+            assert metrics["total_in_use"] == 0
+        finally:
+            await registry.close_all()
+
+    def test_client_outside_event_loop_is_not_pooled(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379")
+
+        registry.get_client()
+
+        assert registry.get_metrics()["total_pools"] == 0
+        assert registry.get_metrics()["unpooled_clients"] == 1
+
+    def test_sync_client_shared(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379", sync_max_connections=3)
+
+        client = registry.get_sync_client()
+
+        assert registry.get_sync_client() is client
+        pool = registry.get_metrics()["pools"][0]
+        assert pool["mode"] == "sync"
+        assert pool["max_connections"] == 3
+        assert pool["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_saturation_reported(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379", max_connections=4, saturation_threshold=0.75)
+        try:
+            client = registry.get_client()
+            # Stand-ins for checked-out connections (no Redis server needed)
+            client.connection_pool._in_use_connections.update(object() for _ in range(3))
+
+            metrics = registry.get_metrics()
+            assert metrics["pools"][0]["utilization"] == 0.75
+            assert metrics["pools"][0]["saturated"] is True
+            assert metrics["saturated_pools"] == 1
+            client.connection_pool._in_use_connections.clear()
+        finally:
+            await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_all_drops_pools(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379")
+        client = registry.get_client()
+        registry.get_sync_client()
+
+        await registry.close_all()
+
+        assert registry.get_metrics()["total_pools"] == 0
+        # A closed registry hands out a fresh pool on next use
+        assert registry.get_client() is not client
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_dependency_reuses_limiter(self):
+        from app.core.dependencies import _get_redis_rate_limiter
+
+        limiter = _get_redis_rate_limiter()
+
+        assert _get_redis_rate_limiter() is limiter
+        assert limiter.redis is get_redis_pool().get_client(decode_responses=True)
+
+    def test_loop_pools_disconnected_or_released(self):
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379")
+
+        async def use_and_close():
+            registry.get_client()
+            await registry.close_loop_clients()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(use_and_close())
+        loop.close()
+        assert registry.get_metrics()["total_pools"] == 0
+
+        async def use():
+            client = registry.get_client()
+            # Stand-in for an open connection (no Redis server needed)
+            connection = MagicMock()
+            client.connection_pool._available_connections.append(connection)
+            return connection
+
+        loop = asyncio.new_event_loop()
+        connection = loop.run_until_complete(use())
+        loop.close()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(use_and_close())
+        loop.close()
+
+        connection._writer.transport._sock.close.assert_called_once()
+        assert registry.get_metrics()["pools_abandoned"] == 1
+        assert registry.get_metrics()["total_pools"] == 0
+
+    @pytest.mark.asyncio
+    async def test_services_resolve_client_in_running_loop(self):
+        from app.services.asset_validation_service import AssetValidationService
+        from app.services.implementations.provider_cache import ProviderCache
+        from app.services.quote_snapshot_service import QuoteSnapshotService
+
+        registry = get_redis_pool()
+        # Created outside a request, e.g. by a sync dependency or before a task's loop runs
+        validation_service = await asyncio.to_thread(AssetValidationService)
+        quote_snapshot = await asyncio.to_thread(QuoteSnapshotService, MagicMock())
+        cache = ProviderCache(namespace="test", redis_pool=registry)
+
+        assert validation_service.redis_client is registry.get_client(decode_responses=True)
+        assert quote_snapshot.redis_client is registry.get_client(decode_responses=True)
+        assert cache.redis_client is registry.get_client(decode_responses=False)
+        assert cache.get_stats()["redis_enabled"] is True
@@ -0,0 +1,164 @@
+"""
+Tests for the shared serialization layer
+
+Tests cover:
+- Cached payload encoding of non-JSON types
+- v1 routers defaulting to the fast response class
+- Encode-time benchmark over the largest responses (timelines, bulk
+  validation, composite signals)
+"""
+
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse
+from app.services.interfaces.asset_validation import BulkValidationResult
+from app.services.interfaces.data_provider import AssetInfo, ValidationResult
+from app.utils.serialization import ORJSON_AVAILABLE, dumps, dumps_str, loads
+
+
+def timeline_payload(snapshots=250, assets=100):
+    start = date(2023, 1, 2)
+    return {
+        "success": True,
+        "data": {
+            "universe_id": "universe-1",
+            "timeline": [
+                {
+                    "id": f"snapshot-{day}",
+                    "universe_id": "universe-1",
+                    "snapshot_date": (start + timedelta(days=day)).isoformat(),
+                    "assets": [
+                        {"symbol": f"SYM{index}", "name": f"Company {index}", "sector": "Technology",
+                         "weight": 1.0 / assets, "market_cap": 1_000_000_000 + index}
+                        for index in range(assets)
+                    ],
+                    "turnover_rate": 0.05,
+                    "assets_added": ["SYM1"],
+                    "assets_removed": ["SYM2"],
+                    "performance_metrics": {"return": 0.012, "volatility": 0.2},
+                    "evolution": {"asset_count_change": 0, "days_since_previous": 1, "composition_stability": 0.95}
+                }
+                for day in range(snapshots)
+            ]
+        }
+    }
+
+
+def bulk_validation_payload(symbols=500):
+    now = datetime.now(timezone.utc)
+    results = {
+        f"SYM{index}": ValidationResult(
+            symbol=f"SYM{index}", is_valid=True, provider="yahoo_finance", timestamp=now, confidence=1.0,
+            asset_info=AssetInfo(symbol=f"SYM{index}", name=f"Company {index}", sector="Technology",
+                                 market_cap=1_000_000_000, is_valid=True, last_updated=now),
+            source="cache"
+        )
+        for index in range(symbols)
+    }
+    return jsonable_encoder(BulkValidationResult(
+        total_requested=symbols, successful_validations=symbols, failed_validations=0, pending_validations=0,
+        results=results, errors={}, processing_time=0.5, cache_hits=symbols, cache_misses=0
+    ))
+
+
+def composite_signals_payload(symbols=50, days=250):
+    start = date(2023, 1, 2)
+    return {
+        symbol: [
+            {"date": (start + timedelta(days=day)).isoformat(), "signal": 1, "strength": 0.8,
+             "indicators": {"rsi": 55.2, "macd": 0.31, "macd_signal": 0.27, "momentum": 0.04}}
+            for day in range(days)
+        ]
+        for symbol in (f"SYM{index}" for index in range(symbols))
+    }
+
+
+class TestSerialization:
+    """Test cached payload encoding"""
+
+    def test_non_json_types_encoded(self):
+        result = ValidationResult(symbol="AAPL", is_valid=True, provider="yahoo_finance",
+                                  timestamp=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), source="cache")
+        encoded = loads(dumps({
+            "when": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "price": Decimal("1.25"),
+            date(2024, 1, 2): "date key",
+            "result": result
+        }))
+
+        assert encoded["when"] == "2024-01-02T00:00:00+00:00"
+        assert encoded["price"] == "1.25"
+        assert encoded["2024-01-02"] == "date key"
+        assert ValidationResult(**encoded["result"]) == result
+        # Integers orjson cannot encode fall back to the stdlib encoder
+        assert loads(dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+
+    def test_cached_validation_round_trip(self):
+        result = ValidationResult(**bulk_validation_payload(1)["results"]["SYM0"])
+
+        assert ValidationResult(**loads(dumps_str(result.model_dump()))) == result
+
+    def test_v1_routers_use_fast_response(self):
+        from app.main import app
+
+        classes = {route.path: route.response_class for route in app.routes if hasattr(route, "response_class")}
+
+        assert classes["/api/v1/universes/"] is FastJSONResponse
+        assert all(cls is FastJSONResponse for path, cls in classes.items() if path.startswith("/api/v1/"))
+        assert classes["/health/"] is not FastJSONResponse
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+class TestSerializationBenchmark:
+    """
+    Encode time of the largest responses, default encoder vs shared serializer
+
+    Timings are reported, not asserted (wall-clock comparisons flake on
+    loaded machines); only identical output is checked.
+    """
+
+    @staticmethod
+    def best_of(render, content, rounds=5):
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            render(content)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    @pytest.mark.parametrize("name,payload", [
+        ("timeline", timeline_payload),
+        ("bulk_validation", bulk_validation_payload),
+        ("composite_signals", composite_signals_payload),
+    ])
+    def test_response_encode_time(self, name, payload):
+        content = payload()
+        default = JSONResponse(content=None)
+        fast = FastJSONResponse(content=None)
+
+        assert json.loads(fast.render(content)) == json.loads(default.render(content))
+
+        default_seconds = self.best_of(default.render, content)
+        fast_seconds = self.best_of(fast.render, content)
+        print(f"\n   {name}: {len(fast.render(content)) / 1024:.0f} KiB, "
+              f"json {default_seconds * 1000:.2f}ms, orjson {fast_seconds * 1000:.2f}ms "
+              f"({default_seconds / fast_seconds:.1f}x)")
+
+    def test_cache_payload_encode_time(self):
+        content = timeline_payload()
+        content["data"]["generated_at"] = datetime.now(timezone.utc)
+
+        assert loads(dumps(content)) == json.loads(json.dumps(content, default=lambda value: value.isoformat()))
+
+        default_seconds = self.best_of(lambda data: json.dumps(data, default=str), content)
+        fast_seconds = self.best_of(dumps, content)
+        print(f"\n   timeline cache payload: json {default_seconds * 1000:.2f}ms, "
+              f"orjson {fast_seconds * 1000:.2f}ms ({default_seconds / fast_seconds:.1f}x)")
@@ -7,10 +7,11 @@ cache invalidation, and enterprise-grade reliability.
 import pytest
 import asyncio
 from datetime import datetime, date, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import os
 
 from app.services.implementations.redis_temporal_cache import RedisTemporalCache
+from app.services.implementations.temporal_cache_codec import TemporalCacheCodec
 from app.services.interfaces.security import ITemporalCache
 
 
@@ -29,6 +30,13 @@ class TestRedisTemporalCache:
         mock_redis.sadd.return_value = 1
         mock_redis.expire.return_value = True
         mock_redis.keys.return_value = []
+        mock_redis.zadd.return_value = 1
+        mock_redis.zrem.return_value = 1
+        mock_redis.zcount.return_value = 0
+        mock_redis.zremrangebyscore.return_value = 0
+        mock_redis.zincrby.return_value = 1.0
+        mock_redis.zrevrange.return_value = []
+        mock_redis.srem.return_value = 1
         mock_redis.info.return_value = {
             "used_memory_human": "1.5M",
             "used_memory_peak_human": "2.1M"
@@ -97,7 +105,7 @@ class TestRedisTemporalCache:
         
         # Test compression
         compressed = temporal_cache._compress_data(test_data)
-        assert isinstance(compressed, str)
+        assert isinstance(compressed, bytes)
         assert len(compressed) > 0
         
         # Test decompression
@@ -106,6 +114,44 @@ class TestRedisTemporalCache:
         assert isinstance(decompressed["snapshots"], list)
         assert len(decompressed["snapshots"]) == 2
     
+    @pytest.mark.asyncio
+    async def test_large_payload_compressed_and_legacy_readable(self, temporal_cache):
+        """Test large payloads are compressed and plain JSON values still decode"""
+        
+        timeline = {
+            "snapshots": [
+                {"date": f"2024-01-{day:02d}", "assets": [f"SYM{i}" for i in range(200)], "turnover_rate": 0.1}
+                for day in range(1, 29)
+            ]
+        }
+        
+        encoded = temporal_cache._compress_data(timeline)
+        assert encoded[0] == 1 and encoded[1] != 0  # Version byte, compressed body
+        assert temporal_cache._decompress_data(encoded) == timeline
+        
+        stats = temporal_cache.codec.get_stats()
+        assert stats["compression_ratio"] > 5
+        assert stats["avg_encode_ms"] > 0
+        
+        # Values written as JSON text before the codec existed
+        assert temporal_cache._decompress_data('{"snapshots": []}') == {"snapshots": []}
+        assert temporal_cache._decompress_data(b'{"snapshots": []}') == {"snapshots": []}
+        assert temporal_cache.codec.get_stats()["legacy_reads"] == 2
+        
+        with pytest.raises(ValueError):
+            temporal_cache._decompress_data(b"\x01\x07garbage")
+    
+    def test_zstd_default_and_zlib_values_readable(self):
+        """Test zstd is the default codec and zlib-compressed values still decode"""
+        
+        payload = {"assets": [f"SYM{i}" for i in range(500)]}
+        zlib_value = TemporalCacheCodec(compression="zlib").encode(payload)
+        codec = TemporalCacheCodec()
+        
+        assert codec.name == "zstd"
+        assert codec.encode(payload)[1] == 2
+        assert codec.decode(zlib_value) == payload
+    
     @pytest.mark.asyncio
     async def test_timeline_cache_operations(self, temporal_cache, mock_redis):
         """Test timeline caching and retrieval"""
@@ -148,6 +194,11 @@ class TestRedisTemporalCache:
         mock_redis.setex.assert_called()
         mock_redis.sadd.assert_called()
         mock_redis.expire.assert_called()
+        
+        # Key registered with its expiry for O(1) stats and cleanup
+        registry_key, members = mock_redis.zadd.call_args.args
+        assert registry_key == "bubble:temporal:registry:timeline"
+        assert list(members) == [mock_redis.setex.call_args.args[0]]
     
     @pytest.mark.asyncio 
     async def test_cache_hit_simulation(self, temporal_cache, mock_redis):
@@ -222,6 +273,10 @@ class TestRedisTemporalCache:
         # Verify Redis delete operations
         mock_redis.delete.assert_called()
         mock_redis.smembers.assert_called()
+        
+        # Deleted keys leave their type registries
+        registries = {call.args[0] for call in mock_redis.zrem.call_args_list}
+        assert registries == {"bubble:temporal:registry:timeline", "bubble:temporal:registry:snapshot"}
     
     @pytest.mark.asyncio
     async def test_cache_statistics(self, temporal_cache, mock_redis):
@@ -232,12 +287,12 @@ class TestRedisTemporalCache:
         temporal_cache._miss_count = 5
         temporal_cache._error_count = 1
         
-        # Mock Redis response
-        mock_redis.keys.return_value = [
-            "bubble:temporal:timeline:univ1:range_123",
-            "bubble:temporal:snapshot:univ1:params_456",
-            "bubble:temporal:timeline:univ2:range_789"
-        ]
+        # Mock registry counts (live keys per type)
+        registry_counts = {
+            "bubble:temporal:registry:timeline": 2,
+            "bubble:temporal:registry:snapshot": 1
+        }
+        mock_redis.zcount.side_effect = lambda key, min_score, max_score: registry_counts.get(key, 0)
         
         stats = await temporal_cache.get_cache_stats()
         
@@ -246,9 +301,10 @@ class TestRedisTemporalCache:
         assert stats["error_count"] == 1
         assert stats["hit_rate"] == 0.75  # 15/(15+5) = 0.75
         assert stats["total_keys"] == 3
-        assert "timeline" in stats["keys_by_type"]
-        assert "snapshot" in stats["keys_by_type"]
+        assert stats["keys_by_type"] == {"timeline": 2, "snapshot": 1}
+        mock_redis.keys.assert_not_called()
         assert stats["compression_enabled"] is True
+        assert "compression_ratio" in stats["codec"]
         assert "ttl_strategies" in stats
     
     @pytest.mark.asyncio
@@ -257,7 +313,7 @@ class TestRedisTemporalCache:
         
         # Test default TTL strategies
         assert temporal_cache._get_ttl_for_type("timeline") == 1800  # 30 minutes
-        assert temporal_cache._get_ttl_for_type("snapshot") == 3600  # 1 hour
+        assert temporal_cache._get_ttl_for_type("snapshot") == 86400  # 1 day, outbox-invalidated
         assert temporal_cache._get_ttl_for_type("universe_meta") == 7200  # 2 hours
         assert temporal_cache._get_ttl_for_type("screening") == 900  # 15 minutes
         assert temporal_cache._get_ttl_for_type("unknown") == 3600  # default
@@ -271,13 +327,70 @@ class TestRedisTemporalCache:
             {"start_date": "2024-01-01", "end_date": "2024-01-31"},
             {"start_date": "2024-02-01", "end_date": "2024-02-29"}
         ]
+        loader = AsyncMock(side_effect=lambda universe_id, start, end: {"snapshots": [universe_id, start, end]})
         
         # Test cache warming
-        results = await temporal_cache.warm_cache(universe_ids, date_ranges)
+        results = await temporal_cache.warm_cache(universe_ids, date_ranges, loader=loader)
         
         assert len(results) == 2
         assert results["universe-1"] is True
         assert results["universe-2"] is True
+        assert loader.await_count == 4
+        assert mock_redis.setex.await_count == 4
+        mock_redis.srem.assert_any_await("bubble:temporal:warm_pending", "universe-1")
+        
+        # Without a loader nothing can be computed
+        assert await RedisTemporalCache(redis_client=mock_redis).warm_cache(universe_ids, date_ranges) == {
+            "universe-1": False,
+            "universe-2": False
+        }
+    
+    @pytest.mark.asyncio
+    async def test_cache_warming_is_capped(self, temporal_cache, mock_redis):
+        """Test warming computes at most max_items timelines"""
+        
+        date_ranges = [
+            {"start_date": "2024-01-01", "end_date": "2024-01-31"},
+            {"start_date": "2024-02-01", "end_date": "2024-02-29"}
+        ]
+        loader = AsyncMock(return_value={"snapshots": []})
+        
+        results = await temporal_cache.warm_cache(["universe-1", "universe-2"], date_ranges, loader=loader, max_items=3)
+        
+        assert loader.await_count == 3
+        assert results == {"universe-1": True, "universe-2": True}
+        
+        results = await temporal_cache.warm_cache(["universe-3"], date_ranges, loader=loader, max_items=0)
+        assert results == {"universe-3": False}
+    
+    @pytest.mark.asyncio
+    async def test_access_tracking_drives_warming_candidates(self, temporal_cache, mock_redis):
+        """Test timeline reads are counted and invalidated hot universes are warmed first"""
+        
+        for _ in range(3):
+            await temporal_cache.get_timeline("universe-1", "2024-01-01", "2024-01-31")
+        await temporal_cache.get_timeline("universe-2", "2024-01-01", "2024-03-31")
+        
+        # Buffered until the flush interval elapses
+        mock_redis.zincrby.assert_not_awaited()
+        assert await temporal_cache.flush_access_counts() == 4
+        mock_redis.zincrby.assert_any_await("bubble:temporal:access:universes", 3, "universe-1")
+        mock_redis.zincrby.assert_any_await("bubble:temporal:access:ranges:universe-1", 3, "2024-01-01:2024-01-31")
+        assert await temporal_cache.flush_access_counts() == 0
+        
+        await temporal_cache.invalidate_universe_cache("universe-2")
+        mock_redis.sadd.assert_any_await("bubble:temporal:warm_pending", "universe-2")
+        
+        mock_redis.zrevrange.side_effect = lambda key, start, end, withscores=False: (
+            [(b"universe-1", 3.0), (b"universe-2", 1.0)] if key.endswith(":universes")
+            else [b"2024-01-01:2024-01-31"]
+        )
+        mock_redis.smembers.return_value = {b"universe-2"}
+        
+        assert await temporal_cache.get_warming_candidates(max_universes=2) == ["universe-2", "universe-1"]
+        assert await temporal_cache.get_hot_ranges("universe-1") == [
+            {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+        ]
     
     @pytest.mark.asyncio
     async def test_error_handling(self, temporal_cache, mock_redis):
@@ -287,13 +400,13 @@ class TestRedisTemporalCache:
         # Reset the redis_client to None to force _ensure_connection to create a new one
         temporal_cache.redis_client = None
         
-        # Mock redis.from_url to return our mock_redis, then make ping fail
-        import redis.asyncio as redis
+        # Hand out our mock_redis from the Redis pool, then make ping fail
         from unittest.mock import patch
         
         from redis.exceptions import RedisError
         
-        with patch.object(redis, 'from_url', return_value=mock_redis):
+        with patch("app.services.implementations.redis_temporal_cache.get_redis_pool") as get_pool:
+            get_pool.return_value.get_client.return_value = mock_redis
             mock_redis.ping.side_effect = RedisError("Redis connection failed")
             
             with pytest.raises(Exception, match="Failed to connect to Redis"):
@@ -324,18 +437,288 @@ class TestRedisTemporalCache:
     async def test_cache_cleanup(self, temporal_cache, mock_redis):
         """Test expired key cleanup functionality"""
         
-        # Mock expired keys (TTL = -2)
-        mock_redis.keys.return_value = [
-            "bubble:temporal:timeline:univ1:range_123",
-            "bubble:temporal:snapshot:univ1:params_456"
-        ]
-        mock_redis.ttl.return_value = -2  # Expired
+        # Mock expired registry entries (one timeline, one snapshot)
+        expired = {
+            "bubble:temporal:registry:timeline": 1,
+            "bubble:temporal:registry:snapshot": 1
+        }
+        mock_redis.zremrangebyscore.side_effect = lambda key, min_score, max_score: expired.get(key, 0)
         
         expired_count = await temporal_cache.cleanup_expired_keys()
         assert expired_count == 2
         
-        # Verify TTL check was called
-        assert mock_redis.ttl.call_count >= 2
+        # No keyspace scan or per-key TTL round trips
+        mock_redis.keys.assert_not_called()
+        mock_redis.ttl.assert_not_called()
+
+    
+    @pytest.mark.asyncio
+    async def test_registry_pruned_on_write(self, temporal_cache, mock_redis):
+        """Test writes drop expired registry entries, at most once per interval"""
+        
+        for universe_id in ("universe-1", "universe-2"):
+            await temporal_cache.set_timeline(universe_id, "2024-01-01", "2024-01-31", {"test": "data"})
+        
+        mock_redis.zremrangebyscore.assert_awaited_once()
+        registry_key, min_score, max_score = mock_redis.zremrangebyscore.await_args.args
+        assert registry_key == "bubble:temporal:registry:timeline" and min_score == "-inf"
+        assert mock_redis.zadd.await_count == 2
+        
+        temporal_cache.registry_prune_interval_seconds = 0
+        await temporal_cache.set_timeline("universe-3", "2024-01-01", "2024-01-31", {"test": "data"})
+        assert mock_redis.zremrangebyscore.await_count == 2
+
+class TestTimelineSegments:
+    """Test per-snapshot segment caching"""
+    
+    @pytest.fixture
+    def store(self):
+        """Strings and sorted sets backing the mocked Redis client"""
+        return {"strings": {}, "zsets": {}}
+    
+    @pytest.fixture
+    def temporal_cache(self, store):
+        """Create temporal cache on a mocked Redis that keeps written values"""
+        strings, zsets = store["strings"], store["zsets"]
+        mock_redis = AsyncMock()
+        
+        async def setex(key, ttl, value):
+            strings[key] = value.encode() if isinstance(value, str) else value
+        
+        async def delete(*keys):
+            for key in keys:
+                strings.pop(key, None)
+        
+        async def zadd(key, mapping):
+            zsets.setdefault(key, {}).update(mapping)
+        
+        async def zrangebyscore(key, min_score, max_score):
+            members = sorted(zsets.get(key, {}).items(), key=lambda item: item[1])
+            return [member.encode() for member, score in members if min_score <= score <= max_score]
+        
+        async def set_nx(key, value, nx=False, px=None):
+            if nx and key in strings:
+                return None
+            strings[key] = value.encode()
+            return True
+        
+        async def release(script, numkeys, key, token):
+            if strings.get(key) == token.encode():
+                del strings[key]
+        
+        mock_redis.get.side_effect = lambda key: strings.get(key)
+        mock_redis.mget.side_effect = lambda keys: [strings.get(key) for key in keys]
+        mock_redis.setex.side_effect = setex
+        mock_redis.delete.side_effect = delete
+        mock_redis.zadd.side_effect = zadd
+        mock_redis.zrangebyscore.side_effect = zrangebyscore
+        mock_redis.set.side_effect = set_nx
+        mock_redis.eval.side_effect = release
+        
+        return RedisTemporalCache(redis_client=mock_redis, recompute_lock_poll_seconds=0.01)
+    
+    @staticmethod
+    def snapshot(snapshot_date):
+        return {"snapshot_date": snapshot_date, "assets": [{"symbol": "AAPL"}], "turnover_rate": 0.1}
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_ranges_share_segments(self, temporal_cache, store):
+        """Test any range inside the covered span is assembled from segments"""
+        
+        assert await temporal_cache.get_timeline_segments("universe-1", "2024-01-01", "2024-06-30") is None
+        
+        snapshots = [self.snapshot("2024-01-31"), self.snapshot("2024-02-29"), self.snapshot("2024-03-31")]
+        assert await temporal_cache.set_timeline_segments("universe-1", "2024-01-01", "2024-06-30", snapshots)
+        
+        window = await temporal_cache.get_timeline_segments("universe-1", "2024-02-01", "2024-04-30")
+        assert [segment["snapshot_date"] for segment in window] == ["2024-02-29", "2024-03-31"]
+        assert await temporal_cache.get_timeline_segments("universe-1", "2024-04-01", "2024-05-31") == []
+        
+        # Outside the covered span
+        assert await temporal_cache.get_timeline_segments("universe-1", "2023-12-01", "2024-03-31") is None
+        
+        # Adjacent ranges extend the coverage
+        await temporal_cache.set_timeline_segments("universe-1", "2024-07-01", None, [self.snapshot("2024-07-31")])
+        assert store["strings"]["bubble:temporal:segment_coverage:universe-1"].startswith(b"2024-01-01::")
+        assert len(await temporal_cache.get_timeline_segments("universe-1", "2024-01-01", "2025-01-01")) == 4
+    
+    @pytest.mark.asyncio
+    async def test_new_snapshot_writes_one_segment(self, temporal_cache, store):
+        """Test adding a snapshot keeps cached segments and coverage"""
+        
+        await temporal_cache.set_timeline_segments("universe-1", "2024-01-01", None, [self.snapshot("2024-01-31")])
+        temporal_cache.redis_client.setex.reset_mock()
+        
+        assert await temporal_cache.add_timeline_segment("universe-1", self.snapshot("2024-02-29"))
+        
+        temporal_cache.redis_client.setex.assert_awaited_once()
+        assert temporal_cache.redis_client.setex.await_args.args[0] == "bubble:temporal:segment:universe-1:2024-02-29"
+        timeline = await temporal_cache.get_timeline_segments("universe-1", "2024-01-01", "2024-12-31")
+        assert [segment["snapshot_date"] for segment in timeline] == ["2024-01-31", "2024-02-29"]
+    
+    @pytest.mark.asyncio
+    async def test_expired_segment_drops_coverage(self, temporal_cache, store):
+        """Test a missing segment turns the lookup into a miss"""
+        
+        await temporal_cache.set_timeline_segments(
+            "universe-1", "2024-01-01", "2024-12-31", [self.snapshot("2024-01-31"), self.snapshot("2024-02-29")]
+        )
+        del store["strings"]["bubble:temporal:segment:universe-1:2024-01-31"]
+        
+        assert await temporal_cache.get_timeline_segments("universe-1", "2024-01-01", "2024-12-31") is None
+        assert "bubble:temporal:segment_coverage:universe-1" not in store["strings"]
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, temporal_cache, store):
+        """Test concurrent misses of one universe run the loader once"""
+        
+        async def loader(start_date, end_date):
+            await asyncio.sleep(0.05)
+            return [self.snapshot("2024-01-31")], end_date
+        loader = AsyncMock(side_effect=loader)
+        
+        results = await asyncio.gather(*[
+            temporal_cache.get_or_load_timeline_segments("universe-1", "2024-01-01", "2024-12-31", loader)
+            for _ in range(5)
+        ])
+        
+        assert loader.await_count == 1
+        assert [cache_hit for _, cache_hit in results].count(False) == 1
+        assert all(len(snapshots) == 1 for snapshots, _ in results)
+        assert "bubble:temporal:lock:segments:universe-1" not in store["strings"]
+    
+    @pytest.mark.asyncio
+    async def test_other_process_lock_holder_is_waited_for(self, temporal_cache, store):
+        """Test a miss waits for the segments loaded by another process instead of loading"""
+        
+        store["strings"]["bubble:temporal:lock:segments:universe-1"] = b"other-process"
+        loader = AsyncMock(return_value=([self.snapshot("2024-01-31")], "2024-12-31"))
+        
+        async def other_process():
+            await asyncio.sleep(0.03)
+            await temporal_cache.set_timeline_segments("universe-1", "2024-01-01", "2024-12-31", [self.snapshot("2024-01-31")])
+        
+        (snapshots, cache_hit), _ = await asyncio.gather(
+            temporal_cache.get_or_load_timeline_segments("universe-1", "2024-01-01", "2024-12-31", loader),
+            other_process()
+        )
+        
+        assert cache_hit is True
+        assert len(snapshots) == 1
+        loader.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_stale_segments_served_while_refreshing(self, temporal_cache, store):
+        """Test expired coverage is served and refreshed once in the background"""
+        
+        await temporal_cache.set_timeline_segments(
+            "universe-1", "2024-01-01", "2024-12-31", [self.snapshot("2024-01-31")], ttl_seconds=0
+        )
+        refreshed = asyncio.Event()
+        
+        async def loader(start_date, end_date):
+            refreshed.set()
+            return [self.snapshot("2024-01-31"), self.snapshot("2024-02-29")], end_date
+        loader = AsyncMock(side_effect=loader)
+        
+        results = await asyncio.gather(*[
+            temporal_cache.get_or_load_timeline_segments("universe-1", "2024-01-01", "2024-12-31", loader)
+            for _ in range(3)
+        ])
+        
+        assert all(cache_hit and len(snapshots) == 1 for snapshots, cache_hit in results)
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+        await asyncio.sleep(0.01)
+        assert loader.await_count == 1
+        
+        snapshots, cache_hit = await temporal_cache.get_or_load_timeline_segments(
+            "universe-1", "2024-01-01", "2024-12-31", loader
+        )
+        assert cache_hit is True
+        assert len(snapshots) == 2
+        assert temporal_cache._stampede_stats["stale_served"] == 3
+        assert temporal_cache._stampede_stats["background_refreshes"] == 1
+    
+    def test_early_refresh_scales_with_recompute_cost(self, temporal_cache):
+        """Test XFetch picks early refresh near expiry for expensive recomputes only"""
+        from app.services.implementations.redis_temporal_cache import SegmentCoverage
+        
+        now = datetime.now().timestamp()
+        expensive = SegmentCoverage(date(2024, 1, 1), None, now + 1, compute_seconds=10.0)
+        cheap = SegmentCoverage(date(2024, 1, 1), None, now + 1, compute_seconds=0.001)
+        
+        with patch("app.services.implementations.redis_temporal_cache.random.random", return_value=0.5):
+            assert temporal_cache._coverage_state(expensive) == "early"
+            assert temporal_cache._coverage_state(cheap) == "fresh"
+        assert temporal_cache._coverage_state(SegmentCoverage(date(2024, 1, 1), None, now - 1, 0.0)) == "stale"
+
+
+class TestTemporalL1Cache:
+    """Test the in-process L1 and its pub/sub invalidation"""
+    
+    @pytest.fixture
+    def temporal_cache(self):
+        """Create temporal cache with a mocked Redis returning one timeline"""
+        mock_redis = AsyncMock()
+        cache = RedisTemporalCache(redis_client=mock_redis)
+        mock_redis.get.return_value = cache._compress_data({"snapshots": [{"snapshot_date": "2024-01-31"}]})
+        mock_redis.smembers.return_value = set()
+        return cache
+    
+    @pytest.mark.asyncio
+    async def test_hot_reads_skip_redis(self, temporal_cache):
+        """Test repeated reads are served from the L1"""
+        
+        first = await temporal_cache.get_timeline("universe-1", "2024-01-01", "2024-12-31")
+        second = await temporal_cache.get_timeline("universe-1", "2024-01-01", "2024-12-31")
+        
+        assert first["snapshots"] == second["snapshots"]
+        temporal_cache.redis_client.get.assert_awaited_once()
+        
+        stats = temporal_cache.l1_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_invalidation_is_published_and_drops_entries(self, temporal_cache):
+        """Test invalidating a universe clears its L1 entries locally and notifies other processes"""
+        
+        await temporal_cache.get_timeline("universe-1", "2024-01-01", "2024-12-31")
+        await temporal_cache.get_timeline("universe-2", "2024-01-01", "2024-12-31")
+        
+        await temporal_cache.invalidate_universe_cache("universe-1")
+        
+        temporal_cache.redis_client.publish.assert_awaited_once_with("bubble:temporal:invalidations", "universe-1")
+        assert temporal_cache.l1_cache.get_stats()["size"] == 1
+        
+        await temporal_cache.get_timeline("universe-1", "2024-01-01", "2024-12-31")
+        assert temporal_cache.redis_client.get.await_count == 3
+    
+    def test_listener_applies_published_invalidations(self):
+        """Test the listener thread body drops entries named in messages and clears after a disconnect"""
+        from app.services.implementations.temporal_l1_cache import TemporalL1Cache
+        
+        l1_cache = TemporalL1Cache()
+        l1_cache.set("bubble:temporal:timeline:universe-1:range_a", {"snapshots": []})
+        l1_cache.set("bubble:temporal:timeline:universe-2:range_a", {"snapshots": []})
+        
+        client = MagicMock()
+        client.pubsub.return_value.listen.return_value = iter([{"type": "message", "data": b"universe-1"}])
+        
+        class Stop(Exception):
+            pass
+        
+        with patch("app.services.implementations.temporal_l1_cache.sync_redis.from_url", return_value=client), \
+                patch("app.services.implementations.temporal_l1_cache.time.sleep", side_effect=Stop):
+            with pytest.raises(Stop):
+                l1_cache._listen("redis://test:6379", "bubble:temporal:invalidations")
+        
+        stats = l1_cache.get_stats()
+        assert stats["messages_received"] == 1
+        assert stats["entries_invalidated"] == 1
+        assert stats["listener_reconnects"] == 1
+        assert stats["size"] == 0  # Cleared once the subscription ended
 
 
 class TestTemporalCacheIntegration:
@@ -230,6 +230,37 @@ class TestUniverseServiceTemporal:
         assert timeline_result.data['period_analysis']['average_asset_count'] == 4.0
         assert timeline_result.data['universe_info']['name'] == universe.name
     
+    @pytest.mark.asyncio
+    async def test_background_timeline_refresh_uses_own_session(self, db_session: Session, test_universe_with_assets):
+        """Test the stale-while-revalidate loader does not use the request's session"""
+        from sqlalchemy.orm import sessionmaker
+        
+        universe = test_universe_with_assets['universe']
+        db_session.add(UniverseSnapshot(universe_id=universe.id, snapshot_date=date(2024, 3, 31), assets=[]))
+        db_session.commit()
+        
+        opened = []
+        factory = sessionmaker(bind=db_session.get_bind())
+        def session_factory():
+            session = factory()
+            opened.append(session)
+            return session
+        
+        temporal_cache = AsyncMock()
+        temporal_cache.get_or_load_timeline_segments.return_value = ([], True)
+        service = UniverseService(db_session, temporal_cache=temporal_cache, session_factory=session_factory)
+        
+        await service.get_universe_timeline(universe_id=universe.id, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
+        db_session.close()
+        
+        refresh_loader = temporal_cache.get_or_load_timeline_segments.await_args.kwargs["refresh_loader"]
+        snapshots, covered_end = await refresh_loader("2024-01-01", "2024-12-31")
+        
+        assert [snapshot["snapshot_date"] for snapshot in snapshots] == ["2024-03-31"]
+        assert covered_end == "2024-12-31"
+        assert len(opened) == 1
+        assert not opened[0].in_transaction()  # closed after loading
+    
     @pytest.mark.asyncio
     async def test_get_universe_timeline_no_snapshots(self, universe_service: UniverseService, test_universe_with_assets):
         """Test get_universe_timeline with no snapshots"""
@@ -249,6 +280,42 @@ class TestUniverseServiceTemporal:
         assert "No snapshots found" in timeline_result.message
         assert "create_initial_snapshot" in timeline_result.next_actions
     
+    @pytest.mark.asyncio
+    async def test_warm_temporal_cache_recomputes_hot_ranges(self, db_session: Session, test_universe_with_assets):
+        """Test warming recomputes the hot date ranges of invalidated universes within the budget"""
+        from app.services.implementations.redis_temporal_cache import RedisTemporalCache
+        
+        universe = test_universe_with_assets['universe']
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        redis_client.smembers.return_value = {universe.id.encode()}
+        redis_client.zrevrange.side_effect = lambda key, start, end, withscores=False: (
+            [(universe.id.encode(), 5.0)] if key.endswith(":universes")
+            else [b"2024-01-01:2024-12-31", b"2024-06-01:2024-06-30"]
+        )
+        cache = RedisTemporalCache(redis_client=redis_client)
+        service = UniverseService(db_session, temporal_cache=cache)
+        
+        for snapshot_date in [date(2024, 3, 31), date(2024, 6, 30)]:
+            await service.create_universe_snapshot(universe_id=universe.id, snapshot_date=snapshot_date)
+        redis_client.setex.reset_mock()
+        
+        result = await service.warm_temporal_cache(max_items=2)
+        
+        assert result.success is True
+        assert result.data['universes'][universe.id] == {"timelines": 2, "warmed": True}
+        assert result.metadata['items_computed'] == 2
+        
+        written_keys = [call.args[0] for call in redis_client.setex.await_args_list]
+        segment_keys = [key for key in written_keys if key.startswith("bubble:temporal:segment:")]
+        assert segment_keys == [
+            f"bubble:temporal:segment:{universe.id}:2024-03-31",
+            f"bubble:temporal:segment:{universe.id}:2024-06-30",
+            f"bubble:temporal:segment:{universe.id}:2024-06-30"
+        ]
+        assert f"bubble:temporal:segment_coverage:{universe.id}" in written_keys
+        redis_client.srem.assert_awaited_once_with("bubble:temporal:warm_pending", universe.id)
+    
     @pytest.mark.asyncio
     async def test_backfill_universe_history(self, universe_service: UniverseService, test_universe_with_assets):
         """Test backfill_universe_history method"""
@@ -21,8 +21,16 @@ import psutil
 import gc
 from datetime import datetime, timezone
 
+from ..core.http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
+# Upstream hosts of providers calling HTTP APIs directly; the OpenBB and Yahoo
+# SDKs manage their own connections and get no pooled session
+PROVIDER_HOSTS = {
+    "alpha_vantage": "www.alphavantage.co"
+}
+
 class PerformanceOptimizer:
     """Performance optimization manager for composite data provider"""
     
@@ -62,38 +70,14 @@ class PerformanceOptimizer:
     async def initialize_connection_pools(self, providers: List[str]):
         """Initialize optimized connection pools for all providers"""
         try:
+            http_pool = get_http_pool()
             for provider in providers:
-                # Create optimized connector
-                connector = aiohttp.TCPConnector(
-                    limit=self.max_connections,
-                    limit_per_host=self.max_connections // 2,
-                    keepalive_timeout=60,
-                    enable_cleanup_closed=True,
-                    use_dns_cache=True,
-                    ttl_dns_cache=300,  # 5 minutes DNS cache
-                    family=0,  # Allow both IPv4 and IPv6
-                )
-                
-                # Create session with optimized settings
-                timeout = aiohttp.ClientTimeout(
-                    total=self.connection_timeout,
-                    connect=self.request_timeout,
-                    sock_read=self.request_timeout
-                )
-                
-                session = aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout,
-                    headers={
-                        "User-Agent": "BubblePlatform/1.0 (Performance-Optimized)",
-                        "Accept": "application/json",
-                        "Accept-Encoding": "gzip, deflate",
-                        "Connection": "keep-alive"
-                    },
-                    raise_for_status=False  # Handle errors manually
-                )
-                
-                self.connection_pools[provider] = session
+                # Sessions come from the application-wide registry so pools are
+                # shared with the providers instead of duplicated per optimizer;
+                # per-host limits (e.g. Alpha Vantage's small pool) stay the registry's
+                host = PROVIDER_HOSTS.get(provider)
+                if host is not None:
+                    self.connection_pools[provider] = await http_pool.get_session(host)
                 
                 # Initialize thread pool for this provider
                 self.thread_pools[provider] = ThreadPoolExecutor(
@@ -113,11 +97,8 @@ class PerformanceOptimizer:
     async def cleanup_connection_pools(self):
         """Clean up connection pools and resources"""
         try:
-            # Close all HTTP sessions
-            for provider, session in self.connection_pools.items():
-                if not session.closed:
-                    await session.close()
-                    logger.debug(f"Connection pool closed for {provider}")
+            # HTTP sessions are owned by the shared pool registry and closed on
+            # application shutdown; only drop our references here
             
             # Shutdown thread pools
             for provider, pool in self.thread_pools.items():
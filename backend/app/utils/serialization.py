@@ -0,0 +1,61 @@
+"""
+Shared JSON serialization for API responses and cached payloads
+
+Uses orjson when it is installed (stdlib json otherwise). Types JSON has no
+encoding for go through ``_default``:
+- Pydantic models are dumped in JSON mode
+- dates and times become ISO strings, enums their values, sets lists
+- anything else becomes ``str``, like the ``json.dumps(..., default=str)``
+  calls this replaces
+"""
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+SERIALIZER = "orjson" if ORJSON_AVAILABLE else "json"
+
+# Dict keys such as dates or ints are stringified instead of rejected
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(data: Any) -> str:
+    """Serialize to a compact JSON string"""
+    return dumps(data).decode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
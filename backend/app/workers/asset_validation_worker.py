@@ -19,14 +19,15 @@ from celery.exceptions import Retry
 from ..core.celery_app import celery_app
 from ..core.database import SessionLocal
 from ..core.config import settings
+from ..core.http_pool import get_http_pool
+from ..core.redis_pool import get_redis_pool
 from ..services.asset_validation_service import AssetValidationService
 from ..models.asset import Asset
-import redis
 
 logger = logging.getLogger(__name__)
 
-# Redis client for progress tracking
-redis_client = redis.from_url(settings.redis_url)
+# Redis client for progress tracking, on this worker process's shared sync pool
+redis_client = get_redis_pool().get_sync_client()
 
 class CallbackTask(Task):
     """Base task with callback support for progress tracking"""
@@ -156,6 +157,8 @@ def validate_asset_background(self, symbol: str, user_id: str, force_refresh: bo
             }
             
         finally:
+            loop.run_until_complete(get_http_pool().close_loop_sessions())
+            loop.run_until_complete(get_redis_pool().close_loop_clients())
             loop.close()
             
     except Exception as exc:
@@ -0,0 +1,82 @@
+"""
+Background cache outbox worker implementation.
+
+Periodic jobs applying the cache outbox:
+- Dispatch pending events into targeted cache invalidations and warming
+- Purge processed events past their retention
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from ..core.celery_app import celery_app
+from ..core.database import SessionLocal
+from ..core.redis_pool import get_redis_pool
+from ..services.cache_outbox_dispatcher import CacheOutboxDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def dispatch_cache_outbox(batch_size: int = 500, max_batches: int = 10) -> Dict[str, Any]:
+    """
+    Apply pending cache outbox events
+
+    Args:
+        batch_size: Events read per batch
+        max_batches: Batches applied per run while the backlog fills them (a batch
+            with failed events ends the run)
+    """
+    db = SessionLocal()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        dispatcher = CacheOutboxDispatcher(db, batch_size=batch_size)
+        totals: Dict[str, Any] = {'events': 0, 'failed': 0, 'batches': 0}
+
+        for _ in range(max_batches):
+            result = loop.run_until_complete(dispatcher.dispatch_pending())
+            totals['batches'] += 1
+            if result.data is None:
+                logger.warning(f"Cache outbox dispatch failed: {result.error}")
+                return {'success': False, 'error': result.error, **totals}
+            totals['events'] += result.data['events']
+            totals['failed'] += result.data.get('failed', 0)
+            # Failed events wait for their backoff; with the cache failing, stop for this run
+            if result.data.get('failed') or not result.metadata.get('batch_full'):
+                break
+
+        if totals['events']:
+            logger.info(f"Cache outbox dispatched {totals['events']} events ({totals['failed']} failed)")
+        return {'success': totals['failed'] == 0, **totals}
+
+    except Exception as e:
+        logger.error(f"Cache outbox dispatch task failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        loop.run_until_complete(get_redis_pool().close_loop_clients())
+        loop.close()
+        db.close()
+
+
+@celery_app.task
+def purge_cache_outbox(retention_hours: int = 24) -> Dict[str, Any]:
+    """
+    Delete processed cache outbox events
+
+    Args:
+        retention_hours: How long processed events are kept for inspection
+    """
+    db = SessionLocal()
+
+    try:
+        deleted = CacheOutboxDispatcher(db).purge_processed(retention_hours)
+        return {'success': True, 'deleted': deleted}
+
+    except Exception as e:
+        logger.error(f"Cache outbox purge failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        db.close()
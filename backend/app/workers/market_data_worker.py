@@ -0,0 +1,124 @@
+"""
+Background market data worker implementation.
+
+Periodic jobs keeping locally stored market data fresh so request paths
+(screening in particular) read from the database instead of providers:
+- Bulk fundamentals refresh into fundamentals_snapshots and Asset
+- Pre-market warmup of active-universe symbols before the US open
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..core.celery_app import celery_app
+from ..core.database import SessionLocal
+from ..core.http_pool import get_http_pool
+from ..core.redis_pool import get_redis_pool
+from ..services.fundamentals_service import FundamentalsRefreshService
+from ..services.premarket_warmup_service import PremarketWarmupService, minutes_to_open
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def refresh_fundamentals_snapshot(symbols: Optional[List[str]] = None, batch_size: int = 50) -> Dict[str, Any]:
+    """
+    Bulk refresh fundamentals for validated assets
+
+    Runs daily after the US close. Fundamentals are fetched in multi-symbol
+    provider calls, upserted into today's snapshot and copied onto Asset.
+
+    Args:
+        symbols: Symbols to refresh (defaults to all validated active assets)
+        batch_size: Symbols per upstream call
+    """
+    db = SessionLocal()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        service = FundamentalsRefreshService(db, batch_size=batch_size)
+        result = loop.run_until_complete(service.refresh(symbols))
+
+        if result.success:
+            logger.info(f"Fundamentals refresh completed: {result.message}")
+        else:
+            logger.warning(f"Fundamentals refresh failed: {result.error}")
+
+        return {
+            'success': result.success,
+            'message': result.message,
+            'error': result.error,
+            **(result.data or {})
+        }
+
+    except Exception as e:
+        logger.error(f"Fundamentals refresh task failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        loop.run_until_complete(get_http_pool().close_loop_sessions())
+        loop.run_until_complete(get_redis_pool().close_loop_clients())
+        loop.close()
+        db.close()
+
+
+@celery_app.task
+def premarket_warmup(
+    symbols: Optional[List[str]] = None,
+    window_minutes: float = 30.0,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Prefetch history, fundamentals and quotes for active-universe symbols
+
+    Scheduled at both possible UTC times of the pre-open (the US open moves
+    between 13:30 and 14:30 UTC with daylight saving); runs only when the open
+    is within window_minutes so it fires once per trading day.
+
+    Args:
+        symbols: Symbols to warm (defaults to the distinct symbols of active universes)
+        window_minutes: Run only if the open is at most this many minutes away
+        force: Run regardless of the time of day
+    """
+    remaining = minutes_to_open()
+    if not force and not (0 < remaining <= window_minutes):
+        return {'success': True, 'skipped': True, 'minutes_to_open': round(remaining, 1)}
+
+    db = SessionLocal()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        from ..services.implementations.composite_data_provider import CompositeDataProvider
+        from ..services.quote_snapshot_service import QuoteSnapshotService
+
+        # Redis-backed provider cache so API workers hit what the warmup fetched
+        composite_provider = CompositeDataProvider(redis_pool=get_redis_pool())
+        service = PremarketWarmupService(
+            db,
+            composite_provider=composite_provider,
+            quote_snapshot=QuoteSnapshotService(composite_provider)
+        )
+        result = loop.run_until_complete(service.run(symbols))
+
+        if result.success:
+            logger.info(f"Pre-market warmup completed: {result.message}")
+        else:
+            logger.warning(f"Pre-market warmup failed: {result.message}")
+
+        return {
+            'success': result.success,
+            'message': result.message,
+            'error': result.error,
+            **(result.data or {})
+        }
+
+    except Exception as e:
+        logger.error(f"Pre-market warmup task failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        loop.run_until_complete(get_http_pool().close_loop_sessions())
+        loop.run_until_complete(get_redis_pool().close_loop_clients())
+        loop.close()
+        db.close()
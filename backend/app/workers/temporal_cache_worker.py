@@ -0,0 +1,91 @@
+"""
+Background temporal cache worker implementation.
+
+Periodic jobs keeping the universe timeline cache warm for what users read:
+- Recompute the most read timelines (invalidated universes first)
+- Decay access counts so warming follows recent traffic
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from ..core.celery_app import celery_app
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.redis_pool import get_redis_pool
+from ..services.implementations.redis_temporal_cache import RedisTemporalCache
+from ..services.universe_service import UniverseService
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def warm_temporal_cache(
+    max_universes: int = 10,
+    max_ranges_per_universe: int = 3,
+    max_items: int = 25
+) -> Dict[str, Any]:
+    """
+    Recompute hot universe timelines into the temporal cache
+
+    Args:
+        max_universes: Number of hot universes considered
+        max_ranges_per_universe: Hot date ranges warmed per universe
+        max_items: Cap on entries computed per run
+    """
+    db = SessionLocal()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        service = UniverseService(db, temporal_cache=RedisTemporalCache(redis_url=settings.redis_url))
+        result = loop.run_until_complete(service.warm_temporal_cache(
+            max_universes=max_universes,
+            max_ranges_per_universe=max_ranges_per_universe,
+            max_items=max_items
+        ))
+
+        if result.success:
+            logger.info(f"Temporal cache warming completed: {result.message}")
+        else:
+            logger.warning(f"Temporal cache warming failed: {result.error}")
+
+        return {
+            'success': result.success,
+            'message': result.message,
+            'error': result.error,
+            **(result.metadata or {})
+        }
+
+    except Exception as e:
+        logger.error(f"Temporal cache warming task failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        loop.run_until_complete(get_redis_pool().close_loop_clients())
+        loop.close()
+        db.close()
+
+
+@celery_app.task
+def decay_temporal_cache_access(factor: float = 0.5) -> Dict[str, Any]:
+    """
+    Scale down universe read counts so stale popularity fades
+
+    Args:
+        factor: Multiplier applied to every universe's read count
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        cache = RedisTemporalCache(redis_url=settings.redis_url)
+        loop.run_until_complete(cache.decay_access_counts(factor))
+        return {'success': True, 'factor': factor}
+
+    except Exception as e:
+        logger.error(f"Temporal cache access decay failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        loop.run_until_complete(get_redis_pool().close_loop_clients())
+        loop.close()